@@ -0,0 +1,351 @@
+"""
+Бенчмарк количества обращений к хранилищу FSM за одно обновление.
+
+Скрипт вызывает хендлеры бота (category_selection_callback, process_pagination_callback,
+send_photo_handler, process_update_photo_description и хендлер /cancel) с обычным FSMContext
+и через FSMUnitOfWorkMiddleware (BufferedFSMContext) и считает обращения к хранилищу.
+Запросы к БД и Telegram Bot API заменены заглушками, чтобы замерялись только обращения к FSM.
+В оба варианта входит чтение состояния FSMContextMiddleware (raw_state), как при обработке обновления
+Dispatcher. Каждое обращение имитирует сетевой запрос к внешнему хранилищу задержкой --rtt.
+Обновление данных (update_data) считается одним обращением, как в PostgresStorage.
+
+Запуск (БД и токен бота не нужны):
+    python -m benchmarks.fsm_benchmark --updates 200 --rtt 0.001
+"""
+
+import argparse
+import asyncio
+import contextlib
+import time
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable
+)
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch
+)
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from bot_app.handlers.admin_handlers import process_update_photo_description
+from bot_app.handlers.bot_commands import bot_commands_router
+from bot_app.handlers.user_handlers import (
+    category_selection_callback,
+    process_pagination_callback,
+    send_photo_handler
+)
+from bot_app.middlewares.fsm_unit_of_work import FSMUnitOfWorkMiddleware
+from bot_app.utils.group_registry import GroupRegistry
+
+
+# ID администратора (для остальных пользователей check_is_admin возвращает False)
+ADMIN_ID = 1
+USER_ID = 123
+
+# Хендлер /cancel (имя cancel_handler в модуле перекрыто хендлером /commandos, поэтому он берётся из роутера)
+CANCEL_HANDLER = next(
+    handler.callback
+    for handler in bot_commands_router.message.handlers
+    if handler.callback.__name__ == 'cancel_handler' and 'state' in handler.params
+)
+
+
+class RoundTripStorage(MemoryStorage):
+
+    """
+    Хранилище в памяти, считающее обращения и имитирующее задержку сетевого запроса.
+    """
+
+    def __init__(self,
+                 rtt: float):
+
+        """
+        Инициализация хранилища.
+        :param rtt: Задержка одного обращения (в секундах).
+        """
+
+        super().__init__()
+        self.rtt = rtt
+        self.round_trips = 0
+
+    async def _round_trip(self) -> None:
+
+        """
+        Учёт одного обращения к хранилищу.
+        :return: Функция ничего не возвращает.
+        """
+
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    async def set_state(self, key, state=None) -> None:
+
+        """
+        Запись состояния за одно обращение.
+        :param key: Ключ FSM пользователя.
+        :param state: Новое состояние.
+        :return: Функция ничего не возвращает.
+        """
+
+        await self._round_trip()
+        await super().set_state(key=key, state=state)
+
+    async def get_state(self, key) -> str | None:
+
+        """
+        Чтение состояния за одно обращение.
+        :param key: Ключ FSM пользователя.
+        :return: Возвращает состояние пользователя.
+        """
+
+        await self._round_trip()
+        return await super().get_state(key=key)
+
+    async def set_data(self, key, data) -> None:
+
+        """
+        Запись данных за одно обращение.
+        :param key: Ключ FSM пользователя.
+        :param data: Новые данные.
+        :return: Функция ничего не возвращает.
+        """
+
+        await self._round_trip()
+        await super().set_data(key=key, data=data)
+
+    async def get_data(self, key) -> dict[str, Any]:
+
+        """
+        Чтение данных за одно обращение.
+        :param key: Ключ FSM пользователя.
+        :return: Возвращает данные пользователя.
+        """
+
+        await self._round_trip()
+        return await super().get_data(key=key)
+
+    async def update_data(self, key, data) -> dict[str, Any]:
+
+        """
+        Обновление данных за одно обращение, как запрос с jsonb || в PostgresStorage.
+        :param key: Ключ FSM пользователя.
+        :param data: Изменённые ключи данных.
+        :return: Возвращает данные пользователя после обновления.
+        """
+
+        await self._round_trip()
+        current_data = await MemoryStorage.get_data(self, key=key)
+        current_data.update(data)
+        await MemoryStorage.set_data(self, key=key, data=current_data)
+        return current_data.copy()
+
+    async def seed(self,
+                   key: StorageKey,
+                   state: str | None,
+                   data: dict[str, Any]) -> None:
+
+        """
+        Подготовка состояния перед обновлением без учёта обращений.
+        :param key: Ключ FSM пользователя.
+        :param state: Начальное состояние.
+        :param data: Начальные данные.
+        :return: Функция ничего не возвращает.
+        """
+
+        await MemoryStorage.set_state(self, key=key, state=state)
+        await MemoryStorage.set_data(self, key=key, data=data)
+
+
+def make_callback(callback_data: str,
+                  user_id: int = USER_ID) -> MagicMock:
+
+    """
+    Создание CallbackQuery с заглушками методов Bot API.
+    :param callback_data: Данные кнопки.
+    :param user_id: ID пользователя, нажавшего кнопку.
+    :return: Возвращает мок CallbackQuery.
+    """
+
+    callback = MagicMock()
+    callback.data = callback_data
+    callback.from_user.id = user_id
+    callback.answer = AsyncMock()
+    callback.message = AsyncMock()
+    callback.message.photo = None
+    callback.message.caption = 'Description123'
+
+    return callback
+
+
+async def category_selection(state: FSMContext) -> None:
+    await category_selection_callback(
+        callback=make_callback('category_Category123'),
+        state=state,
+        pool=MagicMock()
+    )
+
+
+async def pagination(state: FSMContext) -> None:
+    await process_pagination_callback(
+        callback=make_callback('page_2_next_6'),
+        state=state,
+        pool=MagicMock()
+    )
+
+
+async def send_photo_user(state: FSMContext) -> None:
+    await send_photo_handler(
+        callback=make_callback('photo_id_1'),
+        bot=MagicMock(),
+        state=state,
+        pool=MagicMock(),
+        group_registry=GroupRegistry()
+    )
+
+
+async def send_photo_admin(state: FSMContext) -> None:
+    await send_photo_handler(
+        callback=make_callback('photo_id_1', user_id=ADMIN_ID),
+        bot=MagicMock(),
+        state=state,
+        pool=MagicMock(),
+        group_registry=GroupRegistry()
+    )
+
+
+async def update_description(state: FSMContext) -> None:
+    await process_update_photo_description(
+        callback=make_callback('update_description', user_id=ADMIN_ID),
+        state=state,
+        pool=MagicMock()
+    )
+
+
+async def cancel_command(state: FSMContext) -> None:
+    await CANCEL_HANDLER(
+        message=AsyncMock(),
+        state=state
+    )
+
+
+# Хендлеры бота и состояние FSM перед обновлением: (сценарий, состояние, данные)
+SCENARIOS: dict[str, tuple[Callable[[FSMContext], Awaitable[None]], str | None, dict[str, Any]]] = {
+    'category_selection_callback': (category_selection, None, {'cancel_handler': False}),
+    'process_pagination_callback': (pagination, None, {'category': 'Category123', 'current_page': 1}),
+    'send_photo_handler': (send_photo_user, None, {'category': 'Category123', 'current_page': 1}),
+    'send_photo_handler (админ)': (send_photo_admin, None, {'category': 'Category123', 'current_page': 1}),
+    'update_description (админ)': (update_description, None, {'category': 'Category123', 'photo_id': 'photo123'}),
+    '/cancel': (cancel_command, 'SearchPhotoState:search_photo', {'category': 'Category123'})
+}
+
+
+def patch_handlers() -> contextlib.ExitStack:
+
+    """
+    Замена запросов к БД и проверки администратора в модулях хендлеров заглушками.
+    :return: Возвращает стек патчей, снимаемых при выходе из контекста.
+    """
+
+    photos = [{'id': i, 'description': f'Description{i}'} for i in range(6, 12)]
+    patches = {
+        'bot_app.handlers.user_handlers.get_photos_page_from_db': AsyncMock(
+            return_value={'photos': photos, 'total': 60}
+        ),
+        'bot_app.handlers.user_handlers.get_photo_by_id_from_db': AsyncMock(
+            return_value={'photo_id': 'photo123', 'description': 'Description123'}
+        ),
+        'bot_app.handlers.user_handlers.check_is_admin': AsyncMock(
+            side_effect=lambda bot, user_id, groups_id: user_id == ADMIN_ID
+        ),
+        'bot_app.handlers.admin_handlers.get_photo_description_by_file_id_from_db': AsyncMock(
+            return_value='Description123'
+        )
+    }
+
+    stack = contextlib.ExitStack()
+    for target, mock in patches.items():
+        stack.enter_context(patch(target, mock))
+
+    return stack
+
+
+async def run(scenario: Callable[[FSMContext], Awaitable[None]],
+              initial_state: str | None,
+              initial_data: dict[str, Any],
+              buffered: bool,
+              updates: int,
+              rtt: float) -> tuple[float, float]:
+
+    """
+    Прогон сценария для нескольких обновлений.
+    :param scenario: Вызов хендлера.
+    :param initial_state: Состояние FSM перед каждым обновлением.
+    :param initial_data: Данные FSM перед каждым обновлением.
+    :param buffered: Вызывать хендлер через FSMUnitOfWorkMiddleware.
+    :param updates: Количество обновлений.
+    :param rtt: Задержка одного обращения к хранилищу (в секундах).
+    :return: Возвращает среднее количество обращений к хранилищу и время (мс) на обновление.
+    """
+
+    storage = RoundTripStorage(rtt=rtt)
+    key = StorageKey(bot_id=42, chat_id=USER_ID, user_id=USER_ID)
+    middleware = FSMUnitOfWorkMiddleware()
+
+    async def handler(event, data):
+        await scenario(data['state'])
+
+    elapsed = 0.0
+    for _ in range(updates):
+        await storage.seed(key=key, state=initial_state, data=initial_data)
+
+        started = time.perf_counter()
+        # Чтение состояния FSMContextMiddleware перед вызовом хендлера
+        data = {
+            'state': FSMContext(storage=storage, key=key),
+            'raw_state': await storage.get_state(key=key)
+        }
+        if buffered:
+            await middleware(handler, MagicMock(), data)
+        else:
+            await handler(MagicMock(), data)
+        elapsed += time.perf_counter() - started
+
+    return storage.round_trips / updates, elapsed / updates * 1000
+
+
+async def main() -> None:
+
+    """
+    Запуск бенчмарка и вывод результатов.
+    :return: Функция ничего не возвращает.
+    """
+
+    parser = argparse.ArgumentParser(description='Бенчмарк обращений к хранилищу FSM')
+    parser.add_argument('--updates', type=int, default=200, help='Количество обновлений на сценарий')
+    parser.add_argument('--rtt', type=float, default=0.001, help='Задержка одного обращения к хранилищу (с)')
+    args = parser.parse_args()
+
+    print(f'{"Сценарий":<30} {"FSMContext":>22} {"BufferedFSMContext":>22}')
+    with patch_handlers():
+        for name, (scenario, initial_state, initial_data) in SCENARIOS.items():
+            plain_trips, plain_ms = await run(
+                scenario, initial_state, initial_data, buffered=False, updates=args.updates, rtt=args.rtt
+            )
+            buffered_trips, buffered_ms = await run(
+                scenario, initial_state, initial_data, buffered=True, updates=args.updates, rtt=args.rtt
+            )
+            print(
+                f'{name:<30} '
+                f'{plain_trips:>6.1f} обр. {plain_ms:>6.2f} мс '
+                f'{buffered_trips:>6.1f} обр. {buffered_ms:>6.2f} мс'
+            )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""
+Микро-бенчмарк кэша инлайн-клавиатур.
+
+Скрипт сравнивает построение клавиатур на каждый callback (функции из
+bot_app/keyboards/keyboards.py без кэша) с получением готовых клавиатур из
+кэша: время на вызов (timeit) и объём выделенной памяти на вызов (tracemalloc).
+Набор клавиатур соответствует одному callback: клавиатуры сборок страницы,
+пагинации, администратора и категорий.
+
+Запуск (БД и токен бота не нужны):
+    python -m benchmarks.keyboard_benchmark --items 10 --number 20000
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from typing import Callable
+
+from bot_app.keyboards.keyboards import (
+    create_admins_keyboard,
+    create_assembl_buttons,
+    create_categories_keyboard,
+    create_paginated_keyboard
+)
+from bot_app.utils.keyboard_cache import keyboard_cache
+
+
+def make_callback(items: int,
+                  categories: int,
+                  cached: bool) -> Callable[[], None]:
+
+    """
+    Формирование функции, строящей клавиатуры для одного callback.
+    :param items: Количество сборок на странице.
+    :param categories: Количество категорий в клавиатуре категорий.
+    :param cached: Использовать кэш клавиатур или строить клавиатуры заново.
+    :return: Возвращает функцию без аргументов.
+    """
+
+    assembl = [{'id': i, 'description': f'Сборка {i}'} for i in range(1, items + 1)]
+    categories_list = [{'name': f'category{i}', 'description': f'Категория {i}'} for i in range(categories)]
+
+    def build(func: Callable) -> Callable:
+        return func if cached else func.__wrapped__
+
+    assembl_kb = build(create_assembl_buttons)
+    pagination_kb = build(create_paginated_keyboard)
+    admins_kb = build(create_admins_keyboard)
+    categories_kb = build(create_categories_keyboard)
+
+    def callback() -> None:
+        # Данные страницы приходят из БД новым списком на каждый callback
+        assembl_kb(assembl=[dict(item) for item in assembl])
+        pagination_kb(current_page=2, total_pages=5, first_id=1, last_id=items)
+        admins_kb(category='category1')
+        categories_kb(categories=categories_list)
+
+    return callback
+
+
+def measure(callback: Callable[[], None],
+            number: int) -> tuple[float, float]:
+
+    """
+    Замер времени и выделенной памяти на один вызов.
+    :param callback: Функция для замера.
+    :param number: Количество вызовов.
+    :return: Возвращает время (мкс) и объём выделенной памяти (байт) на вызов.
+    """
+
+    # Прогрев, в том числе заполнение кэша
+    callback()
+
+    seconds = min(timeit.repeat(callback, number=number, repeat=3))
+
+    # Пиковый объём памяти, выделяемой за один вызов
+    peaks = []
+    tracemalloc.start()
+    for _ in range(100):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        callback()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    tracemalloc.stop()
+
+    return seconds / number * 1_000_000, sum(peaks) / len(peaks)
+
+
+def main() -> None:
+
+    """
+    Запуск бенчмарка и вывод результатов.
+    :return: Функция ничего не возвращает.
+    """
+
+    parser = argparse.ArgumentParser(description='Бенчмарк кэша инлайн-клавиатур')
+    parser.add_argument('--items', type=int, default=10, help='Количество сборок на странице')
+    parser.add_argument('--categories', type=int, default=8, help='Количество категорий')
+    parser.add_argument('--number', type=int, default=20000, help='Количество вызовов в одном замере')
+    args = parser.parse_args()
+
+    keyboard_cache.clear()
+
+    results = {}
+    for name, cached in (('без кэша', False), ('с кэшем', True)):
+        results[name] = measure(
+            callback=make_callback(
+                items=args.items,
+                categories=args.categories,
+                cached=cached
+            ),
+            number=args.number
+        )
+
+    for name, (usec, alloc) in results.items():
+        print(f'{name:>10}: {usec:8.2f} мкс/callback, пик памяти {alloc:8.1f} байт/callback')
+
+    (plain_usec, plain_alloc), (cached_usec, cached_alloc) = results.values()
+    print(f'Ускорение: x{plain_usec / cached_usec:.1f}, память: x{plain_alloc / max(cached_alloc, 1):.1f}')
+
+
+if __name__ == '__main__':
+    main()
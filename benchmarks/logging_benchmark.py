@@ -0,0 +1,173 @@
+"""
+Бенчмарк задержки цикла событий при интенсивном логировании.
+
+Скрипт запускает задачи, которые пишут в лог так же, как хендлеры бота (logger.info
+на каждое обновление), и параллельно замеряет, на сколько опаздывает пробуждение
+задачи-монитора, которая каждую миллисекунду засыпает на 1 мс. Сравниваются запись
+в RotatingFileHandler прямо из цикла событий (прежняя настройка config/log.py) и
+конвейер QueueHandler/QueueListener с фоновым потоком записи. Лог пишется во временную
+папку с ротацией по 1 MB, как в боте. Параметр --io-delay добавляет блокирующую задержку
+к каждой записи в файл, имитируя медленный или загруженный диск.
+
+Запуск (БД и токен бота не нужны):
+    python -m benchmarks.logging_benchmark --workers 50 --records 500 --io-delay 0.0002
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+from typing import Callable
+
+from config.log import (
+    create_file_handler,
+    create_queue_pipeline
+)
+
+
+async def monitor_loop_lag(stop: asyncio.Event,
+                           lags: list[float],
+                           interval: float = 0.001) -> None:
+
+    """
+    Замер опоздания пробуждения задачи относительно запрошенного интервала сна.
+    :param stop: Событие окончания замера.
+    :param lags: Список, в который добавляются опоздания (в секундах).
+    :param interval: Интервал сна (в секундах).
+    :return: Функция ничего не возвращает.
+    """
+
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def run(logger: logging.Logger,
+              workers: int,
+              records: int,
+              pause: float) -> tuple[float, list[float]]:
+
+    """
+    Запись в лог из нескольких задач с замером задержки цикла событий.
+    :param logger: Логгер для записи.
+    :param workers: Количество задач, пишущих в лог.
+    :param records: Количество записей от одной задачи.
+    :param pause: Пауза задачи между записями (в секундах), имитирующая ожидание следующего обновления.
+    :return: Возвращает количество записей в секунду и список опозданий цикла событий.
+    """
+
+    async def worker(worker_id: int) -> None:
+        for i in range(records):
+            logger.info(f'Пользователь {worker_id} запустил бота, обновление {i}')
+            await asyncio.sleep(pause)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    monitor = asyncio.create_task(monitor_loop_lag(stop, lags))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(workers)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await monitor
+
+    return workers * records / elapsed, lags
+
+
+def slow_emit(emit: Callable[[logging.LogRecord], None],
+              delay: float) -> Callable[[logging.LogRecord], None]:
+
+    """
+    Добавление блокирующей задержки к записи обработчика (медленный диск).
+    :param emit: Метод emit обработчика.
+    :param delay: Задержка одной записи (в секундах).
+    :return: Возвращает метод emit с задержкой.
+    """
+
+    def wrapper(record: logging.LogRecord) -> None:
+        time.sleep(delay)
+        emit(record)
+
+    return wrapper
+
+
+def percentile(values: list[float],
+               q: float) -> float:
+
+    """
+    Вычисление перцентиля.
+    :param values: Значения.
+    :param q: Перцентиль от 0 до 1.
+    :return: Возвращает значение перцентиля.
+    """
+
+    values = sorted(values)
+
+    return values[min(len(values) - 1, int(q * len(values)))] if values else 0.0
+
+
+def main() -> None:
+
+    """
+    Запуск бенчмарка и вывод результатов.
+    :return: Функция ничего не возвращает.
+    """
+
+    parser = argparse.ArgumentParser(description='Бенчмарк задержки цикла событий при логировании')
+    parser.add_argument('--workers', type=int, default=50, help='Количество задач, пишущих в лог')
+    parser.add_argument('--records', type=int, default=2000, help='Количество записей от одной задачи')
+    parser.add_argument('--pause', type=float, default=0.001, help='Пауза задачи между записями (с)')
+    parser.add_argument('--io-delay', type=float, default=0.0, help='Задержка записи в файл (с)')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help='Формат записей')
+    args = parser.parse_args()
+
+    print(f'{"Настройка":<22} {"записей/с":>10} {"p50 лаг":>10} {"p99 лаг":>10} {"макс. лаг":>10} {"отброшено":>10}')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in ('RotatingFileHandler', 'QueueHandler'):
+            logger = logging.getLogger(f'benchmark.{name}')
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+            file_handler = create_file_handler(
+                path=os.path.join(tmp_dir, f'{name}.log'),
+                log_format=args.format
+            )
+            if args.io_delay:
+                file_handler.emit = slow_emit(file_handler.emit, args.io_delay)
+
+            queue_handler = listener = None
+            if name == 'QueueHandler':
+                queue_handler, listener = create_queue_pipeline(file_handler)
+                listener.start()
+                logger.addHandler(queue_handler)
+            else:
+                logger.addHandler(file_handler)
+
+            rate, lags = asyncio.run(run(
+                logger=logger,
+                workers=args.workers,
+                records=args.records,
+                pause=args.pause
+            ))
+
+            if listener:
+                listener.stop()
+            file_handler.close()
+
+            print(
+                f'{name:<22} {rate:>10.0f} '
+                f'{percentile(lags, 0.5) * 1000:>8.2f}мс '
+                f'{percentile(lags, 0.99) * 1000:>8.2f}мс '
+                f'{max(lags, default=0) * 1000:>8.2f}мс '
+                f'{queue_handler.dropped if queue_handler else 0:>10}'
+            )
+
+
+if __name__ == '__main__':
+    main()
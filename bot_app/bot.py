@@ -1,28 +1,107 @@
 import asyncio
 
+import asyncpg.pool
 from aiogram import (
     Bot,
     Dispatcher
 )
 from aiogram.client.bot import DefaultBotProperties
 from aiogram.enums.parse_mode import ParseMode
-
-from bot_app.exceptions.database import DatabaseConnectionError
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from bot_app.exceptions.database import (
+    DatabaseConnectionError,
+    DatabaseCheckExtensionError,
+    DatabaseGetGroupError,
+    DatabaseLoadSearchIndexError,
+    DatabaseMigrationError
+)
+from bot_app.exceptions.webhook import WebhookConfigError
 from bot_app.middlewares.add_pool_in_handlers import DatabaseMiddleware
+from bot_app.middlewares.fsm_unit_of_work import FSMUnitOfWorkMiddleware
+from bot_app.middlewares.instrumentation import (
+    APITimingMiddleware,
+    InstrumentationMiddleware
+)
+from bot_app.middlewares.rate_limiter import RateLimitMiddleware
+from bot_app.middlewares.throttling import ThrottlingMiddleware
 from bot_app.handlers.bot_commands import bot_commands_router
 from bot_app.handlers.group_handlers import bot_group_joined_router
 from bot_app.handlers.user_handlers import bot_user_handlers_router
 from bot_app.handlers.admin_handlers import bot_admins_handlers_router
 from bot_app.keyboards.bot_menu import set_main_menu
-
-from config.config import BOT_TOKEN
+from bot_app.metrics_server import (
+    runtime_collector,
+    start_metrics_server
+)
+from bot_app.utils.group_registry import GroupRegistry
+from bot_app.utils.metrics import metrics
+from bot_app.utils.photo_cache import photo_cache
+from bot_app.webhook import run_webhook
+
+from config.config import (
+    BOT_TOKEN,
+    BOT_RUN_MODE,
+    DB_MIGRATE_ON_STARTUP,
+    FSM_STORAGE,
+    METRICS_ENABLED,
+    SEARCH_INDEX_ENABLED
+)
+from config.fsm_storage import PostgresStorage
+from config.migrations import migrate_db
+from config.statements import statements
 from config.database import (
     create_pool,
-    close_pool
+    close_pool,
+    check_pg_trgm_in_db,
+    load_search_index
 )
 from config.log import logger
 
 
+def create_dispatcher(pool: asyncpg.pool.Pool,
+                      group_registry: GroupRegistry,
+                      storage: BaseStorage,
+                      throttling: ThrottlingMiddleware) -> Dispatcher:
+
+    """
+    Создание Dispatcher с middleware и хендлерами бота.
+    Роутеры хендлеров - объекты модулей, поэтому Dispatcher можно создать один раз на процесс.
+    :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
+    :param storage: Хранилище состояний FSM.
+    :param throttling: Middleware ограничения нажатий кнопок.
+    :return: Возвращает объект Dispatcher.
+    """
+
+    dp = Dispatcher(storage=storage)
+
+    # Замер времени обработки обновлений, хендлеров, запросов к БД и Telegram Bot API
+    instrumentation = InstrumentationMiddleware()
+    dp.update.middleware(instrumentation)
+    dp.update.middleware(throttling)
+    dp.update.middleware(
+        DatabaseMiddleware(
+            pool=pool,
+            group_registry=group_registry
+        )
+    )
+    # Изменения FSM за время обработки обновления записываются в хранилище один раз
+    dp.update.middleware(FSMUnitOfWorkMiddleware())
+
+    # Регистрация хендлеров
+    dp.include_router(bot_commands_router)
+    dp.include_router(bot_admins_handlers_router)
+    dp.include_router(bot_user_handlers_router)
+    dp.include_router(bot_group_joined_router)
+
+    # Замер времени хендлеров с меткой роутера
+    instrumentation.setup(dp)
+
+    return dp
+
+
 async def main():
 
     """
@@ -30,22 +109,61 @@ async def main():
     :return: Функция ничего не возвращает.
     """
 
-    # Инициализируем pool и bot перед try, чтобы можно было закрыть его в finally
+    # Инициализируем pool, bot и dp перед try, чтобы можно было закрыть их в finally
     pool = None
     bot = None
+    dp = None
+    rate_limiter = None
+    throttling = None
+    metrics_runner = None
 
     try:
         # Создание пулла подключений к БД
         pool = await create_pool()
 
+        # Применение новых миграций схемы БД (таблицы и индексы)
+        if DB_MIGRATE_ON_STARTUP:
+            await migrate_db(pool=pool)
+
+        # Без расширения pg_trgm поиск фото выполняется запросом с ILIKE
+        try:
+            await check_pg_trgm_in_db(pool=pool)
+        except DatabaseCheckExtensionError as e:
+            logger.error(e)
+
+        # Загрузка групп из БД в реестр групп
+        group_registry = await GroupRegistry.load(pool=pool)
+
+        # Загрузка фото в поисковый индекс, при ошибке поиск выполняется в БД
+        if SEARCH_INDEX_ENABLED:
+            try:
+                await load_search_index(pool=pool)
+            except DatabaseLoadSearchIndexError as e:
+                logger.error(e)
+
         # Инициализация бота
         bot = Bot(
             token=BOT_TOKEN,
             default=DefaultBotProperties(parse_mode=ParseMode.HTML)
         )
-        dp = Dispatcher()
-
-        dp.update.middleware(DatabaseMiddleware(pool=pool))
+        # Исходящие сообщения отправляются с соблюдением лимитов Telegram
+        rate_limiter = RateLimitMiddleware()
+        bot.session.middleware(rate_limiter)
+        # Время запросов к Telegram Bot API без ожидания лимитов
+        bot.session.middleware(APITimingMiddleware())
+        # Состояния FSM в БД общие для всех процессов бота и сохраняются между перезапусками
+        if FSM_STORAGE == 'postgres':
+            storage = PostgresStorage(pool=pool)
+        else:
+            storage = MemoryStorage()
+        # Поток нажатий кнопок пользователем схлопывается до запросов к БД
+        throttling = ThrottlingMiddleware()
+        dp = create_dispatcher(
+            pool=pool,
+            group_registry=group_registry,
+            storage=storage,
+            throttling=throttling
+        )
 
         # Сохраняем объект Bot в Dispatcher
         dp['bot'] = bot
@@ -53,21 +171,47 @@ async def main():
         # Регистрация кнопки menu
         await set_main_menu(bot)
 
-        # Регистрация хендлеров
-        dp.include_router(bot_commands_router)
-        dp.include_router(bot_admins_handlers_router)
-        dp.include_router(bot_user_handlers_router)
-        dp.include_router(bot_group_joined_router)
+        # Сервер метрик для Prometheus, ошибка запуска не мешает работе бота
+        if METRICS_ENABLED:
+            metrics.add_collector(
+                runtime_collector(
+                    pool=pool,
+                    rate_limiter=rate_limiter,
+                    throttling=throttling
+                )
+            )
+            try:
+                metrics_runner = await start_metrics_server()
+            except OSError as e:
+                logger.error(f'Не удалось запустить сервер метрик: {e}')
+
+        # Запуск бота через webhook (aiohttp-сервер) или long polling
+        if BOT_RUN_MODE == 'webhook':
+            print('Успешный запуск бота!')
+            logger.info('Успешный запуск бота в режиме webhook!')
+
+            await run_webhook(
+                dp=dp,
+                bot=bot
+            )
+        else:
+            await bot.delete_webhook(drop_pending_updates=True)
+
+            print('Успешный запуск бота!')
+            logger.info('Успешный запуск бота!')
+
+            await dp.start_polling(bot)
 
-        # Запуск бота
-        await bot.delete_webhook(drop_pending_updates=True)
+    except DatabaseConnectionError as e:
+        logger.error(e)
 
-        print('Успешный запуск бота!')
-        logger.info('Успешный запуск бота!')
+    except DatabaseMigrationError as e:
+        logger.error(e)
 
-        await dp.start_polling(bot)
+    except DatabaseGetGroupError as e:
+        logger.error(e)
 
-    except DatabaseConnectionError as e:
+    except WebhookConfigError as e:
         logger.error(e)
 
     except asyncio.CancelledError:
@@ -75,12 +219,26 @@ async def main():
     finally:
         logger.info('Бот завершает работу...')
 
+        # Останавливаем сервер метрик, если он был запущен
+        if metrics_runner:
+            await metrics_runner.cleanup()
+
         # Закрываем сессию бота, если он был создан
         if bot:
+            logger.info(f'Статистика ограничения исходящих сообщений: {rate_limiter.stats()}')
             await bot.session.close()
 
+        # Закрываем хранилище состояний FSM до закрытия пула соединений
+        if dp:
+            logger.info(f'Статистика нажатий кнопок: {throttling.stats()}')
+            await dp.storage.close()
+
         # Закрываем пул соединений с БД, если он был создан
         if pool:
+            logger.info(f'Статистика пула соединений с БД: {pool.stats()}')
+            logger.info(f'Статистика запросов к БД: {statements.stats()}')
+            logger.info(f'Статистика кэша фото: {photo_cache.stats()}')
+            logger.info(f'Метрики: {metrics.dump()}')
             await close_pool(pool)
             logger.info('Успешная остановка бота.')
 
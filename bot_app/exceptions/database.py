@@ -36,16 +36,16 @@ class DatabaseAddPhotoWithCategoryError(BotAppError):
     pass
 
 
-class DatabaseGetPhotosError(BotAppError):
+class DatabaseImportPhotosError(BotAppError):
     """
-    Ошибка получения фотографий из БД.
+    Ошибка массового импорта фотографий с категориями в БД.
     """
     pass
 
 
-class DatabaseGetTotalPhotosError(BotAppError):
+class DatabaseGetPhotosError(BotAppError):
     """
-    Ошибка получения общего количества фотографий по категории из БД.
+    Ошибка получения фотографий из БД.
     """
     pass
 
@@ -64,6 +64,13 @@ class DatabaseGetFileIdByDescriptionError(BotAppError):
     pass
 
 
+class DatabaseGetPhotoByIdError(BotAppError):
+    """
+    Ошибка получения фотографии по её id из БД.
+    """
+    pass
+
+
 class DatabaseGetCategoriesError(BotAppError):
     """
     Ошибка получения всех категорий из БД.
@@ -97,3 +104,31 @@ class DatabaseSearchPhotoByDescriptionError(BotAppError):
     Ошибка поиска фотографий по описанию в БД.
     """
     pass
+
+
+class DatabaseCheckExtensionError(BotAppError):
+    """
+    Ошибка проверки расширений Postgres в БД.
+    """
+    pass
+
+
+class DatabaseLoadSearchIndexError(BotAppError):
+    """
+    Ошибка загрузки фото из БД в поисковый индекс.
+    """
+    pass
+
+
+class DatabaseFSMStorageError(BotAppError):
+    """
+    Ошибка чтения или записи состояния FSM в БД.
+    """
+    pass
+
+
+class DatabaseMigrationError(BotAppError):
+    """
+    Ошибка применения миграций схемы БД.
+    """
+    pass
@@ -0,0 +1,8 @@
+from .base import BotAppError
+
+
+class WebhookConfigError(BotAppError):
+    """
+    Ошибка настройки запуска бота через webhook.
+    """
+    pass
@@ -21,6 +21,52 @@ def detect_language(text: str) -> str:
     return 'unknowm'
 
 
+def transliterate_text(text: str,
+                       language: str | None = None) -> str | None:
+
+    """
+    Перевод текста из кириллицы в латиницу или из латиницы в кириллицу.
+    :param text: Текст для перевода.
+    :param language: Язык текста (по умолчанию определяется по самому тексту).
+    :return: Возвращает переведённый текст или None, если язык не определён.
+    """
+
+    if language is None:
+        language = detect_language(text=text)
+
+    # Если язык - кириллица
+    if language == 'cyrillic':
+        return translit(
+            text,
+            language_code='ru',
+            reversed=True
+        )
+    # Если язык - латиница
+    elif language == 'latin':
+        return translit(
+            text,
+            language_code='ru',
+            reversed=False
+        )
+    return None
+
+
+def transliterate_texts(texts: list[str]) -> list[str | None]:
+
+    """
+    Перевод списка текстов (массовый импорт фото). Одинаковые тексты переводятся один раз.
+    :param texts: Тексты для перевода.
+    :return: Возвращает переведённые тексты в порядке исходных (None, если язык текста не определён).
+    """
+
+    translated: dict[str, str | None] = {}
+    for text in texts:
+        if text not in translated:
+            translated[text] = transliterate_text(text=text)
+
+    return [translated[text] for text in texts]
+
+
 class TransliterationFilter(BaseFilter):
 
     """
@@ -51,24 +97,12 @@ class TransliterationFilter(BaseFilter):
         else:
             user_input_separate = user_input
 
-        # Если язык - кириллица
-        if language == 'cyrillic':
-            # Добавляем трансформированный текст в объект message
-            translit_text = translit(
-                user_input_separate,
-                language_code='ru',
-                reversed=True
-            )
-        # Если язык - латиница
-        elif language == 'latin':
-            # Добавляем трансформированный текст в объект message
-            translit_text = translit(
-                user_input_separate,
-                language_code='ru',
-                reversed=False
-            )
-        else:
-            # Если язык не определён
+        translit_text = transliterate_text(
+            text=user_input_separate,
+            language=language
+        )
+        # Если язык не определён
+        if translit_text is None:
             return {'description': user_input_separate}
 
         return {
@@ -11,7 +11,6 @@ from aiogram.types import (
 from aiogram.fsm.context import FSMContext
 
 from bot_app.exceptions.database import (
-    DatabaseGetGroupError,
     DatabaseGetCategoriesError,
     DatabaseAddPhotoWithCategoryError,
     DatabaseDeletePhotoError,
@@ -25,10 +24,10 @@ from bot_app.lexicon.lexicon_common.lexicon_ru import LEXICON_RU
 from bot_app.states.admin_states import AdminUpdateDescriptionState
 
 from bot_app.utils.admin_check import check_is_admin
+from bot_app.utils.group_registry import GroupRegistry
 
 from config.database import (
     PhotoAlreadyExistsError,
-    get_groups_from_db,
     get_categories_from_db,
     add_photo_with_category_to_db,
     delete_photo_from_db,
@@ -48,6 +47,7 @@ bot_admins_handlers_router = Router(name='bot_admins_handlers_router')
 async def update_photo_handler(message: Message,
                                bot: Bot,
                                pool: asyncpg.pool.Pool,
+                               group_registry: GroupRegistry,
                                state: FSMContext):
 
     """
@@ -55,6 +55,7 @@ async def update_photo_handler(message: Message,
     :param message: Сообщение от пользователя.
     :param bot: Объект Bot.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :param state: Состояние пользователя для FSM.
     :return: Функция ничего не возвращает.
     """
@@ -63,8 +64,8 @@ async def update_photo_handler(message: Message,
         # Проверяем, не вызвана ли команда /cancel
         data = await state.get_data()
         if not data.get('cancel_handler'):
-            # Получаем группы из БД
-            groups_id = await get_groups_from_db(pool=pool)
+            # Получаем группы из реестра групп
+            groups_id = group_registry.groups_id
 
             # Получаем ID пользователя
             user_id = message.from_user.id
@@ -99,9 +100,6 @@ async def update_photo_handler(message: Message,
                         f'{LEXICON_RU["confirm"]}',
                 reply_markup=create_admins_confirmation_keyboard(command='replace')
             )
-    except DatabaseGetGroupError as e:
-        logger.error(e)
-        await message.answer(text=LEXICON_RU['error'])
     except DatabaseGetPhotoDescriptionByFileIdError as e:
         logger.error(e)
         await message.answer(text=LEXICON_RU['error'])
@@ -114,6 +112,7 @@ async def update_photo_handler(message: Message,
 async def check_message_for_photo(message: Message,
                                   bot: Bot,
                                   pool: asyncpg.pool.Pool,
+                                  group_registry: GroupRegistry,
                                   state: FSMContext):
 
     """
@@ -122,6 +121,7 @@ async def check_message_for_photo(message: Message,
     :param message: Сообщение от пользователя.
     :param bot: Объект Bot.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :param state: Состояние пользователя для FSM.
     :return: Функция ничего не возвращает.
     """
@@ -132,9 +132,9 @@ async def check_message_for_photo(message: Message,
 
         # Создаём объект фильтра
         translit_filter = TransliterationFilter(mode='add')
-        # Получаем категории, группы из БД
+        # Получаем категории из БД и группы из реестра групп
         categories = await get_categories_from_db(pool=pool)
-        groups_id = await get_groups_from_db(pool=pool)
+        groups_id = group_registry.groups_id
 
         # Получаем ID пользователя
         user_id = message.from_user.id
@@ -195,9 +195,6 @@ async def check_message_for_photo(message: Message,
     except DatabaseGetCategoriesError as e:
         logger.error(e)
         await message.answer(text=LEXICON_RU['error'])
-    except DatabaseGetGroupError as e:
-        logger.error(e)
-        await message.answer(text=LEXICON_RU['error'])
     except Exception as e:
         logger.error(f'Ошибка при получении фото на добавление в БД: {e}')
         await message.answer(text=LEXICON_RU['error'])
@@ -8,22 +8,15 @@ from aiogram import (
 from aiogram import filters
 from aiogram.fsm.context import FSMContext
 
-from bot_app.exceptions.database import (
-    DatabaseGetCategoriesError,
-    DatabaseGetGroupError
-)
+from bot_app.exceptions.database import DatabaseGetCategoriesError
 from bot_app.filters.check_chat_type import ChatTypeFilter
-from bot_app.keyboards.keyboards import (
-    create_categories_keyboard,
-    create_link_chanel_button
-)
+from bot_app.keyboards.keyboards import create_link_chanel_button
 from bot_app.lexicon.lexicon_common.lexicon_ru import LEXICON_RU
 from bot_app.utils.admin_check import check_is_admin
+from bot_app.utils.category_catalog import category_catalog
+from bot_app.utils.group_registry import GroupRegistry
 
-from config.database import (
-    get_groups_from_db,
-    get_categories_from_db
-)
+from config.database import get_categories_from_db
 from config.log import logger
 
 
@@ -59,13 +52,15 @@ async def cancel_handler(message: types.Message,
                              filters.Command('start'))
 async def start_command(message: types.Message,
                         bot: Bot,
-                        pool: asyncpg.pool.Pool):
+                        pool: asyncpg.pool.Pool,
+                        group_registry: GroupRegistry):
 
     """
     Хендлер, срабатывающий на команду /start с параметрами.
     :param message: Сообщение от пользователя с командой /start.
     :param bot:Объект Bot.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :return: Функция ничего не возвращает.
     """
 
@@ -73,9 +68,8 @@ async def start_command(message: types.Message,
         # Получаем данные о пользователе
         user_id = message.from_user.id
 
-        # Получаем группы из БД
-        groups_id = await get_groups_from_db(pool=pool)
-        logger.info(f'Успешное получение всех групп из БД.')
+        # Получаем группы из реестра групп
+        groups_id = group_registry.groups_id
 
         # Получаем категории из БД
         categories = await get_categories_from_db(pool=pool)
@@ -106,8 +100,6 @@ async def start_command(message: types.Message,
         else:
             await message.answer(text=text)
 
-    except DatabaseGetGroupError as e:
-        logger.error(e)
     except DatabaseGetCategoriesError as e:
         logger.error(e)
     except KeyError as e:
@@ -135,10 +127,11 @@ async def assembles_command(message: types.Message,
     try:
         # Устанавливаем флаг False для активации кнопок
         await state.update_data(cancel_handler=False)
-        # Получаем категории из БД
-        categories = await get_categories_from_db(pool=pool)
+        # Актуализируем каталог категорий (из БД загружается только после создания новой категории)
+        await get_categories_from_db(pool=pool)
 
-        keyboard = create_categories_keyboard(categories=categories)
+        # Получаем готовую клавиатуру с категориями из каталога
+        keyboard = category_catalog.keyboard
 
         # Отправляем пользователю кнопки с категориями
         await message.answer(
@@ -157,7 +150,8 @@ async def assembles_command(message: types.Message,
                              filters.Command('help'))
 async def help_command(message: types.Message,
                        bot: Bot,
-                       pool: asyncpg.pool.Pool
+                       pool: asyncpg.pool.Pool,
+                       group_registry: GroupRegistry
                        ):
 
     """
@@ -165,6 +159,7 @@ async def help_command(message: types.Message,
     :param message: Сообщение от пользователя с командой сборки.
     :param bot: Объект Bot.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :return: Функция ничего не возвращает.
     """
 
@@ -172,9 +167,8 @@ async def help_command(message: types.Message,
         # Получаем данные о пользователе
         user_id = message.from_user.id
 
-        # Получаем группы из БД
-        groups_id = await get_groups_from_db(pool=pool)
-        logger.info(f'Успешное получение всех групп из БД.')
+        # Получаем группы из реестра групп
+        groups_id = group_registry.groups_id
 
         # Получаем категории из БД
         categories = await get_categories_from_db(pool=pool)
@@ -201,9 +195,6 @@ async def help_command(message: types.Message,
         # Отправляем пользователю сообщение с помощью
         await message.answer(text=text)
 
-    except DatabaseGetGroupError as e:
-        logger.error(e)
-        await message.answer(LEXICON_RU['error'])
     except DatabaseGetCategoriesError as e:
         logger.error(e)
         await message.answer(LEXICON_RU['error'])
@@ -22,6 +22,8 @@ from bot_app.exceptions.database import (
 )
 from bot_app.keyboards.keyboards import create_link_button
 from bot_app.lexicon.lexicon_common.lexicon_ru import LEXICON_RU
+from bot_app.utils.admin_cache import admin_cache
+from bot_app.utils.group_registry import GroupRegistry
 
 from config.database import (
     add_group_to_db,
@@ -69,12 +71,14 @@ async def on_chat_joined(event: ChatMemberUpdated):
 
 @bot_group_joined_router.my_chat_member(ChatMemberUpdatedFilter(IS_MEMBER >> ADMINISTRATOR))
 async def on_chat_admin(event: ChatMemberUpdated,
-                        pool: asyncpg.pool.Pool):
+                        pool: asyncpg.pool.Pool,
+                        group_registry: GroupRegistry):
 
     """
     Хендлер, срабатывающий на предоставление боту прав админа в группе.
     :param event: Событие ChatMemberUpdated.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :return: Функция ничего не возвращает.
     """
 
@@ -90,7 +94,11 @@ async def on_chat_admin(event: ChatMemberUpdated,
                 group_id=group_id,
                 group_name=group_name
             )
+            # Добавляем группу в реестр групп
+            group_registry.add(group_id=group_id)
             logger.info(f'Группа {group_name} с ID {group_id} была добавлена в БД.')
+            # Сбрасываем закэшированные статусы пользователей в группе
+            admin_cache.invalidate_group(group_id=group_id)
             # Уведомляем пользователей в группе о том, что они могут взаимодействовать с ботом
             await event.answer(
                 text=LEXICON_RU['hello_group_join'],
@@ -107,6 +115,25 @@ async def on_chat_admin(event: ChatMemberUpdated,
         await event.answer(text=LEXICON_RU['error'])
 
 
+@bot_group_joined_router.chat_member()
+async def on_user_status_changed(event: ChatMemberUpdated):
+
+    """
+    Хендлер, срабатывающий на изменение статуса пользователя в группе.
+    :param event: Событие ChatMemberUpdated.
+    :return: Функция ничего не возвращает.
+    """
+
+    try:
+        # Сбрасываем закэшированный статус пользователя, чтобы следующая проверка запросила его у Telegram
+        admin_cache.invalidate(
+            user_id=event.new_chat_member.user.id,
+            group_id=event.chat.id
+        )
+    except Exception as e:
+        logger.error(f'Ошибка при сбросе статуса пользователя в группе: {e}')
+
+
 @bot_group_joined_router.message(F.text)
 async def on_bot_mention(message: Message,
                          bot: Bot):
@@ -140,12 +167,14 @@ async def on_bot_mention(message: Message,
 
 @bot_group_joined_router.my_chat_member(ChatMemberUpdatedFilter(IS_MEMBER >> IS_NOT_MEMBER))
 async def on_chat_member_updated(event: ChatMemberUpdated,
-                                 pool: asyncpg.pool.Pool):
+                                 pool: asyncpg.pool.Pool,
+                                 group_registry: GroupRegistry):
 
     """
     Хендлер, срабатывающий на событие, когда изменяется статус бота в группе.
     :param event: Объект для слежения за статусом в группе.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :return: Функция ничего не возвращает.
     """
 
@@ -161,7 +190,11 @@ async def on_chat_member_updated(event: ChatMemberUpdated,
                 pool=pool,
                 group_id=group_id
             )
+            # Удаляем группу из реестра групп
+            group_registry.discard(group_id=group_id)
             logger.info(f'Группа {group_name} с ID {group_id} была удалена из БД.')
+            # Сбрасываем закэшированные статусы пользователей в группе
+            admin_cache.invalidate_group(group_id=group_id)
     except DatabaseDeleteGroupError as e:
         logger.error(e)
     except Exception as e:
@@ -14,28 +14,27 @@ from aiogram.fsm.context import FSMContext
 from aiogram.utils.keyboard import InlineKeyboardMarkup
 
 from bot_app.exceptions.database import (
-    DatabaseGetGroupError,
     DatabaseGetPhotosError,
-    DatabaseGetTotalPhotosError,
     DatabaseGetFileIdByDescriptionError,
+    DatabaseGetPhotoByIdError,
     DatabaseSearchPhotoByDescriptionError,
     DatabaseGetCategoriesError
 )
 from bot_app.keyboards.keyboards import (
     create_paginated_keyboard,
-    create_categories_keyboard,
     create_admins_keyboard,
     create_assembl_buttons
 )
 from bot_app.lexicon.lexicon_common.lexicon_ru import LEXICON_RU
 from bot_app.states.user_states import (SearchPhotoState)
 from bot_app.utils.admin_check import check_is_admin
+from bot_app.utils.category_catalog import category_catalog
+from bot_app.utils.group_registry import GroupRegistry
 
 from config.database import (
-    get_groups_from_db,
     get_categories_from_db,
-    get_photos_from_db,
-    get_total_photos_count,
+    get_photos_page_from_db,
+    get_photo_by_id_from_db,
     get_photo_file_id_by_description_from_db,
     search_photo_by_description_in_db
 )
@@ -50,7 +49,8 @@ bot_user_handlers_router = Router(name='bot_user_handlers_router')
 async def search_photo_handler(message: Message,
                                state: FSMContext,
                                bot: Bot,
-                               pool: asyncpg.pool.Pool):
+                               pool: asyncpg.pool.Pool,
+                               group_registry: GroupRegistry):
 
     """
     Хендлер, срабатывающий по состоянию поиска фото из FSM.
@@ -58,14 +58,15 @@ async def search_photo_handler(message: Message,
     :param state: Состояние пользователя для FSM.
     :param bot: Объект Bot.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :return: Функция ничего не возвращает.
     """
     try:
         # Получаем ID пользователя
         user_id = message.from_user.id
 
-        # Получаем группы из БД
-        groups_id = await get_groups_from_db(pool=pool)
+        # Получаем группы из реестра групп
+        groups_id = group_registry.groups_id
 
         # Получаем категорию из словаря data
         data = await state.get_data()
@@ -124,9 +125,6 @@ async def search_photo_handler(message: Message,
             # Уведомляем пользователя о том, что ничего не найдено
             await message.answer(text=LEXICON_RU['photo_not_found'])
             return
-    except DatabaseGetGroupError as e:
-        logger.error(e)
-        await message.answer(text=LEXICON_RU['error'])
     except DatabaseSearchPhotoByDescriptionError as e:
         logger.error(e)
         await message.answer(text=LEXICON_RU['error'])
@@ -198,10 +196,11 @@ async def move_back_to_category_callback(callback: CallbackQuery,
         if not data.get('cancel_handler'):
             # Устанавливаем флаг False для активации кнопок
             await state.update_data(cancel_handler=False)
-            # Получаем категории из БД
-            categories = await get_categories_from_db(pool=pool)
+            # Актуализируем каталог категорий (из БД загружается только после создания новой категории)
+            await get_categories_from_db(pool=pool)
 
-            keyboard = create_categories_keyboard(categories=categories)
+            # Получаем готовую клавиатуру с категориями из каталога
+            keyboard = category_catalog.keyboard
 
             # Отправляем пользователю кнопки с категориями
             await callback.message.edit_text(
@@ -249,22 +248,16 @@ async def category_selection_callback(callback: CallbackQuery,
                 current_page=current_page
             )
 
-            # Получаем список сборок по категории и с пагинацией
-            assembl = await get_photos_from_db(
+            # Получаем первую страницу сборок и общее количество сборок по категории одним запросом
+            page = await get_photos_page_from_db(
                 pool=pool,
                 category=category,
-                limit=items_per_page,
-                offset=(current_page - 1) * items_per_page
-            )
-
-            # Получаем общее количество доступных сборок по данной категории
-            total_builds = await get_total_photos_count(
-                pool=pool,
-                category=category
+                limit=items_per_page
             )
+            assembl = page['photos']
 
             # Рассчитываем общее количество страниц
-            total_pages = math.ceil(total_builds / items_per_page)
+            total_pages = math.ceil(page['total'] / items_per_page)
 
             # Генерируем клавиатуру со сборками
             assembl_kb = create_assembl_buttons(assembl=assembl)
@@ -272,7 +265,9 @@ async def category_selection_callback(callback: CallbackQuery,
             # Генерируем клавиатуру с пагинацией
             pagination_kb = create_paginated_keyboard(
                 current_page=current_page,
-                total_pages=total_pages
+                total_pages=total_pages,
+                first_id=assembl[0]['id'] if assembl else None,
+                last_id=assembl[-1]['id'] if assembl else None
             )
 
             # Формируем сообщение с нумерацией сборок
@@ -307,9 +302,6 @@ async def category_selection_callback(callback: CallbackQuery,
     except DatabaseGetPhotosError as e:
         logger.error(e)
         await callback.message.answer(text=LEXICON_RU['error'])
-    except DatabaseGetTotalPhotosError as e:
-        logger.error(e)
-        await callback.message.answer(text=LEXICON_RU['error'])
     except Exception as e:
         logger.error(f'Ошибка при получении сборок по категории: {e}')
         await callback.message.answer(text=LEXICON_RU['error'])
@@ -333,13 +325,26 @@ async def process_pagination_callback(callback: CallbackQuery,
         data = await state.get_data()
         if not data.get('cancel_handler'):
 
-            # Извлекаем номер страницы
-            current_page = callback.data.split('_')[1]
-            if current_page == 'info':
+            # Извлекаем номер страницы, направление и id фотографии, от которой отсчитывается страница
+            page_data = callback.data.split('_')
+            if page_data[1] == 'info':
                 await callback.answer()
                 return
+            elif (len(page_data) == 4 and page_data[1].isdigit()
+                  and page_data[2] in ('prev', 'next') and page_data[3].isdigit()):
+                current_page = int(page_data[1])
+                direction = page_data[2]
+                cursor = int(page_data[3])
+            elif len(page_data) == 2 and page_data[1].isdigit():
+                # Кнопки старого формата (page_{номер}) открывают первую страницу
+                current_page = 1
+                direction = 'next'
+                cursor = None
             else:
-                current_page = int(current_page)
+                # Кнопка с повреждёнными данными (например, page_2_prev_None) не обрабатывается
+                logger.warning(f'Некорректные данные кнопки пагинации: {callback.data}')
+                await callback.answer()
+                return
 
             # Извлекаем категорию
             category = data.get('category')
@@ -347,22 +352,18 @@ async def process_pagination_callback(callback: CallbackQuery,
             # Задаём общее количество элементов на странице
             items_per_page = 6
 
-            # Получаем список сборок по категории и с пагинацией
-            assembl = await get_photos_from_db(
+            # Получаем страницу сборок и общее количество сборок по категории одним запросом
+            page = await get_photos_page_from_db(
                 pool=pool,
                 category=category,
                 limit=items_per_page,
-                offset=(current_page - 1) * items_per_page
-            )
-
-            # Получаем общее количество доступных сборок по данной категории
-            total_builds = await get_total_photos_count(
-                pool=pool,
-                category=category
+                cursor=cursor,
+                direction=direction
             )
+            assembl = page['photos']
 
             # Рассчитываем общее количество страниц
-            total_pages = math.ceil(total_builds / items_per_page)
+            total_pages = math.ceil(page['total'] / items_per_page)
 
             # Генерируем клавиатуру со сборками
             assembl_kb = create_assembl_buttons(assembl=assembl)
@@ -370,7 +371,9 @@ async def process_pagination_callback(callback: CallbackQuery,
             # Генерируем клавиатуру с пагинацией
             pagination_kb = create_paginated_keyboard(
                 current_page=current_page,
-                total_pages=total_pages
+                total_pages=total_pages,
+                first_id=assembl[0]['id'] if assembl else None,
+                last_id=assembl[-1]['id'] if assembl else None
             )
 
             # Формируем сообщение с нумерацией сборок
@@ -392,9 +395,6 @@ async def process_pagination_callback(callback: CallbackQuery,
     except DatabaseGetPhotosError as e:
         logger.error(e)
         await callback.message.answer(text=LEXICON_RU['error'])
-    except DatabaseGetTotalPhotosError as e:
-        logger.error(e)
-        await callback.message.answer(text=LEXICON_RU['error'])
     except Exception as e:
         logger.error(f'Ошибка при переходе на новую страницу: {e}')
         await callback.message.answer(text=LEXICON_RU['error'])
@@ -404,7 +404,8 @@ async def process_pagination_callback(callback: CallbackQuery,
 async def send_photo_handler(callback: CallbackQuery,
                              bot: Bot,
                              state: FSMContext,
-                             pool: asyncpg.pool.Pool):
+                             pool: asyncpg.pool.Pool,
+                             group_registry: GroupRegistry):
 
     """
     Хендлер, срабатывающий на переход по сборке.
@@ -412,6 +413,7 @@ async def send_photo_handler(callback: CallbackQuery,
     :param bot: Объект Bot.
     :param state: Состояние пользователя для FSM.
     :param pool: Пул соединения с БД.
+    :param group_registry: Реестр групп, в которых работает бот.
     :return: Функция ничего не возвращает.
     """
 
@@ -422,19 +424,34 @@ async def send_photo_handler(callback: CallbackQuery,
             # Получаем данные о пользователе
             user_id = callback.from_user.id
 
-            # Получаем группы из БД
-            groups_id = await get_groups_from_db(pool=pool)
-
-            caption = callback.data.replace("photo_", "")
+            # Получаем группы из реестра групп
+            groups_id = group_registry.groups_id
 
             # Получаем категорию из словаря data
             category = data.get('category')
 
-            # Получаем file_id из БД
-            photo_id = await get_photo_file_id_by_description_from_db(
-                pool=pool,
-                description=caption
-            )
+            photo_db_id = callback.data.replace('photo_id_', '', 1)
+            if callback.data.startswith('photo_id_') and photo_db_id.isdigit():
+                # Получаем file_id и описание по id фото (обычно из кэша фото)
+                photo = await get_photo_by_id_from_db(
+                    pool=pool,
+                    photo_db_id=int(photo_db_id)
+                )
+                if not photo:
+                    await callback.message.edit_text(text=LEXICON_RU['error'])
+                    return
+
+                photo_id = photo['photo_id']
+                caption = photo['description']
+            else:
+                # Кнопки старого формата (photo_{описание}) ищут фото по описанию
+                caption = callback.data.replace("photo_", "")
+
+                # Получаем file_id из БД
+                photo_id = await get_photo_file_id_by_description_from_db(
+                    pool=pool,
+                    description=caption
+                )
 
             if not photo_id:
                 await callback.message.edit_text(text=LEXICON_RU['error'])
@@ -481,7 +498,7 @@ async def send_photo_handler(callback: CallbackQuery,
         else:
             await callback.answer(text=LEXICON_RU['buttons_not_active'])
             return
-    except DatabaseGetGroupError as e:
+    except DatabaseGetPhotoByIdError as e:
         logger.error(e)
         await callback.message.answer(text=LEXICON_RU['error'])
     except DatabaseGetFileIdByDescriptionError as e:
@@ -8,6 +8,7 @@ from bot_app.lexicon.lexicon_common.lexicon_ru import (
     COMMANDS,
     LEXICON_RU
 )
+from bot_app.utils.keyboard_cache import keyboard_cache
 
 from config.config import (
     BOT_URL_FOR_START,
@@ -15,6 +16,7 @@ from config.config import (
 )
 
 
+@keyboard_cache.memoize(key=lambda: None)
 def create_link_button() -> InlineKeyboardMarkup:
 
     """
@@ -34,6 +36,7 @@ def create_link_button() -> InlineKeyboardMarkup:
     return kb_builder.as_markup()
 
 
+@keyboard_cache.memoize(key=lambda: None)
 def create_link_chanel_button() -> InlineKeyboardMarkup:
 
     """
@@ -53,6 +56,9 @@ def create_link_chanel_button() -> InlineKeyboardMarkup:
     return kb_builder.as_markup()
 
 
+@keyboard_cache.memoize(
+    key=lambda categories: tuple((category['name'], category['description']) for category in categories)
+)
 def create_categories_keyboard(categories: list[dict]) -> InlineKeyboardMarkup:
 
     """
@@ -80,13 +86,23 @@ def create_categories_keyboard(categories: list[dict]) -> InlineKeyboardMarkup:
     return kb_builder.as_markup()
 
 
+@keyboard_cache.memoize(
+    key=lambda current_page, total_pages, first_id=None, last_id=None: (current_page, total_pages, first_id, last_id)
+)
 def create_paginated_keyboard(current_page: int,
-                              total_pages: int) -> InlineKeyboardMarkup:
+                              total_pages: int,
+                              first_id: int | None = None,
+                              last_id: int | None = None) -> InlineKeyboardMarkup:
 
     """
     Генерирует инлайн-клавиатуру с пагинацией.
+    В callback_data кнопок передаётся номер страницы, направление и id фотографии, от которой
+    отсчитывается соседняя страница: page_{номер}_{prev|next}_{id}. Без id (пустая страница)
+    кнопка перехода не добавляется.
     :param current_page: Текущая страница.
     :param total_pages: Общее количество фото.
+    :param first_id: id первой фотографии на текущей странице.
+    :param last_id: id последней фотографии на текущей странице.
     :return: Возвращает объект инлайн-клавиатуры с кнопками пагинации.
     """
 
@@ -96,12 +112,12 @@ def create_paginated_keyboard(current_page: int,
     # Добавляем кнопки для пагинации
     pagination_buttons = []
 
-    # Проверяем, что мы не на первой странице
-    if current_page > 1:
+    # Проверяем, что мы не на первой странице и есть фотография, от которой отсчитывается предыдущая
+    if current_page > 1 and first_id is not None:
         # Добавляем кнопку "Предыдущая страница"
         pagination_buttons.append(InlineKeyboardButton(
             text='◀',
-            callback_data=f'page_{current_page - 1}')
+            callback_data=f'page_{current_page - 1}_prev_{first_id}')
         )
 
     # Вставляем информацию о странице как кнопку
@@ -110,12 +126,12 @@ def create_paginated_keyboard(current_page: int,
         callback_data="page_info")
     )
 
-    # Проверяем, что мы не на последней странице
-    if current_page < total_pages:
+    # Проверяем, что мы не на последней странице и есть фотография, от которой отсчитывается следующая
+    if current_page < total_pages and last_id is not None:
         # Добавляем кнопку "Следующая страница"
         pagination_buttons.append(InlineKeyboardButton(
             text='▶',
-            callback_data=f'page_{current_page + 1}')
+            callback_data=f'page_{current_page + 1}_next_{last_id}')
         )
 
     # Создаём клавиатуру
@@ -141,10 +157,12 @@ def create_paginated_keyboard(current_page: int,
     return kb_builder.as_markup()
 
 
+@keyboard_cache.memoize(key=lambda assembl: tuple((item['id'], item['description']) for item in assembl))
 def create_assembl_buttons(assembl: list[dict]) -> InlineKeyboardMarkup:
 
     """
     Генерирует инлайн-клавиатуру со сборками.
+    В callback_data передаётся id фотографии в БД, поэтому её размер не зависит от длины описания.
     :param assembl: Список со сборками.
     :return: Возвращает объект инлайн-клавиатуры.
     """
@@ -154,7 +172,7 @@ def create_assembl_buttons(assembl: list[dict]) -> InlineKeyboardMarkup:
     for item in assembl:
         buttons.button(
             text=item['description'],
-            callback_data=f'photo_{item["description"]}'
+            callback_data=f'photo_id_{item["id"]}'
         )
 
     buttons.adjust(2)
@@ -162,6 +180,7 @@ def create_assembl_buttons(assembl: list[dict]) -> InlineKeyboardMarkup:
     return buttons.as_markup()
 
 
+@keyboard_cache.memoize(key=lambda category: category)
 def create_admins_keyboard(category: str | None) -> InlineKeyboardMarkup:
 
     """
@@ -197,6 +216,7 @@ def create_admins_keyboard(category: str | None) -> InlineKeyboardMarkup:
     return kb_builder.as_markup()
 
 
+@keyboard_cache.memoize(key=lambda command: command)
 def create_admins_confirmation_keyboard(command: str) -> InlineKeyboardMarkup:
 
     """
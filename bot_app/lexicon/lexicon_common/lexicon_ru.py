@@ -71,6 +71,7 @@ LEXICON_RU: dict[str, str] = {
                       'Сообщите об этом администратору!',
     'buttons_not_active': '🚫 Кнопки неактивны!\n'
                           'отправьте новый запрос!',
+    'too_many_requests': '⏳ Слишком много нажатий, подождите немного!',
     'add_bot_in_group': '👋 Привет! Это чат-bot канала COMMANDOS.\n'
                         'Чтобы бот работал стабильно, '
                         'пожалуйста, сделайте его администратором со всеми правами в этой группе!',
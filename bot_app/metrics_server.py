@@ -0,0 +1,137 @@
+from typing import (
+    Callable,
+    Iterable
+)
+
+import asyncpg
+from aiohttp import web
+
+from bot_app.middlewares.rate_limiter import RateLimitMiddleware
+from bot_app.middlewares.throttling import ThrottlingMiddleware
+from bot_app.utils.admin_cache import admin_cache
+from bot_app.utils.keyboard_cache import keyboard_cache
+from bot_app.utils.metrics import (
+    MetricsRegistry,
+    Sample,
+    metrics as default_metrics
+)
+from bot_app.utils.photo_cache import photo_cache
+
+from config.config import (
+    METRICS_HOST,
+    METRICS_PORT,
+    METRICS_PATH
+)
+from config.log import (
+    logger,
+    queue_handler
+)
+from config.statements import statements
+
+
+# Кэши процесса, доля попаданий которых выводится в метриках
+CACHES = {
+    'admin': admin_cache,
+    'photo': photo_cache,
+    'keyboard': keyboard_cache
+}
+
+
+def runtime_collector(pool: asyncpg.pool.Pool | None = None,
+                      rate_limiter: RateLimitMiddleware | None = None,
+                      throttling: ThrottlingMiddleware | None = None) -> Callable[[], Iterable[Sample]]:
+
+    """
+    Создание сборщика текущих значений метрик: пула соединений, запросов к БД, кэшей
+    и ограничителей исходящих сообщений и нажатий кнопок.
+    :param pool: Пул соединения с БД (BotPool).
+    :param rate_limiter: Middleware ограничения исходящих сообщений.
+    :param throttling: Middleware ограничения нажатий кнопок.
+    :return: Возвращает функцию-сборщик для MetricsRegistry.add_collector.
+    """
+
+    def collect_runtime() -> Iterable[Sample]:
+        yield 'log_records_dropped_total', 'counter', {}, queue_handler.dropped
+
+        if pool is not None:
+            pool_stats = pool.stats()
+            yield 'db_pool_size', 'gauge', {}, pool_stats['size']
+            yield 'db_pool_max_size', 'gauge', {}, pool_stats['max_size']
+            yield 'db_pool_connections', 'gauge', {'state': 'in_use'}, pool_stats['in_use']
+            yield 'db_pool_connections', 'gauge', {'state': 'idle'}, pool_stats['idle']
+            yield 'db_pool_utilisation', 'gauge', {}, pool_stats['in_use'] / pool_stats['max_size']
+
+        for name, statement_stats in statements.stats().items():
+            yield 'db_statement_calls_total', 'counter', {'statement': name}, statement_stats['calls']
+            yield 'db_statement_errors_total', 'counter', {'statement': name}, statement_stats['errors']
+
+        for name, cache in CACHES.items():
+            cache_stats = cache.stats()
+            yield 'cache_size', 'gauge', {'cache': name}, cache_stats['size']
+            yield 'cache_hits_total', 'counter', {'cache': name}, cache_stats['hits']
+            yield 'cache_misses_total', 'counter', {'cache': name}, cache_stats['misses']
+            yield 'cache_hit_ratio', 'gauge', {'cache': name}, cache_stats['hit_ratio']
+            yield 'cache_evictions_total', 'counter', {'cache': name}, cache_stats['evictions']
+
+        if rate_limiter is not None:
+            limiter_stats = rate_limiter.stats()
+            yield 'telegram_outbound_requests_total', 'counter', {}, limiter_stats['requests']
+            yield 'telegram_outbound_throttled_total', 'counter', {}, limiter_stats['throttled']
+            yield 'telegram_outbound_retries_total', 'counter', {}, limiter_stats['retries']
+            yield 'telegram_outbound_queue', 'gauge', {}, limiter_stats['queued']
+
+        if throttling is not None:
+            throttling_stats = throttling.stats()
+            for result in ('processed', 'collapsed', 'rate_limited'):
+                yield 'callbacks_total', 'counter', {'result': result}, throttling_stats[result]
+
+    return collect_runtime
+
+
+def create_metrics_app(registry: MetricsRegistry = default_metrics,
+                       path: str = METRICS_PATH) -> web.Application:
+
+    """
+    Создание aiohttp-приложения, отдающего метрики в текстовом формате Prometheus.
+    :param registry: Реестр метрик.
+    :param path: Путь обработчика метрик.
+    :return: Возвращает объект aiohttp-приложения.
+    """
+
+    async def handle_metrics(request: web.Request) -> web.Response:
+        return web.Response(
+            body=registry.render().encode('utf-8'),
+            headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+        )
+
+    app = web.Application()
+    app.router.add_get(path, handle_metrics)
+
+    return app
+
+
+async def start_metrics_server(registry: MetricsRegistry = default_metrics) -> web.AppRunner:
+
+    """
+    Запуск сервера метрик на METRICS_HOST:METRICS_PORT.
+    :param registry: Реестр метрик.
+    :return: Возвращает AppRunner сервера, который нужно остановить через cleanup.
+    """
+
+    runner = web.AppRunner(create_metrics_app(registry=registry))
+    await runner.setup()
+
+    try:
+        site = web.TCPSite(
+            runner,
+            host=METRICS_HOST,
+            port=METRICS_PORT
+        )
+        await site.start()
+    except Exception:
+        await runner.cleanup()
+        raise
+
+    logger.info(f'Сервер метрик запущен на {METRICS_HOST}:{METRICS_PORT}{METRICS_PATH}')
+
+    return runner
@@ -9,22 +9,32 @@ from typing import (
     Awaitable
 )
 
+from bot_app.exceptions.database import DatabaseGetGroupError
+from bot_app.utils.group_registry import GroupRegistry
+
+from config.log import logger
+
 
 class DatabaseMiddleware(BaseMiddleware):
 
     """
-    Middleware для передачи pool в handlers.
+    Middleware для передачи pool и реестра групп в handlers.
+    Перед передачей реестр групп перечитывается из БД, если истекло его время жизни.
     """
 
-    def __init__(self, pool: asyncpg.pool.Pool):
+    def __init__(self,
+                 pool: asyncpg.pool.Pool,
+                 group_registry: GroupRegistry):
 
         """
         Инициализация middleware с пулом соединения с БД.
         :param pool: Пул соединений с БД.
+        :param group_registry: Реестр групп, в которых работает бот.
         """
 
         super().__init__()
         self.pool = pool
+        self.group_registry = group_registry
 
     async def __call__(self,
                        handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
@@ -39,7 +49,15 @@ class DatabaseMiddleware(BaseMiddleware):
         :return: Возвращает результат выполнения хендлера.
         """
 
-        # Добавление pool в data
+        # Реестр групп перечитывается из БД по истечении времени жизни
+        try:
+            await self.group_registry.refresh(pool=self.pool)
+        except DatabaseGetGroupError as e:
+            # Хендлеры продолжают работать с ранее загруженными группами
+            logger.error(e)
+
+        # Добавление pool и реестра групп в data
         data['pool'] = self.pool
+        data['group_registry'] = self.group_registry
 
         return await handler(event, data)
@@ -0,0 +1,63 @@
+from aiogram.dispatcher.middlewares.base import BaseMiddleware
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Update
+
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Awaitable
+)
+
+from bot_app.utils.buffered_fsm import BufferedFSMContext
+
+from config.log import logger
+
+
+class FSMUnitOfWorkMiddleware(BaseMiddleware):
+
+    """
+    Middleware, объединяющий все изменения FSM за время обработки обновления в одну запись.
+    Заменяет контекст FSM хендлеров на BufferedFSMContext и записывает изменения в хранилище
+    после завершения обработки обновления. При ошибке в хендлере изменения тоже записываются,
+    но ошибка записи только логируется, чтобы не подменить исходную ошибку хендлера.
+    Должен регистрироваться как внутренний middleware обновлений, чтобы контекст FSM уже был создан.
+    """
+
+    async def __call__(self,
+                       handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
+                       event: Update,
+                       data: Dict[str, Any]):
+
+        """
+        Переопределение метода __call__.
+        :param handler: Хендлер, который должен быть вызван.
+        :param event: Объект события Update.
+        :param data: Словарь данных, передаваемый в хендлер.
+        :return: Возвращает результат выполнения хендлера.
+        """
+
+        state: FSMContext | None = data.get('state')
+        if state is None:
+            return await handler(event, data)
+
+        # Состояние уже прочитано FSMContextMiddleware (raw_state), повторно из хранилища оно не читается
+        buffered_state = BufferedFSMContext(
+            storage=state.storage,
+            key=state.key,
+            raw_state=data['raw_state']
+        )
+        data['state'] = buffered_state
+
+        try:
+            result = await handler(event, data)
+        except Exception:
+            try:
+                await buffered_state.flush()
+            except Exception as e:
+                logger.error(f'Ошибка записи состояния FSM после ошибки в хендлере: {e}')
+            raise
+
+        await buffered_state.flush()
+
+        return result
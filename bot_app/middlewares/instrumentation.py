@@ -0,0 +1,203 @@
+import time
+
+from aiogram import (
+    Bot,
+    Router
+)
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType
+)
+from aiogram.dispatcher.middlewares.base import BaseMiddleware
+from aiogram.methods import (
+    Response,
+    TelegramMethod
+)
+from aiogram.methods.base import TelegramType
+from aiogram.types import (
+    TelegramObject,
+    Update
+)
+
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Awaitable
+)
+
+from bot_app.utils.metrics import (
+    MetricsRegistry,
+    current_router,
+    metrics as default_metrics
+)
+
+
+class InstrumentationMiddleware(BaseMiddleware):
+
+    """
+    Middleware, замеряющий время обработки обновлений и хендлеров.
+    Время обработки обновления учитывается в гистограмме update_seconds по типу обновления,
+    а после вызова setup - время каждого хендлера в гистограмме handler_seconds по роутеру и хендлеру.
+    На время работы хендлера имя роутера сохраняется в current_router, поэтому запросы к БД
+    и к Telegram Bot API, выполненные хендлером, учитываются с меткой его роутера.
+    """
+
+    def __init__(self,
+                 metrics: MetricsRegistry = default_metrics):
+
+        """
+        Инициализация middleware.
+        :param metrics: Реестр метрик.
+        """
+
+        super().__init__()
+        self.metrics = metrics
+
+    def setup(self,
+              router: Router) -> None:
+
+        """
+        Подключение замера времени хендлеров ко всем вложенным роутерам.
+        :param router: Корневой роутер (Dispatcher) с подключёнными роутерами хендлеров.
+        :return: Функция ничего не возвращает.
+        """
+
+        for sub_router in router.chain_tail:
+            if sub_router is router:
+                continue
+
+            handler_middleware = HandlerTimingMiddleware(
+                router_name=sub_router.name,
+                metrics=self.metrics
+            )
+            for event_name, observer in sub_router.observers.items():
+                if event_name != 'error':
+                    observer.middleware(handler_middleware)
+
+    async def __call__(self,
+                       handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
+                       event: Update,
+                       data: Dict[str, Any]):
+
+        """
+        Переопределение метода __call__.
+        :param handler: Хендлер, который должен быть вызван.
+        :param event: Объект события Update.
+        :param data: Словарь данных, передаваемый в хендлер.
+        :return: Возвращает результат выполнения хендлера.
+        """
+
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        finally:
+            self.metrics.observe(
+                'update_seconds',
+                time.perf_counter() - started,
+                type=event.event_type
+            )
+
+
+class HandlerTimingMiddleware(BaseMiddleware):
+
+    """
+    Middleware роутера, замеряющий время выполнения его хендлеров.
+    Подключается к роутерам через InstrumentationMiddleware.setup.
+    """
+
+    def __init__(self,
+                 router_name: str,
+                 metrics: MetricsRegistry = default_metrics):
+
+        """
+        Инициализация middleware.
+        :param router_name: Имя роутера.
+        :param metrics: Реестр метрик.
+        """
+
+        super().__init__()
+        self.router_name = router_name
+        self.metrics = metrics
+
+    async def __call__(self,
+                       handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+                       event: TelegramObject,
+                       data: Dict[str, Any]):
+
+        """
+        Переопределение метода __call__.
+        :param handler: Хендлер, который должен быть вызван.
+        :param event: Событие (Message, CallbackQuery, ...).
+        :param data: Словарь данных, передаваемый в хендлер.
+        :return: Возвращает результат выполнения хендлера.
+        """
+
+        handler_object = data.get('handler')
+        handler_name = getattr(handler_object.callback, '__name__', 'unknown') if handler_object else 'unknown'
+
+        token = current_router.set(self.router_name)
+        started = time.perf_counter()
+        status = 'ok'
+        try:
+            return await handler(event, data)
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            self.metrics.observe(
+                'handler_seconds',
+                time.perf_counter() - started,
+                router=self.router_name,
+                handler=handler_name,
+                status=status
+            )
+            current_router.reset(token)
+
+
+class APITimingMiddleware(BaseRequestMiddleware):
+
+    """
+    Middleware сессии бота, замеряющий время запросов к Telegram Bot API
+    в гистограмме telegram_api_seconds по методу, роутеру и результату.
+    Регистрируется после RateLimitMiddleware, чтобы не учитывать ожидание лимитов.
+    """
+
+    def __init__(self,
+                 metrics: MetricsRegistry = default_metrics):
+
+        """
+        Инициализация middleware.
+        :param metrics: Реестр метрик.
+        """
+
+        self.metrics = metrics
+
+    async def __call__(self,
+                       make_request: NextRequestMiddlewareType[TelegramType],
+                       bot: Bot,
+                       method: TelegramMethod[TelegramType]) -> Response[TelegramType]:
+
+        """
+        Выполнение запроса к Telegram с замером времени.
+        :param make_request: Следующий обработчик запроса в цепочке middleware сессии.
+        :param bot: Объект Bot.
+        :param method: Метод Telegram Bot API.
+        :return: Возвращает результат запроса.
+        """
+
+        started = time.perf_counter()
+        status = 'ok'
+        try:
+            return await make_request(bot, method)
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            self.metrics.observe(
+                'telegram_api_seconds',
+                time.perf_counter() - started,
+                method=method.__api_method__,
+                router=current_router.get(),
+                status=status
+            )
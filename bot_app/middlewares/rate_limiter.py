@@ -0,0 +1,180 @@
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import (
+    Response,
+    TelegramMethod
+)
+from aiogram.methods.base import TelegramType
+
+from bot_app.utils.cache import TTLCache
+from bot_app.utils.token_bucket import TokenBucket
+
+from config.config import (
+    TELEGRAM_GLOBAL_RATE,
+    TELEGRAM_GLOBAL_BURST,
+    TELEGRAM_CHAT_RATE,
+    TELEGRAM_CHAT_BURST,
+    TELEGRAM_GROUP_RATE,
+    TELEGRAM_GROUP_BURST,
+    TELEGRAM_MAX_RETRIES
+)
+from config.log import logger
+
+
+# Приоритеты запросов: ответы пользователям обслуживаются раньше сообщений в группы
+PRIORITY_INTERACTIVE = 0
+PRIORITY_GROUP = 1
+
+# Методы, отправляющие или изменяющие сообщения, на которые действуют лимиты Telegram
+LIMITED_METHOD_PREFIXES = ('send', 'edit', 'copy', 'forward')
+
+
+class RateLimitMiddleware(BaseRequestMiddleware):
+
+    """
+    Middleware сессии бота, ограничивающий частоту исходящих сообщений под лимиты Telegram.
+    Каждый запрос на отправку или изменение сообщения получает токен общего ограничителя
+    (~30 сообщений в секунду на бота) и ограничителя своего чата (~1 сообщение в секунду в личном чате,
+    ~20 сообщений в минуту в группе). Ответы пользователям имеют приоритет над сообщениями в группы.
+    При ответе TelegramRetryAfter на retry_after секунд приостанавливаются и чат, и весь бот
+    (Telegram не сообщает, какой из лимитов превышен), и запрос повторяется.
+    """
+
+    def __init__(self,
+                 global_rate: float = TELEGRAM_GLOBAL_RATE,
+                 global_burst: float = TELEGRAM_GLOBAL_BURST,
+                 chat_rate: float = TELEGRAM_CHAT_RATE,
+                 chat_burst: float = TELEGRAM_CHAT_BURST,
+                 group_rate: float = TELEGRAM_GROUP_RATE,
+                 group_burst: float = TELEGRAM_GROUP_BURST,
+                 max_retries: int = TELEGRAM_MAX_RETRIES,
+                 max_chats: int = 10000):
+
+        """
+        Инициализация middleware.
+        :param global_rate: Общее количество сообщений в секунду.
+        :param global_burst: Допустимый всплеск сообщений бота.
+        :param chat_rate: Количество сообщений в секунду в личный чат.
+        :param chat_burst: Допустимый всплеск сообщений в личный чат.
+        :param group_rate: Количество сообщений в секунду в группу.
+        :param group_burst: Допустимый всплеск сообщений в группу.
+        :param max_retries: Максимальное количество повторов запроса после TelegramRetryAfter.
+        :param max_chats: Максимальное количество чатов, для которых хранятся ограничители.
+        """
+
+        self.global_bucket = TokenBucket(
+            rate=global_rate,
+            capacity=global_burst
+        )
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.group_rate = group_rate
+        self.group_burst = group_burst
+        self.max_retries = max_retries
+        # chat_id -> ограничитель чата (ограничители неактивных чатов вытесняются)
+        self._chat_buckets = TTLCache(maxsize=max_chats)
+        # Статистика работы
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.wait_total = 0.0
+
+    def _chat_bucket(self,
+                     chat_id: int | str) -> TokenBucket:
+
+        """
+        Получение ограничителя чата.
+        :param chat_id: ID чата (отрицательный у групп) или @username канала.
+        :return: Возвращает ограничитель чата.
+        """
+
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            is_group = not isinstance(chat_id, int) or chat_id < 0
+            bucket = TokenBucket(
+                rate=self.group_rate if is_group else self.chat_rate,
+                capacity=self.group_burst if is_group else self.chat_burst
+            )
+            self._chat_buckets.set(chat_id, bucket)
+
+        return bucket
+
+    @staticmethod
+    def _priority(chat_id: int | str) -> int:
+
+        """
+        Определение приоритета запроса по чату.
+        :param chat_id: ID чата.
+        :return: Возвращает приоритет запроса.
+        """
+
+        if isinstance(chat_id, int) and chat_id > 0:
+            return PRIORITY_INTERACTIVE
+
+        return PRIORITY_GROUP
+
+    async def __call__(self,
+                       make_request: NextRequestMiddlewareType[TelegramType],
+                       bot: Bot,
+                       method: TelegramMethod[TelegramType]) -> Response[TelegramType]:
+
+        """
+        Выполнение запроса к Telegram с соблюдением лимитов.
+        :param make_request: Следующий обработчик запроса в цепочке middleware сессии.
+        :param bot: Объект Bot.
+        :param method: Метод Telegram Bot API.
+        :return: Возвращает результат запроса.
+        """
+
+        chat_id = getattr(method, 'chat_id', None)
+        if chat_id is None or not method.__api_method__.lower().startswith(LIMITED_METHOD_PREFIXES):
+            return await make_request(bot, method)
+
+        self.requests += 1
+        priority = self._priority(chat_id)
+        chat_bucket = self._chat_bucket(chat_id)
+
+        retries = 0
+        while True:
+            # Сначала ждём лимит чата, чтобы не занимать общий токен на время ожидания
+            wait = await chat_bucket.acquire(priority=priority)
+            wait += await self.global_bucket.acquire(priority=priority)
+            if wait > 0:
+                self.throttled += 1
+                self.wait_total += wait
+
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                if retries >= self.max_retries:
+                    raise
+
+                retries += 1
+                self.retries += 1
+                logger.warning(
+                    f'Превышен лимит Telegram для {method.__api_method__} в чате {chat_id}, '
+                    f'повтор через {e.retry_after} с ({retries}/{self.max_retries}).'
+                )
+                # Повтор дождётся окончания паузы на следующем получении токенов
+                chat_bucket.pause(seconds=e.retry_after)
+                self.global_bucket.pause(seconds=e.retry_after)
+
+    def stats(self) -> dict[str, int | float]:
+
+        """
+        Получение статистики ограничения запросов.
+        :return: Возвращает словарь с количеством ограниченных запросов, ожиданий, повторов и временем ожидания.
+        """
+
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'retries': self.retries,
+            'wait_avg_ms': self.wait_total / self.throttled * 1000 if self.throttled else 0.0,
+            'chats': len(self._chat_buckets),
+            'queued': self.global_bucket.waiting
+        }
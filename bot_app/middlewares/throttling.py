@@ -0,0 +1,178 @@
+import asyncio
+import itertools
+
+from aiogram.dispatcher.middlewares.base import BaseMiddleware
+from aiogram.exceptions import TelegramAPIError
+from aiogram.types import (
+    CallbackQuery,
+    Update
+)
+
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Awaitable
+)
+
+from bot_app.lexicon.lexicon_common.lexicon_ru import LEXICON_RU
+from bot_app.utils.cache import TTLCache
+from bot_app.utils.token_bucket import TokenBucket
+
+from config.config import (
+    THROTTLE_CALLBACK_RATE,
+    THROTTLE_CALLBACK_BURST
+)
+from config.log import logger
+
+
+class _CallbackSlot:
+
+    """
+    Очередь нажатий кнопок одного сообщения одним пользователем.
+    """
+
+    __slots__ = ('lock', 'latest', 'waiting')
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        # Порядковый номер последнего нажатия
+        self.latest = 0
+        # Количество нажатий, которые обрабатываются или ждут обработки
+        self.waiting = 0
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+
+    """
+    Middleware, защищающий бота от потока нажатий инлайн-кнопок.
+    Нажатия кнопок одного сообщения одним пользователем обрабатываются по одному, а нажатия,
+    пришедшие во время обработки предыдущего, схлопываются в последнее: промежуточные пропускаются.
+    Сверх лимита THROTTLE_CALLBACK_RATE нажатий в секунду на пользователя нажатия также пропускаются.
+    На пропущенные нажатия бот только отвечает на callback, без запросов к БД и изменения сообщений.
+    """
+
+    def __init__(self,
+                 rate: float = THROTTLE_CALLBACK_RATE,
+                 burst: float = THROTTLE_CALLBACK_BURST,
+                 max_users: int = 10000):
+
+        """
+        Инициализация middleware.
+        :param rate: Количество нажатий в секунду на пользователя.
+        :param burst: Допустимый всплеск нажатий пользователя.
+        :param max_users: Максимальное количество пользователей, для которых хранятся ограничители.
+        """
+
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        # user_id -> ограничитель нажатий пользователя
+        self._buckets = TTLCache(maxsize=max_users)
+        # (user_id, id сообщения) -> очередь нажатий
+        self._slots: dict[tuple[int, int | str | None], _CallbackSlot] = {}
+        self._seq = itertools.count(1)
+        # Статистика работы
+        self.processed = 0
+        self.collapsed = 0
+        self.rate_limited = 0
+
+    def _bucket(self,
+                user_id: int) -> TokenBucket:
+
+        """
+        Получение ограничителя нажатий пользователя.
+        :param user_id: ID пользователя.
+        :return: Возвращает ограничитель нажатий.
+        """
+
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=self.rate,
+                capacity=self.burst
+            )
+            self._buckets.set(user_id, bucket)
+
+        return bucket
+
+    @staticmethod
+    async def _answer(callback: CallbackQuery,
+                      text: str | None = None) -> None:
+
+        """
+        Ответ на пропущенное нажатие, чтобы у пользователя пропал индикатор загрузки на кнопке.
+        :param callback: CallbackQuery от пользователя.
+        :param text: Текст уведомления.
+        :return: Функция ничего не возвращает.
+        """
+
+        try:
+            await callback.answer(text=text)
+        except TelegramAPIError as e:
+            logger.warning(f'Не удалось ответить на пропущенное нажатие: {e}')
+
+    async def __call__(self,
+                       handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
+                       event: Update,
+                       data: Dict[str, Any]):
+
+        """
+        Переопределение метода __call__.
+        :param handler: Хендлер, который должен быть вызван.
+        :param event: Объект события Update.
+        :param data: Словарь данных, передаваемый в хендлер.
+        :return: Возвращает результат выполнения хендлера или None, если нажатие пропущено.
+        """
+
+        callback = event.callback_query
+        if callback is None:
+            return await handler(event, data)
+
+        user_id = callback.from_user.id
+        message_id = callback.message.message_id if callback.message else callback.inline_message_id
+        key = (user_id, message_id)
+
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _CallbackSlot()
+        seq = next(self._seq)
+        slot.latest = seq
+        slot.waiting += 1
+
+        try:
+            async with slot.lock:
+                # Пока ждали, пользователь нажал кнопку этого сообщения ещё раз
+                if slot.latest != seq:
+                    self.collapsed += 1
+                    await self._answer(callback)
+                    return None
+
+                if not self._bucket(user_id).try_acquire():
+                    self.rate_limited += 1
+                    await self._answer(
+                        callback,
+                        text=LEXICON_RU['too_many_requests']
+                    )
+                    return None
+
+                self.processed += 1
+                return await handler(event, data)
+        finally:
+            slot.waiting -= 1
+            if not slot.waiting:
+                del self._slots[key]
+
+    def stats(self) -> dict[str, int]:
+
+        """
+        Получение статистики обработки нажатий.
+        :return: Возвращает словарь с количеством обработанных и пропущенных нажатий.
+        """
+
+        return {
+            'processed': self.processed,
+            'collapsed': self.collapsed,
+            'rate_limited': self.rate_limited,
+            'users': len(self._buckets)
+        }
@@ -0,0 +1,120 @@
+from bot_app.utils.cache import TTLCache
+
+from config.config import (
+    ADMIN_CACHE_TTL,
+    ADMIN_CACHE_NEGATIVE_TTL,
+    ADMIN_CACHE_MAX_SIZE
+)
+
+
+class AdminStatusCache:
+
+    """
+    Класс кэша статуса администратора пользователя в группах.
+    """
+
+    def __init__(self,
+                 ttl: float,
+                 negative_ttl: float,
+                 maxsize: int):
+
+        """
+        Инициализация кэша статусов.
+        :param ttl: Время жизни записи о том, что пользователь администратор (в секундах).
+        :param negative_ttl: Время жизни записи о том, что пользователь не администратор (в секундах).
+        :param maxsize: Максимальное количество пар (user_id, group_id) в кэше.
+        """
+
+        self.negative_ttl = negative_ttl
+        self._cache = TTLCache(
+            maxsize=maxsize,
+            ttl=ttl
+        )
+
+    def get(self,
+            user_id: int,
+            group_id: int) -> bool | None:
+
+        """
+        Получение закэшированного статуса пользователя в группе.
+        :param user_id: ID пользователя.
+        :param group_id: ID группы.
+        :return: Возвращает True/False, если статус известен, и None, если его нужно запросить у Telegram.
+        """
+
+        return self._cache.get((user_id, group_id))
+
+    def set(self,
+            user_id: int,
+            group_id: int,
+            is_admin: bool) -> None:
+
+        """
+        Сохранение статуса пользователя в группе.
+        :param user_id: ID пользователя.
+        :param group_id: ID группы.
+        :param is_admin: Является ли пользователь администратором группы.
+        :return: Функция ничего не возвращает.
+        """
+
+        if is_admin:
+            self._cache.set((user_id, group_id), True)
+        else:
+            self._cache.set(
+                (user_id, group_id),
+                False,
+                ttl=self.negative_ttl
+            )
+
+    def invalidate(self,
+                   user_id: int,
+                   group_id: int) -> None:
+
+        """
+        Сброс статуса пользователя в группе.
+        :param user_id: ID пользователя.
+        :param group_id: ID группы.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._cache.delete((user_id, group_id))
+
+    def invalidate_group(self,
+                         group_id: int) -> int:
+
+        """
+        Сброс статусов всех пользователей в группе.
+        :param group_id: ID группы.
+        :return: Возвращает количество сброшенных записей.
+        """
+
+        return self._cache.delete_where(lambda key: key[1] == group_id)
+
+    def clear(self,
+              reset_stats: bool = False) -> None:
+
+        """
+        Полная очистка кэша.
+        :param reset_stats: Сбросить также счётчики кэша (по умолчанию они не сбрасываются).
+        :return: Функция ничего не возвращает.
+        """
+
+        self._cache.clear(reset_stats=reset_stats)
+
+    def stats(self) -> dict[str, int | float]:
+
+        """
+        Получение статистики кэша.
+        Каждое попадание - это один сэкономленный вызов get_chat_member.
+        :return: Возвращает словарь со статистикой кэша.
+        """
+
+        return self._cache.stats()
+
+
+# Кэш статусов администраторов для всего процесса бота
+admin_cache = AdminStatusCache(
+    ttl=ADMIN_CACHE_TTL,
+    negative_ttl=ADMIN_CACHE_NEGATIVE_TTL,
+    maxsize=ADMIN_CACHE_MAX_SIZE
+)
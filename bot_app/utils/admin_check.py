@@ -1,34 +1,137 @@
+import asyncio
+
 from aiogram import Bot
 from aiogram.exceptions import TelegramBadRequest
 
+from bot_app.utils.admin_cache import admin_cache
+
+from config.config import (
+    ADMIN_CHECK_CONCURRENCY,
+    ADMIN_CHECK_TIMEOUT
+)
 from config.log import logger
 
 
-async def check_is_admin(bot: Bot,
-                         user_id: int,
-                         groups_id: list[int]) -> bool:
+async def _fetch_is_admin(bot: Bot,
+                          user_id: int,
+                          group_id: int,
+                          semaphore: asyncio.Semaphore) -> bool:
 
     """
-    Проверка пользователя на то, что он является администратором в группах.
+    Запрос статуса пользователя в одной группе у Telegram.
     :param bot: Объект Bot.
     :param user_id: ID проверяемого пользователя.
-    :param groups_id: ID групп, в которых проверяется пользователь.
-    :return: Возвращает True, если пользователь является админом в группах и False, если не является.
+    :param group_id: ID группы, в которой проверяется пользователь.
+    :param semaphore: Семафор, ограничивающий количество одновременных запросов.
+    :return: Возвращает True, если пользователь является админом в группе и False, если не является.
     """
 
-    # Осуществляем проверку по каждой группе из БД
-    for group_id in groups_id:
+    async with semaphore:
         try:
             # Получаем информацию о пользователе в группе
             member = await bot.get_chat_member(
                 group_id,
                 user_id
             )
-            # Если пользователь администратор
-            if member.status in ['administrator', 'admin', 'creator']:
-                return True
         except TelegramBadRequest:
             logger.error('Ошибка проверки пользователя на администратора в группах.')
-            continue
+            return False
+
+    is_admin = member.status in ['administrator', 'admin', 'creator']
+    # Сохраняем статус пользователя в кэш
+    admin_cache.set(
+        user_id=user_id,
+        group_id=group_id,
+        is_admin=is_admin
+    )
+
+    return is_admin
+
+
+def _log_task_error(task: asyncio.Task) -> None:
+
+    """
+    Получение и логирование ошибки завершённой проверки группы.
+    Вызывается по завершении каждой задачи, в том числе завершившейся после того, как ответ уже получен,
+    поэтому ни одна ошибка не остаётся непрочитанной (Task exception was never retrieved).
+    :param task: Задача проверки пользователя в одной группе.
+    :return: Функция ничего не возвращает.
+    """
+
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f'Ошибка проверки пользователя на администратора в группе: {task.exception()!r}')
+
+
+async def check_is_admin(bot: Bot,
+                         user_id: int,
+                         groups_id: list[int]) -> bool:
+
+    """
+    Проверка пользователя на то, что он является администратором в группах.
+    Группы, отсутствующие в кэше, проверяются параллельно: первый положительный ответ
+    отменяет остальные запросы, а по истечении ADMIN_CHECK_TIMEOUT проверка прекращается.
+    Ошибка запроса в одной группе логируется и не прерывает проверку остальных групп.
+    :param bot: Объект Bot.
+    :param user_id: ID проверяемого пользователя.
+    :param groups_id: ID групп, в которых проверяется пользователь.
+    :return: Возвращает True, если пользователь является админом в группах и False, если не является.
+    """
+
+    # Группы, статус пользователя в которых отсутствует в кэше
+    missed_groups_id = []
+
+    # Сначала проверяем закэшированные статусы
+    for group_id in groups_id:
+        is_admin = admin_cache.get(
+            user_id=user_id,
+            group_id=group_id
+        )
+        if is_admin:
+            return True
+        if is_admin is None:
+            missed_groups_id.append(group_id)
+
+    if not missed_groups_id:
+        return False
+
+    # Запускаем проверку по всем группам, отсутствующим в кэше
+    semaphore = asyncio.Semaphore(ADMIN_CHECK_CONCURRENCY)
+    pending = {
+        asyncio.create_task(
+            _fetch_is_admin(
+                bot=bot,
+                user_id=user_id,
+                group_id=group_id,
+                semaphore=semaphore
+            )
+        )
+        for group_id in missed_groups_id
+    }
+    for task in pending:
+        task.add_done_callback(_log_task_error)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + ADMIN_CHECK_TIMEOUT
+
+    try:
+        while pending:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                logger.warning(f'Превышено время проверки пользователя {user_id} на администратора в группах.')
+                return False
+
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            # Если пользователь администратор хотя бы в одной группе
+            for task in done:
+                if task.exception() is None and task.result():
+                    return True
+    finally:
+        # Отменяем оставшиеся запросы
+        for task in pending:
+            task.cancel()
 
     return False
@@ -0,0 +1,174 @@
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseStorage,
+    StateType,
+    StorageKey
+)
+
+
+# Маркер ещё не прочитанного из хранилища значения
+_UNSET = object()
+
+
+class BufferedFSMContext(FSMContext):
+
+    """
+    Контекст FSM, накапливающий изменения состояния и данных в памяти в течение обработки одного обновления.
+    Данные читаются из хранилища не больше одного раза, состояние передаётся уже прочитанным FSMContextMiddleware,
+    а изменения записываются методом flush() в конце обработки обновления
+    (не больше одной записи состояния и одной записи данных).
+    Если данные только дополнялись (update_data), в хранилище передаются лишь изменённые ключи,
+    чтобы не затереть ключи, записанные за это время другим процессом.
+    """
+
+    def __init__(self,
+                 storage: BaseStorage,
+                 key: StorageKey,
+                 raw_state: Any = _UNSET):
+
+        """
+        Инициализация контекста.
+        :param storage: Хранилище состояний FSM.
+        :param key: Ключ FSM пользователя.
+        :param raw_state: Состояние, уже прочитанное из хранилища (raw_state из FSMContextMiddleware).
+        Если передано, состояние повторно из хранилища не читается.
+        """
+
+        super().__init__(
+            storage=storage,
+            key=key
+        )
+        self._state: Any = raw_state
+        self._data: Any = _UNSET
+        self._state_changed = False
+        self._data_changed = False
+        # Ключи, изменённые через update_data (None - данные заменены целиком через set_data)
+        self._data_updates: dict[str, Any] | None = {}
+
+    async def set_state(self,
+                        state: StateType = None) -> None:
+
+        """
+        Установка состояния без записи в хранилище (запись выполняет flush()).
+        :param state: Новое состояние пользователя.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._state = state.state if isinstance(state, State) else state
+        self._state_changed = True
+
+    async def get_state(self) -> str | None:
+
+        """
+        Получение состояния (из хранилища читается только при первом обращении, если оно не передано при создании).
+        :return: Возвращает текущее состояние пользователя.
+        """
+
+        if self._state is _UNSET:
+            self._state = await self.storage.get_state(key=self.key)
+
+        return self._state
+
+    async def set_data(self,
+                       data: dict[str, Any]) -> None:
+
+        """
+        Замена данных целиком без записи в хранилище (запись выполняет flush()).
+        :param data: Новые данные пользователя.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._data = dict(data)
+        self._data_changed = True
+        self._data_updates = None
+
+    async def get_data(self) -> dict[str, Any]:
+
+        """
+        Получение данных (из хранилища читаются только при первом обращении).
+        :return: Возвращает копию текущих данных пользователя.
+        """
+
+        if self._data is _UNSET:
+            self._data = dict(await self.storage.get_data(key=self.key))
+
+        return dict(self._data)
+
+    async def get_value(self,
+                        key: str,
+                        default: Any | None = None) -> Any | None:
+
+        """
+        Получение одного значения из данных.
+        :param key: Ключ значения.
+        :param default: Значение по умолчанию, если ключа нет в данных.
+        :return: Возвращает значение по ключу или значение по умолчанию.
+        """
+
+        data = await self.get_data()
+
+        return data.get(key, default)
+
+    async def update_data(self,
+                          data: dict[str, Any] | None = None,
+                          **kwargs: Any) -> dict[str, Any]:
+
+        """
+        Дополнение данных без записи в хранилище (запись выполняет flush()).
+        :param data: Словарь с новыми значениями.
+        :param kwargs: Новые значения в виде именованных аргументов.
+        :return: Возвращает копию данных пользователя после обновления.
+        """
+
+        if data:
+            kwargs.update(data)
+
+        current_data = await self.get_data()
+        current_data.update(kwargs)
+        self._data = current_data
+        self._data_changed = True
+        if self._data_updates is not None:
+            self._data_updates.update(kwargs)
+
+        return current_data.copy()
+
+    @property
+    def changed(self) -> bool:
+
+        """
+        Проверка наличия незаписанных изменений.
+        :return: Возвращает True, если состояние или данные изменялись после последней записи.
+        """
+
+        return self._state_changed or self._data_changed
+
+    async def flush(self) -> None:
+
+        """
+        Запись накопленных изменений в хранилище.
+        :return: Функция ничего не возвращает.
+        """
+
+        if self._state_changed:
+            await self.storage.set_state(
+                key=self.key,
+                state=self._state
+            )
+            self._state_changed = False
+
+        if self._data_changed:
+            if self._data_updates is None:
+                await self.storage.set_data(
+                    key=self.key,
+                    data=dict(self._data)
+                )
+            else:
+                await self.storage.update_data(
+                    key=self.key,
+                    data=dict(self._data_updates)
+                )
+            self._data_changed = False
+            self._data_updates = {}
@@ -0,0 +1,165 @@
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Hashable
+)
+
+
+# Маркер отсутствия значения в кэше (None может быть закэшированным значением)
+_MISSING = object()
+
+
+class TTLCache:
+
+    """
+    Класс LRU-кэша ограниченного размера с временем жизни записей.
+    """
+
+    def __init__(self,
+                 maxsize: int,
+                 ttl: float | None = None):
+
+        """
+        Инициализация кэша.
+        :param maxsize: Максимальное количество записей в кэше.
+        :param ttl: Время жизни записи в секундах по умолчанию (None - бессрочно).
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Словарь key -> (value, expires_at) в порядке последнего использования
+        self._data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        # Счётчики попаданий и промахов
+        self.hits = 0
+        self.misses = 0
+        # Счётчики записей, вытесненных при переполнении и удалённых по истечении времени жизни
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self,
+            key: Hashable,
+            default: Any = None) -> Any:
+
+        """
+        Получение значения из кэша.
+        :param key: Ключ записи.
+        :param default: Значение, возвращаемое при отсутствии записи.
+        :return: Возвращает закэшированное значение или default.
+        """
+
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            self.misses += 1
+            return default
+
+        value, expires_at = item
+        # Если время жизни записи истекло
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            self.expirations += 1
+            return default
+
+        # Отмечаем запись как последнюю использованную
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self,
+            key: Hashable,
+            value: Any,
+            ttl: float | None = _MISSING) -> None:
+
+        """
+        Добавление значения в кэш.
+        :param key: Ключ записи.
+        :param value: Значение для кэширования.
+        :param ttl: Время жизни записи в секундах (по умолчанию берётся из кэша).
+        :return: Функция ничего не возвращает.
+        """
+
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+
+        # Вытесняем самые старые записи при превышении размера
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self,
+               key: Hashable) -> None:
+
+        """
+        Удаление записи из кэша.
+        :param key: Ключ записи.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._data.pop(key, None)
+
+    def delete_where(self,
+                     predicate: Callable[[Hashable], bool]) -> int:
+
+        """
+        Удаление всех записей, ключи которых удовлетворяют условию.
+        :param predicate: Функция, принимающая ключ и возвращающая True для удаления записи.
+        :return: Возвращает количество удалённых записей.
+        """
+
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+
+        return len(keys)
+
+    def clear(self,
+              reset_stats: bool = False) -> None:
+
+        """
+        Полная очистка кэша. Счётчики отдаются в метриках как монотонные (counter),
+        поэтому по умолчанию они не сбрасываются.
+        :param reset_stats: Сбросить также счётчики попаданий, промахов, вытесненных и истёкших записей.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._data.clear()
+        if reset_stats:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self) -> dict[str, int | float]:
+
+        """
+        Получение статистики работы кэша.
+        :return: Возвращает словарь с размером кэша, количеством попаданий, промахов, долей попаданий
+        и количеством вытесненных и истёкших записей.
+        """
+
+        total = self.hits + self.misses
+
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return False
+        expires_at = item[1]
+        return expires_at is None or expires_at > time.monotonic()
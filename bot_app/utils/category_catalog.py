@@ -0,0 +1,114 @@
+import time
+
+from aiogram.utils.keyboard import InlineKeyboardMarkup
+
+from bot_app.keyboards.keyboards import create_categories_keyboard
+from bot_app.utils.keyboard_cache import keyboard_cache
+
+from config.config import CATEGORY_CATALOG_TTL
+
+
+class CategoryCatalog:
+
+    """
+    Класс каталога категорий, хранящий в памяти список категорий и готовую клавиатуру с ними.
+    Каталог считается актуальным, пока его версия не изменится при создании новой категории
+    и не истечёт время жизни: версия меняется только в процессе, создавшем категорию,
+    поэтому другие процессы бота перечитывают категории из БД по истечении ttl.
+    """
+
+    def __init__(self,
+                 ttl: float | None = CATEGORY_CATALOG_TTL):
+
+        """
+        Инициализация пустого каталога категорий.
+        :param ttl: Время жизни загруженных категорий в секундах (None - до изменения версии).
+        """
+
+        self.ttl = ttl
+        # Текущая версия категорий в БД
+        self.version = 0
+        # Версия, для которой загружены категории (None - категории не загружены)
+        self._loaded_version: int | None = None
+        # Время загрузки категорий (time.monotonic)
+        self._loaded_at = 0.0
+        self._categories: list[dict] = []
+        self._keyboard: InlineKeyboardMarkup | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+
+        """
+        Проверка актуальности каталога.
+        :return: Возвращает True, если категории загружены для текущей версии и время жизни не истекло.
+        """
+
+        if self._loaded_version != self.version:
+            return False
+
+        return self.ttl is None or time.monotonic() - self._loaded_at < self.ttl
+
+    @property
+    def categories(self) -> list[dict]:
+
+        """
+        Получение списка категорий из каталога.
+        :return: Возвращает список категорий.
+        """
+
+        return self._categories
+
+    @property
+    def keyboard(self) -> InlineKeyboardMarkup:
+
+        """
+        Получение клавиатуры с категориями, построенной один раз для загруженного списка.
+        :return: Возвращает объект инлайн-клавиатуры.
+        """
+
+        if self._keyboard is None:
+            self._keyboard = create_categories_keyboard(categories=self._categories)
+
+        return self._keyboard
+
+    def store(self,
+              categories: list[dict],
+              version: int) -> None:
+
+        """
+        Сохранение загруженных из БД категорий в каталог.
+        :param categories: Список категорий из БД.
+        :param version: Версия каталога на момент начала загрузки.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._categories = categories
+        self._keyboard = None
+        self._loaded_version = version
+        self._loaded_at = time.monotonic()
+
+    def bump(self) -> None:
+
+        """
+        Увеличение версии каталога после создания новой категории.
+        Вместе с версией сбрасываются клавиатуры, построенные для старого списка категорий.
+        :return: Функция ничего не возвращает.
+        """
+
+        self.version += 1
+        keyboard_cache.clear()
+
+    def clear(self) -> None:
+
+        """
+        Сброс каталога к пустому состоянию.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._categories = []
+        self._keyboard = None
+        self._loaded_version = None
+
+
+# Каталог категорий для всего процесса бота
+category_catalog = CategoryCatalog()
@@ -0,0 +1,118 @@
+import asyncio
+import time
+
+import asyncpg.pool
+
+from typing import Iterable
+
+from config.config import GROUP_REGISTRY_TTL
+from config.database import get_groups_from_db
+
+
+class GroupRegistry:
+
+    """
+    Класс для хранения в памяти ID групп, в которых работает бот.
+    Добавление и удаление групп видны сразу только в процессе, который их обработал,
+    поэтому по истечении ttl реестр перечитывается из БД (метод refresh).
+    """
+
+    def __init__(self,
+                 groups_id: Iterable[int] = (),
+                 ttl: float | None = GROUP_REGISTRY_TTL):
+
+        """
+        Инициализация реестра групп.
+        :param groups_id: ID групп для начального заполнения реестра.
+        :param ttl: Время жизни загруженных групп в секундах (None - без перезагрузки).
+        """
+
+        self._groups_id: set[int] = set(groups_id)
+        self.ttl = ttl
+        # Время загрузки групп (time.monotonic)
+        self._loaded_at = time.monotonic()
+        # Блокировка, чтобы одновременные обновления не перечитывали группы несколько раз
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def load(cls,
+                   pool: asyncpg.pool.Pool) -> 'GroupRegistry':
+
+        """
+        Создание реестра групп с загрузкой всех групп из БД.
+        :param pool: Пул соединения с БД.
+        :return: Возвращает заполненный реестр групп.
+        """
+
+        groups_id = await get_groups_from_db(pool=pool)
+
+        return cls(groups_id=groups_id)
+
+    @property
+    def is_fresh(self) -> bool:
+
+        """
+        Проверка актуальности реестра.
+        :return: Возвращает True, если время жизни загруженных групп не истекло.
+        """
+
+        return self.ttl is None or time.monotonic() - self._loaded_at < self.ttl
+
+    async def refresh(self,
+                      pool: asyncpg.pool.Pool) -> None:
+
+        """
+        Перезагрузка групп из БД, если истекло время жизни реестра.
+        :param pool: Пул соединения с БД.
+        :return: Функция ничего не возвращает.
+        """
+
+        if self.is_fresh:
+            return
+
+        async with self._lock:
+            # Группы могли перечитаться, пока ожидалась блокировка
+            if self.is_fresh:
+                return
+
+            groups_id = await get_groups_from_db(pool=pool)
+            self._groups_id = set(groups_id)
+            self._loaded_at = time.monotonic()
+
+    @property
+    def groups_id(self) -> list[int]:
+
+        """
+        Получение списка ID групп.
+        :return: Возвращает список ID групп.
+        """
+
+        return list(self._groups_id)
+
+    def add(self,
+            group_id: int) -> None:
+
+        """
+        Добавление группы в реестр.
+        :param group_id: ID группы из Telegram.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._groups_id.add(group_id)
+
+    def discard(self,
+                group_id: int) -> None:
+
+        """
+        Удаление группы из реестра.
+        :param group_id: ID группы из Telegram.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._groups_id.discard(group_id)
+
+    def __len__(self) -> int:
+        return len(self._groups_id)
+
+    def __contains__(self, group_id: int) -> bool:
+        return group_id in self._groups_id
@@ -0,0 +1,88 @@
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Hashable
+)
+
+from aiogram.utils.keyboard import InlineKeyboardMarkup
+
+from bot_app.utils.cache import TTLCache
+
+from config.config import KEYBOARD_CACHE_MAX_SIZE
+
+
+class KeyboardCache:
+
+    """
+    Класс кэша готовых инлайн-клавиатур.
+    Клавиатура строится один раз для набора входных данных (список категорий, номер страницы,
+    название категории и т.д.) и затем переиспользуется. Готовые клавиатуры общие для всех
+    пользователей, поэтому их нельзя изменять после получения из кэша.
+    Кэш сбрасывается при изменении версии каталога категорий.
+    """
+
+    def __init__(self,
+                 maxsize: int):
+
+        """
+        Инициализация кэша клавиатур.
+        :param maxsize: Максимальное количество клавиатур в кэше.
+        """
+
+        self._cache = TTLCache(maxsize=maxsize)
+
+    def memoize(self,
+                key: Callable[..., Hashable]) -> Callable[[Callable[..., InlineKeyboardMarkup]],
+                                                          Callable[..., InlineKeyboardMarkup]]:
+
+        """
+        Декоратор функции построения клавиатуры, кэширующий её результат.
+        Функция без кэша доступна через атрибут __wrapped__ декорированной функции.
+        :param key: Функция, принимающая аргументы функции построения и возвращающая ключ клавиатуры.
+        :return: Возвращает декоратор.
+        """
+
+        def decorator(build: Callable[..., InlineKeyboardMarkup]) -> Callable[..., InlineKeyboardMarkup]:
+
+            @wraps(build)
+            def wrapper(*args: Any, **kwargs: Any) -> InlineKeyboardMarkup:
+                cache_key = (build.__name__, key(*args, **kwargs))
+
+                keyboard = self._cache.get(cache_key)
+                if keyboard is None:
+                    keyboard = build(*args, **kwargs)
+                    self._cache.set(cache_key, keyboard)
+
+                return keyboard
+
+            return wrapper
+
+        return decorator
+
+    def clear(self,
+              reset_stats: bool = False) -> None:
+
+        """
+        Полная очистка кэша.
+        :param reset_stats: Сбросить также счётчики кэша (по умолчанию они не сбрасываются).
+        :return: Функция ничего не возвращает.
+        """
+
+        self._cache.clear(reset_stats=reset_stats)
+
+    def stats(self) -> dict[str, int | float]:
+
+        """
+        Получение статистики работы кэша.
+        :return: Возвращает словарь со статистикой кэша.
+        """
+
+        return self._cache.stats()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# Кэш клавиатур для всего процесса бота
+keyboard_cache = KeyboardCache(maxsize=KEYBOARD_CACHE_MAX_SIZE)
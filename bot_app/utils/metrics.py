@@ -0,0 +1,375 @@
+import bisect
+import functools
+import time
+
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator
+)
+
+from config.log import logger
+
+
+# Границы интервалов гистограмм времени (в секундах)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Метрика, собираемая в момент запроса метрик: (имя, тип gauge/counter, метки, значение)
+Sample = tuple[str, str, dict[str, Any], float]
+
+# Имя роутера, хендлер которого сейчас обрабатывает обновление (задаётся middleware инструментирования)
+current_router: ContextVar[str] = ContextVar('current_router', default='none')
+
+
+class Histogram:
+
+    """
+    Класс гистограммы значений с фиксированными границами интервалов (как histogram в Prometheus).
+    """
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'max')
+
+    def __init__(self,
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+
+        """
+        Инициализация пустой гистограммы.
+        :param buckets: Возрастающие верхние границы интервалов.
+        """
+
+        self.buckets = buckets
+        # Количество значений в каждом интервале, последний - выше всех границ
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self,
+                value: float) -> None:
+
+        """
+        Учёт одного значения.
+        :param value: Значение (для времени - в секундах).
+        :return: Функция ничего не возвращает.
+        """
+
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> Iterator[tuple[float, int]]:
+
+        """
+        Получение накопленного количества значений по границам интервалов.
+        :return: Возвращает пары (верхняя граница, количество значений не больше неё), последняя граница - inf.
+        """
+
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            yield bound, total
+
+    def quantile(self,
+                 q: float) -> float:
+
+        """
+        Оценка квантиля по гистограмме (верхняя граница интервала, в который попадает квантиль).
+        :param q: Квантиль от 0 до 1.
+        :return: Возвращает оценку квантиля или 0, если значений нет.
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return min(bound, self.max)
+
+        return self.max
+
+    def stats(self) -> dict[str, int | float]:
+
+        """
+        Получение сводки гистограммы.
+        :return: Возвращает словарь с количеством значений, средним, p50, p95, p99 и максимумом (в миллисекундах).
+        """
+
+        return {
+            'count': self.count,
+            'avg_ms': self.sum / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.quantile(0.5) * 1000,
+            'p95_ms': self.quantile(0.95) * 1000,
+            'p99_ms': self.quantile(0.99) * 1000,
+            'max_ms': self.max * 1000
+        }
+
+
+class MetricsRegistry:
+
+    """
+    Класс реестра метрик процесса: гистограмм и счётчиков с метками.
+    Текущие значения (размер пула, статистика кэшей) собираются функциями-сборщиками в момент запроса метрик.
+    Метрики можно получить словарём (dump) или текстом в формате Prometheus (render).
+    """
+
+    def __init__(self):
+
+        """
+        Инициализация пустого реестра.
+        """
+
+        # (имя, метки) -> гистограмма
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+        # (имя, метки) -> значение счётчика
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        # Функции, возвращающие текущие значения метрик
+        self._collectors: list[Callable[[], Iterable[Sample]]] = []
+        # Имя метрики -> описание
+        self._help: dict[str, str] = {}
+
+    def describe(self,
+                 name: str,
+                 text: str) -> None:
+
+        """
+        Добавление описания метрики (выводится в HELP формата Prometheus).
+        :param name: Имя метрики.
+        :param text: Описание метрики.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._help[name] = text
+
+    def observe(self,
+                name: str,
+                value: float,
+                **labels: Any) -> None:
+
+        """
+        Учёт значения в гистограмме.
+        :param name: Имя гистограммы.
+        :param value: Значение (для времени - в секундах).
+        :param labels: Метки значения.
+        :return: Функция ничего не возвращает.
+        """
+
+        key = (name, _labels_key(labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def inc(self,
+            name: str,
+            value: float = 1,
+            **labels: Any) -> None:
+
+        """
+        Увеличение счётчика.
+        :param name: Имя счётчика.
+        :param value: Величина увеличения.
+        :param labels: Метки счётчика.
+        :return: Функция ничего не возвращает.
+        """
+
+        key = (name, _labels_key(labels))
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def add_collector(self,
+                      collector: Callable[[], Iterable[Sample]]) -> None:
+
+        """
+        Добавление функции, собирающей текущие значения метрик в момент запроса метрик.
+        :param collector: Функция без аргументов, возвращающая метрики (имя, тип, метки, значение).
+        :return: Функция ничего не возвращает.
+        """
+
+        self._collectors.append(collector)
+
+    def collect(self) -> list[tuple[str, str, tuple[tuple[str, str], ...], float]]:
+
+        """
+        Сбор текущих значений метрик всеми сборщиками.
+        Ошибка одного сборщика не мешает получить остальные метрики.
+        :return: Возвращает список метрик (имя, тип, метки, значение).
+        """
+
+        samples = []
+        for collector in self._collectors:
+            try:
+                for name, kind, labels, value in collector():
+                    samples.append((name, kind, _labels_key(labels), value))
+            except Exception as e:
+                logger.error(f'Ошибка сбора метрик {getattr(collector, "__name__", collector)}: '
+                             f'{type(e).__name__}: {e}')
+
+        return sorted(samples)
+
+    def histogram(self,
+                  name: str,
+                  **labels: Any) -> Histogram | None:
+
+        """
+        Получение гистограммы по имени и меткам.
+        :param name: Имя гистограммы.
+        :param labels: Метки гистограммы.
+        :return: Возвращает гистограмму или None, если значений ещё не было.
+        """
+
+        return self._histograms.get((name, _labels_key(labels)))
+
+    def counter(self,
+                name: str,
+                **labels: Any) -> float:
+
+        """
+        Получение значения счётчика по имени и меткам.
+        :param name: Имя счётчика.
+        :param labels: Метки счётчика.
+        :return: Возвращает значение счётчика (0, если счётчик не увеличивался).
+        """
+
+        return self._counters.get((name, _labels_key(labels)), 0)
+
+    def dump(self) -> dict[str, list[dict]]:
+
+        """
+        Получение всех метрик.
+        :return: Возвращает словарь имя метрики -> список записей с метками и сводкой гистограммы или значением счётчика.
+        """
+
+        result: dict[str, list[dict]] = {}
+        for (name, labels), histogram in sorted(self._histograms.items()):
+            result.setdefault(name, []).append({**dict(labels), **histogram.stats()})
+        for (name, labels), value in sorted(self._counters.items()):
+            result.setdefault(name, []).append({**dict(labels), 'value': value})
+        for name, _, labels, value in self.collect():
+            result.setdefault(name, []).append({**dict(labels), 'value': value})
+
+        return result
+
+    def render(self) -> str:
+
+        """
+        Получение всех метрик в текстовом формате Prometheus.
+        :return: Возвращает текст метрик.
+        """
+
+        lines = []
+        described = set()
+
+        def header(name: str,
+                   kind: str) -> None:
+            if name not in described:
+                described.add(name)
+                if name in self._help:
+                    lines.append(f'# HELP {name} {self._help[name]}')
+                lines.append(f'# TYPE {name} {kind}')
+
+        for (name, labels), histogram in sorted(self._histograms.items()):
+            header(name, 'histogram')
+            for bound, total in histogram.cumulative():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{name}_bucket{_format_labels(labels + (("le", le),))} {total}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {histogram.sum!r}')
+            lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+
+        for (name, labels), value in sorted(self._counters.items()):
+            header(name, 'counter')
+            lines.append(f'{name}{_format_labels(labels)} {value!r}')
+
+        for name, kind, labels, value in self.collect():
+            header(name, kind)
+            lines.append(f'{name}{_format_labels(labels)} {float(value)!r}')
+
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+
+        """
+        Очистка всех метрик.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._histograms.clear()
+        self._counters.clear()
+        self._collectors.clear()
+
+
+def _labels_key(labels: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+
+    """
+    Приведение меток метрики к ключу реестра.
+    :param labels: Словарь меток.
+    :return: Возвращает отсортированные пары (имя метки, значение).
+    """
+
+    return tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+
+    """
+    Форматирование меток метрики для формата Prometheus.
+    :param labels: Пары (имя метки, значение).
+    :return: Возвращает строку вида {name="value",...} или пустую строку, если меток нет.
+    """
+
+    if not labels:
+        return ''
+
+    def escape(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+    return '{' + ','.join(f'{label}="{escape(value)}"' for label, value in labels) + '}'
+
+
+def timed_db_call(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+
+    """
+    Декоратор функции работы с БД, учитывающий время и количество её вызовов
+    в гистограмме db_call_seconds с метками функции, роутера и результата,
+    а ошибки - в счётчике db_errors_total по классу исключения (bot_app/exceptions/database.py).
+    :param func: Асинхронная функция работы с БД.
+    :return: Возвращает обёрнутую функцию.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        status = 'ok'
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            status = type(e).__name__
+            metrics.inc(
+                'db_errors_total',
+                function=func.__name__,
+                exception=status
+            )
+            raise
+        finally:
+            metrics.observe(
+                'db_call_seconds',
+                time.perf_counter() - started,
+                function=func.__name__,
+                router=current_router.get(),
+                status=status
+            )
+
+    return wrapper
+
+
+# Реестр метрик для всего процесса бота
+metrics = MetricsRegistry()
+metrics.describe('update_seconds', 'Время обработки обновления Telegram по типу обновления.')
+metrics.describe('handler_seconds', 'Время выполнения хендлера по роутеру и хендлеру.')
+metrics.describe('db_call_seconds', 'Время вызова функции config/database.py по функции, роутеру и результату.')
+metrics.describe('db_errors_total', 'Количество ошибок функций config/database.py по функции и классу исключения.')
+metrics.describe('db_pool_acquire_seconds', 'Время ожидания соединения из пула БД по роутеру.')
+metrics.describe('telegram_api_seconds', 'Время запроса к Telegram Bot API по методу, роутеру и результату.')
@@ -0,0 +1,247 @@
+from typing import (
+    Iterable,
+    Mapping
+)
+
+from bot_app.utils.cache import TTLCache
+from bot_app.utils.search_index import normalize_query
+
+from config.config import (
+    PHOTO_CACHE_TTL,
+    PHOTO_CACHE_MAX_SIZE,
+    PHOTO_SEARCH_CACHE_TTL
+)
+
+
+class PhotoCache:
+
+    """
+    Класс кэша file_id и описаний фото, общего для хендлеров пользователей и администраторов.
+    Фото кэшируются по id в БД (кнопки сборок), по описанию (file_id для описания)
+    и по file_id (описание для file_id), а также кэшируются результаты поиска в БД.
+    Все записи хранятся в одном LRU-кэше, поэтому размер кэша ограничен общим maxsize.
+    Сброс записей после изменения фото не просматривает весь кэш: ключи записей фото
+    запоминаются по его file_id, а результаты поиска сбрасываются сменой поколения в их ключах.
+    """
+
+    def __init__(self,
+                 ttl: float,
+                 maxsize: int,
+                 search_ttl: float = PHOTO_SEARCH_CACHE_TTL):
+
+        """
+        Инициализация кэша фото.
+        :param ttl: Время жизни записи (в секундах).
+        :param maxsize: Максимальное количество записей в кэше.
+        :param search_ttl: Время жизни результата поиска (в секундах).
+        """
+
+        # Ключи записей - кортежи вида ('id', id), ('description', описание),
+        # ('file_id', file_id) и ('search', поколение, категория, запрос)
+        self._cache = TTLCache(
+            maxsize=maxsize,
+            ttl=ttl
+        )
+        self.search_ttl = search_ttl
+        # Поколение результатов поиска: записи прошлых поколений недоступны и вытесняются из кэша
+        self._search_generation = 0
+        # file_id -> ключи записей этого фото
+        self._photo_keys: dict[str, set[tuple]] = {}
+        # Размер словаря ключей, при котором из него удаляются ключи вытесненных записей
+        self._prune_at = maxsize
+
+    def _store(self,
+               key: tuple,
+               photo: dict) -> None:
+
+        """
+        Сохранение записи фото в кэш с запоминанием её ключа по file_id.
+        :param key: Ключ записи.
+        :param photo: Словарь с photo_id (file_id) и description.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._cache.set(key, photo)
+        self._photo_keys.setdefault(photo['photo_id'], set()).add(key)
+
+        # Ключи вытесненных и истёкших записей удаляются, когда словарь вырастает вдвое
+        if len(self._photo_keys) > self._prune_at:
+            self._photo_keys = {
+                photo_id: live_keys
+                for photo_id, keys in self._photo_keys.items()
+                if (live_keys := {key for key in keys if key in self._cache})
+            }
+            self._prune_at = max(self._cache.maxsize, 2 * len(self._photo_keys))
+
+    def get(self,
+            photo_db_id: int) -> dict | None:
+
+        """
+        Получение закэшированного фото по id в БД.
+        :param photo_db_id: id фото в БД.
+        :return: Возвращает словарь с photo_id (file_id) и description или None, если фото нет в кэше.
+        """
+
+        return self._cache.get(('id', photo_db_id))
+
+    def set(self,
+            photo_db_id: int,
+            photo_id: str,
+            description: str) -> None:
+
+        """
+        Сохранение фото в кэш по id в БД.
+        :param photo_db_id: id фото в БД.
+        :param photo_id: file_id фото в Telegram.
+        :param description: Описание фото.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._store(
+            ('id', photo_db_id),
+            {
+                'photo_id': photo_id,
+                'description': description
+            }
+        )
+
+    def store_many(self,
+                   photos: Iterable[Mapping]) -> None:
+
+        """
+        Сохранение в кэш списка фото (страницы или результата поиска).
+        :param photos: Записи с полями id, photo_id и description.
+        :return: Функция ничего не возвращает.
+        """
+
+        for photo in photos:
+            if photo.get('id') is not None:
+                self.set(
+                    photo_db_id=photo['id'],
+                    photo_id=photo['photo_id'],
+                    description=photo['description']
+                )
+
+    def get_file_id(self,
+                    description: str) -> str | None:
+
+        """
+        Получение закэшированного file_id фото по его описанию.
+        :param description: Описание фото.
+        :return: Возвращает file_id или None, если фото нет в кэше.
+        """
+
+        photo = self._cache.get(('description', description))
+
+        return photo['photo_id'] if photo is not None else None
+
+    def get_description(self,
+                        photo_id: str) -> str | None:
+
+        """
+        Получение закэшированного описания фото по его file_id.
+        :param photo_id: file_id фото в Telegram.
+        :return: Возвращает описание или None, если фото нет в кэше.
+        """
+
+        photo = self._cache.get(('file_id', photo_id))
+
+        return photo['description'] if photo is not None else None
+
+    def remember(self,
+                 photo_id: str,
+                 description: str) -> None:
+
+        """
+        Сохранение в кэш соответствия file_id и описания фото в обе стороны.
+        :param photo_id: file_id фото в Telegram.
+        :param description: Описание фото.
+        :return: Функция ничего не возвращает.
+        """
+
+        photo = {
+            'photo_id': photo_id,
+            'description': description
+        }
+        self._store(('description', description), photo)
+        self._store(('file_id', photo_id), photo)
+
+    def get_search(self,
+                   category: str,
+                   query: str) -> list[dict] | None:
+
+        """
+        Получение закэшированного результата поиска фото.
+        :param category: Категория для поиска.
+        :param query: Поисковой запрос.
+        :return: Возвращает копию списка найденных фото или None, если результата нет в кэше.
+        """
+
+        photos = self._cache.get(('search', self._search_generation, category, normalize_query(query)))
+
+        return list(photos) if photos is not None else None
+
+    def set_search(self,
+                   category: str,
+                   query: str,
+                   photos: list[dict]) -> None:
+
+        """
+        Сохранение результата поиска фото в кэш на время search_ttl.
+        :param category: Категория для поиска.
+        :param query: Поисковой запрос.
+        :param photos: Список найденных фото.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._cache.set(
+            ('search', self._search_generation, category, normalize_query(query)),
+            list(photos),
+            ttl=self.search_ttl
+        )
+
+    def invalidate(self,
+                   photo_id: str) -> None:
+
+        """
+        Удаление записей фото из кэша по его file_id после добавления, изменения или удаления фото.
+        Результаты поиска сбрасываются полностью, так как изменение фото может изменить любой из них.
+        :param photo_id: file_id фото в Telegram.
+        :return: Функция ничего не возвращает.
+        """
+
+        for key in self._photo_keys.pop(photo_id, ()):
+            self._cache.delete(key)
+        self._search_generation += 1
+
+    def clear(self,
+              reset_stats: bool = False) -> None:
+
+        """
+        Полная очистка кэша.
+        :param reset_stats: Сбросить также счётчики кэша (по умолчанию они не сбрасываются).
+        :return: Функция ничего не возвращает.
+        """
+
+        self._cache.clear(reset_stats=reset_stats)
+        self._photo_keys.clear()
+        self._prune_at = self._cache.maxsize
+
+    def stats(self) -> dict[str, int | float]:
+
+        """
+        Получение статистики работы кэша (размер, доля попаданий, количество вытесненных записей).
+        :return: Возвращает словарь со статистикой кэша.
+        """
+
+        return self._cache.stats()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# Кэш фото для всего процесса бота
+photo_cache = PhotoCache(
+    ttl=PHOTO_CACHE_TTL,
+    maxsize=PHOTO_CACHE_MAX_SIZE
+)
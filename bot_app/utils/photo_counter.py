@@ -0,0 +1,98 @@
+import time
+
+from config.config import PHOTO_COUNTER_TTL
+
+
+class PhotoCounter:
+
+    """
+    Класс для хранения в памяти количества фотографий в каждой категории.
+    Счётчики изменяются только при добавлении и удалении фото в этом процессе, поэтому
+    по истечении времени жизни количество подсчитывается в БД заново (фото могли изменить другие процессы бота).
+    """
+
+    def __init__(self,
+                 ttl: float | None = PHOTO_COUNTER_TTL):
+
+        """
+        Инициализация пустого счётчика.
+        :param ttl: Время жизни подсчитанного количества в секундах (None - бессрочно).
+        """
+
+        self.ttl = ttl
+        # Словарь категория -> (количество, время истечения)
+        self._counts: dict[str, tuple[int, float | None]] = {}
+
+    def get(self,
+            category: str) -> int | None:
+
+        """
+        Получение количества фотографий в категории.
+        :param category: Название категории.
+        :return: Возвращает количество фотографий или None, если оно ещё не подсчитано или устарело.
+        """
+
+        item = self._counts.get(category)
+        if item is None:
+            return None
+
+        count, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._counts[category]
+            return None
+
+        return count
+
+    def set(self,
+            category: str,
+            count: int) -> None:
+
+        """
+        Сохранение подсчитанного в БД количества фотографий в категории.
+        :param category: Название категории.
+        :param count: Количество фотографий.
+        :return: Функция ничего не возвращает.
+        """
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._counts[category] = (count, expires_at)
+
+    def increment(self,
+                  category: str) -> None:
+
+        """
+        Увеличение счётчика категории после добавления фотографии.
+        Если количество ещё не подсчитано, оно будет получено из БД при следующем запросе.
+        :param category: Название категории.
+        :return: Функция ничего не возвращает.
+        """
+
+        if category in self._counts:
+            count, expires_at = self._counts[category]
+            self._counts[category] = (count + 1, expires_at)
+
+    def decrement(self,
+                  category: str) -> None:
+
+        """
+        Уменьшение счётчика категории после удаления фотографии.
+        :param category: Название категории.
+        :return: Функция ничего не возвращает.
+        """
+
+        if category in self._counts:
+            count, expires_at = self._counts[category]
+            self._counts[category] = (max(count - 1, 0), expires_at)
+
+    def clear(self) -> None:
+
+        """
+        Сброс всех счётчиков.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._counts.clear()
+
+
+# Счётчик фотографий по категориям для всего процесса бота
+photo_counter = PhotoCounter()
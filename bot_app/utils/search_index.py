@@ -0,0 +1,348 @@
+import time
+
+from collections import Counter
+from itertools import count
+from typing import (
+    Iterable,
+    Mapping
+)
+
+from config.config import SEARCH_INDEX_TTL
+
+
+def normalize_query(query: str) -> str:
+
+    """
+    Приведение поискового запроса к единому виду (нижний регистр, без пробелов по краям).
+    Один и тот же нормализованный запрос используется для поиска в БД, в индексе и как ключ кэша поиска.
+    :param query: Поисковой запрос.
+    :return: Возвращает нормализованный запрос.
+    """
+
+    return query.lower().strip()
+
+
+class PhotoSearchIndex:
+
+    """
+    Класс инвертированного индекса по описаниям фото для поиска без обращения к БД.
+    Индекс хранит n-граммы description и description_translit отдельно для каждой категории.
+    Пока индекс не загружен, поиск возвращает None и выполняется в БД.
+    Изменения фото попадают в индекс сразу только в процессе, который их выполнил,
+    поэтому по истечении ttl загруженный индекс перестраивается из БД.
+    """
+
+    def __init__(self,
+                 ngram: int = 3,
+                 similarity_threshold: float = 0.5,
+                 ttl: float | None = SEARCH_INDEX_TTL):
+
+        """
+        Инициализация пустого индекса.
+        :param ngram: Длина n-граммы.
+        :param similarity_threshold: Минимальная доля совпавших n-грамм запроса для нечёткого совпадения.
+        :param ttl: Время жизни загруженного индекса в секундах (None - без перестроения).
+        """
+
+        self.ngram = ngram
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.loaded = False
+        # Время загрузки индекса (time.monotonic)
+        self._loaded_at = 0.0
+        # photo_id -> данные фото
+        self._photos: dict[str, dict] = {}
+        # категория -> n-грамма -> photo_id фото, в описаниях которых она встречается
+        self._postings: dict[str, dict[str, set[str]]] = {}
+        # категория -> photo_id фото категории
+        self._categories: dict[str, set[str]] = {}
+        # Порядковый номер фото для стабильной сортировки результатов
+        self._seq = count()
+
+    def _grams(self,
+               text: str) -> set[str]:
+
+        """
+        Получение n-грамм текста, дополненного пробелами по краям.
+        :param text: Текст в нижнем регистре.
+        :return: Возвращает множество n-грамм.
+        """
+
+        padded = ' ' * (self.ngram - 1) + text + ' '
+
+        return {padded[i:i + self.ngram] for i in range(len(padded) - self.ngram + 1)}
+
+    def build(self,
+              rows: Iterable[Mapping]) -> None:
+
+        """
+        Заполнение индекса всеми фото из БД.
+        :param rows: Записи с полями id, photo_id, description, description_translit и category_name.
+        :return: Функция ничего не возвращает.
+        """
+
+        self.clear()
+        for row in rows:
+            self._insert(
+                photo_db_id=row['id'],
+                photo_id=row['photo_id'],
+                description=row['description'],
+                description_translit=row['description_translit'],
+                category=row['category_name']
+            )
+        self.loaded = True
+        self._loaded_at = time.monotonic()
+
+    @property
+    def is_fresh(self) -> bool:
+
+        """
+        Проверка актуальности индекса.
+        :return: Возвращает True, если индекс загружен и время жизни не истекло.
+        """
+
+        if not self.loaded:
+            return False
+
+        return self.ttl is None or time.monotonic() - self._loaded_at < self.ttl
+
+    def _insert(self,
+                photo_db_id: int,
+                photo_id: str,
+                description: str,
+                description_translit: str | None,
+                category: str,
+                seq: int | None = None) -> None:
+
+        """
+        Добавление фото в индекс без проверки загруженности.
+        :param photo_db_id: id фотографии в БД.
+        :param photo_id: ID фотографии.
+        :param description: Описание фотографии.
+        :param description_translit: Описание фотографии с переводом.
+        :param category: Категория фотографии.
+        :param seq: Порядковый номер фото (None - новый номер).
+        :return: Функция ничего не возвращает.
+        """
+
+        photo = {
+            'id': photo_db_id,
+            'photo_id': photo_id,
+            'description': description,
+            'description_translit': description_translit,
+            'category': category,
+            'seq': next(self._seq) if seq is None else seq,
+            'texts': [text.lower() for text in (description, description_translit) if text]
+        }
+        self._photos[photo_id] = photo
+        self._categories.setdefault(category, set()).add(photo_id)
+
+        postings = self._postings.setdefault(category, {})
+        for text in photo['texts']:
+            for gram in self._grams(text):
+                postings.setdefault(gram, set()).add(photo_id)
+
+    def _remove(self,
+                photo_id: str) -> dict | None:
+
+        """
+        Удаление фото из индекса без проверки загруженности.
+        :param photo_id: ID фотографии.
+        :return: Возвращает данные удалённого фото или None, если фото нет в индексе.
+        """
+
+        photo = self._photos.pop(photo_id, None)
+        if photo is None:
+            return None
+
+        category = photo['category']
+        self._categories[category].discard(photo_id)
+
+        postings = self._postings[category]
+        for text in photo['texts']:
+            for gram in self._grams(text):
+                photo_ids = postings.get(gram)
+                if photo_ids is not None:
+                    photo_ids.discard(photo_id)
+                    if not photo_ids:
+                        del postings[gram]
+
+        return photo
+
+    def add(self,
+            photo_db_id: int,
+            photo_id: str,
+            description: str,
+            description_translit: str | None,
+            category: str) -> None:
+
+        """
+        Добавление или замена фото в индексе после записи в БД.
+        :param photo_db_id: id фотографии в БД.
+        :param photo_id: ID фотографии.
+        :param description: Описание фотографии.
+        :param description_translit: Описание фотографии с переводом.
+        :param category: Категория фотографии.
+        :return: Функция ничего не возвращает.
+        """
+
+        if not self.loaded:
+            return
+
+        self._remove(photo_id=photo_id)
+        self._insert(
+            photo_db_id=photo_db_id,
+            photo_id=photo_id,
+            description=description,
+            description_translit=description_translit,
+            category=category
+        )
+
+    def update_description(self,
+                           photo_id: str,
+                           description: str,
+                           description_translit: str | None) -> None:
+
+        """
+        Обновление описания фото в индексе.
+        :param photo_id: ID фотографии.
+        :param description: Новое описание фотографии.
+        :param description_translit: Новое описание фотографии с переводом.
+        :return: Функция ничего не возвращает.
+        """
+
+        if not self.loaded:
+            return
+
+        photo = self._remove(photo_id=photo_id)
+        if photo is not None:
+            self._insert(
+                photo_db_id=photo['id'],
+                photo_id=photo_id,
+                description=description,
+                description_translit=description_translit,
+                category=photo['category'],
+                seq=photo['seq']
+            )
+
+    def rename(self,
+               photo_id: str,
+               new_photo_id: str) -> None:
+
+        """
+        Замена ID фото в индексе.
+        :param photo_id: Текущий ID фотографии.
+        :param new_photo_id: Новый ID фотографии.
+        :return: Функция ничего не возвращает.
+        """
+
+        if not self.loaded:
+            return
+
+        photo = self._remove(photo_id=photo_id)
+        if photo is not None:
+            self._insert(
+                photo_db_id=photo['id'],
+                photo_id=new_photo_id,
+                description=photo['description'],
+                description_translit=photo['description_translit'],
+                category=photo['category'],
+                seq=photo['seq']
+            )
+
+    def remove(self,
+               photo_id: str) -> None:
+
+        """
+        Удаление фото из индекса.
+        :param photo_id: ID фотографии.
+        :return: Функция ничего не возвращает.
+        """
+
+        if self.loaded:
+            self._remove(photo_id=photo_id)
+
+    def search(self,
+               category: str,
+               query: str,
+               limit: int = 10) -> list[dict] | None:
+
+        """
+        Поиск фото по описанию в категории.
+        Сначала возвращаются фото, описание которых содержит запрос, затем фото с похожим описанием.
+        :param category: Категория для поиска.
+        :param query: Поисковой запрос.
+        :param limit: Максимальное количество результатов.
+        :return: Возвращает список словарей найденных фото или None, если индекс не загружен.
+        """
+
+        if not self.loaded:
+            return None
+
+        query = normalize_query(query)
+        postings = self._postings.get(category)
+        if not query or not postings:
+            return []
+
+        # Кандидаты на вхождение подстроки - фото, содержащие все n-граммы запроса
+        if len(query) >= self.ngram:
+            gram_sets = sorted(
+                (postings.get(query[i:i + self.ngram], set()) for i in range(len(query) - self.ngram + 1)),
+                key=len
+            )
+            candidates = set.intersection(*gram_sets)
+        else:
+            candidates = self._categories[category]
+
+        found = sorted(
+            (
+                self._photos[photo_id] for photo_id in candidates
+                if any(query in text for text in self._photos[photo_id]['texts'])
+            ),
+            key=lambda photo: photo['seq']
+        )
+
+        # Добираем результаты нечётким совпадением по доле общих n-грамм
+        if len(found) < limit:
+            query_grams = self._grams(query)
+            hits = Counter()
+            for gram in query_grams:
+                hits.update(postings.get(gram, ()))
+
+            found_ids = {photo['photo_id'] for photo in found}
+            similar = [
+                (shared / len(query_grams), self._photos[photo_id])
+                for photo_id, shared in hits.items()
+                if photo_id not in found_ids and shared / len(query_grams) >= self.similarity_threshold
+            ]
+            similar.sort(key=lambda item: (-item[0], item[1]['seq']))
+            found.extend(photo for _, photo in similar)
+
+        return [
+            {
+                'id': photo['id'],
+                'description': photo['description'],
+                'description_translit': photo['description_translit'],
+                'photo_id': photo['photo_id']
+            }
+            for photo in found[:limit]
+        ]
+
+    def clear(self) -> None:
+
+        """
+        Сброс индекса к пустому незагруженному состоянию.
+        :return: Функция ничего не возвращает.
+        """
+
+        self.loaded = False
+        self._photos.clear()
+        self._postings.clear()
+        self._categories.clear()
+
+    def __len__(self) -> int:
+        return len(self._photos)
+
+
+# Поисковый индекс фото для всего процесса бота
+search_index = PhotoSearchIndex()
@@ -0,0 +1,140 @@
+import asyncio
+import heapq
+import itertools
+
+
+class TokenBucket:
+
+    """
+    Класс асинхронного ограничителя частоты по алгоритму token bucket.
+    Токены восстанавливаются со скоростью rate в секунду до capacity. Ожидающие токен
+    обслуживаются по приоритету (меньшее значение - выше приоритет), при равном приоритете - по очереди.
+    """
+
+    def __init__(self,
+                 rate: float,
+                 capacity: float):
+
+        """
+        Инициализация ограничителя с полным запасом токенов.
+        :param rate: Скорость восстановления токенов (в секунду).
+        :param capacity: Максимальное количество токенов (допустимый всплеск запросов).
+        """
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at: float | None = None
+        # Куча ожидающих [приоритет, порядковый номер]
+        self._waiters: list[list[int]] = []
+        self._seq = itertools.count()
+        self._changed = asyncio.Event()
+
+    def _refill(self) -> None:
+
+        """
+        Восстановление токенов за время, прошедшее с прошлого обновления.
+        :return: Функция ничего не возвращает.
+        """
+
+        now = asyncio.get_running_loop().time()
+        if self._updated_at is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _notify(self) -> None:
+
+        """
+        Пробуждение ожидающих после изменения очереди.
+        :return: Функция ничего не возвращает.
+        """
+
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    @property
+    def tokens(self) -> float:
+
+        """
+        Получение текущего количества токенов.
+        :return: Возвращает количество токенов (отрицательное во время паузы).
+        """
+
+        self._refill()
+        return self._tokens
+
+    @property
+    def waiting(self) -> int:
+
+        """
+        Получение количества ожидающих токен.
+        :return: Возвращает длину очереди ожидающих.
+        """
+
+        return len(self._waiters)
+
+    def try_acquire(self) -> bool:
+
+        """
+        Получение токена без ожидания.
+        :return: Возвращает True, если токен получен, или False, если токенов нет или есть очередь.
+        """
+
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return True
+
+        return False
+
+    async def acquire(self,
+                      priority: int = 0) -> float:
+
+        """
+        Получение токена с ожиданием его восстановления.
+        :param priority: Приоритет запроса (меньшее значение - выше приоритет).
+        :return: Возвращает время ожидания токена (в секундах).
+        """
+
+        # Токен есть и очереди нет - выдаём без ожидания
+        if self.try_acquire():
+            return 0.0
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        entry = [priority, next(self._seq)]
+        heapq.heappush(self._waiters, entry)
+
+        try:
+            while True:
+                self._refill()
+                if self._waiters[0] is entry:
+                    if self._tokens >= 1:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= 1
+                        self._notify()
+                        return loop.time() - started
+                    # Первый в очереди ждёт восстановления токена
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                else:
+                    # Остальные ждут, пока очередь не сдвинется
+                    await self._changed.wait()
+        except BaseException:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._notify()
+            raise
+
+    def pause(self,
+              seconds: float) -> None:
+
+        """
+        Приостановка выдачи токенов (например, после ответа Telegram retry_after).
+        :param seconds: Длительность паузы (в секундах).
+        :return: Функция ничего не возвращает.
+        """
+
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
@@ -0,0 +1,164 @@
+import asyncio
+import signal
+
+from aiogram import (
+    Bot,
+    Dispatcher
+)
+from aiogram.webhook.aiohttp_server import (
+    SimpleRequestHandler,
+    setup_application
+)
+from aiohttp import web
+
+from bot_app.exceptions.webhook import WebhookConfigError
+
+from config.config import (
+    WEBHOOK_BASE_URL,
+    WEBHOOK_PATH,
+    WEBHOOK_SECRET,
+    WEBAPP_HOST,
+    WEBAPP_PORT,
+    WEBHOOK_SHUTDOWN_TIMEOUT
+)
+from config.log import logger
+
+
+class BotRequestHandler(SimpleRequestHandler):
+
+    """
+    Обработчик запросов Telegram к webhook.
+    Обновления обрабатываются в фоне параллельно друг с другом, а при остановке сервера
+    обработчик дожидается уже принятых обновлений, чтобы они не обрывались на середине.
+    """
+
+    def __init__(self,
+                 dispatcher: Dispatcher,
+                 bot: Bot,
+                 secret_token: str,
+                 handle_in_background: bool = True,
+                 shutdown_timeout: float = WEBHOOK_SHUTDOWN_TIMEOUT):
+
+        """
+        Инициализация обработчика.
+        :param dispatcher: Объект Dispatcher.
+        :param bot: Объект Bot.
+        :param secret_token: Секретный токен для проверки заголовка X-Telegram-Bot-Api-Secret-Token.
+        :param handle_in_background: Отвечать Telegram сразу, не дожидаясь обработки обновления.
+        :param shutdown_timeout: Максимальное время ожидания принятых обновлений при остановке (в секундах).
+        """
+
+        super().__init__(
+            dispatcher=dispatcher,
+            bot=bot,
+            handle_in_background=handle_in_background,
+            secret_token=secret_token
+        )
+        self.shutdown_timeout = shutdown_timeout
+
+    async def close(self) -> None:
+
+        """
+        Ожидание обработки принятых обновлений перед остановкой сервера.
+        :return: Функция ничего не возвращает.
+        """
+
+        tasks = set(self._background_feed_update_tasks)
+        if tasks:
+            logger.info(f'Ожидание обработки {len(tasks)} обновлений перед остановкой...')
+            _, pending = await asyncio.wait(tasks, timeout=self.shutdown_timeout)
+            if pending:
+                logger.warning(f'Не дождались обработки {len(pending)} обновлений при остановке.')
+
+        await super().close()
+
+
+def create_webhook_app(dp: Dispatcher,
+                       bot: Bot,
+                       path: str = WEBHOOK_PATH,
+                       secret_token: str | None = WEBHOOK_SECRET,
+                       handle_in_background: bool = True) -> web.Application:
+
+    """
+    Создание aiohttp-приложения, принимающего обновления от Telegram.
+    :param dp: Объект Dispatcher с зарегистрированными хендлерами.
+    :param bot: Объект Bot.
+    :param path: Путь обработчика обновлений.
+    :param secret_token: Секретный токен для проверки запросов.
+    :param handle_in_background: Отвечать Telegram сразу, не дожидаясь обработки обновления.
+    :return: Возвращает объект aiohttp-приложения.
+    """
+
+    # Без секретного токена обновления сможет отправить кто угодно
+    if not secret_token:
+        raise WebhookConfigError('Не задан WEBHOOK_SECRET.')
+
+    app = web.Application()
+
+    BotRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        secret_token=secret_token,
+        handle_in_background=handle_in_background
+    ).register(app, path=path)
+
+    # Запуск и остановка Dispatcher вместе с сервером
+    setup_application(app, dp, bot=bot)
+
+    return app
+
+
+async def run_webhook(dp: Dispatcher,
+                      bot: Bot) -> None:
+
+    """
+    Запуск бота в режиме webhook: регистрация webhook в Telegram и запуск aiohttp-сервера.
+    Функция работает до отмены задачи или сигнала SIGTERM/SIGINT.
+    :param dp: Объект Dispatcher с зарегистрированными хендлерами.
+    :param bot: Объект Bot.
+    :return: Функция ничего не возвращает.
+    """
+
+    if not WEBHOOK_BASE_URL:
+        raise WebhookConfigError('Не задан WEBHOOK_BASE_URL.')
+
+    app = create_webhook_app(
+        dp=dp,
+        bot=bot
+    )
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    try:
+        site = web.TCPSite(
+            runner,
+            host=WEBAPP_HOST,
+            port=WEBAPP_PORT
+        )
+        await site.start()
+
+        # Telegram начинает отправлять обновления, накопленные во время перезапуска, не отбрасывая их
+        await bot.set_webhook(
+            url=f'{WEBHOOK_BASE_URL.rstrip("/")}{WEBHOOK_PATH}',
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=dp.resolve_used_update_types(),
+            drop_pending_updates=False
+        )
+        logger.info(f'Сервер webhook запущен на {WEBAPP_HOST}:{WEBAPP_PORT}{WEBHOOK_PATH}')
+
+        # Ожидаем сигнала остановки
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                # Windows не поддерживает обработчики сигналов в цикле событий
+                pass
+
+        await stop_event.wait()
+    finally:
+        # Остановка сервера: новые обновления не принимаются, принятые дообрабатываются
+        await runner.cleanup()
+        logger.info('Сервер webhook остановлен.')
@@ -17,3 +17,140 @@ BOT_URL_FOR_START = os.getenv('BOT_URL_FOR_START')
 
 # URL для перехода в канал COMMANDOS
 CHANEL_URL = os.getenv('CHANEL_URL')
+
+# Формат записей лога: text (строки) или json (одна запись JSON на строку)
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()
+
+# Максимальное количество записей лога в очереди фонового потока записи (при переполнении записи отбрасываются)
+LOG_QUEUE_MAX_SIZE = int(os.getenv('LOG_QUEUE_MAX_SIZE', 10000))
+
+# Режим получения обновлений: polling (long polling) или webhook (aiohttp-сервер)
+BOT_RUN_MODE = os.getenv('BOT_RUN_MODE', 'polling').lower()
+
+# Публичный адрес сервера, на который Telegram отправляет обновления в режиме webhook (https://example.com)
+WEBHOOK_BASE_URL = os.getenv('WEBHOOK_BASE_URL')
+
+# Путь обработчика обновлений на сервере
+WEBHOOK_PATH = os.getenv('WEBHOOK_PATH', '/webhook')
+
+# Секретный токен, который Telegram передаёт в заголовке X-Telegram-Bot-Api-Secret-Token
+WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET')
+
+# Адрес и порт, на которых запускается aiohttp-сервер
+WEBAPP_HOST = os.getenv('WEBAPP_HOST', '0.0.0.0')
+WEBAPP_PORT = int(os.getenv('WEBAPP_PORT', 8080))
+
+# Максимальное время (в секундах) ожидания обработки принятых обновлений при остановке сервера
+WEBHOOK_SHUTDOWN_TIMEOUT = float(os.getenv('WEBHOOK_SHUTDOWN_TIMEOUT', 10))
+
+# Запуск HTTP-сервера с метриками в формате Prometheus
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
+# Адрес, порт и путь сервера метрик (отдельно от webhook, чтобы метрики не были доступны извне).
+# По умолчанию сервер слушает только локальный интерфейс: для сбора Prometheus с другого хоста
+# адрес задаётся явно (например, 0.0.0.0 за файрволом)
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.getenv('METRICS_PORT', 9100))
+METRICS_PATH = os.getenv('METRICS_PATH', '/metrics')
+
+# Хранилище состояний FSM: memory (в памяти процесса) или postgres (таблица fsm_state, общая для всех процессов)
+FSM_STORAGE = os.getenv('FSM_STORAGE', 'memory').lower()
+
+# Общее количество исходящих сообщений бота в секунду (лимит Telegram ~30 в секунду)
+TELEGRAM_GLOBAL_RATE = float(os.getenv('TELEGRAM_GLOBAL_RATE', 25))
+
+# Допустимый всплеск исходящих сообщений бота
+TELEGRAM_GLOBAL_BURST = float(os.getenv('TELEGRAM_GLOBAL_BURST', 25))
+
+# Количество исходящих сообщений в секунду в один личный чат (лимит Telegram ~1 в секунду)
+TELEGRAM_CHAT_RATE = float(os.getenv('TELEGRAM_CHAT_RATE', 1))
+
+# Допустимый всплеск исходящих сообщений в один личный чат
+TELEGRAM_CHAT_BURST = float(os.getenv('TELEGRAM_CHAT_BURST', 3))
+
+# Количество исходящих сообщений в секунду в одну группу (лимит Telegram 20 в минуту)
+TELEGRAM_GROUP_RATE = float(os.getenv('TELEGRAM_GROUP_RATE', 20 / 60))
+
+# Допустимый всплеск исходящих сообщений в одну группу
+TELEGRAM_GROUP_BURST = float(os.getenv('TELEGRAM_GROUP_BURST', 3))
+
+# Максимальное количество повторов запроса к Telegram после ответа TelegramRetryAfter
+TELEGRAM_MAX_RETRIES = int(os.getenv('TELEGRAM_MAX_RETRIES', 3))
+
+# Количество нажатий инлайн-кнопок одного пользователя в секунду, которые обрабатываются ботом
+THROTTLE_CALLBACK_RATE = float(os.getenv('THROTTLE_CALLBACK_RATE', 2))
+
+# Допустимый всплеск нажатий инлайн-кнопок одного пользователя
+THROTTLE_CALLBACK_BURST = float(os.getenv('THROTTLE_CALLBACK_BURST', 5))
+
+# Время жизни (в секундах) закэшированного статуса администратора в группе
+ADMIN_CACHE_TTL = int(os.getenv('ADMIN_CACHE_TTL', 300))
+
+# Время жизни (в секундах) закэшированного статуса "не администратор" в группе
+ADMIN_CACHE_NEGATIVE_TTL = int(os.getenv('ADMIN_CACHE_NEGATIVE_TTL', 60))
+
+# Максимальное количество пар (пользователь, группа) в кэше статусов администраторов
+ADMIN_CACHE_MAX_SIZE = int(os.getenv('ADMIN_CACHE_MAX_SIZE', 10000))
+
+# Максимальное количество одновременных запросов get_chat_member при проверке администратора
+ADMIN_CHECK_CONCURRENCY = int(os.getenv('ADMIN_CHECK_CONCURRENCY', 10))
+
+# Максимальное время (в секундах) проверки пользователя на администратора во всех группах
+ADMIN_CHECK_TIMEOUT = float(os.getenv('ADMIN_CHECK_TIMEOUT', 5))
+
+# Время жизни (в секундах) списка категорий в памяти процесса: по его истечении
+# категории, созданные другими процессами бота, перечитываются из БД
+CATEGORY_CATALOG_TTL = int(os.getenv('CATEGORY_CATALOG_TTL', 60))
+
+# Время жизни (в секундах) реестра групп в памяти процесса: по его истечении
+# группы, добавленные и удалённые другими процессами бота, перечитываются из БД
+GROUP_REGISTRY_TTL = int(os.getenv('GROUP_REGISTRY_TTL', 60))
+
+# Максимальное количество готовых инлайн-клавиатур в кэше
+KEYBOARD_CACHE_MAX_SIZE = int(os.getenv('KEYBOARD_CACHE_MAX_SIZE', 1000))
+
+# Поиск фото по описанию через индекс в памяти вместо запросов к БД
+SEARCH_INDEX_ENABLED = os.getenv('SEARCH_INDEX_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+
+# Время жизни (в секундах) поискового индекса в памяти процесса: по его истечении индекс
+# перестраивается из БД с учётом фото, добавленных, изменённых и удалённых другими процессами бота
+SEARCH_INDEX_TTL = int(os.getenv('SEARCH_INDEX_TTL', 300))
+
+# Минимальное количество соединений в пуле БД (открываются при запуске бота)
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 2))
+
+# Максимальное количество соединений в пуле БД
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+
+# Количество запросов, после которого соединение пула БД пересоздаётся
+DB_POOL_MAX_QUERIES = int(os.getenv('DB_POOL_MAX_QUERIES', 50000))
+
+# Время (в секундах), после которого неиспользуемое соединение пула БД закрывается
+DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME = float(os.getenv('DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME', 300))
+
+# Размер кэша подготовленных выражений на одно соединение с БД
+DB_STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', 100))
+
+# Максимальное время (в секундах) выполнения запроса к БД
+DB_COMMAND_TIMEOUT = float(os.getenv('DB_COMMAND_TIMEOUT', 30))
+
+# Применение новых миграций схемы БД (папка migrations) при запуске бота.
+# По умолчанию выключено: миграции применяются при развёртывании командой python -m config.migrations
+DB_MIGRATE_ON_STARTUP = os.getenv('DB_MIGRATE_ON_STARTUP', 'false').lower() in ('1', 'true', 'yes')
+
+# Максимальное время (в секундах) выполнения одной команды миграции (создание индексов на больших таблицах)
+DB_MIGRATION_TIMEOUT = float(os.getenv('DB_MIGRATION_TIMEOUT', 600))
+
+# Время жизни (в секундах) количества фото категории в памяти процесса: по его истечении
+# количество подсчитывается в БД заново с учётом фото, добавленных и удалённых другими процессами бота
+PHOTO_COUNTER_TTL = int(os.getenv('PHOTO_COUNTER_TTL', 300))
+
+# Время жизни (в секундах) закэшированных file_id и описания фото по его id в БД
+PHOTO_CACHE_TTL = int(os.getenv('PHOTO_CACHE_TTL', 3600))
+
+# Время жизни (в секундах) закэшированных результатов поиска фото: изменения фото в других процессах бота
+# не сбрасывают кэш этого процесса, поэтому результаты поиска хранятся недолго
+PHOTO_SEARCH_CACHE_TTL = int(os.getenv('PHOTO_SEARCH_CACHE_TTL', 60))
+
+# Максимальное количество записей в кэше file_id, описаний и результатов поиска фото
+PHOTO_CACHE_MAX_SIZE = int(os.getenv('PHOTO_CACHE_MAX_SIZE', 5000))
@@ -1,9 +1,24 @@
+import asyncio
 import json
 
 import asyncpg
 
-from config.config import DATABASE_URL
+from config.config import (
+    DATABASE_URL,
+    DB_POOL_MIN_SIZE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MAX_QUERIES,
+    DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+    DB_STATEMENT_CACHE_SIZE,
+    DB_COMMAND_TIMEOUT
+)
 from config.log import logger
+from config.pool import (
+    BotConnection,
+    BotPool
+)
+from config import queries
+from config.statements import statements
 
 from bot_app.exceptions.database import (
     DatabaseConnectionError,
@@ -11,29 +26,77 @@ from bot_app.exceptions.database import (
     DatabaseGetGroupError,
     DatabaseDeleteGroupError,
     DatabaseAddPhotoWithCategoryError,
+    DatabaseImportPhotosError,
     DatabaseGetPhotosError,
-    DatabaseGetTotalPhotosError,
     DatabaseGetPhotoDescriptionByFileIdError,
     DatabaseGetFileIdByDescriptionError,
+    DatabaseGetPhotoByIdError,
     DatabaseGetCategoriesError,
     DatabaseDeletePhotoError,
     DatabaseUpdatePhotoError,
     DatabaseUpdatePhotoDescriptionError,
-    DatabaseSearchPhotoByDescriptionError
+    DatabaseSearchPhotoByDescriptionError,
+    DatabaseCheckExtensionError,
+    DatabaseLoadSearchIndexError
 )
 from bot_app.exceptions.photo import PhotoAlreadyExistsError
+from bot_app.utils.category_catalog import category_catalog
+from bot_app.utils.metrics import timed_db_call
+from bot_app.utils.photo_cache import photo_cache
+from bot_app.utils.photo_counter import photo_counter
+from bot_app.utils.search_index import (
+    normalize_query,
+    search_index
+)
+
+
+# Доступность поиска по похожести (расширение pg_trgm), проверяется при запуске бота
+pg_trgm_available = True
+
+# Блокировка, чтобы одновременные поиски не перестраивали устаревший поисковый индекс несколько раз
+_search_index_lock = asyncio.Lock()
+
+
+async def init_connection(conn: BotConnection) -> None:
+
+    """
+    Инициализация нового соединения пула: подготовка часто используемых запросов.
+    Ошибка подготовки (например, не применена миграция) не мешает работе соединения.
+    :param conn: Новое соединение с БД.
+    :return: Функция ничего не возвращает.
+    """
+
+    try:
+        await conn.warm_up(queries=statements.hot_queries())
+    except asyncpg.PostgresError as e:
+        logger.warning(f'Не удалось подготовить запросы для соединения с БД: {type(e).__name__}: {e}')
 
 
 async def create_pool() -> asyncpg.pool.Pool:
 
     """
     Создание пула подключений к БД.
+    Параметры пула задаются переменными окружения DB_POOL_*, DB_STATEMENT_CACHE_SIZE и DB_COMMAND_TIMEOUT.
+    При создании открываются DB_POOL_MIN_SIZE соединений, на каждом из которых подготавливаются
+    часто используемые запросы из реестра запросов (config/queries.py).
     :return: Возвращает объект пула подключения к БД.
     """
 
     try:
         # Возвращаем объект пула подключения к БД
-        return await asyncpg.create_pool(dsn=DATABASE_URL)
+        return await BotPool(
+            DATABASE_URL,
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            max_queries=DB_POOL_MAX_QUERIES,
+            max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+            init=init_connection,
+            loop=None,
+            connection_class=BotConnection,
+            record_class=asyncpg.Record,
+            statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+            command_timeout=DB_COMMAND_TIMEOUT
+        )
     except Exception as e:
         raise DatabaseConnectionError.from_exception(e) from e
 
@@ -53,6 +116,7 @@ async def close_pool(pool: asyncpg.pool.Pool) -> None:
         raise DatabaseConnectionError.from_exception(e) from e
 
 
+@timed_db_call
 async def add_group_to_db(pool: asyncpg.pool.Pool,
                           group_id: int,
                           group_name: str) -> None:
@@ -69,10 +133,8 @@ async def add_group_to_db(pool: asyncpg.pool.Pool,
         # Запрос в БД из пула соединения
         async with pool.acquire() as conn:
             # Осуществляем добавление группы в БД
-            await conn.execute(
-                "INSERT INTO groups (group_id, group_name) "
-                "VALUES ($1, $2) "
-                "ON CONFLICT (group_id) DO NOTHING",
+            await queries.ADD_GROUP.execute(
+                conn,
                 group_id,
                 group_name
             )
@@ -86,6 +148,7 @@ async def add_group_to_db(pool: asyncpg.pool.Pool,
         ) from e
 
 
+@timed_db_call
 async def get_groups_from_db(pool: asyncpg.pool.Pool) -> list[int]:
 
     """
@@ -97,10 +160,7 @@ async def get_groups_from_db(pool: asyncpg.pool.Pool) -> list[int]:
     try:
         # Возвращаем список групп
         async with pool.acquire() as conn:
-            groups_id = await conn.fetchval(
-                "SELECT ARRAY_AGG(group_id) "
-                "FROM groups"
-            )
+            groups_id = await queries.GET_GROUPS.fetchval(conn)
             return groups_id if groups_id else []
     except asyncpg.PostgresError as e:
         raise DatabaseGetGroupError.from_exception(e) from e
@@ -108,6 +168,7 @@ async def get_groups_from_db(pool: asyncpg.pool.Pool) -> list[int]:
         raise DatabaseGetGroupError(f'{type(e).__name__}: {e}') from e
 
 
+@timed_db_call
 async def delete_group_from_db(pool: asyncpg.pool.Pool,
                                group_id: int) -> None:
 
@@ -121,9 +182,8 @@ async def delete_group_from_db(pool: asyncpg.pool.Pool,
     try:
         # Удаляем группу из БД
         async with pool.acquire() as conn:
-            await conn.execute(
-                "DELETE FROM groups "
-                "WHERE group_id = $1",
+            await queries.DELETE_GROUP.execute(
+                conn,
                 group_id
             )
     except asyncpg.exceptions.ForeignKeyViolationError as e:
@@ -132,6 +192,7 @@ async def delete_group_from_db(pool: asyncpg.pool.Pool,
         raise DatabaseDeleteGroupError(f'{type(e).__name__}: {e} | group_id: {group_id}') from e
 
 
+@timed_db_call
 async def add_photo_with_category_to_db(pool: asyncpg.pool.Pool,
                                         photo_id: str,
                                         description: str,
@@ -148,62 +209,74 @@ async def add_photo_with_category_to_db(pool: asyncpg.pool.Pool,
     :return: Функция ничего не возвращает.
     """
 
+    # Флаг создания новой категории для обновления каталога категорий
+    category_created = False
+
     try:
         # Добавление фото с категорией в БД
         async with pool.acquire() as conn:
             async with conn.transaction():
                 # Проверяем, есть ли фото с таким описанием в БД
-                existing = await conn.fetchval(
-                    "SELECT 1 "
-                    "FROM photos "
-                    "WHERE description = $1;",
+                existing = await queries.PHOTO_DESCRIPTION_EXISTS.fetchval(
+                    conn,
                     description
                 )
                 if existing:
                     raise PhotoAlreadyExistsError(f'description: {description}')
 
                 # Если категория уже была в БД, получаем её ID
-                category_id = await conn.fetchval(
-                    "SELECT id "
-                    "FROM categories "
-                    "WHERE category_name = $1;",
+                category_id = await queries.GET_CATEGORY_ID.fetchval(
+                    conn,
                     category_name
                 )
                 # Добавление категории, если её нет
                 if category_id is None:
-                    category_id = await conn.fetchval(
-                        "INSERT INTO categories (category_name, category_description) " 
-                        "VALUES ($1, $2) " 
-                        "ON CONFLICT (category_name) "
-                        "DO NOTHING "
-                        "RETURNING id;",
+                    category_id = await queries.ADD_CATEGORY.fetchval(
+                        conn,
                         category_name,
                         category_name
                     )
+                    # Если категория создана этим запросом
+                    if category_id is not None:
+                        category_created = True
                     # Если всё ещё None — получаем ID вручную
-                    if category_id is None:
-                        category_id = await conn.fetchval(
-                            "SELECT id "
-                            "FROM categories "
-                            "WHERE category_name = $1;",
+                    else:
+                        category_id = await queries.GET_CATEGORY_ID.fetchval(
+                            conn,
                             category_name
                         )
-                # Добавляем фото
-                await conn.execute(
-                    "INSERT INTO photos (photo_id, description, description_translit, category_id) "
-                    "VALUES ($1, $2, $3, $4) "
-                    "ON CONFLICT (photo_id) "
-                    "DO UPDATE "
-                    "SET "
-                    "description = EXCLUDED.description, "
-                    "description_translit = EXCLUDED.description_translit, "
-                    "category_id = EXCLUDED.category_id ",
+                # Добавляем фото (xmax = 0 только у вставленной, а не обновлённой строки)
+                photo = await queries.UPSERT_PHOTO.fetchrow(
+                    conn,
                     photo_id,
                     description,
                     description_translit,
                     category_id
                 )
 
+        # Если была создана новая категория, каталог категорий устарел
+        if category_created:
+            category_catalog.bump()
+
+        # Фото с таким file_id могло быть закэшировано со старым описанием
+        photo_cache.invalidate(photo_id=photo_id)
+
+        # Добавляем фото в поисковый индекс
+        search_index.add(
+            photo_db_id=photo['id'],
+            photo_id=photo_id,
+            description=description,
+            description_translit=description_translit,
+            category=category_name
+        )
+
+        # Обновляем счётчик фотографий в категории
+        if photo['inserted']:
+            photo_counter.increment(category=category_name)
+        else:
+            # Существующее фото могло перейти в другую категорию, поэтому сбрасываем все счётчики
+            photo_counter.clear()
+
     except PhotoAlreadyExistsError:
         raise
     except asyncpg.PostgresError as e:
@@ -214,93 +287,137 @@ async def add_photo_with_category_to_db(pool: asyncpg.pool.Pool,
         ) from e
 
 
-async def get_photos_from_db(pool: asyncpg.pool.Pool,
-                             category: str,
-                             limit: int,
-                             offset: int) -> list[dict]:
+@timed_db_call
+async def import_photos_to_db(pool: asyncpg.pool.Pool,
+                              photos: list[tuple[str, str, str | None, str]]) -> dict[str, int]:
 
     """
-    Получение списка фотографий с пагинацией.
-    :param pool: Пул соединений с БД.
-    :param category: Категория из БД.
-    :param limit: Параметр для ограничения в выводе фотографий.
-    :param offset: Параметр для начала отсчёта ограничения.
-    :return: Возвращает список словарей, содержащий в себе описание, file_id фотографии и id её в БД.
+    Массовое добавление фото с категориями в БД.
+    Строки копируются (COPY) во временную таблицу photo_import и одним запросом сливаются с таблицей photos:
+    новые фото добавляются, у существующих (по file_id) обновляются описание и категория.
+    Строки с описанием, которое уже есть у другого фото, пропускаются, как и при добавлении одного фото.
+    :param pool: Пул соединения с БД.
+    :param photos: Строки импорта: file_id, описание, описание в переводе и название категории.
+    :return: Возвращает словарь с количеством строк, добавленных и обновлённых фото,
+    пропущенных строк и созданных категорий.
     """
 
     try:
-        # Получаем список фотографий с описанием
         async with pool.acquire() as conn:
-            # Получение category_id по названию категории
-            category_row = await conn.fetchrow(
-                "SELECT id "
-                "FROM categories "
-                "WHERE category_name = $1",
-                category
-            )
-            if not category_row:
-                logger.error(f'Категория "{category}" не найдена')
-                return []
-
-            category_id = category_row['id']
-
-            # Получение фото по category_id
-            rows = await conn.fetch(
-                "SELECT id, photo_id, description "
-                "FROM photos "
-                "WHERE category_id = $1 "
-                "ORDER BY id ASC "
-                "LIMIT $2 "
-                "OFFSET $3",
-                category_id,
-                limit,
-                offset
-            )
-
-            photos = [dict(row) for row in rows]
-            return photos
+            async with conn.transaction():
+                await queries.CREATE_PHOTO_IMPORT_TABLE.execute(conn)
+                await conn.copy_records_to_table(
+                    'photo_import',
+                    records=[(position, *photo) for position, photo in enumerate(photos)],
+                    columns=['position', 'photo_id', 'description', 'description_translit', 'category_name']
+                )
+                created_categories = await queries.IMPORT_CATEGORIES.fetch(conn)
+                rows = await queries.MERGE_PHOTO_IMPORT.fetch(conn)
     except asyncpg.PostgresError as e:
-        raise DatabaseGetPhotosError.from_exception(e) from e
+        raise DatabaseImportPhotosError.from_exception(e) from e
     except Exception as e:
-        raise DatabaseGetPhotosError.from_exception(e) from e
+        raise DatabaseImportPhotosError(f'{type(e).__name__}: {e} | rows: {len(photos)}') from e
+
+    inserted = sum(1 for row in rows if row['inserted'])
+
+    # Новые категории, количество фото по категориям и описания фото изменились
+    if created_categories:
+        category_catalog.bump()
+    photo_counter.clear()
+    photo_cache.clear()
+
+    # Загруженный поисковый индекс перестраивается с импортированными фото
+    if search_index.loaded:
+        await load_search_index(pool=pool)
 
+    return {
+        'rows': len(photos),
+        'inserted': inserted,
+        'updated': len(rows) - inserted,
+        'skipped': len(photos) - len(rows),
+        'categories_created': len(created_categories)
+    }
 
-async def get_total_photos_count(pool: asyncpg.pool.Pool,
-                                 category: str) -> int:
+
+@timed_db_call
+async def get_photos_page_from_db(pool: asyncpg.pool.Pool,
+                                  category: str,
+                                  limit: int,
+                                  cursor: int | None = None,
+                                  direction: str = 'next') -> dict:
 
     """
-    Получение общего числа фотографий для вычисления количества страниц.
+    Получение страницы фотографий, общего количества фотографий и ID категории одним запросом.
+    Количество фотографий подсчитывается в БД, только если его нет в счётчике фотографий.
     :param pool: Пул соединений с БД.
     :param category: Категория из БД.
-    :return: Возвращает количество всех фотографий.
+    :param limit: Параметр для ограничения в выводе фотографий.
+    :param cursor: id фотографии, от которой отсчитывается страница (None - первая страница).
+    :param direction: Направление от cursor: 'next' - следующая страница, 'prev' - предыдущая.
+    :return: Возвращает словарь с ID категории (None, если категория не найдена),
+    списком фотографий страницы и общим количеством фотографий в категории.
     """
 
+    # Получаем количество фотографий из счётчика
+    total = photo_counter.get(category=category)
+
+    if direction != 'prev':
+        direction = 'next'
+        cursor = cursor or 0
+
     try:
         async with pool.acquire() as conn:
-            # Получение category_id по названию категории
-            category_row = await conn.fetchrow(
-                "SELECT id "
-                "FROM categories "
-                "WHERE category_name = $1",
-                category
+            row = await queries.GET_PHOTOS_PAGE[direction].fetchrow(
+                conn,
+                category,
+                limit,
+                cursor,
+                total is None
             )
 
-            category_id = category_row['id']
-        # Получаем все фотографии по категории
-        async with pool.acquire() as conn:
-            result = await conn.fetchval(
-                "SELECT COUNT(*) "
-                "FROM photos "
-                "WHERE category_id = $1",
-                category_id
+        category_id = row['category_id']
+        if category_id is None:
+            logger.error(f'Категория "{category}" не найдена')
+            return {
+                'category_id': None,
+                'photos': [],
+                'total': 0
+            }
+
+        # Сохраняем подсчитанное количество в счётчик фотографий
+        if total is None:
+            total = row['total']
+            photo_counter.set(
+                category=category,
+                count=total
             )
-            return result
+
+        photos = json.loads(row['photos']) if row['photos'] else []
+
+        # Неполная первая страница содержит все фото категории: если счётчик с ней не согласен,
+        # его изменили без учёта других процессов бота, и он исправляется без запроса COUNT
+        if direction == 'next' and not cursor and len(photos) < limit and len(photos) != total:
+            total = len(photos)
+            photo_counter.set(
+                category=category,
+                count=total
+            )
+
+        # Сохраняем фото страницы в кэш фото для перехода по кнопкам сборок
+        photo_cache.store_many(photos=photos)
+
+        return {
+            'category_id': category_id,
+            'photos': photos,
+            'total': total
+        }
     except asyncpg.PostgresError as e:
-        raise DatabaseGetTotalPhotosError.from_exception(e) from e
+        raise DatabaseGetPhotosError.from_exception(e) from e
     except Exception as e:
-        raise DatabaseGetTotalPhotosError(f'{type(e).__name__}: {e} | category: {category}') from e
+        raise DatabaseGetPhotosError(f'{type(e).__name__}: {e} | category: {category}') from e
 
 
+@timed_db_call
 async def get_photo_description_by_file_id_from_db(pool: asyncpg.pool.Pool,
                                                    file_id: str) -> str:
 
@@ -311,16 +428,23 @@ async def get_photo_description_by_file_id_from_db(pool: asyncpg.pool.Pool,
     :return: Возвращает строку с описанием фотографии или Описания нет, пожалуйста, обратитесь к администратору.
     """
 
+    # Описание из кэша фото
+    description = photo_cache.get_description(photo_id=file_id)
+    if description is not None:
+        return description
+
     try:
         async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT description "
-                "FROM photos "
-                "WHERE photo_id = $1",
+            row = await queries.GET_PHOTO_DESCRIPTION.fetchrow(
+                conn,
                 file_id
             )
             if row:
                 description = row['description']
+                photo_cache.remember(
+                    photo_id=file_id,
+                    description=description
+                )
                 return description
             else:
                 logger.warning(f'Описание не найдено по file_id={file_id}')
@@ -335,6 +459,44 @@ async def get_photo_description_by_file_id_from_db(pool: asyncpg.pool.Pool,
         ) from e
 
 
+@timed_db_call
+async def get_photo_by_id_from_db(pool: asyncpg.pool.Pool,
+                                  photo_db_id: int) -> dict | None:
+
+    """
+    Получение file_id и описания фото по его id в БД.
+    Фото, показанные на страницах и в результатах поиска, берутся из кэша фото без обращения к БД.
+    :param pool: Пул соединения с БД.
+    :param photo_db_id: id фото в БД.
+    :return: Возвращает словарь с photo_id (file_id) и description или None, если фото не найдено.
+    """
+
+    photo = photo_cache.get(photo_db_id=photo_db_id)
+    if photo is not None:
+        return photo
+
+    try:
+        async with pool.acquire() as conn:
+            row = await queries.GET_PHOTO_BY_ID.fetchrow(
+                conn,
+                photo_db_id
+            )
+        if row is None:
+            return None
+
+        photo_cache.set(
+            photo_db_id=photo_db_id,
+            photo_id=row['photo_id'],
+            description=row['description']
+        )
+        return photo_cache.get(photo_db_id=photo_db_id)
+    except asyncpg.PostgresError as e:
+        raise DatabaseGetPhotoByIdError.from_exception(e) from e
+    except Exception as e:
+        raise DatabaseGetPhotoByIdError(f'{type(e).__name__}: {e} | id: {photo_db_id}') from e
+
+
+@timed_db_call
 async def get_photo_file_id_by_description_from_db(pool: asyncpg.pool.Pool,
                                                    description: str) -> str:
 
@@ -345,16 +507,23 @@ async def get_photo_file_id_by_description_from_db(pool: asyncpg.pool.Pool,
     :return: Возвращает строку с file_id фотографии или Описания нет, пожалуйста, обратитесь к администратору.
     """
 
+    # file_id из кэша фото
+    file_id = photo_cache.get_file_id(description=description)
+    if file_id is not None:
+        return file_id
+
     try:
         async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT photo_id "
-                "FROM photos "
-                "WHERE description = $1",
+            row = await queries.GET_FILE_ID_BY_DESCRIPTION.fetchrow(
+                conn,
                 description
             )
             if row:
                 file_id = row['photo_id']
+                photo_cache.remember(
+                    photo_id=file_id,
+                    description=description
+                )
                 return file_id
             else:
                 return 'file_id нет, пожалуйста, обратитесь к администратору.'
@@ -364,6 +533,7 @@ async def get_photo_file_id_by_description_from_db(pool: asyncpg.pool.Pool,
         raise DatabaseGetFileIdByDescriptionError(f'{type(e).__name__}: {e} | description: {description}') from e
 
 
+@timed_db_call
 async def get_categories_from_db(pool: asyncpg.pool.Pool) -> list[dict]:
 
     """
@@ -372,15 +542,22 @@ async def get_categories_from_db(pool: asyncpg.pool.Pool) -> list[dict]:
     :return: Возвращает список категорий.
     """
 
+    # Если каталог категорий актуален, возвращаем категории без обращения к БД
+    if category_catalog.is_fresh:
+        return category_catalog.categories
+
+    # Запоминаем версию каталога до запроса, чтобы не потерять создание категории во время загрузки
+    version = category_catalog.version
+
     try:
         async with pool.acquire() as conn:
-            categories_json = await conn.fetchval(
-                "SELECT JSON_AGG("
-                "JSONB_BUILD_OBJECT('name', category_name, 'description', category_description) "
-                "ORDER BY id ASC) "
-                "FROM categories",
-            )
+            categories_json = await queries.GET_CATEGORIES.fetchval(conn)
             categories = json.loads(categories_json) if categories_json else []
+            # Сохраняем категории в каталог
+            category_catalog.store(
+                categories=categories,
+                version=version
+            )
             return categories
     except asyncpg.PostgresError as e:
         raise DatabaseGetCategoriesError.from_exception(e) from e
@@ -388,6 +565,7 @@ async def get_categories_from_db(pool: asyncpg.pool.Pool) -> list[dict]:
         raise DatabaseGetCategoriesError.from_exception(e) from e
 
 
+@timed_db_call
 async def delete_photo_from_db(pool: asyncpg.pool.Pool,
                                photo_id: str) -> None:
 
@@ -400,20 +578,25 @@ async def delete_photo_from_db(pool: asyncpg.pool.Pool,
 
     try:
         async with pool.acquire() as conn:
-            result = await conn.execute(
-                "DELETE FROM photos "
-                "WHERE photo_id = $1",
+            rows = await queries.DELETE_PHOTO.fetch(
+                conn,
                 photo_id
             )
-            # Если фото не найдено
-            if result == "DELETE 0":
-                logger.warning(f'Фото с ID {photo_id} не найдено для удаления.')
+        # Если фото не найдено
+        if not rows:
+            logger.warning(f'Фото с ID {photo_id} не найдено для удаления.')
+        # Обновляем счётчик фотографий в категории и поисковый индекс
+        for row in rows:
+            photo_counter.decrement(category=row['category_name'])
+        search_index.remove(photo_id=photo_id)
+        photo_cache.invalidate(photo_id=photo_id)
     except asyncpg.exceptions.ForeignKeyViolationError as e:
         raise DatabaseDeletePhotoError(f'{type(e).__name__}: {e} | file_id: {photo_id}') from e
     except Exception as e:
         raise DatabaseDeletePhotoError(f'{type(e).__name__}: {e} | file_id: {photo_id}') from e
 
 
+@timed_db_call
 async def update_photo_in_db(pool: asyncpg.pool.Pool,
                              photo_id: str,
                              new_photo_id: str) -> None:
@@ -428,16 +611,21 @@ async def update_photo_in_db(pool: asyncpg.pool.Pool,
 
     try:
         async with pool.acquire() as conn:
-            result = await conn.execute(
-                'UPDATE photos '
-                'SET photo_id = $1 '
-                'WHERE photo_id = $2',
+            result = await queries.UPDATE_PHOTO_ID.execute(
+                conn,
                 new_photo_id,
                 photo_id
             )
             # Если фото не найдено
             if result == 'UPDATE 0':
                 logger.warning(f'Фото с ID {photo_id} не найдено в БД.')
+            else:
+                # Обновляем ID фото в поисковом индексе и кэше фото
+                search_index.rename(
+                    photo_id=photo_id,
+                    new_photo_id=new_photo_id
+                )
+                photo_cache.invalidate(photo_id=photo_id)
 
     except asyncpg.PostgresError as e:
         raise DatabaseUpdatePhotoError(f'{type(e).__name__}: {e} | file_id: {photo_id}') from e
@@ -447,6 +635,7 @@ async def update_photo_in_db(pool: asyncpg.pool.Pool,
         ) from e
 
 
+@timed_db_call
 async def update_photo_description(pool: asyncpg.pool.Pool,
                                    photo_id: str,
                                    new_description: str,
@@ -463,11 +652,8 @@ async def update_photo_description(pool: asyncpg.pool.Pool,
 
     try:
         async with pool.acquire() as conn:
-            result = await conn.execute(
-                'UPDATE photos '
-                'SET description = $1, '
-                'description_translit = $2 '
-                'WHERE photo_id = $3',
+            result = await queries.UPDATE_PHOTO_DESCRIPTION.execute(
+                conn,
                 new_description,
                 new_description_translit,
                 photo_id
@@ -475,6 +661,14 @@ async def update_photo_description(pool: asyncpg.pool.Pool,
             # Если фото не найдено
             if result == 'UPDATE 0':
                 logger.warning(f'Фото с ID {photo_id} не найдено в БД.')
+            else:
+                # Обновляем описание фото в поисковом индексе и кэше фото
+                search_index.update_description(
+                    photo_id=photo_id,
+                    description=new_description,
+                    description_translit=new_description_translit
+                )
+                photo_cache.invalidate(photo_id=photo_id)
     except asyncpg.PostgresError as e:
         raise DatabaseUpdatePhotoDescriptionError(f'{type(e).__name__}: {e} | file_id: {photo_id}') from e
     except Exception as e:
@@ -483,32 +677,75 @@ async def update_photo_description(pool: asyncpg.pool.Pool,
         ) from e
 
 
+@timed_db_call
 async def search_photo_by_description_in_db(pool: asyncpg.pool.Pool,
                                             category: str,
                                             query: str) -> list[dict]:
 
     """
     Поиск фото по описанию в БД.
+    Кроме вхождения подстроки находятся описания, похожие на запрос (опечатки),
+    результаты сортируются по похожести. Поиск использует триграммные индексы
+    из миграции migrations/0001_photos_search_trgm.sql. Если в БД нет расширения pg_trgm
+    (см. check_pg_trgm_in_db), ищется только вхождение подстроки.
+    Если загружен поисковый индекс в памяти, поиск выполняется по нему без обращения к БД
+    (по истечении SEARCH_INDEX_TTL индекс перестраивается). Иначе результат поиска в БД кэшируется в кэше фото до следующего изменения фото.
     :param pool: Пул соединений с БД.
     :param category: Категория для поиска.
     :param query: Поисковой запрос.
     :return: Возвращение списка словарей найденных записей.
     """
 
+    # Запрос нормализуется один раз, чтобы кэш поиска и запрос к БД получали одинаковую строку
+    query = normalize_query(query)
+
+    # Устаревший индекс перестраивается из БД, при ошибке поиск идёт по прежнему индексу
     try:
+        await refresh_search_index(pool=pool)
+    except DatabaseLoadSearchIndexError as e:
+        logger.error(e)
+
+    # Ищем в индексе в памяти, если он загружен
+    rows = search_index.search(
+        category=category,
+        query=query
+    )
+    if rows is not None:
+        photo_cache.store_many(photos=rows)
+        return rows
+
+    try:
+        # Результат такого же поиска из кэша фото
+        photos = photo_cache.get_search(
+            category=category,
+            query=query
+        )
+        if photos is not None:
+            return photos
+
         async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                "SELECT description, description_translit, photo_id "
-                "FROM photos "
-                "JOIN categories "
-                "ON photos.category_id = categories.id "
-                "WHERE (description ILIKE $1 OR description_translit ILIKE $1) "
-                "AND categories.category_name = $2 "
-                "LIMIT 10",
-                f'%{query}%',
-                category
-            )
-        return [dict(row) for row in rows]
+            if pg_trgm_available:
+                rows = await queries.SEARCH_PHOTO_BY_DESCRIPTION.fetch(
+                    conn,
+                    f'%{query}%',
+                    category,
+                    query
+                )
+            else:
+                rows = await queries.SEARCH_PHOTO_BY_DESCRIPTION_ILIKE.fetch(
+                    conn,
+                    f'%{query}%',
+                    category
+                )
+        photos = [dict(row) for row in rows]
+        # Сохраняем найденные фото в кэш фото для перехода по кнопкам сборок и результат поиска
+        photo_cache.store_many(photos=photos)
+        photo_cache.set_search(
+            category=category,
+            query=query,
+            photos=photos
+        )
+        return photos
     except asyncpg.PostgresError as e:
         raise DatabaseSearchPhotoByDescriptionError(
             f'{type(e).__name__}: {e} | category: {category} | query: {query}'
@@ -517,3 +754,71 @@ async def search_photo_by_description_in_db(pool: asyncpg.pool.Pool,
         raise DatabaseSearchPhotoByDescriptionError(
             f'{type(e).__name__}: {e} | category: {category} | query: {query}'
         ) from e
+
+
+async def check_pg_trgm_in_db(pool: asyncpg.pool.Pool) -> bool:
+
+    """
+    Проверка наличия расширения pg_trgm, нужного для поиска фото по похожести описания.
+    Без расширения поиск переключается на запрос с ILIKE, а в лог пишется предупреждение.
+    :param pool: Пул соединений с БД.
+    :return: Возвращает True, если расширение создано в БД.
+    """
+
+    global pg_trgm_available
+
+    try:
+        async with pool.acquire() as conn:
+            pg_trgm_available = bool(await queries.CHECK_PG_TRGM.fetchval(conn))
+    except asyncpg.PostgresError as e:
+        raise DatabaseCheckExtensionError.from_exception(e) from e
+    except Exception as e:
+        raise DatabaseCheckExtensionError(f'{type(e).__name__}: {e}') from e
+
+    if not pg_trgm_available:
+        logger.warning(
+            'В БД нет расширения pg_trgm: поиск фото выполняется без учёта опечаток. '
+            'Создайте расширение пользователем с правами суперпользователя (см. README.md).'
+        )
+
+    return pg_trgm_available
+
+
+@timed_db_call
+async def load_search_index(pool: asyncpg.pool.Pool) -> None:
+
+    """
+    Загрузка всех фото из БД в поисковый индекс одним запросом.
+    :param pool: Пул соединений с БД.
+    :return: Функция ничего не возвращает.
+    """
+
+    try:
+        async with pool.acquire() as conn:
+            rows = await queries.GET_PHOTOS_FOR_SEARCH_INDEX.fetch(conn)
+        search_index.build(rows=rows)
+        logger.info(f'В поисковый индекс загружено фото: {len(search_index)}')
+    except asyncpg.PostgresError as e:
+        raise DatabaseLoadSearchIndexError.from_exception(e) from e
+    except Exception as e:
+        raise DatabaseLoadSearchIndexError(f'{type(e).__name__}: {e}') from e
+
+
+async def refresh_search_index(pool: asyncpg.pool.Pool) -> None:
+
+    """
+    Перестроение загруженного поискового индекса, если истекло его время жизни.
+    Незагруженный индекс (поиск по индексу выключен) не загружается.
+    :param pool: Пул соединений с БД.
+    :return: Функция ничего не возвращает.
+    """
+
+    if not search_index.loaded or search_index.is_fresh:
+        return
+
+    async with _search_index_lock:
+        # Индекс мог перестроиться, пока ожидалась блокировка
+        if search_index.is_fresh:
+            return
+
+        await load_search_index(pool=pool)
@@ -0,0 +1,180 @@
+import json
+
+from typing import (
+    Any,
+    Mapping
+)
+
+import asyncpg
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseStorage,
+    DefaultKeyBuilder,
+    KeyBuilder,
+    StateType,
+    StorageKey
+)
+
+from bot_app.exceptions.database import DatabaseFSMStorageError
+
+from config import queries
+from config.statements import Statement
+
+
+class PostgresStorage(BaseStorage):
+
+    """
+    Хранилище состояний FSM в таблице fsm_state (migrations/0002_fsm_state.sql).
+    Состояния общие для всех процессов бота, работающих с одной БД, и сохраняются между перезапусками.
+    Каждое чтение и запись идут напрямую в БД без локального кэша, поэтому процессы не видят устаревших
+    состояний. Обновление данных объединяет ключи в БД (jsonb ||), не теряя ключи, записанные другим процессом.
+    Количество обращений к хранилищу за время обработки обновления ограничивает BufferedFSMContext.
+    """
+
+    def __init__(self,
+                 pool: asyncpg.pool.Pool,
+                 key_builder: KeyBuilder | None = None):
+
+        """
+        Инициализация хранилища.
+        :param pool: Пул соединения с БД.
+        :param key_builder: Построитель строкового ключа FSM (по умолчанию с учётом бота и destiny).
+        """
+
+        self.pool = pool
+        self.key_builder = key_builder or DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+
+    async def _run(self,
+                   method: str,
+                   statement: Statement,
+                   key: str,
+                   *args: Any,
+                   delete_if_empty: bool = False) -> Any:
+
+        """
+        Выполнение запроса к таблице fsm_state по ключу.
+        :param method: Название метода запроса (fetchrow, fetchval, execute).
+        :param statement: Запрос из реестра запросов.
+        :param key: Строковый ключ FSM.
+        :param args: Остальные параметры запроса.
+        :param delete_if_empty: Удалить строку, если после запроса у неё нет ни состояния, ни данных.
+        :return: Возвращает результат запроса.
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                result = await getattr(statement, method)(conn, key, *args)
+                # Удаление проверяет обе колонки в момент выполнения, поэтому не затирает
+                # состояние или данные, записанные другим процессом между запросами
+                if delete_if_empty:
+                    await queries.DELETE_EMPTY_FSM_STATE.execute(conn, key)
+        except Exception as e:
+            raise DatabaseFSMStorageError(f'{type(e).__name__}: {e} | key: {key}') from e
+
+        return result
+
+    async def set_state(self,
+                        key: StorageKey,
+                        state: StateType = None) -> None:
+
+        """
+        Запись состояния FSM. Строка без состояния и данных удаляется из таблицы.
+        :param key: Ключ FSM пользователя.
+        :param state: Новое состояние (None - сброс состояния).
+        :return: Функция ничего не возвращает.
+        """
+
+        state = state.state if isinstance(state, State) else state
+
+        await self._run(
+            'execute',
+            queries.SET_FSM_STATE,
+            self.key_builder.build(key),
+            state,
+            delete_if_empty=state is None
+        )
+
+    async def get_state(self,
+                        key: StorageKey) -> str | None:
+
+        """
+        Получение состояния FSM из БД.
+        :param key: Ключ FSM пользователя.
+        :return: Возвращает состояние или None, если состояние не установлено.
+        """
+
+        return await self._run(
+            'fetchval',
+            queries.GET_FSM_STATE,
+            self.key_builder.build(key)
+        )
+
+    async def set_data(self,
+                       key: StorageKey,
+                       data: Mapping[str, Any]) -> None:
+
+        """
+        Запись данных FSM с заменой всех ранее записанных данных. Строка без состояния и данных удаляется из таблицы.
+        :param key: Ключ FSM пользователя.
+        :param data: Новые данные.
+        :return: Функция ничего не возвращает.
+        """
+
+        await self._run(
+            'execute',
+            queries.SET_FSM_DATA,
+            self.key_builder.build(key),
+            json.dumps(dict(data), ensure_ascii=False),
+            delete_if_empty=not data
+        )
+
+    async def get_data(self,
+                       key: StorageKey) -> dict[str, Any]:
+
+        """
+        Получение данных FSM из БД.
+        :param key: Ключ FSM пользователя.
+        :return: Возвращает словарь данных (пустой, если данных нет).
+        """
+
+        data = await self._run(
+            'fetchval',
+            queries.GET_FSM_DATA,
+            self.key_builder.build(key)
+        )
+
+        return json.loads(data) if data is not None else {}
+
+    async def update_data(self,
+                          key: StorageKey,
+                          data: Mapping[str, Any]) -> dict[str, Any]:
+
+        """
+        Обновление данных FSM одним запросом: переданные ключи объединяются с данными в БД (jsonb ||),
+        поэтому одновременные обновления разных ключей из разных процессов не теряются.
+        :param key: Ключ FSM пользователя.
+        :param data: Изменённые ключи данных.
+        :return: Возвращает данные после обновления.
+        """
+
+        if not data:
+            return await self.get_data(key=key)
+
+        merged = await self._run(
+            'fetchval',
+            queries.UPDATE_FSM_DATA,
+            self.key_builder.build(key),
+            json.dumps(dict(data), ensure_ascii=False)
+        )
+
+        return json.loads(merged)
+
+    async def close(self) -> None:
+
+        """
+        Закрытие хранилища. Изменения уже записаны в БД, а пул соединений закрывается отдельно.
+        :return: Функция ничего не возвращает.
+        """
+
+        pass
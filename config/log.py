@@ -1,6 +1,19 @@
+import atexit
+import copy
+import json
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler
+)
+
+from config.config import (
+    LOG_FORMAT,
+    LOG_QUEUE_MAX_SIZE
+)
 
 
 # Определяем корневую директорию проекта
@@ -13,25 +26,166 @@ log_file = os.path.join(log_dir, 'bot.log')
 # Создание папки logs
 os.makedirs(log_dir, exist_ok=True)
 
-# Обработчик для ротации логов (5 файлов по 1 MB каждый)
-file_handler = RotatingFileHandler(
-    log_file,
-    maxBytes=1024 * 1024,
-    backupCount=5,
-    encoding="utf-8"
-)
 
-# Формат логов
-formatter = logging.Formatter(
-    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-file_handler.setFormatter(formatter)
+class JsonFormatter(logging.Formatter):
+
+    """
+    Форматтер записей лога в JSON (одна запись - одна строка) для сборщиков логов.
+    """
+
+    def format(self,
+               record: logging.LogRecord) -> str:
+
+        """
+        Форматирование записи лога.
+        :param record: Запись лога.
+        :return: Возвращает строку JSON с временем, уровнем, логгером и сообщением записи.
+        """
+
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        # Текст исключения подготавливается обработчиком очереди (DroppingQueueHandler.prepare)
+        if record.exc_info or record.exc_text:
+            entry['exc_info'] = record.exc_text or self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DroppingQueueHandler(QueueHandler):
+
+    """
+    Обработчик, передающий записи лога в ограниченную очередь фонового потока записи.
+    Запись в лог не блокирует цикл событий: при заполненной очереди записи ниже ERROR отбрасываются,
+    а для записей ERROR и выше из очереди вытесняется самая старая запись.
+    """
+
+    def __init__(self,
+                 log_queue: queue.Queue):
+
+        """
+        Инициализация обработчика.
+        :param log_queue: Ограниченная очередь записей лога.
+        """
+
+        super().__init__(log_queue)
+        # Количество отброшенных записей
+        self.dropped = 0
+
+    def prepare(self,
+                record: logging.LogRecord) -> logging.LogRecord:
+
+        """
+        Подготовка записи к передаче в очередь: сообщение подставляется сразу (аргументы могут измениться),
+        а текст исключения сохраняется отдельно в exc_text, чтобы обработчики потока записи
+        форматировали его сами (в том числе в поле exc_info JSON), а не получали его внутри сообщения.
+        :param record: Запись лога.
+        :return: Возвращает копию записи для очереди.
+        """
+
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        # Трассировка уже в exc_text: объект исключения не удерживает кадры стека в очереди
+        record.exc_info = None
+
+        return record
+
+    def enqueue(self,
+                record: logging.LogRecord) -> None:
+
+        """
+        Добавление записи в очередь без ожидания.
+        :param record: Подготовленная запись лога.
+        :return: Функция ничего не возвращает.
+        """
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if record.levelno < logging.ERROR:
+                self.dropped += 1
+                return
+
+        # Ошибки важнее старых записей: освобождаем место, вытесняя самую старую
+        try:
+            self.queue.get_nowait()
+            self.dropped += 1
+        except queue.Empty:
+            pass
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def create_file_handler(path: str,
+                        log_format: str = LOG_FORMAT) -> RotatingFileHandler:
+
+    """
+    Создание обработчика записи лога в файл с ротацией (5 файлов по 1 MB каждый).
+    :param path: Путь к файлу лога.
+    :param log_format: Формат записей: text или json.
+    :return: Возвращает обработчик.
+    """
+
+    file_handler = RotatingFileHandler(
+        path,
+        maxBytes=1024 * 1024,
+        backupCount=5,
+        encoding="utf-8"
+    )
+
+    # Формат логов
+    if log_format == 'json':
+        file_handler.setFormatter(JsonFormatter())
+    else:
+        file_handler.setFormatter(logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        ))
+
+    return file_handler
+
+
+def create_queue_pipeline(*handlers: logging.Handler,
+                          maxsize: int = LOG_QUEUE_MAX_SIZE) -> tuple[DroppingQueueHandler, QueueListener]:
+
+    """
+    Создание конвейера логирования: обработчик очереди для логгеров и фоновый поток,
+    передающий записи из очереди обработчикам (файлу и т.п.).
+    :param handlers: Обработчики, выполняющие запись в фоновом потоке.
+    :param maxsize: Максимальное количество записей в очереди.
+    :return: Возвращает обработчик очереди и остановленный QueueListener.
+    """
+
+    log_queue = queue.Queue(maxsize=maxsize)
+
+    # Сообщение записи подставляется до передачи в очередь, окончательно форматируют обработчики потока
+    queue_handler = DroppingQueueHandler(log_queue)
+
+    return queue_handler, QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+
+# Запись в файл выполняется фоновым потоком, логгеры только кладут записи в очередь
+file_handler = create_file_handler(log_file)
+queue_handler, queue_listener = create_queue_pipeline(file_handler)
+queue_listener.start()
+
+# Дописываем оставшиеся в очереди записи при завершении процесса
+atexit.register(queue_listener.stop)
 
 # Настройка логирования
 logging.basicConfig(
     # Уровень логов: DEBUG, INFO, WARNING, ERROR, CRITICAL
     level=logging.INFO,
-    handlers=[file_handler],
+    handlers=[queue_handler],
     force=True
 )
 
@@ -0,0 +1,266 @@
+import argparse
+import asyncio
+import hashlib
+import re
+
+from pathlib import Path
+
+import asyncpg
+
+from config.config import (
+    DATABASE_URL,
+    DB_MIGRATION_TIMEOUT
+)
+from config.log import logger
+from config import queries
+
+from bot_app.exceptions.database import DatabaseMigrationError
+
+
+# Папка с файлами миграций
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / 'migrations'
+
+# Имя файла миграции: номер версии и название (0001_photos_search_trgm.sql)
+MIGRATION_FILE_PATTERN = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+# Ключ блокировки pg_advisory_lock на время применения миграций
+MIGRATIONS_LOCK_KEY = 7_301_245_001
+
+# Отметка в файле миграции, которую нужно выполнять без транзакции (CREATE INDEX CONCURRENTLY)
+NO_TRANSACTION_MARKER = '-- migrate: no-transaction'
+
+
+class Migration:
+
+    """
+    Класс миграции схемы БД из файла папки migrations.
+    """
+
+    __slots__ = ('version', 'name', 'sql')
+
+    def __init__(self,
+                 version: int,
+                 name: str,
+                 sql: str):
+
+        """
+        Инициализация миграции.
+        :param version: Номер версии миграции.
+        :param name: Название миграции.
+        :param sql: Текст миграции.
+        """
+
+        self.version = version
+        self.name = name
+        self.sql = sql
+
+    @property
+    def checksum(self) -> str:
+
+        """
+        Контрольная сумма текста миграции для обнаружения изменения уже применённой миграции.
+        :return: Возвращает хэш SHA-256 текста миграции.
+        """
+
+        return hashlib.sha256(self.sql.encode('utf-8')).hexdigest()
+
+    @property
+    def transactional(self) -> bool:
+
+        """
+        Признак миграции, выполняемой в транзакции (в файле нет отметки NO_TRANSACTION_MARKER).
+        :return: Возвращает True, если миграция выполняется в транзакции.
+        """
+
+        return NO_TRANSACTION_MARKER not in self.sql
+
+    @property
+    def statements(self) -> list[str]:
+
+        """
+        Разбиение текста миграции на отдельные команды по ';' (без строк комментариев).
+        Несколько команд в одном запросе Postgres выполняет в неявной транзакции,
+        поэтому команды миграции без транзакции выполняются по одной.
+        :return: Возвращает список команд.
+        """
+
+        lines = [line for line in self.sql.splitlines() if not line.strip().startswith('--')]
+
+        return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+    def __repr__(self) -> str:
+        return f'Migration({self.version:04d}_{self.name})'
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+
+    """
+    Загрузка миграций из папки.
+    :param directory: Папка с файлами миграций.
+    :return: Возвращает список миграций по возрастанию версии.
+    """
+
+    migrations: dict[int, Migration] = {}
+    for path in directory.glob('*.sql'):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            continue
+
+        version = int(match.group(1))
+        if version in migrations:
+            raise DatabaseMigrationError(f'несколько миграций с версией {version}: {path.name}')
+
+        migrations[version] = Migration(
+            version=version,
+            name=match.group(2),
+            sql=path.read_text(encoding='utf-8')
+        )
+
+    return [migrations[version] for version in sorted(migrations)]
+
+
+async def get_applied_migrations(conn: asyncpg.Connection) -> dict[int, asyncpg.Record]:
+
+    """
+    Получение применённых миграций из таблицы schema_migrations (таблица создаётся, если её нет).
+    :param conn: Соединение с БД.
+    :return: Возвращает записи применённых миграций по номеру версии.
+    """
+
+    await queries.CREATE_SCHEMA_MIGRATIONS.execute(conn)
+    rows = await queries.GET_APPLIED_MIGRATIONS.fetch(conn)
+
+    return {row['version']: row for row in rows}
+
+
+async def apply_migrations(conn: asyncpg.Connection,
+                           migrations: list[Migration] | None = None,
+                           timeout: float | None = DB_MIGRATION_TIMEOUT) -> list[Migration]:
+
+    """
+    Применение новых миграций. Каждая миграция выполняется в отдельной транзакции вместе
+    с записью о ней в schema_migrations, поэтому ошибка не оставляет миграцию применённой частично.
+    Миграции с отметкой NO_TRANSACTION_MARKER (CREATE INDEX CONCURRENTLY) выполняются без транзакции
+    по одной команде и записываются в schema_migrations после выполнения всех команд.
+    Одновременно запущенные процессы бота применяют миграции по очереди (pg_advisory_lock).
+    Миграции 0001 и 0002 могли быть применены вручную до появления schema_migrations,
+    поэтому все миграции пишутся повторяемыми (IF NOT EXISTS).
+    :param conn: Соединение с БД.
+    :param migrations: Миграции для применения (по умолчанию - все миграции папки migrations).
+    :param timeout: Максимальное время (в секундах) выполнения одной команды миграции (None - без ограничения).
+    :return: Возвращает список применённых миграций.
+    """
+
+    if migrations is None:
+        migrations = load_migrations()
+
+    applied = []
+    try:
+        await queries.LOCK_MIGRATIONS.fetchval(conn, MIGRATIONS_LOCK_KEY)
+        try:
+            applied_versions = await get_applied_migrations(conn)
+
+            for migration in migrations:
+                row = applied_versions.get(migration.version)
+                if row is not None:
+                    if row['checksum'] != migration.checksum:
+                        logger.warning(f'Миграция {migration!r} изменена после применения')
+                    continue
+
+                # Текст миграции может содержать несколько команд, поэтому он не подготавливается
+                if migration.transactional:
+                    async with conn.transaction():
+                        await conn.execute(migration.sql, timeout=timeout)
+                        await queries.ADD_APPLIED_MIGRATION.execute(
+                            conn,
+                            migration.version,
+                            migration.name,
+                            migration.checksum
+                        )
+                else:
+                    # Команды повторяемы (IF NOT EXISTS), поэтому после ошибки миграция применяется заново
+                    for statement in migration.statements:
+                        await conn.execute(statement, timeout=timeout)
+                    await queries.ADD_APPLIED_MIGRATION.execute(
+                        conn,
+                        migration.version,
+                        migration.name,
+                        migration.checksum
+                    )
+                applied.append(migration)
+                logger.info(f'Применена миграция {migration!r}')
+        finally:
+            await queries.UNLOCK_MIGRATIONS.fetchval(conn, MIGRATIONS_LOCK_KEY)
+    except asyncpg.PostgresError as e:
+        raise DatabaseMigrationError(
+            f'{type(e).__name__}: {e} | применено: {[m.version for m in applied]}'
+        ) from e
+
+    return applied
+
+
+async def migrate_db(pool: asyncpg.pool.Pool) -> list[Migration]:
+
+    """
+    Применение новых миграций через соединение из пула (при запуске бота).
+    :param pool: Пул соединения с БД.
+    :return: Возвращает список применённых миграций.
+    """
+
+    try:
+        async with pool.acquire() as conn:
+            return await apply_migrations(conn)
+    except DatabaseMigrationError:
+        raise
+    except Exception as e:
+        raise DatabaseMigrationError.from_exception(e) from e
+
+
+async def main() -> None:
+
+    """
+    Применение миграций или вывод их статуса из командной строки (шаг развёртывания бота):
+        python -m config.migrations [--dsn DSN] [--status] [--timeout SECONDS]
+    Расширение pg_trgm создаётся заранее пользователем с правами суперпользователя (см. README.md).
+    :return: Функция ничего не возвращает.
+    """
+
+    parser = argparse.ArgumentParser(description='Миграции схемы БД бота')
+    parser.add_argument('--dsn', default=DATABASE_URL, help='Путь к БД (по умолчанию DATABASE_URL)')
+    parser.add_argument('--status', action='store_true', help='Вывести статус миграций без применения')
+    parser.add_argument('--timeout', type=float, default=DB_MIGRATION_TIMEOUT,
+                        help='Максимальное время одной команды (с), 0 - без ограничения')
+    args = parser.parse_args()
+
+    if not args.dsn:
+        parser.error('укажите --dsn или переменную окружения DATABASE_URL')
+
+    conn = await asyncpg.connect(dsn=args.dsn)
+    try:
+        if args.status:
+            applied_versions = await get_applied_migrations(conn)
+            for migration in load_migrations():
+                row = applied_versions.get(migration.version)
+                if row is None:
+                    status = 'не применена'
+                elif row['checksum'] != migration.checksum:
+                    status = f'применена {row["applied_at"]:%Y-%m-%d %H:%M}, файл изменён'
+                else:
+                    status = f'применена {row["applied_at"]:%Y-%m-%d %H:%M}'
+                print(f'{migration.version:04d}_{migration.name:<30} {status}')
+            return
+
+        applied = await apply_migrations(
+            conn,
+            timeout=args.timeout or None
+        )
+        for migration in applied:
+            print(f'Применена миграция {migration.version:04d}_{migration.name}')
+        if not applied:
+            print('Новых миграций нет')
+    finally:
+        await conn.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import csv
+import json
+import time
+
+from pathlib import Path
+
+from config.database import (
+    create_pool,
+    close_pool,
+    import_photos_to_db
+)
+from config.log import logger
+
+from bot_app.filters.transliterate_filter import transliterate_texts
+
+
+# Количество строк, импортируемых одной транзакцией
+IMPORT_BATCH_SIZE = 10_000
+
+
+def read_photos(path: Path) -> tuple[list[tuple[str, str, str]], int]:
+
+    """
+    Чтение строк импорта из файла CSV (с заголовком file_id,description,category) или JSONL
+    (объекты с полями file_id, description и category). Вместо file_id может быть указан photo_id.
+    :param path: Путь к файлу.
+    :return: Возвращает строки (file_id, описание, категория) и количество строк без обязательных полей.
+    """
+
+    with path.open(encoding='utf-8-sig', newline='') as file:
+        if path.suffix.lower() in ('.jsonl', '.ndjson'):
+            items = (json.loads(line) for line in file if line.strip())
+        else:
+            items = csv.DictReader(file)
+
+        photos = []
+        invalid = 0
+        for item in items:
+            photo_id = (item.get('file_id') or item.get('photo_id') or '').strip()
+            description = (item.get('description') or '').strip()
+            category = (item.get('category') or '').strip()
+            if photo_id and description and category:
+                photos.append((photo_id, description, category))
+            else:
+                invalid += 1
+
+    return photos, invalid
+
+
+async def import_photos(path: Path,
+                        batch_size: int = IMPORT_BATCH_SIZE) -> dict[str, float]:
+
+    """
+    Импорт фото из файла в БД пачками с переводом описаний.
+    :param path: Путь к файлу CSV или JSONL.
+    :param batch_size: Количество строк, импортируемых одной транзакцией.
+    :return: Возвращает итоговую статистику импорта со временем (в секундах) и скоростью (строк в секунду).
+    """
+
+    started = time.perf_counter()
+    photos, invalid = read_photos(path=path)
+
+    # Описания переводятся так же, как фильтром TransliterationFilter при добавлении одного фото
+    translit_started = time.perf_counter()
+    translits = transliterate_texts([description for _, description, _ in photos])
+    translit_time = time.perf_counter() - translit_started
+
+    records = [
+        (photo_id, description, description_translit, category)
+        for (photo_id, description, category), description_translit in zip(photos, translits)
+    ]
+
+    totals = {
+        'rows': 0,
+        'inserted': 0,
+        'updated': 0,
+        'skipped': 0,
+        'categories_created': 0
+    }
+    pool = await create_pool()
+    try:
+        db_started = time.perf_counter()
+        for start in range(0, len(records), batch_size):
+            stats = await import_photos_to_db(
+                pool=pool,
+                photos=records[start:start + batch_size]
+            )
+            for key, value in stats.items():
+                totals[key] += value
+            print(f'Импортировано строк: {totals["rows"]} из {len(records)}')
+        db_time = time.perf_counter() - db_started
+    finally:
+        await close_pool(pool)
+
+    elapsed = time.perf_counter() - started
+
+    return {
+        **totals,
+        'invalid': invalid,
+        'translit_seconds': translit_time,
+        'db_seconds': db_time,
+        'seconds': elapsed,
+        'rows_per_sec': len(records) / elapsed if elapsed else 0.0,
+        'db_rows_per_sec': len(records) / db_time if db_time else 0.0
+    }
+
+
+async def main() -> None:
+
+    """
+    Массовый импорт фото из командной строки:
+        python -m config.photo_import photos.csv [--batch-size 10000]
+    Работающий бот увидит новые фото без перезапуска: каталог категорий, счётчики фото,
+    поисковый индекс и кэш результатов поиска обновляются по истечении CATEGORY_CATALOG_TTL,
+    PHOTO_COUNTER_TTL, SEARCH_INDEX_TTL и PHOTO_SEARCH_CACHE_TTL.
+    :return: Функция ничего не возвращает.
+    """
+
+    parser = argparse.ArgumentParser(description='Массовый импорт фото сборок в БД из CSV или JSONL')
+    parser.add_argument('path', type=Path, help='Файл CSV (file_id,description,category) или JSONL')
+    parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help='Строк в одной транзакции')
+    args = parser.parse_args()
+
+    stats = await import_photos(
+        path=args.path,
+        batch_size=args.batch_size
+    )
+    logger.info(f'Импорт фото из {args.path}: {stats}')
+
+    print(
+        f'Строк: {stats["rows"]} (без обязательных полей: {stats["invalid"]}), '
+        f'добавлено: {stats["inserted"]}, обновлено: {stats["updated"]}, пропущено: {stats["skipped"]}, '
+        f'новых категорий: {stats["categories_created"]}\n'
+        f'Время: {stats["seconds"]:.2f} с (перевод {stats["translit_seconds"]:.2f} с, БД {stats["db_seconds"]:.2f} с), '
+        f'{stats["rows_per_sec"]:.0f} строк/с (БД {stats["db_rows_per_sec"]:.0f} строк/с)'
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,211 @@
+import time
+
+from typing import Iterable
+
+import asyncpg
+import asyncpg.pool
+
+from bot_app.utils.metrics import (
+    current_router,
+    metrics
+)
+
+from config.log import logger
+
+
+class BotConnection(asyncpg.Connection):
+
+    """
+    Соединение с БД, умеющее заранее подготавливать часто используемые запросы.
+    """
+
+    async def warm_up(self,
+                      queries: Iterable[str]) -> None:
+
+        """
+        Подготовка запросов в кэше подготовленных выражений соединения.
+        Последующие fetch/fetchrow/fetchval с тем же текстом запроса не тратят время на разбор и планирование.
+        Кэш, из которого их берут fetch-методы, заполняет только внутренний метод asyncpg _get_statement
+        (публичный prepare() создаёт отдельное выражение вне кэша). Если внутренний метод в другой версии
+        asyncpg отсутствует или изменил сигнатуру, запросы подготавливаются публичным prepare(): так
+        проверяется их текст, а кэш заполнится при первом выполнении.
+        :param queries: Тексты запросов.
+        :return: Функция ничего не возвращает.
+        """
+
+        get_statement = getattr(self, '_get_statement', None)
+        for query in queries:
+            if get_statement is not None:
+                try:
+                    await get_statement(query, None)
+                    continue
+                except TypeError as e:
+                    logger.warning(f'Подготовка запросов через prepare(): {e}')
+                    get_statement = None
+
+            await self.prepare(query)
+
+
+class PoolStats:
+
+    """
+    Класс для накопления статистики ожидания соединений из пула.
+    """
+
+    def __init__(self):
+
+        """
+        Инициализация пустой статистики.
+        """
+
+        self.acquires = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self,
+               wait: float) -> None:
+
+        """
+        Учёт одного получения соединения из пула.
+        :param wait: Время ожидания соединения в секундах.
+        :return: Функция ничего не возвращает.
+        """
+
+        self.acquires += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    def reset(self) -> None:
+
+        """
+        Сброс накопленной статистики.
+        :return: Функция ничего не возвращает.
+        """
+
+        self.acquires = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+
+class _TimedAcquireContext:
+
+    """
+    Обёртка над контекстом получения соединения, замеряющая время ожидания соединения.
+    """
+
+    __slots__ = ('_context', '_stats')
+
+    def __init__(self,
+                 context,
+                 stats: PoolStats):
+
+        """
+        Инициализация обёртки.
+        :param context: Контекст получения соединения из пула asyncpg.
+        :param stats: Статистика пула, в которую записывается время ожидания.
+        """
+
+        self._context = context
+        self._stats = stats
+
+    async def _acquire(self):
+
+        """
+        Получение соединения с записью времени ожидания в статистику пула и метрики.
+        :return: Возвращает соединение с БД.
+        """
+
+        started = time.perf_counter()
+        conn = await self._context.__aenter__()
+        wait = time.perf_counter() - started
+        self._stats.record(wait=wait)
+        metrics.observe(
+            'db_pool_acquire_seconds',
+            wait,
+            router=current_router.get()
+        )
+        return conn
+
+    async def __aenter__(self):
+
+        """
+        Получение соединения при входе в контекст (async with pool.acquire()).
+        :return: Возвращает соединение с БД.
+        """
+
+        return await self._acquire()
+
+    async def __aexit__(self, *exc):
+
+        """
+        Возврат соединения в пул при выходе из контекста.
+        :param exc: Тип, значение и трассировка исключения, возникшего в контексте.
+        :return: Возвращает результат выхода из контекста asyncpg.
+        """
+
+        return await self._context.__aexit__(*exc)
+
+    def __await__(self):
+
+        """
+        Получение соединения без контекста (await pool.acquire()), соединение возвращается через release().
+        :return: Возвращает итератор ожидания соединения.
+        """
+
+        return self._acquire().__await__()
+
+
+class BotPool(asyncpg.pool.Pool):
+
+    """
+    Пул соединений с БД, собирающий статистику использования соединений.
+    """
+
+    __slots__ = ('_stats',)
+
+    def __init__(self, *args, **kwargs):
+
+        """
+        Инициализация пула с пустой статистикой.
+        :param args: Позиционные аргументы asyncpg.pool.Pool.
+        :param kwargs: Именованные аргументы asyncpg.pool.Pool.
+        """
+
+        super().__init__(*args, **kwargs)
+        self._stats = PoolStats()
+
+    def acquire(self, *, timeout=None):
+
+        """
+        Получение соединения из пула с замером времени ожидания.
+        :param timeout: Максимальное время ожидания соединения.
+        :return: Возвращает контекст получения соединения.
+        """
+
+        return _TimedAcquireContext(
+            context=super().acquire(timeout=timeout),
+            stats=self._stats
+        )
+
+    def stats(self) -> dict:
+
+        """
+        Получение статистики пула соединений.
+        :return: Возвращает словарь с размером пула, количеством занятых и свободных соединений
+        и временем ожидания соединения (в миллисекундах).
+        """
+
+        size = self.get_size()
+        idle = self.get_idle_size()
+        stats = self._stats
+
+        return {
+            'min_size': self.get_min_size(),
+            'max_size': self.get_max_size(),
+            'size': size,
+            'in_use': size - idle,
+            'idle': idle,
+            'acquires': stats.acquires,
+            'wait_avg_ms': stats.wait_total / stats.acquires * 1000 if stats.acquires else 0.0,
+            'wait_max_ms': stats.wait_max * 1000
+        }
@@ -0,0 +1,351 @@
+from config.statements import statements
+
+
+# Группы
+
+ADD_GROUP = statements.register(
+    'add_group',
+    "INSERT INTO groups (group_id, group_name) "
+    "VALUES ($1, $2) "
+    "ON CONFLICT (group_id) DO NOTHING"
+)
+
+GET_GROUPS = statements.register(
+    'get_groups',
+    "SELECT ARRAY_AGG(group_id) "
+    "FROM groups"
+)
+
+DELETE_GROUP = statements.register(
+    'delete_group',
+    "DELETE FROM groups "
+    "WHERE group_id = $1"
+)
+
+
+# Категории
+
+GET_CATEGORY_ID = statements.register(
+    'get_category_id',
+    "SELECT id "
+    "FROM categories "
+    "WHERE category_name = $1;"
+)
+
+ADD_CATEGORY = statements.register(
+    'add_category',
+    "INSERT INTO categories (category_name, category_description) "
+    "VALUES ($1, $2) "
+    "ON CONFLICT (category_name) "
+    "DO NOTHING "
+    "RETURNING id;"
+)
+
+GET_CATEGORIES = statements.register(
+    'get_categories',
+    "SELECT JSON_AGG("
+    "JSONB_BUILD_OBJECT('name', category_name, 'description', category_description) "
+    "ORDER BY id ASC) "
+    "FROM categories"
+)
+
+
+# Фото
+
+PHOTO_DESCRIPTION_EXISTS = statements.register(
+    'photo_description_exists',
+    "SELECT 1 "
+    "FROM photos "
+    "WHERE description = $1;"
+)
+
+UPSERT_PHOTO = statements.register(
+    'upsert_photo',
+    "INSERT INTO photos (photo_id, description, description_translit, category_id) "
+    "VALUES ($1, $2, $3, $4) "
+    "ON CONFLICT (photo_id) "
+    "DO UPDATE "
+    "SET "
+    "description = EXCLUDED.description, "
+    "description_translit = EXCLUDED.description_translit, "
+    "category_id = EXCLUDED.category_id "
+    "RETURNING id, (xmax = 0) AS inserted"
+)
+
+def _photos_page_sql(page_condition: str) -> str:
+
+    """
+    Формирование запроса страницы фото вместе с количеством фото в категории.
+    :param page_condition: Условие и сортировка фото страницы относительно id фотографии $3.
+    :return: Возвращает текст запроса.
+    """
+
+    return (
+        "WITH category AS ("
+        "SELECT id FROM categories WHERE category_name = $1"
+        "), page AS ("
+        "SELECT photos.id, photos.photo_id, photos.description "
+        "FROM photos "
+        "JOIN category ON photos.category_id = category.id "
+        "WHERE TRUE "
+        f"{page_condition}"
+        "LIMIT $2"
+        ") "
+        "SELECT "
+        "(SELECT id FROM category) AS category_id, "
+        "CASE WHEN $4 THEN ("
+        "SELECT COUNT(*) FROM photos WHERE category_id = (SELECT id FROM category)"
+        ") END AS total, "
+        "(SELECT JSON_AGG("
+        "JSONB_BUILD_OBJECT('id', id, 'photo_id', photo_id, 'description', description) "
+        "ORDER BY id ASC) FROM page) AS photos"
+    )
+
+
+# Запрос страницы фото для каждого направления пагинации
+GET_PHOTOS_PAGE = {
+    'next': statements.register(
+        'get_photos_page_next',
+        _photos_page_sql("AND photos.id > $3 ORDER BY photos.id ASC "),
+        hot=True
+    ),
+    'prev': statements.register(
+        'get_photos_page_prev',
+        _photos_page_sql("AND photos.id < $3 ORDER BY photos.id DESC "),
+        hot=True
+    )
+}
+
+GET_PHOTO_DESCRIPTION = statements.register(
+    'get_photo_description',
+    "SELECT description "
+    "FROM photos "
+    "WHERE photo_id = $1"
+)
+
+GET_PHOTO_BY_ID = statements.register(
+    'get_photo_by_id',
+    "SELECT photo_id, description "
+    "FROM photos "
+    "WHERE id = $1",
+    hot=True
+)
+
+GET_FILE_ID_BY_DESCRIPTION = statements.register(
+    'get_file_id_by_description',
+    "SELECT photo_id "
+    "FROM photos "
+    "WHERE description = $1",
+    hot=True
+)
+
+DELETE_PHOTO = statements.register(
+    'delete_photo',
+    "DELETE FROM photos "
+    "WHERE photo_id = $1 "
+    "RETURNING (SELECT category_name FROM categories WHERE id = photos.category_id) AS category_name"
+)
+
+UPDATE_PHOTO_ID = statements.register(
+    'update_photo_id',
+    'UPDATE photos '
+    'SET photo_id = $1 '
+    'WHERE photo_id = $2'
+)
+
+UPDATE_PHOTO_DESCRIPTION = statements.register(
+    'update_photo_description',
+    'UPDATE photos '
+    'SET description = $1, '
+    'description_translit = $2 '
+    'WHERE photo_id = $3'
+)
+
+# Не подготавливается при открытии соединения: без расширения pg_trgm ошибка подготовки
+# прервала бы подготовку остальных запросов
+SEARCH_PHOTO_BY_DESCRIPTION = statements.register(
+    'search_photo_by_description',
+    "SELECT photos.id, description, description_translit, photo_id "
+    "FROM photos "
+    "JOIN categories "
+    "ON photos.category_id = categories.id "
+    "WHERE (description ILIKE $1 OR description_translit ILIKE $1 "
+    "OR $3 <% description OR $3 <% description_translit) "
+    "AND categories.category_name = $2 "
+    "ORDER BY GREATEST(word_similarity($3, description), "
+    "word_similarity($3, description_translit)) DESC, photos.id "
+    "LIMIT 10"
+)
+
+# Поиск без расширения pg_trgm (только вхождение подстроки, без учёта опечаток)
+SEARCH_PHOTO_BY_DESCRIPTION_ILIKE = statements.register(
+    'search_photo_by_description_ilike',
+    "SELECT photos.id, description, description_translit, photo_id "
+    "FROM photos "
+    "JOIN categories "
+    "ON photos.category_id = categories.id "
+    "WHERE (description ILIKE $1 OR description_translit ILIKE $1) "
+    "AND categories.category_name = $2 "
+    "ORDER BY photos.id "
+    "LIMIT 10"
+)
+
+CHECK_PG_TRGM = statements.register(
+    'check_pg_trgm',
+    "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+)
+
+GET_PHOTOS_FOR_SEARCH_INDEX = statements.register(
+    'get_photos_for_search_index',
+    "SELECT photos.id, photos.photo_id, photos.description, photos.description_translit, categories.category_name "
+    "FROM photos "
+    "JOIN categories "
+    "ON photos.category_id = categories.id "
+    "ORDER BY photos.id"
+)
+
+
+# Массовый импорт фото
+
+# Промежуточная таблица импорта, удаляется при завершении транзакции
+CREATE_PHOTO_IMPORT_TABLE = statements.register(
+    'create_photo_import_table',
+    "CREATE TEMP TABLE photo_import ("
+    "position INTEGER NOT NULL, "
+    "photo_id TEXT NOT NULL, "
+    "description TEXT NOT NULL, "
+    "description_translit TEXT, "
+    "category_name TEXT NOT NULL) "
+    "ON COMMIT DROP"
+)
+
+# Категории импорта, которых ещё нет в БД (описание категории - её название, как при добавлении фото)
+IMPORT_CATEGORIES = statements.register(
+    'import_categories',
+    "INSERT INTO categories (category_name, category_description) "
+    "SELECT DISTINCT category_name, category_name "
+    "FROM photo_import "
+    "ON CONFLICT (category_name) DO NOTHING "
+    "RETURNING id"
+)
+
+# Слияние импорта с таблицей photos: для повторяющегося file_id берётся последняя строка файла,
+# для повторяющегося описания - первая, а описания, которые уже есть у другого фото в БД, пропускаются
+MERGE_PHOTO_IMPORT = statements.register(
+    'merge_photo_import',
+    "WITH latest AS ("
+    "SELECT DISTINCT ON (photo_id) * "
+    "FROM photo_import "
+    "ORDER BY photo_id, position DESC"
+    "), unique_description AS ("
+    "SELECT DISTINCT ON (description) * "
+    "FROM latest "
+    "ORDER BY description, position"
+    ") "
+    "INSERT INTO photos (photo_id, description, description_translit, category_id) "
+    "SELECT unique_description.photo_id, unique_description.description, "
+    "unique_description.description_translit, categories.id "
+    "FROM unique_description "
+    "JOIN categories "
+    "ON categories.category_name = unique_description.category_name "
+    "WHERE NOT EXISTS ("
+    "SELECT 1 FROM photos "
+    "WHERE photos.description = unique_description.description "
+    "AND photos.photo_id <> unique_description.photo_id"
+    ") "
+    "ON CONFLICT (photo_id) "
+    "DO UPDATE "
+    "SET "
+    "description = EXCLUDED.description, "
+    "description_translit = EXCLUDED.description_translit, "
+    "category_id = EXCLUDED.category_id "
+    "RETURNING (xmax = 0) AS inserted"
+)
+
+
+# Состояния FSM
+
+GET_FSM_STATE = statements.register(
+    'get_fsm_state',
+    "SELECT state "
+    "FROM fsm_state "
+    "WHERE key = $1"
+)
+
+GET_FSM_DATA = statements.register(
+    'get_fsm_data',
+    "SELECT data "
+    "FROM fsm_state "
+    "WHERE key = $1"
+)
+
+SET_FSM_STATE = statements.register(
+    'set_fsm_state',
+    "INSERT INTO fsm_state (key, state) "
+    "VALUES ($1, $2) "
+    "ON CONFLICT (key) "
+    "DO UPDATE "
+    "SET state = EXCLUDED.state, updated_at = now()"
+)
+
+SET_FSM_DATA = statements.register(
+    'set_fsm_data',
+    "INSERT INTO fsm_state (key, data) "
+    "VALUES ($1, $2::jsonb) "
+    "ON CONFLICT (key) "
+    "DO UPDATE "
+    "SET data = EXCLUDED.data, updated_at = now()"
+)
+
+# Ключи объединяются с данными в БД, поэтому одновременные обновления разных ключей не теряются
+UPDATE_FSM_DATA = statements.register(
+    'update_fsm_data',
+    "INSERT INTO fsm_state (key, data) "
+    "VALUES ($1, $2::jsonb) "
+    "ON CONFLICT (key) "
+    "DO UPDATE "
+    "SET data = fsm_state.data || EXCLUDED.data, updated_at = now() "
+    "RETURNING data"
+)
+
+DELETE_EMPTY_FSM_STATE = statements.register(
+    'delete_empty_fsm_state',
+    "DELETE FROM fsm_state "
+    "WHERE key = $1 AND state IS NULL AND data = '{}'::jsonb"
+)
+
+
+# Миграции
+
+CREATE_SCHEMA_MIGRATIONS = statements.register(
+    'create_schema_migrations',
+    "CREATE TABLE IF NOT EXISTS schema_migrations ("
+    "version INTEGER PRIMARY KEY, "
+    "name TEXT NOT NULL, "
+    "checksum TEXT NOT NULL, "
+    "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+)
+
+GET_APPLIED_MIGRATIONS = statements.register(
+    'get_applied_migrations',
+    "SELECT version, name, checksum, applied_at "
+    "FROM schema_migrations "
+    "ORDER BY version"
+)
+
+ADD_APPLIED_MIGRATION = statements.register(
+    'add_applied_migration',
+    "INSERT INTO schema_migrations (version, name, checksum) "
+    "VALUES ($1, $2, $3)"
+)
+
+# Блокировка на время применения миграций, чтобы их не применяли одновременно несколько процессов бота
+LOCK_MIGRATIONS = statements.register(
+    'lock_migrations',
+    "SELECT pg_advisory_lock($1)"
+)
+
+UNLOCK_MIGRATIONS = statements.register(
+    'unlock_migrations',
+    "SELECT pg_advisory_unlock($1)"
+)
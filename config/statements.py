@@ -0,0 +1,226 @@
+import time
+
+from typing import (
+    Any,
+    Iterator
+)
+
+import asyncpg
+
+
+class Statement:
+
+    """
+    Класс запроса к БД из реестра запросов.
+    Запрос подготавливается соединением при первом выполнении и дальше берётся из кэша
+    подготовленных выражений этого соединения, а время каждого выполнения учитывается в статистике запроса.
+    """
+
+    __slots__ = ('name', 'sql', 'hot', 'calls', 'errors', 'time_total', 'time_max')
+
+    def __init__(self,
+                 name: str,
+                 sql: str,
+                 hot: bool = False):
+
+        """
+        Инициализация запроса.
+        :param name: Имя запроса в реестре.
+        :param sql: Текст запроса.
+        :param hot: Признак часто используемого запроса, подготавливаемого при создании соединения.
+        """
+
+        self.name = name
+        self.sql = sql
+        self.hot = hot
+        self.calls = 0
+        self.errors = 0
+        self.time_total = 0.0
+        self.time_max = 0.0
+
+    async def _run(self,
+                   method: str,
+                   conn: asyncpg.Connection,
+                   args: tuple) -> Any:
+
+        """
+        Выполнение запроса выбранным методом соединения с замером времени.
+        :param method: Название метода соединения (fetch, fetchrow, fetchval, execute, executemany).
+        :param conn: Соединение с БД.
+        :param args: Параметры запроса.
+        :return: Возвращает результат метода соединения.
+        """
+
+        started = time.perf_counter()
+        try:
+            return await getattr(conn, method)(self.sql, *args)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.calls += 1
+            self.time_total += elapsed
+            self.time_max = max(self.time_max, elapsed)
+
+    async def fetch(self, conn: asyncpg.Connection, *args) -> list[asyncpg.Record]:
+
+        """
+        Выполнение запроса с получением всех строк результата.
+        :param conn: Соединение с БД.
+        :param args: Параметры запроса.
+        :return: Возвращает список строк результата.
+        """
+
+        return await self._run('fetch', conn, args)
+
+    async def fetchrow(self, conn: asyncpg.Connection, *args) -> asyncpg.Record | None:
+
+        """
+        Выполнение запроса с получением первой строки результата.
+        :param conn: Соединение с БД.
+        :param args: Параметры запроса.
+        :return: Возвращает первую строку результата или None, если строк нет.
+        """
+
+        return await self._run('fetchrow', conn, args)
+
+    async def fetchval(self, conn: asyncpg.Connection, *args) -> Any:
+
+        """
+        Выполнение запроса с получением значения первого столбца первой строки.
+        :param conn: Соединение с БД.
+        :param args: Параметры запроса.
+        :return: Возвращает значение или None, если строк нет.
+        """
+
+        return await self._run('fetchval', conn, args)
+
+    async def execute(self, conn: asyncpg.Connection, *args) -> str:
+
+        """
+        Выполнение запроса без получения строк результата.
+        :param conn: Соединение с БД.
+        :param args: Параметры запроса.
+        :return: Возвращает статус выполнения команды.
+        """
+
+        return await self._run('execute', conn, args)
+
+    async def executemany(self, conn: asyncpg.Connection, args: list[tuple]) -> None:
+
+        """
+        Выполнение запроса для каждого набора параметров.
+        :param conn: Соединение с БД.
+        :param args: Список наборов параметров запроса.
+        :return: Функция ничего не возвращает.
+        """
+
+        return await self._run('executemany', conn, (args,))
+
+    def stats(self) -> dict:
+
+        """
+        Получение статистики выполнения запроса.
+        :return: Возвращает словарь с количеством выполнений, ошибок и временем выполнения (в миллисекундах).
+        """
+
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'time_avg_ms': self.time_total / self.calls * 1000 if self.calls else 0.0,
+            'time_max_ms': self.time_max * 1000
+        }
+
+    def reset(self) -> None:
+
+        """
+        Сброс статистики выполнения запроса.
+        :return: Функция ничего не возвращает.
+        """
+
+        self.calls = 0
+        self.errors = 0
+        self.time_total = 0.0
+        self.time_max = 0.0
+
+
+class StatementRegistry:
+
+    """
+    Класс реестра всех запросов к БД.
+    """
+
+    def __init__(self):
+
+        """
+        Инициализация пустого реестра.
+        """
+
+        self._statements: dict[str, Statement] = {}
+
+    def register(self,
+                 name: str,
+                 sql: str,
+                 hot: bool = False) -> Statement:
+
+        """
+        Добавление запроса в реестр.
+        :param name: Уникальное имя запроса.
+        :param sql: Текст запроса.
+        :param hot: Признак часто используемого запроса.
+        :return: Возвращает объект запроса.
+        """
+
+        if name in self._statements:
+            raise ValueError(f'Запрос {name} уже зарегистрирован')
+
+        statement = Statement(
+            name=name,
+            sql=sql,
+            hot=hot
+        )
+        self._statements[name] = statement
+
+        return statement
+
+    def hot_queries(self) -> list[str]:
+
+        """
+        Получение текстов часто используемых запросов для подготовки на новом соединении.
+        :return: Возвращает список текстов запросов.
+        """
+
+        return [statement.sql for statement in self._statements.values() if statement.hot]
+
+    def stats(self) -> dict[str, dict]:
+
+        """
+        Получение статистики выполнения всех запросов.
+        :return: Возвращает словарь со статистикой по имени запроса.
+        """
+
+        return {name: statement.stats() for name, statement in self._statements.items()}
+
+    def reset(self) -> None:
+
+        """
+        Сброс статистики выполнения всех запросов.
+        :return: Функция ничего не возвращает.
+        """
+
+        for statement in self._statements.values():
+            statement.reset()
+
+    def __getitem__(self, name: str) -> Statement:
+        return self._statements[name]
+
+    def __iter__(self) -> Iterator[Statement]:
+        return iter(self._statements.values())
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+
+# Реестр запросов к БД для всего процесса бота
+statements = StatementRegistry()
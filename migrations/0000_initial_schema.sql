@@ -0,0 +1,29 @@
+-- Таблицы бота: группы, категории и фото сборок. Индексы таблицы photos создаются
+-- без блокировки записи миграцией 0003_photos_indexes.sql.
+-- Все объекты создаются с IF NOT EXISTS, поэтому миграция безопасна для БД, в которой
+-- таблицы были созданы вручную: в ней добавляются только недостающие индексы.
+-- Имя уникального индекса совпадает с именем ограничения UNIQUE, которое Postgres создаёт
+-- по умолчанию (categories_category_name_key), чтобы не дублировать его.
+
+CREATE TABLE IF NOT EXISTS groups (
+    group_id BIGINT PRIMARY KEY,
+    group_name TEXT
+);
+
+CREATE TABLE IF NOT EXISTS categories (
+    id SERIAL PRIMARY KEY,
+    category_name TEXT NOT NULL,
+    category_description TEXT
+);
+
+CREATE TABLE IF NOT EXISTS photos (
+    id SERIAL PRIMARY KEY,
+    photo_id TEXT NOT NULL,
+    description TEXT NOT NULL,
+    description_translit TEXT,
+    category_id INTEGER REFERENCES categories (id)
+);
+
+-- Поиск категории по имени и ON CONFLICT (category_name) при добавлении категории
+CREATE UNIQUE INDEX IF NOT EXISTS categories_category_name_key
+    ON categories (category_name);
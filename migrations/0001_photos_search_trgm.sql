@@ -0,0 +1,13 @@
+-- migrate: no-transaction
+-- Триграммные индексы для поиска фото по описанию (search_photo_by_description_in_db).
+-- GIN-индексы с gin_trgm_ops ускоряют как ILIKE '%...%', так и операторы похожести (<%),
+-- поэтому поиск не выполняет последовательное сканирование таблицы photos.
+-- Нужно расширение pg_trgm: его заранее создаёт суперпользователь (CREATE EXTENSION pg_trgm, см. README.md).
+-- Индексы строятся CONCURRENTLY, не блокируя запись в photos. Если построение прервано,
+-- остаётся индекс в состоянии INVALID: его нужно удалить (DROP INDEX CONCURRENTLY) и применить миграцию заново.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS photos_description_trgm_idx
+    ON photos USING GIN (description gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS photos_description_translit_trgm_idx
+    ON photos USING GIN (description_translit gin_trgm_ops);
@@ -0,0 +1,10 @@
+-- Таблица состояний FSM (config/fsm_storage.py, FSM_STORAGE=postgres).
+-- Одна строка на ключ FSM (бот, чат, пользователь): состояние и данные пользователя.
+-- Строки с пустым состоянием и пустыми данными удаляются, поэтому таблица хранит только активные диалоги.
+
+CREATE TABLE IF NOT EXISTS fsm_state (
+    key TEXT PRIMARY KEY,
+    state TEXT,
+    data JSONB NOT NULL DEFAULT '{}'::jsonb,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
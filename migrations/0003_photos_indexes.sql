@@ -0,0 +1,18 @@
+-- migrate: no-transaction
+-- Индексы таблицы photos под запросы config/queries.py.
+-- Индексы строятся CONCURRENTLY, не блокируя запись в photos. Если построение прервано,
+-- остаётся индекс в состоянии INVALID: его нужно удалить (DROP INDEX CONCURRENTLY) и применить миграцию заново.
+-- Имя уникального индекса совпадает с именем ограничения UNIQUE, которое Postgres создаёт
+-- по умолчанию (photos_photo_id_key), чтобы не дублировать его в БД, созданной вручную.
+
+-- Поиск, изменение и удаление фото по file_id и ON CONFLICT (photo_id) при добавлении фото
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS photos_photo_id_key
+    ON photos (photo_id);
+
+-- Проверка дубликата описания и получение file_id по описанию
+CREATE INDEX CONCURRENTLY IF NOT EXISTS photos_description_idx
+    ON photos (description);
+
+-- Пагинация по ключу (category_id = ... AND id > ... ORDER BY id) и подсчёт фото в категории
+CREATE INDEX CONCURRENTLY IF NOT EXISTS photos_category_id_id_idx
+    ON photos (category_id, id);
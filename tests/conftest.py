@@ -1,7 +1,15 @@
+import asyncio
+import os
+import uuid
+
+import asyncpg
 import pytest
 import pytest_asyncio
 
+from collections import defaultdict
 from typing import (
+    Any,
+    AsyncGenerator,
     Callable,
     Awaitable
 )
@@ -13,6 +21,9 @@ from unittest.mock import (
 
 
 from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import TelegramMethod
 from aiogram.types import (
     Message,
     Chat,
@@ -24,6 +35,136 @@ from aiogram.types import (
 )
 from aiogram.fsm.context import FSMContext
 
+from bot_app.utils.admin_cache import admin_cache
+from bot_app.utils.category_catalog import category_catalog
+from bot_app.utils.keyboard_cache import keyboard_cache
+from bot_app.utils.metrics import metrics
+from bot_app.utils.photo_cache import photo_cache
+from bot_app.utils.photo_counter import photo_counter
+from bot_app.utils.search_index import search_index
+from bot_app.utils.group_registry import GroupRegistry
+
+from config.migrations import apply_migrations
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+
+    """
+    Фикстура для очистки кэшей процесса между тестами.
+    :return: Функция ничего не возвращает.
+    """
+
+    admin_cache.clear(reset_stats=True)
+    category_catalog.clear()
+    photo_counter.clear()
+    search_index.clear()
+    photo_cache.clear(reset_stats=True)
+    keyboard_cache.clear(reset_stats=True)
+    metrics.clear()
+    yield
+    admin_cache.clear(reset_stats=True)
+    category_catalog.clear()
+    photo_counter.clear()
+    search_index.clear()
+    photo_cache.clear(reset_stats=True)
+    keyboard_cache.clear(reset_stats=True)
+    metrics.clear()
+
+
+class FakeTelegramSession(BaseSession):
+
+    """
+    Сессия бота, имитирующая Telegram Bot API без сетевых запросов.
+    Запоминает время каждого запроса по чатам и может отвечать TelegramRetryAfter
+    на первые запросы в чат, как Telegram при превышении лимита.
+    """
+
+    def __init__(self,
+                 latency: float = 0.0):
+
+        super().__init__()
+        self.latency = latency
+        # chat_id -> время запросов (по часам цикла событий)
+        self.requests: dict[int | str, list[float]] = defaultdict(list)
+        # Порядок выполнения запросов (chat_id)
+        self.order: list[int | str] = []
+        # chat_id -> количество ответов TelegramRetryAfter, которые ещё нужно отправить
+        self.retry_after: dict[int | str, int] = {}
+        self.retry_after_seconds = 0.05
+
+    async def make_request(self,
+                           bot: Bot,
+                           method: TelegramMethod[Any],
+                           timeout: int | None = None) -> Any:
+
+        chat_id = getattr(method, 'chat_id', None)
+        if self.retry_after.get(chat_id):
+            self.retry_after[chat_id] -= 1
+            raise TelegramRetryAfter(
+                method=method,
+                message='Too Many Requests',
+                retry_after=self.retry_after_seconds
+            )
+
+        self.requests[chat_id].append(asyncio.get_running_loop().time())
+        self.order.append(chat_id)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        return True
+
+    async def stream_content(self, *args, **kwargs) -> AsyncGenerator[bytes, None]:
+        yield b''
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest_asyncio.fixture
+async def fake_telegram_api() -> tuple[Bot, FakeTelegramSession]:
+
+    """
+    Фикстура для бота с имитацией Telegram Bot API.
+    :return: Возвращает кортеж из объекта Bot и его сессии FakeTelegramSession.
+    """
+
+    session = FakeTelegramSession()
+    bot = Bot(
+        token='42:TEST',
+        session=session
+    )
+
+    return bot, session
+
+
+@pytest_asyncio.fixture
+async def migrated_db() -> AsyncGenerator[asyncpg.Connection, None]:
+
+    """
+    Фикстура для соединения с тестовой БД (TEST_DATABASE_URL), в которой применены все миграции.
+    Миграции применяются во временной схеме, которая удаляется после теста.
+    Расширение pg_trgm создаётся заранее, как при развёртывании (пользователь тестовой БД - суперпользователь).
+    Если переменная TEST_DATABASE_URL не задана, тест пропускается.
+    :return: Возвращает соединение с БД с временной схемой в search_path.
+    """
+
+    dsn = os.getenv('TEST_DATABASE_URL')
+    if not dsn:
+        pytest.skip('TEST_DATABASE_URL не задан')
+
+    schema = f'test_{uuid.uuid4().hex[:12]}'
+    conn = await asyncpg.connect(dsn=dsn)
+    try:
+        await conn.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        await conn.execute(f'CREATE SCHEMA {schema}')
+        await conn.execute(f'SET search_path TO {schema}, public')
+        await apply_migrations(conn)
+        yield conn
+    finally:
+        await conn.execute(f'DROP SCHEMA IF EXISTS {schema} CASCADE')
+        await conn.close()
+
 
 @pytest_asyncio.fixture
 async def mock_db_pool() -> Callable[[dict], Awaitable[tuple[MagicMock, MagicMock]]]:
@@ -164,6 +305,18 @@ def mock_admin():
     return mock_bot, mock_member
 
 
+@pytest.fixture
+def group_registry(sample_test_data) -> GroupRegistry:
+
+    """
+    Фикстура для реестра групп.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Возвращает реестр групп, заполненный тестовыми группами.
+    """
+
+    return GroupRegistry(groups_id=sample_test_data['groups'])
+
+
 @pytest.fixture
 def keyboards_test_data() -> dict[str, InlineKeyboardMarkup]:
 
@@ -254,11 +407,11 @@ def keyboards_test_data() -> dict[str, InlineKeyboardMarkup]:
                 [
                     InlineKeyboardButton(
                         text='Description123',
-                        callback_data='photo_Description123'
+                        callback_data='photo_id_123'
                     ),
                     InlineKeyboardButton(
                         text='Description456',
-                        callback_data='photo_Description456'
+                        callback_data='photo_id_456'
                     )
                 ]
             ]
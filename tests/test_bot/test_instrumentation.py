@@ -0,0 +1,84 @@
+import pytest
+
+from aiogram import (
+    Dispatcher,
+    Router
+)
+from aiogram.types import (
+    Message,
+    Update
+)
+
+from bot_app.middlewares.instrumentation import (
+    APITimingMiddleware,
+    InstrumentationMiddleware
+)
+from bot_app.utils.metrics import metrics
+
+
+# Синтетическое обновление с текстовым сообщением от пользователя
+UPDATE = {
+    'update_id': 1,
+    'message': {
+        'message_id': 1,
+        'date': 0,
+        'chat': {
+            'id': 123,
+            'type': 'private'
+        },
+        'from': {
+            'id': 123,
+            'is_bot': False,
+            'first_name': 'Test'
+        },
+        'text': 'Description123'
+    }
+}
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_tags_by_router(fake_telegram_api):
+
+    """
+    Тест замера времени обновления, хендлера и запросов к Telegram Bot API с меткой роутера.
+    :param fake_telegram_api: Фикстура бота с имитацией Telegram Bot API.
+    :return: Функция ничего не возвращает.
+    """
+
+    bot, session = fake_telegram_api
+    bot.session.middleware(APITimingMiddleware())
+
+    router = Router(name='bot_user_handlers_router')
+
+    @router.message()
+    async def search_photo(message: Message):
+        await message.answer(text='reply')
+
+    dp = Dispatcher()
+    instrumentation = InstrumentationMiddleware()
+    dp.update.middleware(instrumentation)
+    dp.include_router(router)
+    instrumentation.setup(dp)
+
+    for _ in range(3):
+        await dp.feed_update(bot, Update.model_validate(UPDATE, context={'bot': bot}))
+
+    assert metrics.histogram('update_seconds', type='message').count == 3
+    assert metrics.histogram(
+        'handler_seconds',
+        router='bot_user_handlers_router',
+        handler='search_photo',
+        status='ok'
+    ).count == 3
+    assert metrics.histogram(
+        'telegram_api_seconds',
+        method='sendMessage',
+        router='bot_user_handlers_router',
+        status='ok'
+    ).count == 3
+
+    # Вне хендлера запрос учитывается без роутера
+    await bot.get_me()
+    assert metrics.histogram('telegram_api_seconds', method='getMe', router='none', status='ok').count == 1
+
+    await bot.session.close()
@@ -0,0 +1,89 @@
+import pytest
+
+from unittest.mock import MagicMock
+
+from aiohttp.test_utils import (
+    TestClient,
+    TestServer
+)
+
+from bot_app.exceptions.database import DatabaseGetPhotosError
+from bot_app.metrics_server import (
+    create_metrics_app,
+    runtime_collector
+)
+from bot_app.middlewares.rate_limiter import RateLimitMiddleware
+from bot_app.middlewares.throttling import ThrottlingMiddleware
+from bot_app.utils.metrics import (
+    metrics,
+    timed_db_call
+)
+from bot_app.utils.photo_cache import photo_cache
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+
+    """
+    Тестирование отдачи метрик в формате Prometheus.
+    :return: Функция ничего не возвращает.
+    """
+
+    pool = MagicMock()
+    pool.stats.return_value = {
+        'min_size': 2,
+        'max_size': 10,
+        'size': 4,
+        'in_use': 3,
+        'idle': 1
+    }
+    metrics.add_collector(
+        runtime_collector(
+            pool=pool,
+            rate_limiter=RateLimitMiddleware(),
+            throttling=ThrottlingMiddleware()
+        )
+    )
+
+    # Ошибка функции работы с БД учитывается по классу исключения
+    @timed_db_call
+    async def get_photos_page_from_db():
+        raise DatabaseGetPhotosError('error')
+
+    with pytest.raises(DatabaseGetPhotosError):
+        await get_photos_page_from_db()
+
+    metrics.observe('update_seconds', 0.01, type='callback_query')
+    photo_cache.get_file_id(description='missing')
+
+    async with TestClient(TestServer(create_metrics_app(path='/metrics'))) as client:
+        response = await client.get('/metrics')
+        assert response.status == 200
+        assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+        text = await response.text()
+
+    assert '# TYPE update_seconds histogram' in text
+    assert 'update_seconds_count{type="callback_query"} 1' in text
+    assert 'db_errors_total{exception="DatabaseGetPhotosError",function="get_photos_page_from_db"} 1' in text
+    assert 'db_pool_connections{state="in_use"} 3.0' in text
+    assert 'db_pool_utilisation 0.3' in text
+    assert '# TYPE cache_hit_ratio gauge' in text
+    assert 'cache_misses_total{cache="photo"} 1.0' in text
+    assert 'telegram_outbound_retries_total 0.0' in text
+    assert 'callbacks_total{result="collapsed"} 0.0' in text
+
+
+def test_metrics_collector_error():
+
+    """
+    Тестирование того, что ошибка сборщика не мешает отдаче остальных метрик.
+    :return: Функция ничего не возвращает.
+    """
+
+    def broken_collector():
+        raise RuntimeError('error')
+
+    metrics.add_collector(broken_collector)
+    metrics.inc('errors_total')
+
+    assert 'errors_total 1' in metrics.render()
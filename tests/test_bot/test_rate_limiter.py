@@ -0,0 +1,180 @@
+import asyncio
+
+import pytest
+
+from aiogram.exceptions import TelegramRetryAfter
+
+from bot_app.middlewares.rate_limiter import RateLimitMiddleware
+
+
+def assert_within_limit(timestamps: list[float],
+                        rate: float,
+                        capacity: float) -> None:
+
+    """
+    Проверка, что запросы не превышают лимит token bucket на любом отрезке времени.
+    :param timestamps: Время запросов.
+    :param rate: Допустимое количество запросов в секунду.
+    :param capacity: Допустимый всплеск запросов.
+    :return: Функция ничего не возвращает.
+    """
+
+    timestamps = sorted(timestamps)
+    for i, start in enumerate(timestamps):
+        for j in range(i, len(timestamps)):
+            # Небольшой допуск на погрешность таймеров цикла событий
+            assert j - i + 1 <= capacity + rate * (timestamps[j] - start) + 0.5
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_under_load(fake_telegram_api):
+
+    """
+    Тест соблюдения общего и чатовых лимитов при всплеске запросов в личные чаты и группы.
+    :param fake_telegram_api: Фикстура бота с имитацией Telegram Bot API.
+    :return: Функция ничего не возвращает.
+    """
+
+    bot, session = fake_telegram_api
+    # Лимиты уменьшены пропорционально, чтобы тест выполнялся быстро
+    limiter = RateLimitMiddleware(
+        global_rate=300,
+        global_burst=10,
+        chat_rate=50,
+        chat_burst=2,
+        group_rate=20,
+        group_burst=2
+    )
+    bot.session.middleware(limiter)
+
+    chats = [1, 2, 3, 4, -100, -200]
+    await asyncio.gather(*[
+        bot.send_message(chat_id=chat_id, text='text')
+        for chat_id in chats
+        for _ in range(8)
+    ])
+
+    all_requests = []
+    for chat_id in chats:
+        assert len(session.requests[chat_id]) == 8
+        if chat_id > 0:
+            assert_within_limit(session.requests[chat_id], rate=50, capacity=2)
+        else:
+            assert_within_limit(session.requests[chat_id], rate=20, capacity=2)
+        all_requests += session.requests[chat_id]
+    assert_within_limit(all_requests, rate=300, capacity=10)
+
+    stats = limiter.stats()
+    assert stats['requests'] == 48
+    assert stats['throttled'] > 0
+    assert stats['queued'] == 0
+
+    await bot.session.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_priority(fake_telegram_api):
+
+    """
+    Тест приоритета ответов пользователям над сообщениями в группы.
+    :param fake_telegram_api: Фикстура бота с имитацией Telegram Bot API.
+    :return: Функция ничего не возвращает.
+    """
+
+    bot, session = fake_telegram_api
+    limiter = RateLimitMiddleware(
+        global_rate=100,
+        global_burst=1,
+        group_rate=1000,
+        group_burst=100
+    )
+    bot.session.middleware(limiter)
+
+    # Рассылка по группам заняла очередь, затем приходят ответы пользователям
+    announcements = [
+        asyncio.create_task(bot.send_message(chat_id=-i, text='announcement'))
+        for i in range(1, 6)
+    ]
+    await asyncio.sleep(0)
+    replies = [
+        asyncio.create_task(bot.send_message(chat_id=i, text='reply'))
+        for i in range(1, 3)
+    ]
+    await asyncio.gather(*announcements, *replies)
+
+    # Первый токен достаётся первой группе, следующие - пользователям, затем остальным группам
+    assert session.order == [-1, 1, 2, -2, -3, -4, -5]
+
+    await bot.session.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_retry_after(fake_telegram_api):
+
+    """
+    Тест повтора запроса после ответа TelegramRetryAfter.
+    :param fake_telegram_api: Фикстура бота с имитацией Telegram Bot API.
+    :return: Функция ничего не возвращает.
+    """
+
+    bot, session = fake_telegram_api
+    limiter = RateLimitMiddleware(
+        chat_rate=100,
+        chat_burst=5,
+        max_retries=2
+    )
+    bot.session.middleware(limiter)
+    loop = asyncio.get_running_loop()
+
+    # Запрос повторяется после паузы retry_after
+    session.retry_after[1] = 2
+    started = loop.time()
+    assert await bot.send_message(chat_id=1, text='text') is True
+    assert loop.time() - started >= 2 * session.retry_after_seconds
+    assert limiter.stats()['retries'] == 2
+
+    # После max_retries повторов ошибка передаётся вызывающему коду
+    session.retry_after[2] = 3
+    with pytest.raises(TelegramRetryAfter):
+        await bot.send_message(chat_id=2, text='text')
+    assert session.requests[2] == []
+
+    # Запросы без чата (например, ответы на callback) не ограничиваются
+    await bot.get_me()
+    assert limiter.stats()['requests'] == 2
+
+    await bot.session.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_retry_after_pauses_bot(fake_telegram_api):
+
+    """
+    Тест приостановки всех исходящих сообщений бота после ответа TelegramRetryAfter в одном чате.
+    :param fake_telegram_api: Фикстура бота с имитацией Telegram Bot API.
+    :return: Функция ничего не возвращает.
+    """
+
+    bot, session = fake_telegram_api
+    limiter = RateLimitMiddleware(
+        global_rate=100,
+        global_burst=10,
+        chat_rate=100,
+        chat_burst=10
+    )
+    bot.session.middleware(limiter)
+    loop = asyncio.get_running_loop()
+
+    session.retry_after[1] = 1
+    paused_at = loop.time()
+    retried = asyncio.create_task(bot.send_message(chat_id=1, text='text'))
+    await asyncio.sleep(0)
+
+    # Сообщение в другой чат ждёт окончания паузы бота
+    assert await bot.send_message(chat_id=3, text='text') is True
+    assert session.requests[3][0] - paused_at >= session.retry_after_seconds * 0.9
+
+    assert await retried is True
+    assert limiter.stats()['retries'] == 1
+
+    await bot.session.close()
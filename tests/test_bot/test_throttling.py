@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from unittest.mock import (
+    AsyncMock,
+    MagicMock
+)
+
+from bot_app.lexicon.lexicon_common.lexicon_ru import LEXICON_RU
+from bot_app.middlewares.throttling import ThrottlingMiddleware
+
+
+def create_update(user_id: int = 123,
+                  message_id: int | None = 1,
+                  data: str = 'page_2_next_6') -> MagicMock:
+
+    """
+    Создание мокированного обновления.
+    :param user_id: ID пользователя, нажавшего кнопку.
+    :param message_id: ID сообщения с кнопкой (None - обновление без нажатия кнопки).
+    :param data: callback_data кнопки.
+    :return: Возвращает мокированный объект Update.
+    """
+
+    update = MagicMock()
+    if message_id is None:
+        update.callback_query = None
+        return update
+
+    update.callback_query.from_user.id = user_id
+    update.callback_query.message.message_id = message_id
+    update.callback_query.data = data
+    update.callback_query.answer = AsyncMock()
+
+    return update
+
+
+@pytest.mark.asyncio
+async def test_throttling_collapses_repeated_callbacks():
+
+    """
+    Тест схлопывания нажатий, пришедших во время обработки предыдущего нажатия, в последнее.
+    :return: Функция ничего не возвращает.
+    """
+
+    middleware = ThrottlingMiddleware(
+        rate=100,
+        burst=100
+    )
+    release = asyncio.Event()
+    handled = []
+
+    async def handler(event, data):
+        handled.append(event.callback_query.data)
+        await release.wait()
+        return 'handled'
+
+    updates = [create_update(data=f'page_{i}_next_6') for i in range(5)]
+    # Нажатие кнопки другого сообщения не схлопывается с остальными
+    other = create_update(message_id=2, data='photo_id_1')
+
+    tasks = [asyncio.create_task(middleware(handler, update, {})) for update in updates + [other]]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    # Обработаны первое нажатие (пришло первым) и последнее, промежуточные пропущены
+    assert handled == ['page_0_next_6', 'photo_id_1', 'page_4_next_6']
+    assert results == ['handled', None, None, None, 'handled', 'handled']
+    for update in updates[1:4]:
+        update.callback_query.answer.assert_awaited_once_with(text=None)
+    updates[4].callback_query.answer.assert_not_awaited()
+
+    assert middleware.stats()['collapsed'] == 3
+    assert middleware.stats()['processed'] == 3
+    assert middleware._slots == {}
+
+
+@pytest.mark.asyncio
+async def test_throttling_rate_limit():
+
+    """
+    Тест ограничения количества нажатий пользователя в секунду.
+    :return: Функция ничего не возвращает.
+    """
+
+    middleware = ThrottlingMiddleware(
+        rate=0.01,
+        burst=2
+    )
+    handler = AsyncMock(return_value='handled')
+
+    results = [await middleware(handler, create_update(), {}) for _ in range(3)]
+
+    assert results == ['handled', 'handled', None]
+    assert handler.await_count == 2
+    assert middleware.stats()['rate_limited'] == 1
+
+    # Лимит считается отдельно для каждого пользователя
+    update = create_update(user_id=456)
+    assert await middleware(handler, update, {}) == 'handled'
+
+    # Пропущенное сверх лимита нажатие получает уведомление
+    update = create_update()
+    assert await middleware(handler, update, {}) is None
+    update.callback_query.answer.assert_awaited_once_with(text=LEXICON_RU['too_many_requests'])
+
+
+@pytest.mark.asyncio
+async def test_throttling_skips_other_updates():
+
+    """
+    Тест обработки обновлений без нажатия кнопок без ограничений.
+    :return: Функция ничего не возвращает.
+    """
+
+    middleware = ThrottlingMiddleware(
+        rate=0.01,
+        burst=1
+    )
+    handler = AsyncMock(return_value='handled')
+
+    for _ in range(3):
+        assert await middleware(handler, create_update(message_id=None), {}) == 'handled'
+
+    assert handler.await_count == 3
+    assert middleware.stats()['processed'] == 0
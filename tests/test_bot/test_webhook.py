@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from aiogram import (
+    Bot,
+    Dispatcher,
+    Router
+)
+from aiogram.types import Message
+from aiohttp.test_utils import (
+    TestClient,
+    TestServer
+)
+
+from bot_app.exceptions.webhook import WebhookConfigError
+from bot_app.webhook import create_webhook_app
+
+
+# Синтетическое обновление с текстовым сообщением от пользователя
+UPDATE = {
+    'update_id': 1,
+    'message': {
+        'message_id': 1,
+        'date': 0,
+        'chat': {
+            'id': 123,
+            'type': 'private'
+        },
+        'from': {
+            'id': 123,
+            'is_bot': False,
+            'first_name': 'Test'
+        },
+        'text': 'Description123'
+    }
+}
+
+
+def create_dispatcher(received: list[str],
+                      delay: float = 0) -> Dispatcher:
+
+    """
+    Создание Dispatcher с хендлером, запоминающим текст полученных сообщений.
+    :param received: Список для текста полученных сообщений.
+    :param delay: Время обработки сообщения (в секундах).
+    :return: Возвращает объект Dispatcher.
+    """
+
+    router = Router()
+
+    @router.message()
+    async def handler(message: Message):
+        await asyncio.sleep(delay)
+        received.append(message.text)
+
+    dp = Dispatcher()
+    dp.include_router(router)
+
+    return dp
+
+
+@pytest.mark.asyncio
+async def test_webhook_app():
+
+    """
+    Тестирование приёма обновлений через webhook с проверкой секретного токена.
+    :return: Функция ничего не возвращает.
+    """
+
+    received = []
+    bot = Bot(token='42:TEST')
+
+    app = create_webhook_app(
+        dp=create_dispatcher(received=received),
+        bot=bot,
+        path='/webhook',
+        secret_token='secret',
+        handle_in_background=False
+    )
+
+    async with TestClient(TestServer(app)) as client:
+        # Запрос без секретного токена отклоняется
+        response = await client.post('/webhook', json=UPDATE)
+        assert response.status == 401
+
+        # Запрос с неверным секретным токеном отклоняется
+        response = await client.post(
+            '/webhook',
+            json=UPDATE,
+            headers={'X-Telegram-Bot-Api-Secret-Token': 'wrong'}
+        )
+        assert response.status == 401
+        assert received == []
+
+        # Обновление с верным токеном передаётся в Dispatcher
+        response = await client.post(
+            '/webhook',
+            json=UPDATE,
+            headers={'X-Telegram-Bot-Api-Secret-Token': 'secret'}
+        )
+        assert response.status == 200
+        assert received == ['Description123']
+
+    # Без секретного токена приложение не создаётся
+    with pytest.raises(WebhookConfigError):
+        create_webhook_app(
+            dp=create_dispatcher(received=received),
+            bot=bot,
+            secret_token=None
+        )
+
+
+@pytest.mark.asyncio
+async def test_webhook_app_shutdown():
+
+    """
+    Тестирование того, что при остановке сервера принятые обновления обрабатываются до конца.
+    :return: Функция ничего не возвращает.
+    """
+
+    received = []
+
+    app = create_webhook_app(
+        dp=create_dispatcher(received=received, delay=0.05),
+        bot=Bot(token='42:TEST'),
+        path='/webhook',
+        secret_token='secret'
+    )
+
+    async with TestClient(TestServer(app)) as client:
+        # Ответ Telegram отправляется сразу, обработка идёт в фоне
+        response = await client.post(
+            '/webhook',
+            json=UPDATE,
+            headers={'X-Telegram-Bot-Api-Secret-Token': 'secret'}
+        )
+        assert response.status == 200
+        assert received == []
+
+    assert received == ['Description123']
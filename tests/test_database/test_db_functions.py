@@ -13,65 +13,133 @@ from bot_app.exceptions.database import (
     DatabaseGetGroupError,
     DatabaseDeleteGroupError,
     DatabaseAddPhotoWithCategoryError,
+    DatabaseImportPhotosError,
     DatabaseGetPhotosError,
-    DatabaseGetTotalPhotosError,
     DatabaseGetPhotoDescriptionByFileIdError,
     DatabaseGetFileIdByDescriptionError,
+    DatabaseGetPhotoByIdError,
     DatabaseGetCategoriesError,
     DatabaseDeletePhotoError,
     DatabaseUpdatePhotoError,
     DatabaseUpdatePhotoDescriptionError,
-    DatabaseSearchPhotoByDescriptionError
+    DatabaseSearchPhotoByDescriptionError,
+    DatabaseCheckExtensionError,
+    DatabaseLoadSearchIndexError
 )
 from bot_app.exceptions.photo import PhotoAlreadyExistsError
-
+from bot_app.utils.category_catalog import category_catalog
+from bot_app.utils.photo_cache import photo_cache
+from bot_app.utils.photo_counter import photo_counter
+from bot_app.utils.search_index import search_index
+
+from config.config import (
+    DB_POOL_MIN_SIZE,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MAX_QUERIES,
+    DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+    DB_STATEMENT_CACHE_SIZE,
+    DB_COMMAND_TIMEOUT
+)
+from config import (
+    database,
+    queries
+)
 from config.database import (
+    init_connection,
     create_pool,
     close_pool,
     add_group_to_db,
     get_groups_from_db,
     delete_group_from_db,
     add_photo_with_category_to_db,
-    get_photos_from_db,
-    get_total_photos_count,
+    import_photos_to_db,
+    get_photos_page_from_db,
     get_photo_description_by_file_id_from_db,
     get_photo_file_id_by_description_from_db,
+    get_photo_by_id_from_db,
     get_categories_from_db,
     delete_photo_from_db,
     update_photo_in_db,
     update_photo_description,
-    search_photo_by_description_in_db
+    search_photo_by_description_in_db,
+    check_pg_trgm_in_db,
+    load_search_index,
+    refresh_search_index
 )
+from config.pool import BotConnection
+from config.statements import statements
 
 
 @pytest.mark.asyncio
 @patch('config.database.DATABASE_URL', 'mock_dsn')
-@patch('config.database.asyncpg.create_pool', new_callable=AsyncMock)
-async def test_create_pool(mock_asyncpg_create_pool):
+@patch('config.database.BotPool')
+async def test_create_pool(mock_bot_pool):
+
+    """
+    Тестирование успешного создания пула подключения.
+    :param mock_bot_pool: Мокированный класс пула соединений BotPool.
+    :return: Функция ничего не возвращает.
+    """
 
-    """Тестирование успешного создания пула подключения."""
+    async def mock_pool_init():
+        return 'mock_pool'
 
-    mock_asyncpg_create_pool.return_value = 'mock_pool'
+    mock_bot_pool.side_effect = lambda *args, **kwargs: mock_pool_init()
 
     pool = await create_pool()
 
-    mock_asyncpg_create_pool.assert_called_once_with(dsn='mock_dsn')
+    mock_bot_pool.assert_called_once_with(
+        'mock_dsn',
+        min_size=DB_POOL_MIN_SIZE,
+        max_size=DB_POOL_MAX_SIZE,
+        max_queries=DB_POOL_MAX_QUERIES,
+        max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+        init=init_connection,
+        loop=None,
+        connection_class=BotConnection,
+        record_class=asyncpg.Record,
+        statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+        command_timeout=DB_COMMAND_TIMEOUT
+    )
     assert pool == 'mock_pool'
 
-    mock_asyncpg_create_pool.reset_mock()
+    mock_bot_pool.reset_mock()
 
-    mock_asyncpg_create_pool.side_effect = TypeError('Type error')
+    mock_bot_pool.side_effect = TypeError('Type error')
     with pytest.raises(DatabaseConnectionError) as exc_info:
         await create_pool()
 
     assert 'TypeError' in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_init_connection():
+
+    """
+    Тестирование подготовки часто используемых запросов на новом соединении пула.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_conn = AsyncMock()
+
+    await init_connection(conn=mock_conn)
+
+    mock_conn.warm_up.assert_awaited_once_with(queries=statements.hot_queries())
+
+    # Ошибка подготовки запросов не прерывает создание соединения
+    mock_conn.warm_up.side_effect = asyncpg.PostgresError('DB error')
+    await init_connection(conn=mock_conn)
+
+
 @pytest.mark.asyncio
 @patch('config.database.close_pool', new_callable=AsyncMock)
 async def test_close_pool(mock_pool):
 
-    """Тестирование успешного закрытия пула подключения."""
+    """
+    Тестирование успешного закрытия пула подключения.
+    :param mock_pool: AsyncMock, передаваемый в close_pool как пул соединений.
+    :return: Функция ничего не возвращает.
+    """
 
     await close_pool(pool=mock_pool)
     mock_pool.close.assert_awaited_once()
@@ -260,12 +328,18 @@ async def test_add_photo_with_category_to_db(mock_db_pool,
 
     mock_pool, mock_conn = await mock_db_pool(data=photo)
 
+    version = category_catalog.version
+    photo_counter.set(
+        category=category,
+        count=3
+    )
+
     # Настраиваем fetchval через side_effect
     mock_conn.fetchval = AsyncMock(side_effect=[
         None,
-        category_id,
-        None
+        category_id
     ])
+    mock_conn.fetchrow = AsyncMock(return_value={'id': 1, 'inserted': True})
 
     await add_photo_with_category_to_db(
         pool=mock_pool,
@@ -291,7 +365,7 @@ async def test_add_photo_with_category_to_db(mock_db_pool,
         ),
     ], any_order=False)
 
-    mock_conn.execute.assert_called_once_with(
+    mock_conn.fetchrow.assert_called_once_with(
         "INSERT INTO photos (photo_id, description, description_translit, category_id) "
         "VALUES ($1, $2, $3, $4) "
         "ON CONFLICT (photo_id) "
@@ -299,13 +373,61 @@ async def test_add_photo_with_category_to_db(mock_db_pool,
         "SET "
         "description = EXCLUDED.description, "
         "description_translit = EXCLUDED.description_translit, "
-        "category_id = EXCLUDED.category_id ",
+        "category_id = EXCLUDED.category_id "
+        "RETURNING id, (xmax = 0) AS inserted",
         photo_id,
         description,
         description_translit,
         category_id
     )
 
+    # Категория уже была в БД, версия каталога категорий не меняется
+    assert category_catalog.version == version
+    # Новое фото увеличивает счётчик фотографий категории
+    assert photo_counter.get(category=category) == 4
+
+    mock_conn.fetchval.reset_mock()
+
+    # Тестируем обновление существующего фото
+    mock_conn.fetchval = AsyncMock(side_effect=[
+        None,
+        category_id
+    ])
+    mock_conn.fetchrow = AsyncMock(return_value={'id': 1, 'inserted': False})
+
+    await add_photo_with_category_to_db(
+        pool=mock_pool,
+        photo_id=photo_id,
+        description=description,
+        description_translit=description_translit,
+        category_name=category
+    )
+
+    # Фото могло сменить категорию, поэтому счётчики сбрасываются
+    assert photo_counter.get(category=category) is None
+
+    mock_conn.fetchval.reset_mock()
+    mock_conn.execute.reset_mock()
+
+    # Тестируем создание новой категории
+    mock_conn.fetchval = AsyncMock(side_effect=[
+        None,
+        None,
+        category_id
+    ])
+    mock_conn.fetchrow = AsyncMock(return_value={'id': 1, 'inserted': True})
+
+    await add_photo_with_category_to_db(
+        pool=mock_pool,
+        photo_id=photo_id,
+        description=description,
+        description_translit=description_translit,
+        category_name=category
+    )
+
+    # Проверяем, что версия каталога категорий увеличилась
+    assert category_catalog.version == version + 1
+
     mock_conn.fetchval.reset_mock()
     mock_conn.execute.reset_mock()
 
@@ -353,89 +475,75 @@ async def test_add_photo_with_category_to_db(mock_db_pool,
 
 
 @pytest.mark.asyncio
-async def test_get_photos_from_db(mock_db_pool,
-                                  sample_test_data) -> None:
+async def test_import_photos_to_db(mock_db_pool) -> None:
 
     """
-    Тестирование функции получения фото из базы данных.
+    Тестирование функции массового импорта фото через промежуточную таблицу.
     :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
     возвращающая кортеж из мокированного пула соединений и само соединение с БД.
-    :param sample_test_data: Словарь с тестовыми данными.
     :return: Функция ничего не возвращает.
     """
 
-    photo_data = sample_test_data['photos']
-
-    category = next(iter({cat['category'] for cat in photo_data}))
-    category_id = sample_test_data['category_id']['id']
-
-    mock_pool, mock_conn = await mock_db_pool(data={})
+    photos = [
+        ('file_1', 'Описание 1', 'Opisanie 1', 'Category1'),
+        ('file_2', 'Описание 2', 'Opisanie 2', 'Category2'),
+        ('file_1', 'Описание 1', 'Opisanie 1', 'Category1')
+    ]
+    mock_pool, mock_conn = await mock_db_pool(data=[])
+    mock_conn.copy_records_to_table = AsyncMock()
+    mock_conn.fetch = AsyncMock(side_effect=[
+        [{'id': 2}],
+        [{'inserted': True}, {'inserted': False}]
+    ])
 
-    mock_conn.fetchrow = AsyncMock(return_value={'id': category_id})
-    mock_conn.fetch = AsyncMock(return_value=photo_data)
+    version = category_catalog.version
+    photo_counter.set(category='Category1', count=3)
+    photo_cache.remember(photo_id='file_1', description='Старое описание')
 
-    result = await get_photos_from_db(
+    stats = await import_photos_to_db(
         pool=mock_pool,
-        category=category,
-        limit=5,
-        offset=0
-    )
-
-    mock_conn.fetchrow.assert_called_once_with(
-        "SELECT id "
-        "FROM categories "
-        "WHERE category_name = $1",
-        category
+        photos=photos
     )
 
-    mock_conn.fetch.assert_called_once_with(
-        "SELECT id, photo_id, description "
-        "FROM photos "
-        "WHERE category_id = $1 "
-        "ORDER BY id ASC "
-        "LIMIT $2 "
-        "OFFSET $3",
-        category_id,
-        5,
-        0
+    assert stats == {
+        'rows': 3,
+        'inserted': 1,
+        'updated': 1,
+        'skipped': 1,
+        'categories_created': 1
+    }
+    mock_conn.execute.assert_awaited_once_with(queries.CREATE_PHOTO_IMPORT_TABLE.sql)
+    mock_conn.copy_records_to_table.assert_awaited_once_with(
+        'photo_import',
+        records=[(position, *photo) for position, photo in enumerate(photos)],
+        columns=['position', 'photo_id', 'description', 'description_translit', 'category_name']
     )
+    assert [c.args for c in mock_conn.fetch.await_args_list] == [
+        (queries.IMPORT_CATEGORIES.sql,),
+        (queries.MERGE_PHOTO_IMPORT.sql,)
+    ]
 
-    assert result == photo_data
-
-    mock_conn.fetchrow.reset_mock()
-    mock_conn.fetch.reset_mock()
+    # Создана категория, счётчики и кэш фото сброшены
+    assert category_catalog.version == version + 1
+    assert photo_counter.get(category='Category1') is None
+    assert photo_cache.get_description(photo_id='file_1') is None
 
     # Тестируем ошибку, связанную с БД
-    mock_conn.fetchrow.side_effect = asyncpg.PostgresError("DB error")
-    with pytest.raises(DatabaseGetPhotosError) as exc_info:
-        await get_photos_from_db(
+    mock_conn.copy_records_to_table.side_effect = asyncpg.PostgresError('DB error')
+    with pytest.raises(DatabaseImportPhotosError) as exc_info:
+        await import_photos_to_db(
             pool=mock_pool,
-            category=category,
-            limit=5,
-            offset=0
+            photos=photos
         )
-    assert "DB error" in str(exc_info.value)
-
-    mock_conn.fetchrow.reset_mock()
-
-    # Тестируем неизвестную ошибку
-    mock_conn.fetchrow.side_effect = TypeError("Type error")
-    with pytest.raises(DatabaseGetPhotosError) as exc_info:
-        await get_photos_from_db(
-            pool=mock_pool,
-            category=category,
-            limit=5,
-            offset=0
-        )
-    assert "TypeError" in str(exc_info.value)
+    assert 'DB error' in str(exc_info.value)
 
 
 @pytest.mark.asyncio
-async def test_get_total_photos_count(mock_db_pool,
-                                      sample_test_data) -> None:
+async def test_get_photos_page_from_db(mock_db_pool,
+                                       sample_test_data) -> None:
 
     """
-    Тестирование функции получения всех фото из конкретной категории.
+    Тестирование функции получения страницы фото вместе с общим количеством фото одним запросом.
     :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
     возвращающая кортеж из мокированного пула соединений и само соединение с БД.
     :param sample_test_data: Словарь с тестовыми данными.
@@ -447,43 +555,101 @@ async def test_get_total_photos_count(mock_db_pool,
     category = next(iter({cat['category'] for cat in photo_data}))
     category_id = sample_test_data['category_id']['id']
 
-    total_photos = len(photo_data)
+    photos = [
+        {
+            'id': photo['id'],
+            'photo_id': photo['photo_id'],
+            'description': photo['description']
+        }
+        for photo in photo_data
+    ]
 
     mock_pool, mock_conn = await mock_db_pool(data={})
 
-    mock_conn.fetchrow = AsyncMock(return_value={'id': category_id})
-    mock_conn.fetchval = AsyncMock(return_value=total_photos)
+    mock_conn.fetchrow = AsyncMock(return_value={
+        'category_id': category_id,
+        'total': len(photos),
+        'photos': json.dumps(photos)
+    })
 
-    result = await get_total_photos_count(
+    # Первая страница: количество фото подсчитывается в том же запросе
+    result = await get_photos_page_from_db(
         pool=mock_pool,
-        category=category
+        category=category,
+        limit=5
     )
 
-    mock_conn.fetchrow.assert_called_once_with(
-        "SELECT id "
-        "FROM categories "
-        "WHERE category_name = $1",
-        category
+    mock_conn.fetchrow.assert_called_once()
+    args = mock_conn.fetchrow.call_args.args
+    assert "photos.id > $3 ORDER BY photos.id ASC" in args[0]
+    assert args[1:] == (category, 5, 0, True)
+
+    assert result == {
+        'category_id': category_id,
+        'photos': photos,
+        'total': len(photos)
+    }
+    assert photo_counter.get(category=category) == len(photos)
+
+    mock_conn.fetchrow.reset_mock()
+
+    # Предыдущая страница: количество берётся из счётчика фотографий
+    await get_photos_page_from_db(
+        pool=mock_pool,
+        category=category,
+        limit=5,
+        cursor=photos[0]['id'],
+        direction='prev'
     )
 
-    mock_conn.fetchval.assert_called_once_with(
-        "SELECT COUNT(*) "
-        "FROM photos "
-        "WHERE category_id = $1",
-        category_id
+    args = mock_conn.fetchrow.call_args.args
+    assert "photos.id < $3 ORDER BY photos.id DESC" in args[0]
+    assert args[1:] == (category, 5, photos[0]['id'], False)
+
+    mock_conn.fetchrow.reset_mock()
+
+    # Неполная первая страница исправляет счётчик, не согласный с ней (фото удалили в другом процессе)
+    photo_counter.set(category=category, count=len(photos) + 10)
+    result = await get_photos_page_from_db(
+        pool=mock_pool,
+        category=category,
+        limit=len(photos) + 1
     )
 
-    assert result == total_photos
+    assert mock_conn.fetchrow.call_args.args[-1] is False
+    assert result['total'] == len(photos)
+    assert photo_counter.get(category=category) == len(photos)
+
+    mock_conn.fetchrow.reset_mock()
+
+    # Тестируем отсутствующую категорию
+    mock_conn.fetchrow.return_value = {
+        'category_id': None,
+        'total': None,
+        'photos': None
+    }
+    result = await get_photos_page_from_db(
+        pool=mock_pool,
+        category='unknown',
+        limit=5
+    )
+
+    assert result == {
+        'category_id': None,
+        'photos': [],
+        'total': 0
+    }
+    assert photo_counter.get(category='unknown') is None
 
     mock_conn.fetchrow.reset_mock()
-    mock_conn.fetchval.reset_mock()
 
     # Тестируем ошибку, связанную с БД
     mock_conn.fetchrow.side_effect = asyncpg.PostgresError("DB error")
-    with pytest.raises(DatabaseGetTotalPhotosError) as exc_info:
-        await get_total_photos_count(
+    with pytest.raises(DatabaseGetPhotosError) as exc_info:
+        await get_photos_page_from_db(
             pool=mock_pool,
-            category=category
+            category=category,
+            limit=5
         )
     assert "DB error" in str(exc_info.value)
 
@@ -491,10 +657,11 @@ async def test_get_total_photos_count(mock_db_pool,
 
     # Тестируем неизвестную ошибку
     mock_conn.fetchrow.side_effect = TypeError("Type error")
-    with pytest.raises(DatabaseGetTotalPhotosError) as exc_info:
-        await get_total_photos_count(
+    with pytest.raises(DatabaseGetPhotosError) as exc_info:
+        await get_photos_page_from_db(
             pool=mock_pool,
-            category=category
+            category=category,
+            limit=5
         )
     assert "TypeError" in str(exc_info.value)
 
@@ -534,6 +701,17 @@ async def test_get_photo_description_by_file_id_from_db(mock_db_pool,
 
     mock_conn.fetchrow.reset_mock()
 
+    # Повторный запрос обслуживается из кэша фото
+    result = await get_photo_description_by_file_id_from_db(
+        pool=mock_pool,
+        file_id=photo_id
+    )
+
+    mock_conn.fetchrow.assert_not_called()
+    assert result == description
+
+    photo_cache.clear()
+
     # Тестируем ошибку, связанную с БД
     mock_conn.fetchrow.side_effect = asyncpg.PostgresError("DB error")
     with pytest.raises(DatabaseGetPhotoDescriptionByFileIdError) as exc_info:
@@ -591,6 +769,17 @@ async def test_get_photo_file_id_by_description_from_db(mock_db_pool,
 
     mock_conn.fetchrow.reset_mock()
 
+    # Повторный запрос обслуживается из кэша фото
+    result = await get_photo_file_id_by_description_from_db(
+        pool=mock_pool,
+        description=description
+    )
+
+    mock_conn.fetchrow.assert_not_called()
+    assert result == photo_id
+
+    photo_cache.clear()
+
     # Тестируем ошибку, связанную с БД
     mock_conn.fetchrow.side_effect = asyncpg.PostgresError("DB error")
     with pytest.raises(DatabaseGetFileIdByDescriptionError) as exc_info:
@@ -612,6 +801,82 @@ async def test_get_photo_file_id_by_description_from_db(mock_db_pool,
     assert "TypeError" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_get_photo_by_id_from_db(mock_db_pool,
+                                      sample_test_data) -> None:
+
+    """
+    Тестирование функции получения фото по его id в БД.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    photo_data = sample_test_data['photo']
+
+    expected = {
+        'photo_id': photo_data['photo_id'],
+        'description': photo_data['description']
+    }
+
+    mock_pool, mock_conn = await mock_db_pool(data=expected)
+
+    # Фото нет в кэше - запрос в БД и сохранение в кэш
+    result = await get_photo_by_id_from_db(
+        pool=mock_pool,
+        photo_db_id=1
+    )
+
+    mock_conn.fetchrow.assert_called_once_with(
+        "SELECT photo_id, description "
+        "FROM photos "
+        "WHERE id = $1",
+        1
+    )
+    assert result == expected
+    assert photo_cache.get(photo_db_id=1) == expected
+
+    mock_conn.fetchrow.reset_mock()
+
+    # Фото из кэша - без запроса в БД
+    result = await get_photo_by_id_from_db(
+        pool=mock_pool,
+        photo_db_id=1
+    )
+
+    mock_conn.fetchrow.assert_not_called()
+    assert result == expected
+
+    # Фото не найдено
+    mock_conn.fetchrow = AsyncMock(return_value=None)
+    result = await get_photo_by_id_from_db(
+        pool=mock_pool,
+        photo_db_id=2
+    )
+
+    assert result is None
+    assert photo_cache.get(photo_db_id=2) is None
+
+    # Тестируем ошибку, связанную с БД
+    mock_conn.fetchrow.side_effect = asyncpg.PostgresError("DB error")
+    with pytest.raises(DatabaseGetPhotoByIdError) as exc_info:
+        await get_photo_by_id_from_db(
+            pool=mock_pool,
+            photo_db_id=2
+        )
+    assert "DB error" in str(exc_info.value)
+
+    # Тестируем неизвестную ошибку
+    mock_conn.fetchrow.side_effect = TypeError("Type error")
+    with pytest.raises(DatabaseGetPhotoByIdError) as exc_info:
+        await get_photo_by_id_from_db(
+            pool=mock_pool,
+            photo_db_id=2
+        )
+    assert "TypeError" in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_get_categories_from_db(mock_db_pool,
                                       sample_test_data) -> None:
@@ -642,6 +907,15 @@ async def test_get_categories_from_db(mock_db_pool,
 
     mock_conn.fetchval.reset_mock()
 
+    # Повторный запрос берёт категории из каталога без обращения к БД
+    result = await get_categories_from_db(pool=mock_poll)
+
+    mock_conn.fetchval.assert_not_called()
+    assert result == category_data
+
+    # Создание новой категории делает каталог устаревшим
+    category_catalog.bump()
+
     # Тестируем ошибку, связанную с БД
     mock_conn.fetchval.side_effect = asyncpg.PostgresError("DB error")
     with pytest.raises(DatabaseGetCategoriesError) as exc_info:
@@ -672,23 +946,35 @@ async def test_delete_photo_from_db(mock_db_pool,
     photo_data = sample_test_data['photo']
     photo_id = photo_data['photo_id']
 
+    category = photo_data['category']
+
     mock_pool, mock_conn = await mock_db_pool(data=photo_data)
 
+    mock_conn.fetch = AsyncMock(return_value=[{'category_name': category}])
+    photo_counter.set(
+        category=category,
+        count=3
+    )
+
     await delete_photo_from_db(
         pool=mock_pool,
         photo_id=photo_id
     )
 
-    mock_conn.execute.assert_called_once_with(
+    mock_conn.fetch.assert_called_once_with(
         "DELETE FROM photos "
-        "WHERE photo_id = $1",
+        "WHERE photo_id = $1 "
+        "RETURNING (SELECT category_name FROM categories WHERE id = photos.category_id) AS category_name",
         photo_id
     )
 
-    mock_conn.execute.reset_mock()
+    # Удалённое фото уменьшает счётчик фотографий категории
+    assert photo_counter.get(category=category) == 2
+
+    mock_conn.fetch.reset_mock()
 
     # Тестируем ошибку, связанную с БД
-    mock_conn.execute.side_effect = asyncpg.PostgresError("DB error")
+    mock_conn.fetch.side_effect = asyncpg.PostgresError("DB error")
     with pytest.raises(DatabaseDeletePhotoError) as exc_info:
         await delete_photo_from_db(
             pool=mock_pool,
@@ -696,10 +982,10 @@ async def test_delete_photo_from_db(mock_db_pool,
         )
     assert "DB error" in str(exc_info.value)
 
-    mock_conn.execute.reset_mock()
+    mock_conn.fetch.reset_mock()
 
     # Тестируем неизвестную ошибку
-    mock_conn.execute.side_effect = TypeError("Type error")
+    mock_conn.fetch.side_effect = TypeError("Type error")
     with pytest.raises(DatabaseDeletePhotoError) as exc_info:
         await delete_photo_from_db(
             pool=mock_pool,
@@ -784,6 +1070,12 @@ async def test_update_photo_description(mock_db_pool,
 
     mock_pool, mock_conn = await mock_db_pool(data=photo_data)
 
+    # Старое описание фото закэшировано
+    photo_cache.remember(
+        photo_id=photo_id,
+        description=photo_data['description']
+    )
+
     await update_photo_description(
         pool=mock_pool,
         photo_id=photo_id,
@@ -791,6 +1083,10 @@ async def test_update_photo_description(mock_db_pool,
         new_description_translit=new_description_translit
     )
 
+    # Изменённое фото удалено из кэша фото
+    assert photo_cache.get_description(photo_id=photo_id) is None
+    assert photo_cache.get_file_id(description=photo_data['description']) is None
+
     mock_conn.execute.assert_called_once_with(
         "UPDATE photos "
         "SET description = $1, "
@@ -830,13 +1126,15 @@ async def test_update_photo_description(mock_db_pool,
 
 @pytest.mark.asyncio
 async def test_search_photo_by_description_in_db(mock_db_pool,
-                                                 sample_test_data) -> None:
+                                                 sample_test_data,
+                                                 mocker) -> None:
 
     """
     Тестирование функции поиска фото по описанию в БД.
     :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
     возвращающая кортеж из мокированного пула соединений и само соединение с БД.
     :param sample_test_data: Словарь с тестовыми данными.
+    :param mocker: Мокер для отключения расширения pg_trgm.
     :return: Функция ничего не возвращает.
     """
 
@@ -858,21 +1156,55 @@ async def test_search_photo_by_description_in_db(mock_db_pool,
     )
 
     mock_conn.fetch.assert_called_once_with(
-        "SELECT description, description_translit, photo_id "
+        "SELECT photos.id, description, description_translit, photo_id "
         "FROM photos "
         "JOIN categories "
         "ON photos.category_id = categories.id "
-        "WHERE (description ILIKE $1 OR description_translit ILIKE $1) "
+        "WHERE (description ILIKE $1 OR description_translit ILIKE $1 "
+        "OR $3 <% description OR $3 <% description_translit) "
         "AND categories.category_name = $2 "
+        "ORDER BY GREATEST(word_similarity($3, description), "
+        "word_similarity($3, description_translit)) DESC, photos.id "
         "LIMIT 10",
         f'%{query}%',
-        category
+        category,
+        query
     )
 
     assert result == [photo_data[0]]
 
     mock_conn.fetch.reset_mock()
 
+    # Повторный поиск обслуживается из кэша фото
+    result = await search_photo_by_description_in_db(
+        pool=mock_pool,
+        category=category,
+        query=query
+    )
+
+    mock_conn.fetch.assert_not_called()
+    assert result == [photo_data[0]]
+
+    photo_cache.clear()
+
+    # Запрос нормализуется до обращения к кэшу и к БД: в БД и в кэш попадает одна и та же строка
+    await search_photo_by_description_in_db(
+        pool=mock_pool,
+        category=category,
+        query='  AK117 '
+    )
+    assert mock_conn.fetch.call_args.args[1:] == ('%ak117%', category, 'ak117')
+
+    mock_conn.fetch.reset_mock()
+    await search_photo_by_description_in_db(
+        pool=mock_pool,
+        category=category,
+        query='ak117'
+    )
+    mock_conn.fetch.assert_not_called()
+
+    photo_cache.clear()
+
     # Тестируем ошибку, связанную с БД
     mock_conn.fetch.side_effect = asyncpg.PostgresError("DB error")
     with pytest.raises(DatabaseSearchPhotoByDescriptionError) as exc_info:
@@ -891,6 +1223,250 @@ async def test_search_photo_by_description_in_db(mock_db_pool,
         await search_photo_by_description_in_db(
             pool=mock_pool,
             category=category,
-            query=None
+            query=query
         )
     assert "Type error" in str(exc_info.value)
+
+    mock_conn.fetch.reset_mock()
+    mock_conn.fetch.side_effect = None
+
+    # Без расширения pg_trgm ищется только вхождение подстроки
+    mocker.patch('config.database.pg_trgm_available', False)
+    mock_conn.fetch = AsyncMock(return_value=filtered_data)
+    result = await search_photo_by_description_in_db(
+        pool=mock_pool,
+        category=category,
+        query=query
+    )
+    mock_conn.fetch.assert_called_once_with(
+        "SELECT photos.id, description, description_translit, photo_id "
+        "FROM photos "
+        "JOIN categories "
+        "ON photos.category_id = categories.id "
+        "WHERE (description ILIKE $1 OR description_translit ILIKE $1) "
+        "AND categories.category_name = $2 "
+        "ORDER BY photos.id "
+        "LIMIT 10",
+        f'%{query}%',
+        category
+    )
+    assert result == [photo_data[0]]
+
+    mock_conn.fetch.reset_mock()
+    photo_cache.clear()
+
+    # Тестируем поиск по загруженному индексу в памяти без обращения к БД
+    search_index.build(rows=[
+        {
+            'id': photo['id'],
+            'photo_id': photo['photo_id'],
+            'description': photo['description'],
+            'description_translit': None,
+            'category_name': photo['category']
+        }
+        for photo in photo_data
+    ])
+
+    result = await search_photo_by_description_in_db(
+        pool=mock_pool,
+        category=category,
+        query=query
+    )
+
+    mock_conn.fetch.assert_not_called()
+    assert result == [
+        {
+            'id': photo['id'],
+            'description': photo['description'],
+            'description_translit': None,
+            'photo_id': photo['photo_id']
+        }
+        for photo in filtered_data if photo['category'] == category
+    ]
+
+
+@pytest.mark.asyncio
+async def test_check_pg_trgm_in_db(mock_db_pool,
+                                   mocker) -> None:
+
+    """
+    Тестирование проверки расширения pg_trgm при запуске бота.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :param mocker: Мокер для восстановления флага доступности расширения и логгера.
+    :return: Функция ничего не возвращает.
+    """
+
+    mocker.patch('config.database.pg_trgm_available', True)
+    mock_logger = mocker.patch('config.database.logger')
+
+    mock_pool, mock_conn = await mock_db_pool(data=True)
+    assert await check_pg_trgm_in_db(pool=mock_pool) is True
+    mock_conn.fetchval.assert_called_once_with(
+        "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+    )
+    mock_logger.warning.assert_not_called()
+
+    # Без расширения поиск переключается на ILIKE с предупреждением в логе
+    mock_conn.fetchval = AsyncMock(return_value=False)
+    assert await check_pg_trgm_in_db(pool=mock_pool) is False
+    assert database.pg_trgm_available is False
+    assert 'pg_trgm' in mock_logger.warning.call_args.args[0]
+
+    # Тестируем ошибку, связанную с БД
+    mock_conn.fetchval = AsyncMock(side_effect=asyncpg.PostgresError('DB error'))
+    with pytest.raises(DatabaseCheckExtensionError) as exc_info:
+        await check_pg_trgm_in_db(pool=mock_pool)
+    assert 'DB error' in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_load_search_index(mock_db_pool,
+                                 sample_test_data) -> None:
+
+    """
+    Тестирование функции загрузки фото из БД в поисковый индекс и его обновления.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    photo_data = sample_test_data['photos']
+    category = photo_data[0]['category']
+
+    rows = [
+        {
+            'id': photo['id'],
+            'photo_id': photo['photo_id'],
+            'description': photo['description'],
+            'description_translit': None,
+            'category_name': photo['category']
+        }
+        for photo in photo_data
+    ]
+
+    mock_pool, mock_conn = await mock_db_pool(data={})
+
+    mock_conn.fetch = AsyncMock(return_value=rows)
+
+    await load_search_index(pool=mock_pool)
+
+    mock_conn.fetch.assert_called_once_with(
+        "SELECT photos.id, photos.photo_id, photos.description, photos.description_translit, categories.category_name "
+        "FROM photos "
+        "JOIN categories "
+        "ON photos.category_id = categories.id "
+        "ORDER BY photos.id"
+    )
+
+    assert search_index.loaded is True
+    assert len(search_index) == len(rows)
+
+    # Изменение описания обновляет индекс
+    mock_conn.execute = AsyncMock(return_value='UPDATE 1')
+    await update_photo_description(
+        pool=mock_pool,
+        photo_id=photo_data[0]['photo_id'],
+        new_description='Новое описание',
+        new_description_translit='novoe opisanie'
+    )
+    assert [photo['photo_id'] for photo in search_index.search(category=category, query='novoe')] == [
+        photo_data[0]['photo_id']
+    ]
+
+    # Изменение ID фото обновляет индекс
+    await update_photo_in_db(
+        pool=mock_pool,
+        photo_id=photo_data[0]['photo_id'],
+        new_photo_id='photo000'
+    )
+    assert [photo['photo_id'] for photo in search_index.search(category=category, query='novoe')] == ['photo000']
+
+    # Удаление фото убирает его из индекса
+    mock_conn.fetch = AsyncMock(return_value=[{'category_name': category}])
+    await delete_photo_from_db(
+        pool=mock_pool,
+        photo_id='photo000'
+    )
+    assert search_index.search(category=category, query='novoe') == []
+    assert len(search_index) == len(rows) - 1
+
+    # Тестируем ошибку, связанную с БД
+    mock_conn.fetch = AsyncMock(side_effect=asyncpg.PostgresError("DB error"))
+    with pytest.raises(DatabaseLoadSearchIndexError) as exc_info:
+        await load_search_index(pool=mock_pool)
+    assert "DB error" in str(exc_info.value)
+
+    # Тестируем неизвестную ошибку
+    mock_conn.fetch = AsyncMock(side_effect=TypeError("Type error"))
+    with pytest.raises(DatabaseLoadSearchIndexError) as exc_info:
+        await load_search_index(pool=mock_pool)
+    assert "TypeError" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_refresh_search_index(mock_db_pool,
+                                    sample_test_data,
+                                    mocker) -> None:
+
+    """
+    Тестирование перестроения поискового индекса по истечении времени жизни.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :param mocker: Мокер для подмены времени и логгера.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.search_index.time.monotonic', return_value=100.0)
+    mocker.patch.object(search_index, 'ttl', 300)
+
+    photo = sample_test_data['photos'][0]
+    row = {
+        'id': photo['id'],
+        'photo_id': photo['photo_id'],
+        'description': photo['description'],
+        'description_translit': None,
+        'category_name': photo['category']
+    }
+
+    mock_pool, mock_conn = await mock_db_pool(data={})
+
+    # Незагруженный индекс (поиск по индексу выключен) не загружается
+    mock_conn.fetch = AsyncMock(return_value=[row])
+    await refresh_search_index(pool=mock_pool)
+    mock_conn.fetch.assert_not_called()
+    assert search_index.loaded is False
+
+    await load_search_index(pool=mock_pool)
+    mock_conn.fetch.reset_mock()
+
+    # Пока время жизни не истекло, индекс не перестраивается
+    mock_time.return_value = 399.0
+    await refresh_search_index(pool=mock_pool)
+    mock_conn.fetch.assert_not_called()
+
+    # Другой процесс бота добавил фото: после истечения времени жизни поиск находит его
+    new_row = dict(row, id=1000, photo_id='photo_other_worker', description='Other worker 123')
+    mock_conn.fetch = AsyncMock(return_value=[row, new_row])
+    mock_time.return_value = 400.0
+    result = await search_photo_by_description_in_db(
+        pool=mock_pool,
+        category=photo['category'],
+        query='other worker'
+    )
+    mock_conn.fetch.assert_called_once()
+    assert [found['photo_id'] for found in result] == ['photo_other_worker']
+
+    # Ошибка перестроения логируется, поиск выполняется по прежнему индексу
+    mock_logger = mocker.patch('config.database.logger')
+    mock_conn.fetch = AsyncMock(side_effect=asyncpg.PostgresError('DB error'))
+    mock_time.return_value = 800.0
+    result = await search_photo_by_description_in_db(
+        pool=mock_pool,
+        category=photo['category'],
+        query='other worker'
+    )
+    mock_logger.error.assert_called_once()
+    assert [found['photo_id'] for found in result] == ['photo_other_worker']
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+import asyncpg
+
+from unittest.mock import AsyncMock
+
+from aiogram.fsm.storage.base import StorageKey
+
+from bot_app.exceptions.database import DatabaseFSMStorageError
+from bot_app.states.user_states import SearchPhotoState
+
+from config.fsm_storage import PostgresStorage
+
+
+# Ключ FSM пользователя в личном чате
+KEY = StorageKey(
+    bot_id=42,
+    chat_id=123,
+    user_id=123
+)
+
+
+@pytest.mark.asyncio
+async def test_postgres_storage_read(mock_db_pool):
+
+    """
+    Тестирование чтения состояния FSM из БД при каждом обращении (без локального кэша).
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_pool, mock_conn = await mock_db_pool(data=None)
+    mock_conn.fetchval = AsyncMock(return_value='SearchPhotoState:search_photo')
+
+    storage = PostgresStorage(pool=mock_pool)
+
+    assert await storage.get_state(key=KEY) == 'SearchPhotoState:search_photo'
+    mock_conn.fetchval.assert_awaited_once_with(
+        "SELECT state "
+        "FROM fsm_state "
+        "WHERE key = $1",
+        'fsm:42:123:123:default'
+    )
+
+    # Каждое чтение идёт в БД, поэтому изменения других процессов видны сразу
+    mock_conn.fetchval = AsyncMock(side_effect=[
+        json.dumps({'category': 'Category123'}),
+        json.dumps({'category': 'Category'})
+    ])
+    assert await storage.get_data(key=KEY) == {'category': 'Category123'}
+    assert await storage.get_data(key=KEY) == {'category': 'Category'}
+    assert mock_conn.fetchval.await_count == 2
+
+    # Ключ без записи в БД
+    mock_conn.fetchval = AsyncMock(return_value=None)
+    assert await storage.get_state(key=KEY) is None
+    assert await storage.get_data(key=KEY) == {}
+
+    # Тестируем ошибку, связанную с БД
+    mock_conn.fetchval = AsyncMock(side_effect=asyncpg.PostgresError('DB error'))
+    with pytest.raises(DatabaseFSMStorageError) as exc_info:
+        await storage.get_state(key=KEY)
+    assert 'DB error' in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_postgres_storage_write(mock_db_pool):
+
+    """
+    Тестирование записи состояния и данных FSM и удаления пустых строк.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_pool, mock_conn = await mock_db_pool(data=None)
+
+    storage = PostgresStorage(pool=mock_pool)
+
+    await storage.set_state(key=KEY, state=SearchPhotoState.search_photo)
+    await storage.set_data(key=KEY, data={'category': 'Категория'})
+
+    assert [c.args for c in mock_conn.execute.await_args_list] == [
+        (
+            "INSERT INTO fsm_state (key, state) "
+            "VALUES ($1, $2) "
+            "ON CONFLICT (key) "
+            "DO UPDATE "
+            "SET state = EXCLUDED.state, updated_at = now()",
+            'fsm:42:123:123:default',
+            'SearchPhotoState:search_photo'
+        ),
+        (
+            "INSERT INTO fsm_state (key, data) "
+            "VALUES ($1, $2::jsonb) "
+            "ON CONFLICT (key) "
+            "DO UPDATE "
+            "SET data = EXCLUDED.data, updated_at = now()",
+            'fsm:42:123:123:default',
+            '{"category": "Категория"}'
+        )
+    ]
+
+    # Очистка состояния удаляет строку, если у неё не осталось ни состояния, ни данных
+    mock_conn.execute.reset_mock()
+    await storage.set_state(key=KEY, state=None)
+    await storage.set_data(key=KEY, data={})
+
+    delete = (
+        "DELETE FROM fsm_state "
+        "WHERE key = $1 AND state IS NULL AND data = '{}'::jsonb",
+        'fsm:42:123:123:default'
+    )
+    executed = [c.args for c in mock_conn.execute.await_args_list]
+    assert executed[1] == delete
+    assert executed[3] == delete
+    assert len(executed) == 4
+
+    # Тестируем ошибку, связанную с БД
+    mock_conn.execute = AsyncMock(side_effect=asyncpg.PostgresError('DB error'))
+    with pytest.raises(DatabaseFSMStorageError):
+        await storage.set_state(key=KEY, state='SearchPhotoState:search_photo')
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_postgres_storage_update_data(mock_db_pool):
+
+    """
+    Тестирование обновления данных FSM одним запросом с объединением ключей в БД.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_pool, mock_conn = await mock_db_pool(data=None)
+    # Ключ category записан другим процессом
+    mock_conn.fetchval = AsyncMock(return_value=json.dumps({'category': 'Category123', 'current_page': 2}))
+
+    storage = PostgresStorage(pool=mock_pool)
+
+    assert await storage.update_data(key=KEY, data={'current_page': 2}) == {
+        'category': 'Category123',
+        'current_page': 2
+    }
+    mock_conn.fetchval.assert_awaited_once_with(
+        "INSERT INTO fsm_state (key, data) "
+        "VALUES ($1, $2::jsonb) "
+        "ON CONFLICT (key) "
+        "DO UPDATE "
+        "SET data = fsm_state.data || EXCLUDED.data, updated_at = now() "
+        "RETURNING data",
+        'fsm:42:123:123:default',
+        '{"current_page": 2}'
+    )
+    mock_conn.execute.assert_not_called()
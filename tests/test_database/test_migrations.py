@@ -0,0 +1,246 @@
+import json
+
+import asyncpg
+import pytest
+
+from unittest.mock import (
+    AsyncMock,
+    MagicMock
+)
+
+from bot_app.exceptions.database import DatabaseMigrationError
+
+from config import queries
+from config.migrations import (
+    MIGRATIONS_LOCK_KEY,
+    Migration,
+    apply_migrations,
+    load_migrations
+)
+
+
+def make_conn(applied: list[dict]) -> MagicMock:
+
+    """
+    Создание мокированного соединения с БД с применёнными миграциями.
+    :param applied: Записи таблицы schema_migrations.
+    :return: Возвращает мокированное соединение.
+    """
+
+    conn = MagicMock()
+    conn.transaction.return_value.__aenter__ = AsyncMock(return_value=conn)
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    conn.fetch = AsyncMock(return_value=applied)
+    conn.fetchval = AsyncMock(return_value=True)
+    conn.execute = AsyncMock()
+
+    return conn
+
+
+def test_load_migrations():
+
+    """
+    Тестирование загрузки миграций из папки migrations по возрастанию версии.
+    :return: Функция ничего не возвращает.
+    """
+
+    migrations = load_migrations()
+
+    assert [(m.version, m.name) for m in migrations] == [
+        (0, 'initial_schema'),
+        (1, 'photos_search_trgm'),
+        (2, 'fsm_state'),
+        (3, 'photos_indexes')
+    ]
+    assert not any('CREATE EXTENSION' in statement for statement in migrations[1].statements)
+    assert [m.transactional for m in migrations] == [True, False, True, False]
+    assert migrations[3].statements[-1] == (
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS photos_category_id_id_idx\n    ON photos (category_id, id)'
+    )
+    assert migrations[0].checksum == Migration(0, 'other', migrations[0].sql).checksum
+
+
+def test_load_migrations_duplicate_version(tmp_path):
+
+    """
+    Тестирование ошибки при нескольких миграциях с одной версией и пропуска посторонних файлов.
+    :param tmp_path: Временная папка для файлов теста.
+    :return: Функция ничего не возвращает.
+    """
+
+    (tmp_path / '0001_first.sql').write_text('SELECT 1', encoding='utf-8')
+    (tmp_path / 'README.sql').write_text('SELECT 2', encoding='utf-8')
+
+    assert [m.name for m in load_migrations(tmp_path)] == ['first']
+
+    (tmp_path / '0001_second.sql').write_text('SELECT 3', encoding='utf-8')
+
+    with pytest.raises(DatabaseMigrationError):
+        load_migrations(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_pending_only():
+
+    """
+    Тестирование применения только новых миграций под блокировкой.
+    :return: Функция ничего не возвращает.
+    """
+
+    migrations = [
+        Migration(0, 'initial', 'CREATE TABLE a ()'),
+        Migration(1, 'index', 'CREATE INDEX b ON a ()')
+    ]
+    conn = make_conn([{'version': 0, 'name': 'initial', 'checksum': migrations[0].checksum}])
+
+    applied = await apply_migrations(conn, migrations=migrations, timeout=10)
+
+    assert applied == [migrations[1]]
+    executed = [c.args for c in conn.execute.await_args_list]
+    assert (queries.CREATE_SCHEMA_MIGRATIONS.sql,) in executed
+    assert ('CREATE INDEX b ON a ()',) in executed
+    assert ('CREATE TABLE a ()',) not in executed
+    assert (queries.ADD_APPLIED_MIGRATION.sql, 1, 'index', migrations[1].checksum) in executed
+    conn.transaction.assert_called_once()
+    assert [c.args for c in conn.fetchval.await_args_list] == [
+        (queries.LOCK_MIGRATIONS.sql, MIGRATIONS_LOCK_KEY),
+        (queries.UNLOCK_MIGRATIONS.sql, MIGRATIONS_LOCK_KEY)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_no_transaction():
+
+    """
+    Тестирование миграции без транзакции: команды выполняются по одной, затем миграция записывается.
+    :return: Функция ничего не возвращает.
+    """
+
+    migration = Migration(
+        3,
+        'indexes',
+        '-- migrate: no-transaction\n'
+        '-- Индексы\n'
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS a_idx ON a (x);\n\n'
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS b_idx\n    ON a (y);\n'
+    )
+    conn = make_conn([])
+
+    assert await apply_migrations(conn, migrations=[migration], timeout=None) == [migration]
+
+    executed = [c.args for c in conn.execute.await_args_list]
+    assert executed[1:] == [
+        ('CREATE INDEX CONCURRENTLY IF NOT EXISTS a_idx ON a (x)',),
+        ('CREATE INDEX CONCURRENTLY IF NOT EXISTS b_idx\n    ON a (y)',),
+        (queries.ADD_APPLIED_MIGRATION.sql, 3, 'indexes', migration.checksum)
+    ]
+    conn.transaction.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_error():
+
+    """
+    Тестирование ошибки миграции: блокировка снимается, ошибка оборачивается в DatabaseMigrationError.
+    :return: Функция ничего не возвращает.
+    """
+
+    conn = make_conn([])
+
+    async def execute(sql, *args, **kwargs):
+        if sql == 'BROKEN':
+            raise asyncpg.PostgresSyntaxError('syntax error')
+
+    conn.execute = AsyncMock(side_effect=execute)
+
+    with pytest.raises(DatabaseMigrationError):
+        await apply_migrations(conn, migrations=[Migration(0, 'broken', 'BROKEN')])
+
+    assert conn.fetchval.await_args_list[-1].args == (queries.UNLOCK_MIGRATIONS.sql, MIGRATIONS_LOCK_KEY)
+
+
+def plan_indexes(plan: dict | list) -> set[str]:
+
+    """
+    Сбор имён индексов из плана запроса EXPLAIN (FORMAT JSON).
+    :param plan: План запроса или его узел.
+    :return: Возвращает множество имён индексов, используемых планом.
+    """
+
+    if isinstance(plan, list):
+        return set().union(*(plan_indexes(item) for item in plan))
+
+    indexes = {plan['Index Name']} if 'Index Name' in plan else set()
+    for key in ('Plan', 'Plans'):
+        if key in plan:
+            indexes |= plan_indexes(plan[key])
+
+    return indexes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('statement, args, index', [
+    (queries.GET_FILE_ID_BY_DESCRIPTION, ('ak117 ranked 1',), 'photos_description_idx'),
+    (queries.PHOTO_DESCRIPTION_EXISTS, ('ak117 ranked 1',), 'photos_description_idx'),
+    (queries.GET_PHOTO_DESCRIPTION, ('file_1',), 'photos_photo_id_key'),
+    (queries.UPDATE_PHOTO_DESCRIPTION, ('new', 'new', 'file_1'), 'photos_photo_id_key'),
+    (queries.DELETE_PHOTO, ('file_1',), 'photos_photo_id_key'),
+    (queries.GET_CATEGORY_ID, ('category_1',), 'categories_category_name_key'),
+    (queries.GET_PHOTOS_PAGE['next'], ('category_1', 6, 100, True), 'photos_category_id_id_idx'),
+    (queries.GET_PHOTOS_PAGE['prev'], ('category_1', 6, 100, True), 'photos_category_id_id_idx'),
+])
+async def test_queries_use_indexes(migrated_db,
+                                   statement,
+                                   args,
+                                   index):
+
+    """
+    Тестирование индексов схемы: EXPLAIN запросов по file_id, описанию и пагинации показывает индекс.
+    Последовательное сканирование запрещается, чтобы на небольшой тестовой таблице
+    проверялось наличие подходящего индекса, а не выбор планировщика по размеру таблицы.
+    :param migrated_db: Соединение с тестовой БД с применёнными миграциями.
+    :param statement: Запрос из реестра запросов.
+    :param args: Параметры запроса.
+    :param index: Индекс, который должен использоваться в плане запроса.
+    :return: Функция ничего не возвращает.
+    """
+
+    await migrated_db.execute(
+        "INSERT INTO categories (category_name) "
+        "SELECT 'category_' || i FROM generate_series(1, 10) AS i"
+    )
+    await migrated_db.execute(
+        "INSERT INTO photos (photo_id, description, description_translit, category_id) "
+        "SELECT 'file_' || i, 'ak117 ranked ' || i, 'ak117 ranked ' || i, i % 10 + 1 "
+        "FROM generate_series(1, 2000) AS i"
+    )
+    await migrated_db.execute('ANALYZE')
+    await migrated_db.execute('SET enable_seqscan = off')
+
+    plan = await migrated_db.fetchval(f'EXPLAIN (FORMAT JSON) {statement.sql}', *args)
+
+    assert index in plan_indexes(json.loads(plan))
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_repeatable(migrated_db):
+
+    """
+    Тестирование повторного применения: применённые миграции пропускаются, схема содержит индексы.
+    :param migrated_db: Соединение с тестовой БД с применёнными миграциями.
+    :return: Функция ничего не возвращает.
+    """
+
+    assert await apply_migrations(migrated_db) == []
+
+    indexes = {row['indexname'] for row in await migrated_db.fetch(
+        "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"
+    )}
+    assert {
+        'categories_category_name_key',
+        'photos_photo_id_key',
+        'photos_description_idx',
+        'photos_category_id_id_idx',
+        'photos_description_trgm_idx',
+        'fsm_state_pkey'
+    } <= indexes
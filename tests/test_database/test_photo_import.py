@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch
+)
+
+from config.photo_import import (
+    import_photos,
+    read_photos
+)
+
+
+def test_read_photos_csv(tmp_path):
+
+    """
+    Тестирование чтения строк импорта из CSV с пропуском строк без обязательных полей.
+    :param tmp_path: Временная папка для файлов теста.
+    :return: Функция ничего не возвращает.
+    """
+
+    path = tmp_path / 'photos.csv'
+    path.write_text(
+        'file_id,description,category\n'
+        'file_1, Описание 1 ,Category1\n'
+        'file_2,,Category1\n'
+        'file_3,Opisanie 3,Category2\n',
+        encoding='utf-8'
+    )
+
+    photos, invalid = read_photos(path=path)
+
+    assert photos == [
+        ('file_1', 'Описание 1', 'Category1'),
+        ('file_3', 'Opisanie 3', 'Category2')
+    ]
+    assert invalid == 1
+
+
+def test_read_photos_jsonl(tmp_path):
+
+    """
+    Тестирование чтения строк импорта из JSONL (file_id или photo_id).
+    :param tmp_path: Временная папка для файлов теста.
+    :return: Функция ничего не возвращает.
+    """
+
+    path = tmp_path / 'photos.jsonl'
+    path.write_text(
+        json.dumps({'file_id': 'file_1', 'description': 'Описание 1', 'category': 'Category1'}) + '\n'
+        '\n' +
+        json.dumps({'photo_id': 'file_2', 'description': 'Opisanie 2', 'category': 'Category2'}) + '\n',
+        encoding='utf-8'
+    )
+
+    photos, invalid = read_photos(path=path)
+
+    assert photos == [
+        ('file_1', 'Описание 1', 'Category1'),
+        ('file_2', 'Opisanie 2', 'Category2')
+    ]
+    assert invalid == 0
+
+
+@pytest.mark.asyncio
+async def test_import_photos(tmp_path):
+
+    """
+    Тестирование импорта пачками с переводом описаний и подсчётом итоговой статистики.
+    :param tmp_path: Временная папка для файлов теста.
+    :return: Функция ничего не возвращает.
+    """
+
+    path = tmp_path / 'photos.csv'
+    path.write_text(
+        'file_id,description,category\n'
+        'file_1,Описание,Category1\n'
+        'file_2,Opisanie,Category1\n'
+        'file_3,123,Category2\n',
+        encoding='utf-8'
+    )
+
+    pool = MagicMock()
+    import_mock = AsyncMock(side_effect=lambda pool, photos: {
+        'rows': len(photos),
+        'inserted': len(photos),
+        'updated': 0,
+        'skipped': 0,
+        'categories_created': 1
+    })
+
+    with patch('config.photo_import.create_pool', AsyncMock(return_value=pool)), \
+            patch('config.photo_import.close_pool', AsyncMock()) as close_mock, \
+            patch('config.photo_import.import_photos_to_db', import_mock):
+        stats = await import_photos(path=path, batch_size=2)
+
+    assert [c.kwargs['photos'] for c in import_mock.await_args_list] == [
+        [
+            ('file_1', 'Описание', 'Opisanie', 'Category1'),
+            ('file_2', 'Opisanie', 'Описание', 'Category1')
+        ],
+        [
+            ('file_3', '123', None, 'Category2')
+        ]
+    ]
+    close_mock.assert_awaited_once_with(pool)
+    assert stats['rows'] == 3
+    assert stats['inserted'] == 3
+    assert stats['categories_created'] == 2
+    assert stats['invalid'] == 0
+    assert stats['rows_per_sec'] > 0
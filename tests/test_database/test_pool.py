@@ -0,0 +1,121 @@
+import pytest
+import asyncpg
+
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch
+)
+
+from config.pool import (
+    BotConnection,
+    BotPool,
+    PoolStats,
+    _TimedAcquireContext
+)
+
+
+@pytest.mark.asyncio
+async def test_bot_connection_warm_up():
+
+    """
+    Тестирование подготовки запросов в кэше подготовленных выражений соединения.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_conn = MagicMock()
+    mock_conn._get_statement = AsyncMock()
+
+    await BotConnection.warm_up(mock_conn, queries=['SELECT 1', 'SELECT 2'])
+
+    assert [c.args for c in mock_conn._get_statement.await_args_list] == [
+        ('SELECT 1', None),
+        ('SELECT 2', None)
+    ]
+
+    # Внутренний метод asyncpg изменил сигнатуру: запросы подготавливаются публичным prepare()
+    mock_conn._get_statement = AsyncMock(side_effect=TypeError('unexpected argument'))
+    mock_conn.prepare = AsyncMock()
+
+    await BotConnection.warm_up(mock_conn, queries=['SELECT 1', 'SELECT 2'])
+
+    mock_conn._get_statement.assert_awaited_once()
+    assert [c.args for c in mock_conn.prepare.await_args_list] == [('SELECT 1',), ('SELECT 2',)]
+
+    # Внутреннего метода нет
+    mock_conn = MagicMock(spec=['prepare'])
+    mock_conn.prepare = AsyncMock()
+
+    await BotConnection.warm_up(mock_conn, queries=['SELECT 1'])
+
+    mock_conn.prepare.assert_awaited_once_with('SELECT 1')
+
+
+@pytest.mark.asyncio
+async def test_timed_acquire_context():
+
+    """
+    Тестирование замера времени ожидания соединения из пула.
+    :return: Функция ничего не возвращает.
+    """
+
+    stats = PoolStats()
+
+    mock_context = MagicMock()
+    mock_context.__aenter__ = AsyncMock(return_value='mock_conn')
+    mock_context.__aexit__ = AsyncMock(return_value=None)
+
+    with patch('config.pool.time.perf_counter', side_effect=[10.0, 10.25, 20.0, 20.5]):
+        async with _TimedAcquireContext(context=mock_context, stats=stats) as conn:
+            assert conn == 'mock_conn'
+
+        # Получение соединения через await
+        conn = await _TimedAcquireContext(context=mock_context, stats=stats)
+        assert conn == 'mock_conn'
+
+    mock_context.__aexit__.assert_awaited_once()
+    assert stats.acquires == 2
+    assert stats.wait_total == pytest.approx(0.75)
+    assert stats.wait_max == pytest.approx(0.5)
+
+    stats.reset()
+    assert stats.acquires == 0
+    assert stats.wait_max == 0.0
+
+
+def test_bot_pool_stats():
+
+    """
+    Тестирование статистики пула соединений.
+    :return: Функция ничего не возвращает.
+    """
+
+    pool = BotPool(
+        'mock_dsn',
+        min_size=1,
+        max_size=5,
+        max_queries=100,
+        max_inactive_connection_lifetime=300,
+        loop=None,
+        connection_class=BotConnection,
+        record_class=asyncpg.Record
+    )
+
+    assert pool.stats() == {
+        'min_size': 1,
+        'max_size': 5,
+        'size': 0,
+        'in_use': 0,
+        'idle': 0,
+        'acquires': 0,
+        'wait_avg_ms': 0.0,
+        'wait_max_ms': 0.0
+    }
+
+    pool._stats.record(wait=0.002)
+    pool._stats.record(wait=0.004)
+
+    stats = pool.stats()
+    assert stats['acquires'] == 2
+    assert stats['wait_avg_ms'] == pytest.approx(3.0)
+    assert stats['wait_max_ms'] == pytest.approx(4.0)
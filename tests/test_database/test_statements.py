@@ -0,0 +1,95 @@
+import pytest
+import asyncpg
+
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch
+)
+
+from config import queries
+from config.statements import (
+    Statement,
+    StatementRegistry,
+    statements
+)
+
+
+@pytest.mark.asyncio
+async def test_statement():
+
+    """
+    Тестирование выполнения запроса из реестра с замером времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    statement = Statement(
+        name='get_group',
+        sql='SELECT group_id FROM groups WHERE group_id = $1'
+    )
+
+    mock_conn = MagicMock()
+    mock_conn.fetchval = AsyncMock(return_value=1)
+    mock_conn.execute = AsyncMock(side_effect=asyncpg.PostgresError('DB error'))
+
+    with patch('config.statements.time.perf_counter', side_effect=[1.0, 1.002, 2.0, 2.004]):
+        result = await statement.fetchval(mock_conn, 1)
+
+        # Ошибка запроса учитывается в статистике и пробрасывается дальше
+        with pytest.raises(asyncpg.PostgresError):
+            await statement.execute(mock_conn, 1)
+
+    mock_conn.fetchval.assert_awaited_once_with('SELECT group_id FROM groups WHERE group_id = $1', 1)
+    assert result == 1
+
+    stats = statement.stats()
+    assert stats['calls'] == 2
+    assert stats['errors'] == 1
+    assert stats['time_avg_ms'] == pytest.approx(3.0)
+    assert stats['time_max_ms'] == pytest.approx(4.0)
+
+    statement.reset()
+    assert statement.stats() == {
+        'calls': 0,
+        'errors': 0,
+        'time_avg_ms': 0.0,
+        'time_max_ms': 0.0
+    }
+
+
+def test_statement_registry():
+
+    """
+    Тестирование реестра запросов.
+    :return: Функция ничего не возвращает.
+    """
+
+    registry = StatementRegistry()
+
+    first = registry.register('first', 'SELECT 1', hot=True)
+    registry.register('second', 'SELECT 2')
+
+    assert registry['first'] is first
+    assert len(registry) == 2
+    assert registry.hot_queries() == ['SELECT 1']
+    assert set(registry.stats()) == {'first', 'second'}
+
+    # Имя запроса должно быть уникальным
+    with pytest.raises(ValueError):
+        registry.register('first', 'SELECT 3')
+
+
+def test_queries_registered():
+
+    """
+    Тестирование того, что все запросы к БД зарегистрированы в общем реестре.
+    :return: Функция ничего не возвращает.
+    """
+
+    registered = list(statements)
+
+    assert queries.SEARCH_PHOTO_BY_DESCRIPTION in registered
+    assert queries.GET_FILE_ID_BY_DESCRIPTION.sql in statements.hot_queries()
+    assert all(statement.sql in statements.hot_queries() for statement in queries.GET_PHOTOS_PAGE.values())
+    # Тексты запросов не повторяются
+    assert len({statement.sql for statement in registered}) == len(registered)
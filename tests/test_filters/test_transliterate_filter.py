@@ -2,7 +2,11 @@ import pytest
 
 from transliterate import translit
 
-from bot_app.filters.transliterate_filter import TransliterationFilter
+from bot_app.filters.transliterate_filter import (
+    TransliterationFilter,
+    transliterate_text,
+    transliterate_texts
+)
 
 
 @pytest.mark.asyncio
@@ -46,3 +50,22 @@ async def test_transliterate_filter(mock_handler,
         assert result['description_translit'] == expected_translit
     else:
         assert 'description_translit' not in result
+
+
+def test_transliterate_texts():
+
+    """
+    Тестирование перевода списка текстов, как при добавлении одного фото фильтром.
+    :return: Функция ничего не возвращает.
+    """
+
+    assert transliterate_text(text='Описание') == translit('Описание', language_code='ru', reversed=True)
+    assert transliterate_text(text='Opisanie', language='latin') == 'Описание'
+    assert transliterate_text(text='123') is None
+
+    assert transliterate_texts(['Описание', 'Opisanie', '123', 'Описание']) == [
+        'Opisanie',
+        'Описание',
+        None,
+        'Opisanie'
+    ]
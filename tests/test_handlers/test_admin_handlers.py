@@ -7,7 +7,6 @@ from unittest.mock import (
 )
 
 from bot_app.exceptions.database import (
-    DatabaseGetGroupError,
     DatabaseGetCategoriesError,
     DatabaseAddPhotoWithCategoryError,
     DatabaseDeletePhotoError,
@@ -36,6 +35,7 @@ async def test_update_photo_handler(mock_db_pool,
                                     mock_admin,
                                     keyboards_test_data,
                                     sample_test_data,
+                                    group_registry,
                                     mocker):
 
     """
@@ -45,6 +45,7 @@ async def test_update_photo_handler(mock_db_pool,
     :param mock_handler: Функция, возвращающая кортеж из мокированных объектов для message, callback и state.
     :param keyboards_test_data: Словарь с тестовыми данными клавиатуры.
     :param sample_test_data: Словарь с тестовыми данными.
+    :param group_registry: Реестр групп, заполненный тестовыми группами.
     :param mocker: Мокер для добавления side_effect в тест для тестирования ошибки.
     :return: Функция ничего не возвращает.
     """
@@ -79,11 +80,6 @@ async def test_update_photo_handler(mock_db_pool,
     message.photo[-1].file_id = new_photo_id
 
     # Мокаем функции работы с базой данных
-    mock_get_groups_from_db = mocker.patch(
-        "bot_app.handlers.admin_handlers.get_groups_from_db",
-        return_value=groups_data
-    )
-
     mock_get_photo_description_by_file_id_from_db = mocker.patch(
         'bot_app.handlers.admin_handlers.get_photo_description_by_file_id_from_db',
         return_value=description
@@ -105,11 +101,11 @@ async def test_update_photo_handler(mock_db_pool,
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
 
     # Проверяем вызовы
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_get_photo_description_by_file_id_from_db.assert_awaited_once_with(
         pool=mock_pool,
         file_id=photo_id
@@ -133,7 +129,6 @@ async def test_update_photo_handler(mock_db_pool,
 
     # Сбрасываем отправку сообщений для дальнейшего тестирования
     message.answer.reset_mock()
-    mock_get_groups_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
 
     # Если пользователь не админ
@@ -144,11 +139,11 @@ async def test_update_photo_handler(mock_db_pool,
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
 
     # Проверяем вызовы
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_check_is_admin.assert_awaited_once()
 
     # Проверяем, что сообщение с текстом было успешно отправлено
@@ -158,32 +153,14 @@ async def test_update_photo_handler(mock_db_pool,
     message.answer.reset_mock()
 
     # Тестируем сценарий с ошибкой
-    mock_get_groups_from_db.side_effect = DatabaseGetGroupError()
-    # Если пользователь не админ
     mock_check_is_admin.return_value = True
-
-    # Запуск хендлера
-    await update_photo_handler(
-        message=message,
-        bot=mock_bot,
-        pool=mock_pool,
-        state=state
-    )
-    # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
-    message.answer.assert_awaited_once_with(text=LEXICON_RU["error"])
-
-    # Сбрасываем отправку сообщений для дальнейшего тестирования
-    message.answer.reset_mock()
-    # Сбрасываем side_effect
-    mock_get_groups_from_db.side_effect = None
-
-    # Тестируем сценарий с ошибкой
     mock_get_photo_description_by_file_id_from_db.side_effect = DatabaseGetPhotoDescriptionByFileIdError()
     # Запуск хендлера
     await update_photo_handler(
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
     # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
@@ -201,6 +178,7 @@ async def test_check_message_for_photo(mock_db_pool,
                                        mock_admin,
                                        keyboards_test_data,
                                        sample_test_data,
+                                       group_registry,
                                        mocker):
 
     """
@@ -210,6 +188,7 @@ async def test_check_message_for_photo(mock_db_pool,
     :param mock_handler: Функция, возвращающая кортеж из мокированных объектов для message, callback и state.
     :param keyboards_test_data: Словарь с тестовыми данными клавиатуры.
     :param sample_test_data: Словарь с тестовыми данными.
+    :param group_registry: Реестр групп, заполненный тестовыми группами.
     :param mocker: Мокер для добавления side_effect в тест для тестирования ошибки.
     :return: Функция ничего не возвращает.
     """
@@ -221,8 +200,6 @@ async def test_check_message_for_photo(mock_db_pool,
     category = photo_data['category']
 
     categories_data = sample_test_data['category']
-    groups_data = sample_test_data['groups']
-
     user_data = sample_test_data['user']
     user_id = user_data['user_id']
 
@@ -245,11 +222,6 @@ async def test_check_message_for_photo(mock_db_pool,
         "bot_app.handlers.admin_handlers.get_categories_from_db",
         return_value=categories_data
     )
-    mock_get_groups_from_db = mocker.patch(
-        "bot_app.handlers.admin_handlers.get_groups_from_db",
-        return_value=groups_data
-    )
-
     mock_check_is_admin = mocker.patch(
         'bot_app.handlers.admin_handlers.check_is_admin',
         return_value=True
@@ -276,12 +248,12 @@ async def test_check_message_for_photo(mock_db_pool,
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
 
     # Проверяем вызовы
     mock_get_categories_from_db.assert_awaited_once_with(pool=mock_pool)
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_translit_filter_class.assert_called_once_with(mode='add')
     mock_check_is_admin.assert_awaited_once()
 
@@ -310,7 +282,6 @@ async def test_check_message_for_photo(mock_db_pool,
     # Сбрасываем отправку сообщений для дальнейшего тестирования
     message.answer.reset_mock()
     mock_get_categories_from_db.reset_mock()
-    mock_get_groups_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     mock_translit_filter_class.reset_mock()
     state.update_data.reset_mock()
@@ -326,12 +297,12 @@ async def test_check_message_for_photo(mock_db_pool,
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
 
     # Проверяем вызовы
     mock_get_categories_from_db.assert_awaited_once_with(pool=mock_pool)
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_translit_filter_class.assert_called_once_with(mode='add')
     mock_check_is_admin.assert_awaited_once()
 
@@ -344,7 +315,6 @@ async def test_check_message_for_photo(mock_db_pool,
     # Сбрасываем отправку сообщений для дальнейшего тестирования
     message.answer.reset_mock()
     mock_get_categories_from_db.reset_mock()
-    mock_get_groups_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     mock_translit_filter_class.reset_mock()
     mock_create_admins_confirmation_keyboard.reset_mock()
@@ -363,12 +333,12 @@ async def test_check_message_for_photo(mock_db_pool,
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
 
     # Проверяем вызовы
     mock_get_categories_from_db.assert_awaited_once_with(pool=mock_pool)
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_translit_filter_class.assert_called_once_with(mode='add')
     mock_check_is_admin.assert_awaited_once()
 
@@ -406,6 +376,7 @@ async def test_check_message_for_photo(mock_db_pool,
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
     # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
@@ -416,24 +387,6 @@ async def test_check_message_for_photo(mock_db_pool,
     # Сбрасываем side_effect
     mock_get_categories_from_db.side_effect = None
 
-    # Тестируем сценарий с ошибкой
-    mock_get_groups_from_db.side_effect = DatabaseGetGroupError()
-
-    # Запуск хендлера
-    await check_message_for_photo(
-        message=message,
-        bot=mock_bot,
-        pool=mock_pool,
-        state=state
-    )
-    # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
-    message.answer.assert_awaited_once_with(text=LEXICON_RU['error'])
-
-    # Сбрасываем отправку сообщений для дальнейшего тестирования
-    message.answer.reset_mock()
-    # Сбрасываем side_effect
-    mock_get_groups_from_db.side_effect = None
-
     message.chat.type = None
 
     # Запуск хендлера
@@ -441,6 +394,7 @@ async def test_check_message_for_photo(mock_db_pool,
         message=message,
         bot=mock_bot,
         pool=mock_pool,
+        group_registry=group_registry,
         state=state
     )
 
@@ -8,9 +8,11 @@ from bot_app.handlers.group_handlers import (
     on_chat_joined,
     on_chat_admin,
     on_bot_mention,
-    on_chat_member_updated
+    on_chat_member_updated,
+    on_user_status_changed
 )
 from bot_app.lexicon.lexicon_common.lexicon_ru import LEXICON_RU
+from bot_app.utils.admin_cache import admin_cache
 
 
 @pytest.mark.asyncio
@@ -65,6 +67,7 @@ async def test_on_chat_admin(mock_db_pool,
                              mock_group_handler,
                              sample_test_data,
                              keyboards_test_data,
+                             group_registry,
                              mocker):
 
     """
@@ -74,6 +77,7 @@ async def test_on_chat_admin(mock_db_pool,
     :param mock_group_handler: Функция, возвращающая замокированный объект для ChatMemberUpdated в виде event
     и замокированный объект bot.
     :param sample_test_data: Словарь с тестовыми данными.
+    :param group_registry: Реестр групп, заполненный тестовыми группами.
     :param mocker: Мокер для добавления side_effect в тест для тестирования ошибки.
     :return: Функция ничего не возвращает.
     """
@@ -107,7 +111,8 @@ async def test_on_chat_admin(mock_db_pool,
     # Запуск хендлера
     await on_chat_admin(
         event=event,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что функция добавления группы в БД была вызвана с правильными параметрами
@@ -117,6 +122,9 @@ async def test_on_chat_admin(mock_db_pool,
         group_name=chat_title
     )
 
+    # Проверяем, что группа добавлена в реестр групп
+    assert chat_id in group_registry
+
     # Проверяем, что функция создания клавиатуры была вызвана с правильными параметрами
     mock_create_link_button.assert_called_once()
 
@@ -134,7 +142,8 @@ async def test_on_chat_admin(mock_db_pool,
     # Запуск хендлера
     await on_chat_admin(
         event=event,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что сообщение с ошибкой было успешно отправлено
@@ -149,7 +158,8 @@ async def test_on_chat_admin(mock_db_pool,
     # Запуск хендлера
     await on_chat_admin(
         event=event,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что сообщение с ошибкой было успешно отправлено
@@ -228,6 +238,7 @@ async def test_on_bot_mention(mock_handler,
 async def test_on_chat_member_updated(mock_db_pool,
                                       mock_group_handler,
                                       sample_test_data,
+                                      group_registry,
                                       mocker):
 
     """
@@ -236,6 +247,7 @@ async def test_on_chat_member_updated(mock_db_pool,
     возвращающая кортеж из мокированного пула соединений и само соединение с БД.
     :param mock_group_handler: Функция, возвращающая замокированный объект для ChatMemberUpdated в виде event.
     :param sample_test_data: Словарь с тестовыми данными.
+    :param group_registry: Реестр групп, заполненный тестовыми группами.
     :param mocker: Мокер для добавления side_effect в тест для тестирования ошибки.
     :return: Функция ничего не возвращает.
     """
@@ -261,11 +273,13 @@ async def test_on_chat_member_updated(mock_db_pool,
     event.bot.id = bot_id
     event.new_chat_member.user.id = bot_id
     event.new_chat_member.status = 'kicked'
+    group_registry.add(group_id=chat_id)
 
     # Запуск хендлера
     await on_chat_member_updated(
         event=event,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что функция удаления группы из БД была вызвана с правильными параметрами
@@ -274,12 +288,16 @@ async def test_on_chat_member_updated(mock_db_pool,
         group_id=chat_id
     )
 
+    # Проверяем, что группа удалена из реестра групп
+    assert chat_id not in group_registry
+
     # Тестируем сценарий с ошибкой
     mock_delete_group_from_db.side_effect = DatabaseDeleteGroupError()
     # Запуск хендлера
     await on_chat_member_updated(
         event=event,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Сбрасываем ошибку для дальнейшего тестирования
@@ -290,5 +308,41 @@ async def test_on_chat_member_updated(mock_db_pool,
     # Запуск хендлера
     await on_chat_member_updated(
         event=event,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
+    )
+
+
+@pytest.mark.asyncio
+async def test_on_user_status_changed(mock_group_handler,
+                                      sample_test_data):
+
+    """
+    Тестирование хендлера для события изменения статуса пользователя в группе.
+    :param mock_group_handler: Функция, возвращающая замокированный объект для ChatMemberUpdated в виде event.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    # Данные для теста
+    chat_id = sample_test_data['chat']['chat_id']
+    user_id = sample_test_data['user']['user_id']
+
+    # Получаем данные из наших фикстур
+    bot, event = mock_group_handler
+
+    event.chat.id = chat_id
+    event.new_chat_member.user.id = user_id
+
+    # Кэшируем статус пользователя
+    admin_cache.set(
+        user_id=user_id,
+        group_id=chat_id,
+        is_admin=True
     )
+
+    # Запуск хендлера
+    await on_user_status_changed(event=event)
+
+    # Проверяем, что статус пользователя сброшен
+    assert admin_cache.get(user_id=user_id, group_id=chat_id) is None
@@ -5,12 +5,11 @@ from aiogram.utils.keyboard import InlineKeyboardMarkup
 from unittest.mock import AsyncMock
 
 from bot_app.exceptions.database import (
-    DatabaseGetGroupError,
     DatabaseSearchPhotoByDescriptionError,
     DatabaseGetCategoriesError,
     DatabaseGetPhotosError,
-    DatabaseGetTotalPhotosError,
-    DatabaseGetFileIdByDescriptionError
+    DatabaseGetFileIdByDescriptionError,
+    DatabaseGetPhotoByIdError
 )
 from bot_app.handlers.user_handlers import (
     search_photo_handler,
@@ -30,6 +29,7 @@ async def test_search_photo_handler(mock_db_pool,
                                     mock_admin,
                                     sample_test_data,
                                     keyboards_test_data,
+                                    group_registry,
                                     mocker):
 
     """
@@ -40,6 +40,7 @@ async def test_search_photo_handler(mock_db_pool,
     :param mock_admin: Функция, возвращающая замокированные объекты mock_bot и mock_member.
     :param sample_test_data: Словарь с тестовыми данными.
     :param keyboards_test_data: Словарь с тестовыми данными клавиатуры.
+    :param group_registry: Реестр групп, заполненный тестовыми группами.
     :param mocker: Мокер для добавления side_effect в тест для тестирования ошибки.
     :return: Функция ничего не возвращает.
     """
@@ -51,7 +52,6 @@ async def test_search_photo_handler(mock_db_pool,
     description = photo_data['description']
     category = photo_data['category']
     query = 'Des'
-    groups = sample_test_data['groups']
 
     assemble_buttons = keyboards_test_data['assemble_buttons']
     admins_keyboard = keyboards_test_data['admin_keyboard']
@@ -73,11 +73,6 @@ async def test_search_photo_handler(mock_db_pool,
     })
 
     # Мокаем функции работы с базой данных
-    mock_get_groups_from_db = mocker.patch(
-        'bot_app.handlers.user_handlers.get_groups_from_db',
-        return_value=groups
-    )
-
     mock_search_photo_by_description_in_db = mocker.patch(
         'bot_app.handlers.user_handlers.search_photo_by_description_in_db',
         return_value=filtered_data
@@ -104,11 +99,11 @@ async def test_search_photo_handler(mock_db_pool,
         message=message,
         state=state,
         bot=mock_bot,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что функция для работы с БД была вызвана
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
 
     mock_search_photo_by_description_in_db.assert_awaited_once_with(
         pool=mock_pool,
@@ -131,7 +126,6 @@ async def test_search_photo_handler(mock_db_pool,
     # Сбрасываем всё для дальнейшего использования
     message.answer.reset_mock()
     mock_create_assembl_buttons.reset_mock()
-    mock_get_groups_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     mock_search_photo_by_description_in_db.reset_mock()
 
@@ -149,7 +143,8 @@ async def test_search_photo_handler(mock_db_pool,
         message=message,
         state=state,
         bot=mock_bot,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что функция для работы с БД была вызвана
@@ -181,7 +176,6 @@ async def test_search_photo_handler(mock_db_pool,
     # Сбрасываем всё для дальнейшего использования
     message.answer_photo.reset_mock()
     mock_create_admins_keyboard.reset_mock()
-    mock_get_groups_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     mock_search_photo_by_description_in_db.reset_mock()
 
@@ -194,7 +188,8 @@ async def test_search_photo_handler(mock_db_pool,
         message=message,
         state=state,
         bot=mock_bot,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что функция для работы с БД была вызвана
@@ -219,7 +214,6 @@ async def test_search_photo_handler(mock_db_pool,
 
     # Сбрасываем всё для дальнейшего использования
     message.answer_photo.reset_mock()
-    mock_get_groups_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     mock_search_photo_by_description_in_db.reset_mock()
 
@@ -231,7 +225,8 @@ async def test_search_photo_handler(mock_db_pool,
         message=message,
         state=state,
         bot=mock_bot,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что функция для работы с БД была вызвана
@@ -249,28 +244,9 @@ async def test_search_photo_handler(mock_db_pool,
 
     # Сбрасываем всё для дальнейшего использования
     message.answer.reset_mock()
-    mock_get_groups_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     mock_search_photo_by_description_in_db.reset_mock()
 
-    # Тестируем сценарий с ошибкой
-    mock_get_groups_from_db.side_effect = DatabaseGetGroupError()
-
-    # Запуск хендлера
-    await search_photo_handler(
-        message=message,
-        state=state,
-        bot=mock_bot,
-        pool=mock_pool
-    )
-
-    # Проверяем, что вторым вызовом было отправлено сообщение с ошибкой
-    message.answer.assert_awaited_once_with(text=LEXICON_RU["error"])
-
-    # Сбрасываем всё для дальнейшего использования
-    message.answer.reset_mock()
-    mock_get_groups_from_db.side_effect = None
-
     # Тестируем сценарий с ошибкой
     mock_search_photo_by_description_in_db.side_effect = DatabaseSearchPhotoByDescriptionError()
 
@@ -279,7 +255,8 @@ async def test_search_photo_handler(mock_db_pool,
         message=message,
         state=state,
         bot=mock_bot,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что вторым вызовом было отправлено сообщение с ошибкой
@@ -297,7 +274,8 @@ async def test_search_photo_handler(mock_db_pool,
         message=message,
         state=state,
         bot=mock_bot,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что вторым вызовом было отправлено сообщение с ошибкой
@@ -461,11 +439,9 @@ async def test_move_back_to_category_callback(mock_db_pool,
         return_value=category_data
     )
 
-    # Мокаем функцию создания клавиатуры
-    mock_create_categories_keyboard = mocker.patch(
-        'bot_app.handlers.user_handlers.create_categories_keyboard',
-        return_value=categories_keyboard
-    )
+    # Мокаем каталог категорий с готовой клавиатурой
+    mock_category_catalog = mocker.patch('bot_app.handlers.user_handlers.category_catalog')
+    mock_category_catalog.keyboard = categories_keyboard
 
     # Запуск хендлера
     await move_back_to_category_callback(
@@ -483,9 +459,6 @@ async def test_move_back_to_category_callback(mock_db_pool,
         reply_markup=categories_keyboard
     )
 
-    # Проверяем, что функция создания клавиатуры была вызвана с правильными параметрами
-    mock_create_categories_keyboard.assert_called_once()
-
     # Проверяем, что обновление в словаре data прошло успешно
     state.update_data.assert_awaited_once_with(cancel_handler=False)
 
@@ -567,8 +540,9 @@ async def test_category_selection_callback(mock_db_pool,
     """
 
     # Данные для теста
-    photo_data = sample_test_data['photo']
-    category = photo_data['category']
+    photo_data = sample_test_data['photos'][0]
+    photo_id = photo_data['id']
+    category = sample_test_data['photo']['category']
 
     assemble_buttons = keyboards_test_data['assemble_buttons']
     keyboard_pagination = keyboards_test_data['pagination_keyboard']
@@ -590,13 +564,9 @@ async def test_category_selection_callback(mock_db_pool,
     })
 
     # Мокаем функции для работы с БД
-    mock_get_photos_from_db = mocker.patch(
-        'bot_app.handlers.user_handlers.get_photos_from_db',
-        return_value=[]
-    )
-    mock_get_total_photos_count = mocker.patch(
-        'bot_app.handlers.user_handlers.get_total_photos_count',
-        return_value=1
+    mock_get_photos_page_from_db = mocker.patch(
+        'bot_app.handlers.user_handlers.get_photos_page_from_db',
+        return_value={'category_id': 1, 'photos': [], 'total': 1}
     )
 
     # Мокаем функцию создания клавиатуры
@@ -618,18 +588,11 @@ async def test_category_selection_callback(mock_db_pool,
         pool=mock_pool
     )
 
-    # Проверяем, что функция для получения фото была вызвана с правильными параметрами
-    mock_get_photos_from_db.assert_awaited_once_with(
+    # Проверяем, что функция для получения страницы фото была вызвана с правильными параметрами
+    mock_get_photos_page_from_db.assert_awaited_once_with(
         pool=mock_pool,
         category=category,
-        limit=6,
-        offset=0
-    )
-
-    # Проверяем, что функция для получения общего количества фото была вызвана
-    mock_get_total_photos_count.assert_awaited_once_with(
-        pool=mock_pool,
-        category=category
+        limit=6
     )
 
     # Проверяем, что данные категории и страницы успешно обновляются в состоянии
@@ -642,7 +605,9 @@ async def test_category_selection_callback(mock_db_pool,
     mock_create_assembl_buttons.assert_called_once()
     mock_create_paginated_keyboard.assert_called_once_with(
         current_page=1,
-        total_pages=1
+        total_pages=1,
+        first_id=None,
+        last_id=None
     )
 
     # Проверяем, что сообщение с текстом было успешно отправлено
@@ -652,15 +617,14 @@ async def test_category_selection_callback(mock_db_pool,
 
     # Сбрасываем всё для дальнейшего использования
     callback.message.edit_text.reset_mock()
-    mock_get_photos_from_db.reset_mock()
-    mock_get_total_photos_count.reset_mock()
+    mock_get_photos_page_from_db.reset_mock()
     mock_create_paginated_keyboard.reset_mock()
     mock_create_assembl_buttons.reset_mock()
     state.update_data.reset_mock()
 
     # Тестируем сценарий с else
     # Запуск хендлера
-    mock_get_photos_from_db.return_value = [photo_data]
+    mock_get_photos_page_from_db.return_value = {'category_id': 1, 'photos': [photo_data], 'total': 1}
 
     await category_selection_callback(
         callback=callback,
@@ -674,25 +638,20 @@ async def test_category_selection_callback(mock_db_pool,
         current_page=1
     )
 
-    # Проверяем, что функция для получения фото была вызвана с правильными параметрами
-    mock_get_photos_from_db.assert_awaited_once_with(
+    # Проверяем, что функция для получения страницы фото была вызвана с правильными параметрами
+    mock_get_photos_page_from_db.assert_awaited_once_with(
         pool=mock_pool,
         category=category,
-        limit=6,
-        offset=0
-    )
-
-    # Проверяем, что функция для получения общего количества фото была вызвана
-    mock_get_total_photos_count.assert_awaited_once_with(
-        pool=mock_pool,
-        category=category
+        limit=6
     )
 
     # Проверяем, что функция создания клавиатуры была вызвана с правильными параметрами
     mock_create_assembl_buttons.assert_called_once()
     mock_create_paginated_keyboard.assert_called_once_with(
         current_page=1,
-        total_pages=1
+        total_pages=1,
+        first_id=photo_id,
+        last_id=photo_id
     )
 
     # Проверяем, что сообщение удалено
@@ -707,14 +666,13 @@ async def test_category_selection_callback(mock_db_pool,
     # Сбрасываем всё для дальнейшего использования
     callback.message.answer.reset_mock()
     callback.message.photo = False
-    mock_get_photos_from_db.reset_mock()
-    mock_get_total_photos_count.reset_mock()
+    mock_get_photos_page_from_db.reset_mock()
     mock_create_paginated_keyboard.reset_mock()
     mock_create_assembl_buttons.reset_mock()
     state.update_data.reset_mock()
 
     # Запуск хендлера
-    mock_get_photos_from_db.return_value = [photo_data]
+    mock_get_photos_page_from_db.return_value = {'category_id': 1, 'photos': [photo_data], 'total': 1}
 
     await category_selection_callback(
         callback=callback,
@@ -728,25 +686,20 @@ async def test_category_selection_callback(mock_db_pool,
         current_page=1
     )
 
-    # Проверяем, что функция для получения фото была вызвана с правильными параметрами
-    mock_get_photos_from_db.assert_awaited_once_with(
+    # Проверяем, что функция для получения страницы фото была вызвана с правильными параметрами
+    mock_get_photos_page_from_db.assert_awaited_once_with(
         pool=mock_pool,
         category=category,
-        limit=6,
-        offset=0
-    )
-
-    # Проверяем, что функция для получения общего количества фото была вызвана
-    mock_get_total_photos_count.assert_awaited_once_with(
-        pool=mock_pool,
-        category=category
+        limit=6
     )
 
     # Проверяем, что функция создания клавиатуры была вызвана с правильными параметрами
     mock_create_assembl_buttons.assert_called_once()
     mock_create_paginated_keyboard.assert_called_once_with(
         current_page=1,
-        total_pages=1
+        total_pages=1,
+        first_id=photo_id,
+        last_id=photo_id
     )
 
     # Проверяем, что сообщение с текстом и клавиатурой было успешно отправлено
@@ -757,8 +710,7 @@ async def test_category_selection_callback(mock_db_pool,
 
     # Сбрасываем всё для дальнейшего использования
     callback.message.edit_text.reset_mock()
-    mock_get_photos_from_db.reset_mock()
-    mock_get_total_photos_count.reset_mock()
+    mock_get_photos_page_from_db.reset_mock()
     mock_create_paginated_keyboard.reset_mock()
     mock_create_assembl_buttons.reset_mock()
     state.update_data.reset_mock()
@@ -769,7 +721,7 @@ async def test_category_selection_callback(mock_db_pool,
     })
 
     # Запуск хендлера
-    mock_get_photos_from_db.return_value = [photo_data]
+    mock_get_photos_page_from_db.return_value = {'category_id': 1, 'photos': [photo_data], 'total': 1}
 
     await category_selection_callback(
         callback=callback,
@@ -789,7 +741,7 @@ async def test_category_selection_callback(mock_db_pool,
         'cancel_handler': False
     })
 
-    mock_get_photos_from_db.side_effect = DatabaseGetPhotosError()
+    mock_get_photos_page_from_db.side_effect = DatabaseGetPhotosError()
 
     # Запуск хендлера
     await category_selection_callback(
@@ -803,24 +755,7 @@ async def test_category_selection_callback(mock_db_pool,
 
     # Сбрасываем всё для дальнейшего использования
     callback.message.answer.reset_mock()
-    mock_get_photos_from_db.side_effect = None
-
-    # Тестируем сценарий с ошибкой
-    mock_get_total_photos_count.side_effect = DatabaseGetTotalPhotosError()
-
-    # Запуск хендлера
-    await category_selection_callback(
-        callback=callback,
-        state=state,
-        pool=mock_pool
-    )
-
-    # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
-    callback.message.answer.assert_awaited_once_with(text=LEXICON_RU['error'])
-
-    # Сбрасываем всё для дальнейшего использования
-    callback.message.answer.reset_mock()
-    mock_get_total_photos_count.side_effect = None
+    mock_get_photos_page_from_db.side_effect = None
 
     # Тестируем сценарий с ошибкой
     state.get_data.side_effect = Exception()
@@ -854,6 +789,7 @@ async def test_process_pagination_callback(mock_db_pool,
     """
 
     # Данные для теста
+    photos_data = sample_test_data['photos']
     photo_data = sample_test_data['photo']
 
     state_data = sample_test_data['state']
@@ -868,13 +804,9 @@ async def test_process_pagination_callback(mock_db_pool,
     )
 
     # Мокаем функции для работы с БД
-    mock_get_photos_from_db = mocker.patch(
-        'bot_app.handlers.user_handlers.get_photos_from_db',
-        return_value=[photo_data]
-    )
-    mock_get_total_photos_count = mocker.patch(
-        'bot_app.handlers.user_handlers.get_total_photos_count',
-        return_value=1
+    mock_get_photos_page_from_db = mocker.patch(
+        'bot_app.handlers.user_handlers.get_photos_page_from_db',
+        return_value={'category_id': 1, 'photos': photos_data, 'total': 1}
     )
 
     # Мокаем функцию создания клавиатуры
@@ -892,7 +824,8 @@ async def test_process_pagination_callback(mock_db_pool,
     message, callback, state = mock_handler
 
     # Передаём ожидаемые данные в callback
-    callback.data = f'page_{current_page}'
+    cursor = 100
+    callback.data = f'page_{current_page}_next_{cursor}'
 
     state.get_data = AsyncMock(return_value={
         'cancel_handler': False,
@@ -912,25 +845,22 @@ async def test_process_pagination_callback(mock_db_pool,
     # Проверяем, что данные категории и страницы успешно обновляются в состоянии
     state.update_data.assert_awaited_once_with(current_page=current_page)
 
-    # Проверяем, что функция для получения фото была вызвана с правильными параметрами
-    mock_get_photos_from_db.assert_awaited_once_with(
+    # Проверяем, что функция для получения страницы фото была вызвана с правильными параметрами
+    mock_get_photos_page_from_db.assert_awaited_once_with(
         pool=mock_pool,
         category=category,
         limit=6,
-        offset=6
-    )
-
-    # Проверяем, что функция для получения общего количества фото была вызвана
-    mock_get_total_photos_count.assert_awaited_once_with(
-        pool=mock_pool,
-        category=category
+        cursor=cursor,
+        direction='next'
     )
 
     # Проверяем, что функция создания клавиатуры была вызвана с правильными параметрами
     mock_create_assembl_buttons.assert_called_once()
     mock_create_paginated_keyboard.assert_called_once_with(
         current_page=current_page,
-        total_pages=1
+        total_pages=1,
+        first_id=photos_data[0]['id'],
+        last_id=photos_data[-1]['id']
     )
 
     # Проверяем, что сообщение с текстом и клавиатурой было успешно отправлено
@@ -940,8 +870,7 @@ async def test_process_pagination_callback(mock_db_pool,
     )
 
     # Сбрасываем всё для дальнейшего использования
-    mock_get_photos_from_db.reset_mock()
-    mock_get_total_photos_count.reset_mock()
+    mock_get_photos_page_from_db.reset_mock()
     mock_create_paginated_keyboard.reset_mock()
     mock_create_assembl_buttons.reset_mock()
     state.get_data.reset_mock()
@@ -952,7 +881,7 @@ async def test_process_pagination_callback(mock_db_pool,
     })
 
     # Запуск хендлера
-    mock_get_photos_from_db.return_value = [photo_data]
+    mock_get_photos_page_from_db.return_value = {'category_id': 1, 'photos': [photo_data], 'total': 1}
 
     await category_selection_callback(
         callback=callback,
@@ -972,7 +901,7 @@ async def test_process_pagination_callback(mock_db_pool,
         'cancel_handler': False
     })
 
-    mock_get_photos_from_db.side_effect = DatabaseGetPhotosError()
+    mock_get_photos_page_from_db.side_effect = DatabaseGetPhotosError()
 
     # Запуск хендлера
     await process_pagination_callback(
@@ -986,10 +915,10 @@ async def test_process_pagination_callback(mock_db_pool,
 
     # Сбрасываем всё для дальнейшего использования
     callback.message.answer.reset_mock()
-    mock_get_photos_from_db.side_effect = None
+    mock_get_photos_page_from_db.side_effect = None
 
     # Тестируем сценарий с ошибкой
-    mock_get_total_photos_count.side_effect = DatabaseGetTotalPhotosError()
+    state.get_data.side_effect = Exception()
 
     # Запуск хендлера
     await process_pagination_callback(
@@ -1001,22 +930,61 @@ async def test_process_pagination_callback(mock_db_pool,
     # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
     callback.message.answer.assert_awaited_once_with(text=LEXICON_RU['error'])
 
-    # Сбрасываем всё для дальнейшего использования
-    callback.message.answer.reset_mock()
-    mock_get_total_photos_count.side_effect = None
 
-    # Тестируем сценарий с ошибкой
-    state.get_data.side_effect = Exception()
+@pytest.mark.asyncio
+async def test_process_pagination_callback_empty_page(mock_handler,
+                                                     mocker):
+
+    """
+    Тестирование пагинации на последней и пустой странице и кнопок с повреждёнными данными.
+    :param mock_handler: Функция, возвращающая кортеж из мокированных объектов для message, callback и state.
+    :param mocker: Мокер для подмены функции получения страницы фото.
+    :return: Функция ничего не возвращает.
+    """
+
+    message, callback, state = mock_handler
+    state.get_data = AsyncMock(return_value={
+        'cancel_handler': False,
+        'category': 'Category123'
+    })
+
+    # Страница опустела (фото удалены): кнопки перехода без id не добавляются
+    mock_get_photos_page_from_db = mocker.patch(
+        'bot_app.handlers.user_handlers.get_photos_page_from_db',
+        return_value={'category_id': 1, 'photos': [], 'total': 12}
+    )
+    callback.data = 'page_2_next_100'
 
-    # Запуск хендлера
     await process_pagination_callback(
         callback=callback,
         state=state,
-        pool=mock_pool
+        pool=AsyncMock()
     )
 
-    # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
-    callback.message.answer.assert_awaited_once_with(text=LEXICON_RU['error'])
+    reply_markup = callback.message.edit_text.call_args.kwargs['reply_markup']
+    callback_data = [button.callback_data for row in reply_markup.inline_keyboard for button in row]
+    assert 'page_info' in callback_data
+    assert not [data for data in callback_data if data.startswith('page_') and data != 'page_info']
+    callback.message.answer.assert_not_called()
+
+    # Кнопка с повреждёнными данными закрывается без запроса к БД и без сообщения об ошибке
+    mock_get_photos_page_from_db.reset_mock()
+    callback.message.edit_text.reset_mock()
+    for data in ('page_1_prev_None', 'page_x_next_5', 'page_2_up_5', 'page_'):
+        callback.data = data
+        callback.answer.reset_mock()
+
+        await process_pagination_callback(
+            callback=callback,
+            state=state,
+            pool=AsyncMock()
+        )
+
+        callback.answer.assert_awaited_once_with()
+
+    mock_get_photos_page_from_db.assert_not_called()
+    callback.message.edit_text.assert_not_called()
+    callback.message.answer.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -1024,6 +992,7 @@ async def test_send_photo_handler(mock_db_pool,
                                   mock_handler,
                                   keyboards_test_data,
                                   sample_test_data,
+                                  group_registry,
                                   mocker):
 
     """
@@ -1033,6 +1002,7 @@ async def test_send_photo_handler(mock_db_pool,
     :param mock_handler: Функция, возвращающая кортеж из мокированных объектов для message, callback и state.
     :param keyboards_test_data: Словарь с тестовыми данными клавиатуры.
     :param sample_test_data: Словарь с тестовыми данными.
+    :param group_registry: Реестр групп, заполненный тестовыми группами.
     :param mocker: Мокер для добавления side_effect в тест для тестирования ошибки.
     :return: Функция ничего не возвращает.
     """
@@ -1042,8 +1012,6 @@ async def test_send_photo_handler(mock_db_pool,
     photo_id = ''
     category = photo_data['category']
 
-    groups_data = sample_test_data['groups']
-
     keyboard_admin = keyboards_test_data['admin_keyboard']
 
     # Получаем фикстуры
@@ -1060,10 +1028,6 @@ async def test_send_photo_handler(mock_db_pool,
     })
 
     # Мокаем функции работы с базой данных
-    mock_get_groups_from_db = mocker.patch(
-        "bot_app.handlers.user_handlers.get_groups_from_db",
-        return_value=groups_data
-    )
     mock_get_photo_file_id_by_description_from_db = mocker.patch(
         "bot_app.handlers.user_handlers.get_photo_file_id_by_description_from_db",
         return_value=photo_id
@@ -1087,11 +1051,11 @@ async def test_send_photo_handler(mock_db_pool,
         callback=callback,
         bot=mocker.Mock(),
         state=state,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем вызовы
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_get_photo_file_id_by_description_from_db.assert_awaited_once_with(
         pool=mock_pool,
         description=caption
@@ -1101,7 +1065,6 @@ async def test_send_photo_handler(mock_db_pool,
     callback.message.edit_text.assert_awaited_once_with(text=LEXICON_RU['error'])
 
     # Сбрасываем всё для дальнейшего тестирования
-    mock_get_groups_from_db.reset_mock()
     mock_get_photo_file_id_by_description_from_db.reset_mock()
     callback.answer.reset_mock()
     callback.message.edit_text.reset_mock()
@@ -1116,11 +1079,11 @@ async def test_send_photo_handler(mock_db_pool,
         callback=callback,
         bot=mocker.Mock(),
         state=state,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем вызовы
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_get_photo_file_id_by_description_from_db.assert_awaited_once_with(
         pool=mock_pool,
         description=caption
@@ -1136,7 +1099,6 @@ async def test_send_photo_handler(mock_db_pool,
     state.clear.assert_awaited_once()
 
     # Сбрасываем всё для дальнейшего тестирования
-    mock_get_groups_from_db.reset_mock()
     mock_get_photo_file_id_by_description_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     callback.message.answer_photo.reset_mock()
@@ -1151,11 +1113,11 @@ async def test_send_photo_handler(mock_db_pool,
         callback=callback,
         bot=mocker.Mock(),
         state=state,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем вызовы
-    mock_get_groups_from_db.assert_awaited_once_with(pool=mock_pool)
     mock_get_photo_file_id_by_description_from_db.assert_awaited_once_with(
         pool=mock_pool,
         description=caption
@@ -1182,7 +1144,6 @@ async def test_send_photo_handler(mock_db_pool,
     mock_create_admins_keyboard.assert_called_once()
 
     # Сбрасываем всё для дальнейшего тестирования
-    mock_get_groups_from_db.reset_mock()
     mock_get_photo_file_id_by_description_from_db.reset_mock()
     mock_check_is_admin.reset_mock()
     callback.answer.reset_mock()
@@ -1198,7 +1159,8 @@ async def test_send_photo_handler(mock_db_pool,
         callback=callback,
         bot=mocker.Mock(),
         state=state,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что отправлено сообщение с необходимым текстом
@@ -1214,14 +1176,15 @@ async def test_send_photo_handler(mock_db_pool,
         'category': category
     })
 
-    mock_get_groups_from_db.side_effect = DatabaseGetGroupError()
+    mock_get_photo_file_id_by_description_from_db.side_effect = DatabaseGetFileIdByDescriptionError()
 
     # Запуск хендлера
     await send_photo_handler(
         callback=callback,
         bot=mocker.Mock(),
         state=state,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
@@ -1229,25 +1192,82 @@ async def test_send_photo_handler(mock_db_pool,
 
     # Сбрасываем всё для дальнейшего использования
     callback.message.answer.reset_mock()
-    mock_get_groups_from_db.side_effect = None
+    mock_get_photo_file_id_by_description_from_db.side_effect = None
+    mock_get_photo_file_id_by_description_from_db.reset_mock()
+    callback.answer.reset_mock()
+    callback.message.answer_photo.reset_mock()
+    state.clear.reset_mock()
+
+    # Тестируем кнопку с id фото
+    callback.data = 'photo_id_123'
+    mock_check_is_admin.return_value = False
+
+    mock_get_photo_by_id_from_db = mocker.patch(
+        'bot_app.handlers.user_handlers.get_photo_by_id_from_db',
+        return_value={
+            'photo_id': photo_id,
+            'description': caption
+        }
+    )
+
+    # Запуск хендлера
+    await send_photo_handler(
+        callback=callback,
+        bot=mocker.Mock(),
+        state=state,
+        pool=mock_pool,
+        group_registry=group_registry
+    )
+
+    # Проверяем, что фото получено по id, а поиск по описанию не выполнялся
+    mock_get_photo_by_id_from_db.assert_awaited_once_with(
+        pool=mock_pool,
+        photo_db_id=123
+    )
+    mock_get_photo_file_id_by_description_from_db.assert_not_awaited()
+
+    callback.message.answer_photo.assert_awaited_once_with(
+        photo=photo_id,
+        caption=description
+    )
+    state.clear.assert_awaited_once()
+
+    # Сбрасываем всё для дальнейшего тестирования
+    mock_get_photo_by_id_from_db.reset_mock()
+    callback.message.answer_photo.reset_mock()
+    callback.message.edit_text.reset_mock()
+
+    # Тестируем сценарий, когда фото с таким id уже удалено
+    mock_get_photo_by_id_from_db.return_value = None
+
+    # Запуск хендлера
+    await send_photo_handler(
+        callback=callback,
+        bot=mocker.Mock(),
+        state=state,
+        pool=mock_pool,
+        group_registry=group_registry
+    )
+
+    callback.message.edit_text.assert_awaited_once_with(text=LEXICON_RU['error'])
+    callback.message.answer_photo.assert_not_awaited()
 
     # Тестируем сценарий с ошибкой
-    mock_get_photo_file_id_by_description_from_db.side_effect = DatabaseGetFileIdByDescriptionError()
+    mock_get_photo_by_id_from_db.side_effect = DatabaseGetPhotoByIdError()
 
     # Запуск хендлера
     await send_photo_handler(
         callback=callback,
         bot=mocker.Mock(),
         state=state,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
-    # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
     callback.message.answer.assert_awaited_once_with(text=LEXICON_RU['error'])
 
     # Сбрасываем всё для дальнейшего использования
     callback.message.answer.reset_mock()
-    mock_get_photo_file_id_by_description_from_db.side_effect = None
 
     # Тестируем сценарий с ошибкой
     state.get_data.side_effect = Exception()
@@ -1257,7 +1277,8 @@ async def test_send_photo_handler(mock_db_pool,
         callback=callback,
         bot=mocker.Mock(),
         state=state,
-        pool=mock_pool
+        pool=mock_pool,
+        group_registry=group_registry
     )
 
     # Проверяем, что в случае ошибки будет отправлено сообщение с необходимым текстом
@@ -0,0 +1,99 @@
+import pytest
+
+from bot_app.utils.admin_cache import AdminStatusCache
+from bot_app.utils.cache import TTLCache
+
+
+def test_ttl_cache(mocker):
+
+    """
+    Тестирование LRU-кэша с временем жизни записей.
+    :param mocker: Мокер для подмены времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.cache.time.monotonic', return_value=100.0)
+
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    # Промах по пустому кэшу
+    assert cache.get('a') is None
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    # Попадание и отметка 'a' как последней использованной
+    assert cache.get('a') == 1
+
+    # Добавление третьей записи вытесняет самую старую ('b')
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert 'a' in cache
+    assert len(cache) == 2
+
+    # Истечение времени жизни
+    mock_time.return_value = 111.0
+    assert cache.get('a') is None
+
+    # Запись без времени жизни
+    cache.set('d', 4, ttl=None)
+    mock_time.return_value = 10_000.0
+    assert cache.get('d') == 4
+
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 2
+    assert stats['hit_ratio'] == pytest.approx(0.5)
+    # 'b' вытеснена при переполнении, 'a' удалена по истечении времени жизни
+    assert stats['evictions'] == 1
+    assert stats['expirations'] == 1
+
+    # Очистка кэша не сбрасывает счётчики, которые отдаются в метриках как монотонные
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()['hits'] == 2
+    assert cache.get('d') is None
+    assert cache.stats()['misses'] == 3
+
+    cache.clear(reset_stats=True)
+    assert cache.stats()['hits'] == 0
+    assert cache.stats()['misses'] == 0
+
+
+def test_admin_status_cache(mocker):
+
+    """
+    Тестирование кэша статусов администраторов.
+    :param mocker: Мокер для подмены времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.cache.time.monotonic', return_value=0.0)
+
+    cache = AdminStatusCache(
+        ttl=300,
+        negative_ttl=60,
+        maxsize=100
+    )
+
+    cache.set(user_id=1, group_id=10, is_admin=True)
+    cache.set(user_id=1, group_id=20, is_admin=False)
+    cache.set(user_id=2, group_id=10, is_admin=False)
+
+    assert cache.get(user_id=1, group_id=10) is True
+    assert cache.get(user_id=1, group_id=20) is False
+    assert cache.get(user_id=3, group_id=10) is None
+
+    # Отрицательный статус живёт меньше положительного
+    mock_time.return_value = 61.0
+    assert cache.get(user_id=1, group_id=20) is None
+    assert cache.get(user_id=1, group_id=10) is True
+
+    # Сброс статуса одного пользователя
+    cache.invalidate(user_id=1, group_id=10)
+    assert cache.get(user_id=1, group_id=10) is None
+
+    # Сброс статусов всей группы
+    cache.set(user_id=1, group_id=10, is_admin=True)
+    assert cache.invalidate_group(group_id=10) == 2
+    assert cache.get(user_id=1, group_id=10) is None
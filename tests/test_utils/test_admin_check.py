@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from aiogram.exceptions import TelegramBadRequest
@@ -7,6 +9,7 @@ from unittest.mock import (
     MagicMock
 )
 
+from bot_app.utils.admin_cache import admin_cache
 from bot_app.utils.admin_check import check_is_admin
 
 
@@ -43,7 +46,8 @@ async def test_check_is_admin(mock_admin,
     # Проверка результата
     assert result_is_admin is True
 
-    # Если пользователь не админ
+    # Если пользователь не админ (сбрасываем закэшированный статус)
+    admin_cache.clear()
     mock_member.status = 'member'
 
     # Запуск функции
@@ -57,6 +61,7 @@ async def test_check_is_admin(mock_admin,
     assert result_not_admin is False
 
     # Тестируем функцию с исключением
+    admin_cache.clear()
     mock_member.get_chat_member = AsyncMock(side_effect=TelegramBadRequest(
         method=MagicMock(),
         message='Test Error'
@@ -71,3 +76,145 @@ async def test_check_is_admin(mock_admin,
 
     # Проверка результата
     assert result_error is False
+
+
+@pytest.mark.asyncio
+async def test_check_is_admin_uses_cache(mock_admin,
+                                         sample_test_data):
+
+    """
+    Тестирование того, что повторная проверка администратора берёт статус из кэша.
+    :param mock_admin: Функция, возвращающая замокированные объекты bot и get_chat_member.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    # Получаем данные для теста
+    user_id = sample_test_data['user']['user_id']
+    groups_id = sample_test_data['groups']
+
+    # Получаем данные из фикстур
+    mock_bot, mock_member = mock_admin
+
+    # Пользователь не администратор ни в одной группе
+    mock_member.status = 'member'
+
+    assert await check_is_admin(bot=mock_bot, user_id=user_id, groups_id=groups_id) is False
+    assert mock_bot.get_chat_member.await_count == len(groups_id)
+
+    # Повторная проверка не обращается к Telegram
+    mock_bot.get_chat_member.reset_mock()
+    assert await check_is_admin(bot=mock_bot, user_id=user_id, groups_id=groups_id) is False
+    mock_bot.get_chat_member.assert_not_awaited()
+
+    # После сброса статуса в одной группе запрашивается только она
+    admin_cache.invalidate(user_id=user_id, group_id=groups_id[0])
+    mock_member.status = 'creator'
+    assert await check_is_admin(bot=mock_bot, user_id=user_id, groups_id=groups_id) is True
+    mock_bot.get_chat_member.assert_awaited_once_with(groups_id[0], user_id)
+
+
+@pytest.mark.asyncio
+async def test_check_is_admin_concurrent(mocker,
+                                         sample_test_data):
+
+    """
+    Тестирование параллельной проверки администратора с отменой оставшихся запросов и ограничением по времени.
+    :param mocker: Мокер для подмены настроек.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    # Получаем данные для теста
+    user_id = sample_test_data['user']['user_id']
+    fast_group, slow_group, _ = sample_test_data['groups']
+
+    cancelled = []
+
+    async def get_chat_member(group_id, _user_id):
+        # Быстрая группа отвечает сразу, медленная - "зависает"
+        if group_id == fast_group:
+            return MagicMock(status='administrator')
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(group_id)
+            raise
+        return MagicMock(status='member')
+
+    mock_bot = AsyncMock()
+    mock_bot.get_chat_member = AsyncMock(side_effect=get_chat_member)
+
+    # Первый положительный ответ отменяет остальные запросы
+    result = await check_is_admin(
+        bot=mock_bot,
+        user_id=user_id,
+        groups_id=[slow_group, fast_group]
+    )
+    await asyncio.sleep(0)
+
+    assert result is True
+    assert cancelled == [slow_group]
+
+    # Медленная группа не задерживает ответ дольше заданного времени
+    mocker.patch('bot_app.utils.admin_check.ADMIN_CHECK_TIMEOUT', 0.05)
+
+    result = await asyncio.wait_for(
+        check_is_admin(
+            bot=mock_bot,
+            user_id=user_id,
+            groups_id=[slow_group]
+        ),
+        timeout=1
+    )
+
+    assert result is False
+    # Статус по истечении времени не кэшируется
+    assert admin_cache.get(user_id=user_id, group_id=slow_group) is None
+
+
+@pytest.mark.asyncio
+async def test_check_is_admin_task_errors(mocker,
+                                          sample_test_data):
+
+    """
+    Тестирование ошибок запросов в отдельных группах: ошибка логируется и не прерывает проверку.
+    :param mocker: Мокер для подмены логгера.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    user_id = sample_test_data['user']['user_id']
+    failed_group, other_failed_group, admin_group = sample_test_data['groups']
+
+    async def get_chat_member(group_id, _user_id):
+        if group_id == failed_group:
+            raise RuntimeError('network error')
+        if group_id == other_failed_group:
+            await asyncio.sleep(0)
+            raise RuntimeError('timeout error')
+        await asyncio.sleep(0.01)
+        return MagicMock(status='administrator')
+
+    mock_bot = AsyncMock()
+    mock_bot.get_chat_member = AsyncMock(side_effect=get_chat_member)
+    mock_logger = mocker.patch('bot_app.utils.admin_check.logger')
+
+    loop = asyncio.get_running_loop()
+    unretrieved = []
+    loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+    try:
+        result = await check_is_admin(
+            bot=mock_bot,
+            user_id=user_id,
+            groups_id=[failed_group, other_failed_group, admin_group]
+        )
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+
+    assert result is True
+    logged = [c.args[0] for c in mock_logger.error.call_args_list]
+    assert len(logged) == 2
+    assert any('timeout error' in message for message in logged)
+    assert unretrieved == []
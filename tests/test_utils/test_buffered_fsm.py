@@ -0,0 +1,137 @@
+import pytest
+
+from unittest.mock import AsyncMock
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from bot_app.middlewares.fsm_unit_of_work import FSMUnitOfWorkMiddleware
+from bot_app.states.user_states import SearchPhotoState
+from bot_app.utils.buffered_fsm import BufferedFSMContext
+
+
+# Ключ FSM пользователя в личном чате
+KEY = StorageKey(
+    bot_id=42,
+    chat_id=123,
+    user_id=123
+)
+
+
+@pytest.mark.asyncio
+async def test_buffered_fsm_context(mocker):
+
+    """
+    Тестирование накопления изменений FSM и их записи одним вызовом.
+    :param mocker: Мокер для подсчёта обращений к хранилищу.
+    :return: Функция ничего не возвращает.
+    """
+
+    storage = MemoryStorage()
+    await storage.set_data(key=KEY, data={'cancel_handler': False})
+
+    get_data = mocker.spy(storage, 'get_data')
+    set_data = mocker.spy(storage, 'set_data')
+    update_data = mocker.spy(storage, 'update_data')
+    set_state = mocker.spy(storage, 'set_state')
+
+    state = BufferedFSMContext(storage=storage, key=KEY)
+
+    # Последовательность вызовов как в category_selection_callback
+    data = await state.get_data()
+    assert data == {'cancel_handler': False}
+    await state.update_data(category='Category123', current_page=1)
+    await state.update_data({'current_page': 2})
+    await state.set_state(SearchPhotoState.search_photo)
+
+    # Изменения видны в контексте, но ещё не записаны
+    assert await state.get_value('current_page') == 2
+    assert await state.get_state() == 'SearchPhotoState:search_photo'
+    assert await storage.get_data(key=KEY) == {'cancel_handler': False}
+    assert state.changed is True
+
+    await state.flush()
+
+    assert await storage.get_data(key=KEY) == {'cancel_handler': False, 'category': 'Category123', 'current_page': 2}
+    assert await storage.get_state(key=KEY) == 'SearchPhotoState:search_photo'
+    assert state.changed is False
+
+    # По одной записи состояния и данных: в хранилище передаются только изменённые ключи
+    update_data.assert_awaited_once_with(key=KEY, data={'category': 'Category123', 'current_page': 2})
+    set_state.assert_awaited_once()
+    get_data_count = get_data.await_count
+
+    # Очистка состояния не читает данные из хранилища и заменяет данные целиком
+    set_data.reset_mock()
+    update_data.reset_mock()
+    state = BufferedFSMContext(storage=storage, key=KEY)
+    await state.clear()
+    await state.update_data(cancel_handler=True)
+    await state.flush()
+
+    assert get_data.await_count == get_data_count
+    set_data.assert_awaited_once_with(key=KEY, data={'cancel_handler': True})
+    update_data.assert_not_awaited()
+    assert await storage.get_data(key=KEY) == {'cancel_handler': True}
+    assert await storage.get_state(key=KEY) is None
+
+    # Без изменений запись не выполняется
+    set_data.reset_mock()
+    await BufferedFSMContext(storage=storage, key=KEY).flush()
+    set_data.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fsm_unit_of_work_middleware(mocker):
+
+    """
+    Тестирование подмены контекста FSM и записи изменений после обработки обновления.
+    :param mocker: Мокер для подсчёта обращений к хранилищу.
+    :return: Функция ничего не возвращает.
+    """
+
+    storage = MemoryStorage()
+    middleware = FSMUnitOfWorkMiddleware()
+    get_state = mocker.spy(storage, 'get_state')
+
+    async def handler(event, data):
+        assert isinstance(data['state'], BufferedFSMContext)
+        # Состояние берётся из raw_state без обращения к хранилищу
+        assert await data['state'].get_state() == 'SearchPhotoState:search_photo'
+        await data['state'].update_data(category='Category123')
+        return 'result'
+
+    data = {
+        'state': FSMContext(storage=storage, key=KEY),
+        'raw_state': 'SearchPhotoState:search_photo'
+    }
+    assert await middleware(handler, AsyncMock(), data) == 'result'
+    assert await storage.get_data(key=KEY) == {'category': 'Category123'}
+    get_state.assert_not_awaited()
+
+    async def failing_handler(event, data):
+        await data['state'].update_data(current_page=2)
+        raise ValueError('handler error')
+
+    # Изменения записываются и при ошибке в хендлере
+    with pytest.raises(ValueError):
+        await middleware(failing_handler, AsyncMock(), {'state': FSMContext(storage=storage, key=KEY), 'raw_state': None})
+
+    assert await storage.get_data(key=KEY) == {'category': 'Category123', 'current_page': 2}
+
+    # Ошибка записи не подменяет ошибку хендлера
+    mocker.patch.object(storage, 'update_data', AsyncMock(side_effect=RuntimeError('storage error')))
+    mock_logger = mocker.patch('bot_app.middlewares.fsm_unit_of_work.logger')
+    with pytest.raises(ValueError):
+        await middleware(failing_handler, AsyncMock(), {'state': FSMContext(storage=storage, key=KEY), 'raw_state': None})
+    assert 'storage error' in mock_logger.error.call_args.args[0]
+
+    # Без ошибки в хендлере ошибка записи передаётся дальше
+    with pytest.raises(RuntimeError):
+        await middleware(handler, AsyncMock(), dict(data, state=FSMContext(storage=storage, key=KEY)))
+
+    # Обновление без контекста FSM передаётся хендлеру без изменений
+    mock_handler = AsyncMock(return_value='result')
+    assert await middleware(mock_handler, AsyncMock(), {}) == 'result'
+    mock_handler.assert_awaited_once()
@@ -0,0 +1,53 @@
+from bot_app.utils.category_catalog import CategoryCatalog
+
+
+def test_category_catalog(sample_test_data, mocker):
+
+    """
+    Тестирование каталога категорий.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :param mocker: Мокер для подмены времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.category_catalog.time.monotonic', return_value=100.0)
+
+    # Данные для теста
+    categories = sample_test_data['category']
+
+    catalog = CategoryCatalog(ttl=60)
+
+    # Пустой каталог не актуален
+    assert catalog.is_fresh is False
+
+    catalog.store(
+        categories=categories,
+        version=catalog.version
+    )
+    assert catalog.is_fresh is True
+    assert catalog.categories == categories
+
+    # Клавиатура строится один раз и переиспользуется
+    keyboard = catalog.keyboard
+    assert catalog.keyboard is keyboard
+    assert len(keyboard.inline_keyboard[0]) == 2
+
+    # Создание новой категории делает каталог устаревшим
+    catalog.bump()
+    assert catalog.is_fresh is False
+
+    # Категории, загруженные для старой версии, не делают каталог актуальным
+    catalog.store(
+        categories=categories,
+        version=catalog.version - 1
+    )
+    assert catalog.is_fresh is False
+
+    # По истечении времени жизни категории перечитываются (их могли создать другие процессы бота)
+    catalog.store(
+        categories=categories,
+        version=catalog.version
+    )
+    assert catalog.is_fresh is True
+    mock_time.return_value = 160.0
+    assert catalog.is_fresh is False
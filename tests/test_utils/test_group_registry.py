@@ -0,0 +1,95 @@
+import pytest
+import asyncpg
+
+from unittest.mock import AsyncMock
+
+from bot_app.middlewares.add_pool_in_handlers import DatabaseMiddleware
+from bot_app.utils.group_registry import GroupRegistry
+
+
+@pytest.mark.asyncio
+async def test_group_registry(mock_db_pool,
+                              sample_test_data):
+
+    """
+    Тестирование реестра групп.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    # Данные для теста
+    groups = sample_test_data['groups']
+    group_id = sample_test_data['chat']['chat_id']
+
+    # Получаем данные из фикстур
+    mock_pool, mock_conn = await mock_db_pool(data=groups)
+
+    # Загружаем группы из БД одним запросом
+    registry = await GroupRegistry.load(pool=mock_pool)
+
+    mock_conn.fetchval.assert_called_once()
+    assert sorted(registry.groups_id) == sorted(groups)
+
+    # Добавление и удаление группы не обращаются к БД
+    registry.add(group_id=group_id)
+    assert group_id in registry
+    assert len(registry) == len(groups) + 1
+
+    registry.discard(group_id=group_id)
+    registry.discard(group_id=group_id)
+    assert group_id not in registry
+    assert mock_conn.fetchval.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_group_registry_refresh(mock_db_pool,
+                                      sample_test_data,
+                                      mocker):
+
+    """
+    Тестирование перезагрузки реестра групп из БД по истечении времени жизни.
+    :param mock_db_pool: Функция, которая принимает данные и возвращает корутину,
+    возвращающая кортеж из мокированного пула соединений и само соединение с БД.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :param mocker: Мокер для подмены времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.group_registry.time.monotonic', return_value=100.0)
+
+    # Данные для теста
+    groups = sample_test_data['groups']
+    group_id = sample_test_data['chat']['chat_id']
+
+    # Другой процесс бота добавил группу в БД
+    mock_pool, mock_conn = await mock_db_pool(data=groups + [group_id])
+
+    registry = GroupRegistry(groups_id=groups, ttl=60)
+    middleware = DatabaseMiddleware(pool=mock_pool, group_registry=registry)
+    handler = AsyncMock()
+
+    # Пока время жизни не истекло, БД не запрашивается
+    mock_time.return_value = 159.0
+    await middleware(handler, AsyncMock(), {})
+    assert registry.is_fresh is True
+    mock_conn.fetchval.assert_not_called()
+    assert group_id not in registry
+
+    # По истечении времени жизни реестр перечитывается один раз
+    mock_time.return_value = 160.0
+    await middleware(handler, AsyncMock(), {})
+    await middleware(handler, AsyncMock(), {})
+    mock_conn.fetchval.assert_called_once()
+    assert group_id in registry
+    assert handler.await_args.args[1]['group_registry'] is registry
+
+    # Ошибка БД не прерывает обработку обновления, реестр остаётся прежним
+    mock_time.return_value = 300.0
+    mock_conn.fetchval = AsyncMock(side_effect=asyncpg.PostgresError('DB error'))
+    mock_logger = mocker.patch('bot_app.middlewares.add_pool_in_handlers.logger')
+    await middleware(handler, AsyncMock(), {})
+    mock_logger.error.assert_called_once()
+    assert handler.await_count == 4
+    assert group_id in registry
@@ -0,0 +1,78 @@
+from bot_app.keyboards.keyboards import (
+    create_admins_keyboard,
+    create_assembl_buttons,
+    create_paginated_keyboard
+)
+from bot_app.utils.category_catalog import CategoryCatalog
+from bot_app.utils.keyboard_cache import (
+    KeyboardCache,
+    keyboard_cache
+)
+
+
+def test_keyboard_cache():
+
+    """
+    Тестирование кэша инлайн-клавиатур.
+    :return: Функция ничего не возвращает.
+    """
+
+    cache = KeyboardCache(maxsize=2)
+    calls = []
+
+    @cache.memoize(key=lambda command: command)
+    def build(command: str) -> str:
+        calls.append(command)
+        return f'keyboard_{command}'
+
+    # Клавиатура строится один раз для одинаковых аргументов
+    assert build('add') == 'keyboard_add'
+    assert build(command='add') == 'keyboard_add'
+    assert build('delete') == 'keyboard_delete'
+    assert calls == ['add', 'delete']
+
+    # Функция без кэша доступна через __wrapped__
+    assert build.__wrapped__('add') == 'keyboard_add'
+    assert calls == ['add', 'delete', 'add']
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_memoized_keyboards(sample_test_data):
+
+    """
+    Тестирование переиспользования клавиатур из кэша и сброса кэша при изменении каталога категорий.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    photos = sample_test_data['photos']
+
+    keyboard = create_assembl_buttons(assembl=photos)
+    assert keyboard.inline_keyboard[0][0].callback_data == 'photo_id_123'
+    # Тот же список сборок возвращает ту же клавиатуру
+    assert create_assembl_buttons(assembl=[dict(photo) for photo in photos]) is keyboard
+    # Изменённое описание даёт новую клавиатуру
+    changed = [dict(photos[0], description='Новое описание')] + photos[1:]
+    assert create_assembl_buttons(assembl=changed) is not keyboard
+
+    pagination = create_paginated_keyboard(current_page=1, total_pages=2, first_id=1, last_id=5)
+    assert create_paginated_keyboard(1, 2, 1, 5) is pagination
+    assert create_paginated_keyboard(current_page=2, total_pages=2, first_id=6, last_id=10) is not pagination
+
+    # На последней странице нет кнопки вперёд, а без id фотографии - кнопки назад
+    last_page = create_paginated_keyboard(current_page=2, total_pages=2, first_id=None, last_id=None)
+    assert [button.callback_data for button in last_page.inline_keyboard[0]] == ['page_info']
+
+    admins = create_admins_keyboard(category='Category123')
+    assert create_admins_keyboard(category='Category123') is admins
+
+    # Создание новой категории сбрасывает кэш клавиатур
+    CategoryCatalog().bump()
+    assert len(keyboard_cache) == 0
+    assert create_admins_keyboard(category='Category123') is not admins
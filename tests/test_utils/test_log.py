@@ -0,0 +1,124 @@
+import json
+import logging
+import queue
+
+from config.log import (
+    DroppingQueueHandler,
+    JsonFormatter,
+    create_file_handler,
+    create_queue_pipeline
+)
+
+
+def make_record(level: int,
+                msg: str) -> logging.LogRecord:
+
+    """
+    Создание записи лога.
+    :param level: Уровень записи.
+    :param msg: Сообщение записи.
+    :return: Возвращает запись лога.
+    """
+
+    return logging.LogRecord('bot', level, __file__, 1, msg, None, None)
+
+
+def test_dropping_queue_handler():
+
+    """
+    Тест политики переполнения очереди: записи ниже ERROR отбрасываются,
+    а ERROR вытесняет самую старую запись.
+    :return: Функция ничего не возвращает.
+    """
+
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+
+    handler.emit(make_record(logging.INFO, 'first'))
+    handler.emit(make_record(logging.INFO, 'second'))
+    # Очередь заполнена - запись INFO отбрасывается без ожидания
+    handler.emit(make_record(logging.INFO, 'third'))
+    assert handler.dropped == 1
+
+    # Запись ERROR вытесняет самую старую запись
+    handler.emit(make_record(logging.ERROR, 'error'))
+    assert handler.dropped == 2
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ['second', 'error']
+
+
+def test_json_formatter():
+
+    """
+    Тест форматирования записи лога в JSON.
+    :return: Функция ничего не возвращает.
+    """
+
+    record = logging.LogRecord('bot', logging.WARNING, __file__, 1, 'Фото с ID %s не найдено', (123,), None)
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['level'] == 'WARNING'
+    assert entry['logger'] == 'bot'
+    assert entry['message'] == 'Фото с ID 123 не найдено'
+
+
+def test_queue_pipeline_writes_file(tmp_path):
+
+    """
+    Тест записи лога в файл фоновым потоком в формате JSON.
+    :param tmp_path: Временная папка pytest.
+    :return: Функция ничего не возвращает.
+    """
+
+    file_handler = create_file_handler(
+        path=str(tmp_path / 'bot.log'),
+        log_format='json'
+    )
+    queue_handler, listener = create_queue_pipeline(file_handler, maxsize=100)
+
+    logger = logging.getLogger('test_queue_pipeline')
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        logger.warning('Сообщение %s', 1)
+    finally:
+        # Остановка дожидается записи оставшихся в очереди записей
+        listener.stop()
+        logger.removeHandler(queue_handler)
+        file_handler.close()
+
+    lines = (tmp_path / 'bot.log').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['message'] for line in lines] == ['Сообщение 1']
+
+
+def test_queue_pipeline_exc_info(tmp_path):
+
+    """
+    Тест передачи исключения через очередь: в JSON трассировка выводится отдельным полем exc_info.
+    :param tmp_path: Временная папка pytest.
+    :return: Функция ничего не возвращает.
+    """
+
+    file_handler = create_file_handler(
+        path=str(tmp_path / 'bot.log'),
+        log_format='json'
+    )
+    queue_handler, listener = create_queue_pipeline(file_handler, maxsize=100)
+
+    logger = logging.getLogger('test_queue_pipeline_exc_info')
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        try:
+            raise ValueError('Ошибка')
+        except ValueError:
+            logger.exception('Сообщение %s', 1)
+    finally:
+        listener.stop()
+        logger.removeHandler(queue_handler)
+        file_handler.close()
+
+    entry = json.loads((tmp_path / 'bot.log').read_text(encoding='utf-8'))
+    assert entry['message'] == 'Сообщение 1'
+    assert 'ValueError: Ошибка' in entry['exc_info']
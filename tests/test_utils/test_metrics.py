@@ -0,0 +1,92 @@
+import pytest
+
+from bot_app.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+    current_router,
+    metrics,
+    timed_db_call
+)
+
+
+def test_histogram():
+
+    """
+    Тест учёта значений в гистограмме и оценки квантилей.
+    :return: Функция ничего не возвращает.
+    """
+
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    for value in (0.005, 0.005, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1, 1]
+    assert list(histogram.cumulative()) == [(0.01, 2), (0.1, 3), (1.0, 4), (float('inf'), 5)]
+    assert histogram.quantile(0.5) == 0.1
+    # Квантиль выше последней границы оценивается максимумом
+    assert histogram.quantile(0.99) == 5.0
+
+    stats = histogram.stats()
+    assert stats['count'] == 5
+    assert stats['max_ms'] == 5000
+
+
+def test_metrics_registry_dump_and_render():
+
+    """
+    Тест получения метрик словарём и в формате Prometheus.
+    :return: Функция ничего не возвращает.
+    """
+
+    registry = MetricsRegistry()
+    registry.describe('handler_seconds', 'Время хендлера.')
+    registry.observe('handler_seconds', 0.02, router='bot_user_handlers_router', handler='search')
+    registry.observe('handler_seconds', 0.2, router='bot_user_handlers_router', handler='search')
+    registry.inc('errors_total', router='bot_admins_handlers_router')
+
+    assert registry.histogram('handler_seconds', handler='search', router='bot_user_handlers_router').count == 2
+    assert registry.counter('errors_total', router='bot_admins_handlers_router') == 1
+    assert registry.counter('errors_total', router='none') == 0
+
+    dump = registry.dump()
+    assert dump['handler_seconds'][0]['router'] == 'bot_user_handlers_router'
+    assert dump['handler_seconds'][0]['count'] == 2
+    assert dump['errors_total'] == [{'router': 'bot_admins_handlers_router', 'value': 1}]
+
+    text = registry.render()
+    assert '# HELP handler_seconds Время хендлера.' in text
+    assert '# TYPE handler_seconds histogram' in text
+    assert 'handler_seconds_bucket{handler="search",router="bot_user_handlers_router",le="0.025"} 1' in text
+    assert 'handler_seconds_bucket{handler="search",router="bot_user_handlers_router",le="+Inf"} 2' in text
+    assert 'handler_seconds_count{handler="search",router="bot_user_handlers_router"} 2' in text
+    assert 'errors_total{router="bot_admins_handlers_router"} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_timed_db_call():
+
+    """
+    Тест учёта времени и результата вызовов функций работы с БД с меткой роутера.
+    :return: Функция ничего не возвращает.
+    """
+
+    @timed_db_call
+    async def get_something_from_db(fail: bool = False) -> str:
+        if fail:
+            raise ValueError('error')
+        return 'result'
+
+    token = current_router.set('bot_user_handlers_router')
+    try:
+        assert await get_something_from_db() == 'result'
+        with pytest.raises(ValueError):
+            await get_something_from_db(fail=True)
+    finally:
+        current_router.reset(token)
+
+    assert await get_something_from_db() == 'result'
+
+    labels = {'function': 'get_something_from_db'}
+    assert metrics.histogram('db_call_seconds', router='bot_user_handlers_router', status='ok', **labels).count == 1
+    assert metrics.histogram('db_call_seconds', router='bot_user_handlers_router', status='ValueError', **labels).count == 1
+    assert metrics.histogram('db_call_seconds', router='none', status='ok', **labels).count == 1
@@ -0,0 +1,117 @@
+from bot_app.utils.photo_cache import PhotoCache
+
+
+def test_photo_cache(sample_test_data):
+
+    """
+    Тестирование кэша фото по id в БД.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    photos = sample_test_data['photos']
+
+    cache = PhotoCache(ttl=60, maxsize=10)
+
+    assert cache.get(photo_db_id=photos[0]['id']) is None
+
+    # Сохранение страницы фото (записи без id пропускаются)
+    cache.store_many(photos=photos + [{'photo_id': 'photo000', 'description': 'Description000'}])
+
+    for photo in photos:
+        assert cache.get(photo_db_id=photo['id']) == {
+            'photo_id': photo['photo_id'],
+            'description': photo['description']
+        }
+
+    # Сброс записи по file_id после изменения фото
+    cache.invalidate(photo_id=photos[0]['photo_id'])
+    assert cache.get(photo_db_id=photos[0]['id']) is None
+    assert cache.get(photo_db_id=photos[1]['id']) is not None
+
+    cache.clear()
+    assert cache.get(photo_db_id=photos[1]['id']) is None
+
+
+def test_photo_cache_lookups(mocker):
+
+    """
+    Тестирование кэша file_id, описаний и результатов поиска фото.
+    :param mocker: Мокер для подмены времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    mocker.patch('bot_app.utils.cache.time.monotonic', return_value=100.0)
+
+    cache = PhotoCache(ttl=60, maxsize=5)
+
+    # Соответствие file_id и описания сохраняется в обе стороны
+    cache.remember(photo_id='photo123', description='Description123')
+    assert cache.get_file_id(description='Description123') == 'photo123'
+    assert cache.get_description(photo_id='photo123') == 'Description123'
+    assert cache.get_file_id(description='Unknown') is None
+
+    # Результат поиска не зависит от регистра и пробелов в запросе
+    cache.set_search(
+        category='Category123',
+        query='Des',
+        photos=[{'id': 1, 'photo_id': 'photo123', 'description': 'Description123'}]
+    )
+    assert cache.get_search(category='Category123', query=' des ') == [
+        {'id': 1, 'photo_id': 'photo123', 'description': 'Description123'}
+    ]
+    assert cache.get_search(category='Category', query='des') is None
+
+    # Изменение фото сбрасывает его записи и все результаты поиска
+    cache.remember(photo_id='photo456', description='Des456')
+    cache.invalidate(photo_id='photo123')
+    assert cache.get_description(photo_id='photo123') is None
+    assert cache.get_file_id(description='Description123') is None
+    assert cache.get_search(category='Category123', query='des') is None
+    assert cache.get_file_id(description='Des456') == 'photo456'
+
+    # Переполнение вытесняет самые старые записи (в том числе сброшенный результат поиска прошлого поколения)
+    for i in range(4):
+        cache.set(photo_db_id=i, photo_id=f'photo{i}', description=f'Description{i}')
+    assert len(cache) == 5
+
+    stats = cache.stats()
+    assert stats['maxsize'] == 5
+    assert stats['evictions'] == 2
+    assert stats['hits'] == 4
+
+
+def test_photo_cache_invalidate(mocker):
+
+    """
+    Тестирование времени жизни результатов поиска и сброса записей фото без просмотра всего кэша.
+    :param mocker: Мокер для подмены времени и отслеживания просмотра кэша.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.cache.time.monotonic', return_value=100.0)
+
+    cache = PhotoCache(ttl=3600, maxsize=4, search_ttl=60)
+    delete_where = mocker.spy(cache._cache, 'delete_where')
+
+    # Результат поиска живёт search_ttl, остальные записи - ttl
+    cache.set(photo_db_id=1, photo_id='photo1', description='Description1')
+    cache.set_search(category='Category123', query='des', photos=[])
+    mock_time.return_value = 160.0
+    assert cache.get_search(category='Category123', query='des') is None
+    assert cache.get(photo_db_id=1) is not None
+
+    # Сброс удаляет записи фото по сохранённым ключам и не просматривает кэш
+    cache.remember(photo_id='photo1', description='Description1')
+    cache.set_search(category='Category123', query='des', photos=[])
+    cache.invalidate(photo_id='photo1')
+    assert cache.get(photo_db_id=1) is None
+    assert cache.get_file_id(description='Description1') is None
+    assert cache.get_search(category='Category123', query='des') is None
+    delete_where.assert_not_called()
+
+    # Ключи вытесненных записей не накапливаются
+    for i in range(100):
+        cache.set(photo_db_id=i, photo_id=f'photo{i}', description=f'Description{i}')
+    assert len(cache._photo_keys) <= 2 * cache._cache.maxsize
+    assert cache.get(photo_db_id=99) == {'photo_id': 'photo99', 'description': 'Description99'}
@@ -0,0 +1,34 @@
+from bot_app.utils.photo_counter import PhotoCounter
+
+
+def test_photo_counter(mocker):
+
+    """
+    Тестирование счётчика фотографий по категориям с временем жизни.
+    :param mocker: Мокер для подмены времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.photo_counter.time.monotonic', return_value=100.0)
+
+    counter = PhotoCounter(ttl=300)
+
+    # Количество ещё не подсчитано: изменения не создают счётчик
+    assert counter.get(category='Category123') is None
+    counter.increment(category='Category123')
+    assert counter.get(category='Category123') is None
+
+    counter.set(category='Category123', count=1)
+    counter.increment(category='Category123')
+    counter.decrement(category='Category123')
+    counter.decrement(category='Category123')
+    counter.decrement(category='Category123')
+    assert counter.get(category='Category123') == 0
+
+    # Изменения счётчика не продлевают время жизни подсчитанного в БД количества
+    mock_time.return_value = 350.0
+    counter.increment(category='Category123')
+    assert counter.get(category='Category123') == 1
+
+    mock_time.return_value = 400.0
+    assert counter.get(category='Category123') is None
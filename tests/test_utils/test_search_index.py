@@ -0,0 +1,144 @@
+from bot_app.utils.search_index import PhotoSearchIndex
+
+
+def test_photo_search_index(sample_test_data):
+
+    """
+    Тестирование поискового индекса фото.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :return: Функция ничего не возвращает.
+    """
+
+    # Данные для теста
+    rows = [
+        {
+            'id': photo['id'],
+            'photo_id': photo['photo_id'],
+            'description': photo['description'],
+            'description_translit': photo['description'].lower(),
+            'category_name': photo['category']
+        }
+        for photo in sample_test_data['photos']
+    ]
+
+    index = PhotoSearchIndex()
+
+    # Незагруженный индекс не отвечает на поиск и не принимает изменения
+    assert index.search(category='Category123', query='123') is None
+    index.add(
+        photo_db_id=1,
+        photo_id='photo000',
+        description='Description000',
+        description_translit='description000',
+        category='Category123'
+    )
+    assert len(index) == 0
+
+    index.build(rows=rows)
+    assert len(index) == 3
+
+    # Поиск по вхождению подстроки без учёта регистра и только в своей категории
+    assert index.search(category='Category123', query='des') == [
+        {
+            'id': 123,
+            'description': 'Description123',
+            'description_translit': 'description123',
+            'photo_id': 'photo123'
+        },
+        {
+            'id': 456,
+            'description': 'Des456',
+            'description_translit': 'des456',
+            'photo_id': 'photo456'
+        }
+    ]
+    assert index.search(category='Category', query='des') == []
+    assert index.search(category='Unknown', query='des') == []
+
+    # Короткий запрос проверяется по всем фото категории
+    assert [photo['photo_id'] for photo in index.search(category='Category', query='78')] == ['photo789']
+
+    # Запрос с опечаткой находит похожее описание
+    assert [photo['photo_id'] for photo in index.search(category='Category123', query='descriptoin123')] == [
+        'photo123'
+    ]
+
+    # Изменение описания
+    index.update_description(
+        photo_id='photo456',
+        description='Новое описание',
+        description_translit='novoe opisanie'
+    )
+    assert [photo['photo_id'] for photo in index.search(category='Category123', query='opisanie')] == ['photo456']
+    assert [photo['photo_id'] for photo in index.search(category='Category123', query='des')] == ['photo123']
+
+    # Изменение ID фото
+    index.rename(
+        photo_id='photo456',
+        new_photo_id='photo654'
+    )
+    assert [photo['photo_id'] for photo in index.search(category='Category123', query='новое')] == ['photo654']
+
+    # Повторное добавление фото переносит его в другую категорию
+    index.add(
+        photo_db_id=456,
+        photo_id='photo654',
+        description='Новое описание',
+        description_translit='novoe opisanie',
+        category='Category'
+    )
+    assert index.search(category='Category123', query='новое') == []
+    assert [photo['photo_id'] for photo in index.search(category='Category', query='новое')] == ['photo654']
+
+    # Удаление фото
+    index.remove(photo_id='photo654')
+    assert index.search(category='Category', query='новое') == []
+    assert len(index) == 2
+
+    # Ограничение количества результатов
+    assert len(index.search(category='Category123', query='1', limit=0)) == 0
+
+    index.clear()
+    assert index.loaded is False
+    assert len(index) == 0
+
+
+def test_photo_search_index_ttl(sample_test_data, mocker):
+
+    """
+    Тестирование времени жизни загруженного поискового индекса.
+    :param sample_test_data: Словарь с тестовыми данными.
+    :param mocker: Мокер для подмены времени.
+    :return: Функция ничего не возвращает.
+    """
+
+    mock_time = mocker.patch('bot_app.utils.search_index.time.monotonic', return_value=100.0)
+
+    photo = sample_test_data['photos'][0]
+    index = PhotoSearchIndex(ttl=300)
+
+    # Незагруженный индекс не актуален
+    assert index.is_fresh is False
+
+    index.build(rows=[{
+        'id': photo['id'],
+        'photo_id': photo['photo_id'],
+        'description': photo['description'],
+        'description_translit': None,
+        'category_name': photo['category']
+    }])
+    assert index.is_fresh is True
+
+    mock_time.return_value = 399.0
+    assert index.is_fresh is True
+
+    # По истечении времени жизни индекс устаревает, но продолжает отвечать на поиск до перестроения
+    mock_time.return_value = 400.0
+    assert index.is_fresh is False
+    assert index.search(category=photo['category'], query=photo['description']) != []
+
+    # Без времени жизни индекс актуален до очистки
+    index.ttl = None
+    assert index.is_fresh is True
+    index.clear()
+    assert index.is_fresh is False
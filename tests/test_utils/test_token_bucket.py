@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from bot_app.utils.token_bucket import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_and_refill():
+
+    """
+    Тест выдачи токенов: всплеск до capacity без ожидания, далее со скоростью rate.
+    :return: Функция ничего не возвращает.
+    """
+
+    bucket = TokenBucket(
+        rate=100,
+        capacity=3
+    )
+    loop = asyncio.get_running_loop()
+
+    # Всплеск выдаётся сразу
+    for _ in range(3):
+        assert await bucket.acquire() == 0
+
+    # Следующий токен восстанавливается за 1 / rate секунд
+    started = loop.time()
+    wait = await bucket.acquire()
+    assert wait > 0
+    assert loop.time() - started >= 0.009
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_priority():
+
+    """
+    Тест очереди ожидания: запросы с меньшим приоритетом обслуживаются первыми, при равном - по очереди.
+    :return: Функция ничего не возвращает.
+    """
+
+    bucket = TokenBucket(
+        rate=200,
+        capacity=1
+    )
+    await bucket.acquire()
+
+    order = []
+
+    async def acquire(name: str,
+                      priority: int) -> None:
+        await bucket.acquire(priority=priority)
+        order.append(name)
+
+    tasks = [asyncio.create_task(acquire(f'group{i}', 1)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(acquire(f'user{i}', 0)) for i in range(2)]
+    await asyncio.gather(*tasks)
+
+    # Запросы пользователей обгоняют уже ожидающие запросы в группы
+    assert order == ['user0', 'user1', 'group0', 'group1', 'group2']
+    assert bucket.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_cancel_and_pause():
+
+    """
+    Тест отмены ожидания и паузы выдачи токенов.
+    :return: Функция ничего не возвращает.
+    """
+
+    bucket = TokenBucket(
+        rate=100,
+        capacity=1
+    )
+    await bucket.acquire()
+
+    # Отменённый запрос убирается из очереди и не блокирует остальных
+    task = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    assert bucket.waiting == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert bucket.waiting == 0
+
+    # После паузы токен выдаётся не раньше, чем через указанное время
+    bucket.pause(seconds=0.05)
+    assert bucket.tokens < 0
+    assert await bucket.acquire() >= 0.05